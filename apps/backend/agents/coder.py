@@ -11,6 +11,7 @@ import os
 from pathlib import Path
 
 from core.client import create_client
+from core.plan_repository import get_plan
 from linear_updater import (
     LinearTaskState,
     is_linear_enabled,
@@ -66,10 +67,8 @@ from .base import (
 from .memory_manager import debug_memory_system_status, get_graphiti_context
 from .session import post_session_processing, run_agent_session
 from .utils import (
-    find_phase_for_subtask,
     get_commit_count,
     get_latest_commit,
-    load_implementation_plan,
     sync_spec_to_source,
 )
 
@@ -403,8 +402,8 @@ async def run_autonomous_agent(
             )
 
             # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+            plan = get_plan(spec_dir)
+            phase = plan.get_phase_for_subtask(subtask_id) if plan else {}
 
             # Generate focused, minimal prompt for this subtask
             prompt = generate_subtask_prompt(
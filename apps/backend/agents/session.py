@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Any
 
 from claude_agent_sdk import ClaudeSDKClient
+from core.plan_repository import get_plan
 from debug import debug, debug_detailed, debug_error, debug_section, debug_success
 from insight_extractor import extract_session_insights
 from linear_updater import (
@@ -37,10 +38,8 @@ from ui import (
 
 from .memory_manager import save_session_memory
 from .utils import (
-    find_subtask_in_plan,
     get_commit_count,
     get_latest_commit,
-    load_implementation_plan,
     sync_spec_to_source,
 )
 
@@ -109,12 +108,12 @@ async def post_session_processing(
         print_status("Implementation plan synced to main project", "success")
 
     # Check if implementation plan was updated
-    plan = load_implementation_plan(spec_dir)
+    plan = get_plan(spec_dir)
     if not plan:
         print("  Warning: Could not load implementation plan")
         return False
 
-    subtask = find_subtask_in_plan(plan, subtask_id)
+    subtask = plan.get_subtask(subtask_id)
     if not subtask:
         print(f"  Warning: Subtask {subtask_id} not found in plan")
         return False
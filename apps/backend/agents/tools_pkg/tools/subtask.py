@@ -7,11 +7,10 @@ Tools for managing subtask status in implementation_plan.json.
 
 import json
 import logging
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.plan_repository import update_subtask_status as update_plan_subtask
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -23,43 +22,6 @@ except ImportError:
     tool = None
 
 
-def _update_subtask_in_plan(
-    plan: dict[str, Any],
-    subtask_id: str,
-    status: str,
-    notes: str,
-) -> bool:
-    """
-    Update a subtask in the plan.
-
-    Args:
-        plan: The implementation plan dict
-        subtask_id: ID of the subtask to update
-        status: New status (pending, in_progress, completed, failed)
-        notes: Optional notes to add
-
-    Returns:
-        True if subtask was found and updated, False otherwise
-    """
-    subtask_found = False
-    for phase in plan.get("phases", []):
-        for subtask in phase.get("subtasks", []):
-            if subtask.get("id") == subtask_id:
-                subtask["status"] = status
-                if notes:
-                    subtask["notes"] = notes
-                subtask["updated_at"] = datetime.now(timezone.utc).isoformat()
-                subtask_found = True
-                break
-        if subtask_found:
-            break
-
-    if subtask_found:
-        plan["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-    return subtask_found
-
-
 def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
     """
     Create subtask management tools.
@@ -113,10 +75,7 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             }
 
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
-
-            subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
+            subtask_found = update_plan_subtask(spec_dir, subtask_id, status, notes)
 
             if not subtask_found:
                 return {
@@ -128,9 +87,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
-
             return {
                 "content": [
                     {
@@ -145,15 +101,11 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
-
-                    subtask_found = _update_subtask_in_plan(
-                        plan, subtask_id, status, notes
+                    subtask_found = update_plan_subtask(
+                        spec_dir, subtask_id, status, notes
                     )
 
                     if subtask_found:
-                        write_json_atomic(plan_file, plan, indent=2)
                         return {
                             "content": [
                                 {
@@ -10,6 +10,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
+from .file_manifest import FileManifest
+
 # Directories to skip during analysis
 SKIP_DIRS = {
     "node_modules",
@@ -89,8 +91,15 @@ SERVICE_ROOT_FILES = {
 class BaseAnalyzer:
     """Base class with common utilities for all analyzers."""
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, manifest: FileManifest | None = None):
         self.path = path.resolve()
+        # Shared directory listings; pass one manifest to every analyzer of a
+        # project so the tree is read once
+        self.manifest = manifest if manifest is not None else FileManifest(self.path)
+
+    def _glob(self, pattern: str, base: Path | None = None) -> list[Path]:
+        """Glob relative to the analyzer's path (or base), via the shared manifest."""
+        return self.manifest.glob(base if base is not None else self.path, pattern)
 
     def _exists(self, path: str) -> bool:
         """Check if a file exists relative to the analyzer's path."""
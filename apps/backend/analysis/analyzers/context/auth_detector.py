@@ -18,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from ..base import BaseAnalyzer
+from ..file_manifest import FileManifest
 
 
 class AuthDetector(BaseAnalyzer):
@@ -36,8 +37,13 @@ class AuthDetector(BaseAnalyzer):
         "src/models/user.ts",
     ]
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(path, manifest)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -121,7 +127,7 @@ class AuthDetector(BaseAnalyzer):
     def _find_auth_middleware(self) -> list[str]:
         """Detect auth middleware and decorators from Python files."""
         # Limit to first 20 files for performance
-        all_py_files = list(self.path.glob("**/*.py"))[:20]
+        all_py_files = self._glob("**/*.py")[:20]
         auth_decorators = set()
 
         for py_file in all_py_files:
@@ -16,13 +16,19 @@ from pathlib import Path
 from typing import Any
 
 from ..base import BaseAnalyzer
+from ..file_manifest import FileManifest
 
 
 class JobsDetector(BaseAnalyzer):
     """Detects background job and task queue systems."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(path, manifest)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -43,9 +49,7 @@ class JobsDetector(BaseAnalyzer):
 
     def _detect_celery(self) -> dict[str, Any] | None:
         """Detect Celery (Python) task queue."""
-        celery_files = list(self.path.glob("**/celery.py")) + list(
-            self.path.glob("**/tasks.py")
-        )
+        celery_files = self._glob("**/celery.py") + self._glob("**/tasks.py")
         if not celery_files:
             return None
 
@@ -16,13 +16,19 @@ from pathlib import Path
 from typing import Any
 
 from ..base import BaseAnalyzer
+from ..file_manifest import FileManifest
 
 
 class MigrationsDetector(BaseAnalyzer):
     """Detects database migration setup and tools."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(path, manifest)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -68,7 +74,7 @@ class MigrationsDetector(BaseAnalyzer):
         if not self._exists("manage.py"):
             return None
 
-        migration_dirs = list(self.path.glob("**/migrations"))
+        migration_dirs = self._glob("**/migrations")
         if not migration_dirs:
             return None
 
@@ -15,13 +15,19 @@ from pathlib import Path
 from typing import Any
 
 from ..base import BaseAnalyzer
+from ..file_manifest import FileManifest
 
 
 class MonitoringDetector(BaseAnalyzer):
     """Detects monitoring and observability setup."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(path, manifest)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -67,9 +73,7 @@ class MonitoringDetector(BaseAnalyzer):
     def _detect_prometheus(self) -> dict[str, str] | None:
         """Detect Prometheus metrics endpoint."""
         # Look for actual Prometheus imports/usage, not just keywords
-        all_files = (
-            list(self.path.glob("**/*.py"))[:30] + list(self.path.glob("**/*.js"))[:30]
-        )
+        all_files = self._glob("**/*.py")[:30] + self._glob("**/*.js")[:30]
 
         for file_path in all_files:
             # Skip analyzer files to avoid self-detection
@@ -29,13 +29,19 @@ from .context import (
     MonitoringDetector,
     ServicesDetector,
 )
+from .file_manifest import FileManifest
 
 
 class ContextAnalyzer(BaseAnalyzer):
     """Orchestrates project context and configuration analysis."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(path, manifest)
         self.analysis = analysis
 
     def detect_environment_variables(self) -> None:
@@ -62,7 +68,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to AuthDetector for actual detection logic.
         """
-        detector = AuthDetector(self.path, self.analysis)
+        detector = AuthDetector(self.path, self.analysis, self.manifest)
         detector.detect()
 
     def detect_migrations(self) -> None:
@@ -71,7 +77,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to MigrationsDetector for actual detection logic.
         """
-        detector = MigrationsDetector(self.path, self.analysis)
+        detector = MigrationsDetector(self.path, self.analysis, self.manifest)
         detector.detect()
 
     def detect_background_jobs(self) -> None:
@@ -80,7 +86,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to JobsDetector for actual detection logic.
         """
-        detector = JobsDetector(self.path, self.analysis)
+        detector = JobsDetector(self.path, self.analysis, self.manifest)
         detector.detect()
 
     def detect_api_documentation(self) -> None:
@@ -98,5 +104,5 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to MonitoringDetector for actual detection logic.
         """
-        detector = MonitoringDetector(self.path, self.analysis)
+        detector = MonitoringDetector(self.path, self.analysis, self.manifest)
         detector.detect()
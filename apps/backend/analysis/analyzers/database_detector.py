@@ -13,13 +13,14 @@ import re
 from pathlib import Path
 
 from .base import BaseAnalyzer
+from .file_manifest import FileManifest
 
 
 class DatabaseDetector(BaseAnalyzer):
     """Detects database models across multiple ORMs."""
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    def __init__(self, path: Path, manifest: FileManifest | None = None):
+        super().__init__(path, manifest)
 
     def detect_all_models(self) -> dict:
         """Detect all database models across different ORMs."""
@@ -48,7 +49,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_sqlalchemy_models(self) -> dict:
         """Detect SQLAlchemy models."""
         models = {}
-        py_files = list(self.path.glob("**/*.py"))
+        py_files = self._glob("**/*.py")
 
         for file_path in py_files:
             try:
@@ -113,9 +114,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_django_models(self) -> dict:
         """Detect Django models."""
         models = {}
-        model_files = list(self.path.glob("**/models.py")) + list(
-            self.path.glob("**/models/*.py")
-        )
+        model_files = self._glob("**/models.py") + self._glob("**/models/*.py")
 
         for file_path in model_files:
             try:
@@ -210,9 +209,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_typeorm_models(self) -> dict:
         """Detect TypeORM entities."""
         models = {}
-        ts_files = list(self.path.glob("**/*.entity.ts")) + list(
-            self.path.glob("**/entities/*.ts")
-        )
+        ts_files = self._glob("**/*.entity.ts") + self._glob("**/entities/*.ts")
 
         for file_path in ts_files:
             try:
@@ -259,9 +256,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_drizzle_models(self) -> dict:
         """Detect Drizzle ORM schemas."""
         models = {}
-        schema_files = list(self.path.glob("**/schema.ts")) + list(
-            self.path.glob("**/db/schema.ts")
-        )
+        schema_files = self._glob("**/schema.ts") + self._glob("**/db/schema.ts")
 
         for file_path in schema_files:
             try:
@@ -289,9 +284,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_mongoose_models(self) -> dict:
         """Detect Mongoose models."""
         models = {}
-        model_files = list(self.path.glob("**/models/*.js")) + list(
-            self.path.glob("**/models/*.ts")
-        )
+        model_files = self._glob("**/models/*.js") + self._glob("**/models/*.ts")
 
         for file_path in model_files:
             try:
@@ -0,0 +1,199 @@
+"""
+File Manifest Module
+====================
+
+Shared, memoized view of a project's directory tree for the analyzers.
+
+Every detector used to call ``Path.glob("**/*.py")`` (and friends) on its own,
+so a single service was walked a dozen times. A FileManifest reads each
+directory at most once and answers ``glob()`` from memory:
+
+- Directory listings are cached on first use and shared by every detector
+  holding the same manifest
+- Glob results are cached per (base, pattern)
+- ``**/*.<ext>`` patterns are served from per-extension buckets built in one
+  pass over the subtree
+
+Results are identical to ``Path.glob`` (same paths, same order), so analyzer
+output does not change. The tree is not pruned: several detectors look
+inside directories such as ``node_modules`` or ``.venv`` and filter (or not)
+on their own.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+# (name, is_dir without following symlinks, is_symlink)
+_Entry = tuple[str, bool, bool]
+
+_SUFFIX_PATTERN_RE = re.compile(r"^\*\.([^.*?\[\]/\\]+)$")
+
+
+def _normcase(name: str) -> str:
+    return os.path.normcase(name)
+
+
+class FileManifest:
+    """
+    Memoized directory listings with a ``Path.glob`` compatible query.
+
+    Usage:
+        manifest = FileManifest(project_dir)
+        py_files = manifest.glob(service_dir, "**/*.py")
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root).resolve()
+        self._entries: dict[Path, list[_Entry]] = {}
+        self._glob_cache: dict[tuple[Path, str], tuple[Path, ...]] = {}
+        self._suffix_buckets: dict[Path, dict[str, list[Path]]] = {}
+        self._matchers: dict[str, Callable[[str], object]] = {}
+
+    def glob(self, base: Path, pattern: str) -> list[Path]:
+        """
+        Glob relative to a directory, like ``base.glob(pattern)``.
+
+        Args:
+            base: Directory to search from
+            pattern: Relative glob pattern (``**`` allowed as a whole part)
+
+        Returns:
+            Matching paths in the order ``Path.glob`` yields them
+        """
+        base = Path(base)
+        key = (base, pattern)
+        cached = self._glob_cache.get(key)
+        if cached is None:
+            cached = tuple(self._glob(base, pattern))
+            self._glob_cache[key] = cached
+        return list(cached)
+
+    def rglob(self, base: Path, pattern: str) -> list[Path]:
+        """Recursive glob, like ``base.rglob(pattern)``."""
+        return self.glob(base, f"**/{pattern}")
+
+    def _glob(self, base: Path, pattern: str) -> Iterator[Path]:
+        parts = [part for part in pattern.replace("\\", "/").split("/") if part]
+        if not parts or not base.is_dir():
+            return iter(())
+
+        if len(parts) == 2 and parts[0] == "**":
+            match = _SUFFIX_PATTERN_RE.match(parts[1])
+            if match:
+                suffix = _normcase("." + match.group(1))
+                return iter(self._get_suffix_buckets(base).get(suffix, []))
+
+        if "**" in parts:
+            return self._select_recursive(base, parts)
+        return self._select(base, parts)
+
+    # ------------------------------------------------------------------
+    # Directory listings
+    # ------------------------------------------------------------------
+
+    def _list_dir(self, path: Path) -> list[_Entry]:
+        """Get a directory's entries in scandir order (cached)."""
+        entries = self._entries.get(path)
+        if entries is None:
+            entries = []
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir(follow_symlinks=False)
+                            is_symlink = entry.is_symlink()
+                        except OSError:
+                            is_dir = is_symlink = False
+                        entries.append((entry.name, is_dir, is_symlink))
+            except OSError:
+                pass
+            self._entries[path] = entries
+        return entries
+
+    def _iter_dirs(self, path: Path) -> Iterator[Path]:
+        """Yield path and every directory below it, pre-order, not following symlinks."""
+        yield path
+        for name, is_dir, _ in self._list_dir(path):
+            if is_dir:
+                yield from self._iter_dirs(path / name)
+
+    def _get_suffix_buckets(self, base: Path) -> dict[str, list[Path]]:
+        """Group every entry below base by its last extension, in glob order."""
+        buckets = self._suffix_buckets.get(base)
+        if buckets is None:
+            buckets = {}
+            for directory in self._iter_dirs(base):
+                for name, _, _ in self._list_dir(directory):
+                    _, dot, ext = name.rpartition(".")
+                    if dot:
+                        buckets.setdefault(_normcase("." + ext), []).append(
+                            directory / name
+                        )
+            self._suffix_buckets[base] = buckets
+        return buckets
+
+    # ------------------------------------------------------------------
+    # Pattern matching (mirrors pathlib's selectors)
+    # ------------------------------------------------------------------
+
+    def _matcher(self, part: str) -> Callable[[str], object]:
+        matcher = self._matchers.get(part)
+        if matcher is None:
+            flags = re.IGNORECASE if os.name == "nt" else 0
+            matcher = re.compile(fnmatch.translate(part), flags).fullmatch
+            self._matchers[part] = matcher
+        return matcher
+
+    def _select_recursive(self, base: Path, parts: list[str]) -> Iterator[Path]:
+        yielded: set[Path] = set()
+        for path in self._select(base, parts):
+            if path not in yielded:
+                yielded.add(path)
+                yield path
+
+    def _select(self, parent: Path, parts: list[str]) -> Iterator[Path]:
+        if not parts:
+            yield parent
+            return
+
+        part, rest = parts[0], parts[1:]
+
+        if part == "**":
+            for directory in self._iter_dirs(parent):
+                yield from self._select(directory, rest)
+            return
+
+        if any(char in part for char in "*?["):
+            match = self._matcher(part)
+            for name, is_dir, is_symlink in self._list_dir(parent):
+                if rest and not (is_dir or (is_symlink and (parent / name).is_dir())):
+                    continue
+                if match(name):
+                    yield from self._select(parent / name, rest)
+            return
+
+        path = parent / part
+        if self._has_entry(parent, part, need_dir=bool(rest)):
+            yield from self._select(path, rest)
+
+    def _has_entry(self, parent: Path, name: str, need_dir: bool) -> bool:
+        """Check for a literal child (following symlinks, like Path.exists/is_dir)."""
+        wanted = _normcase(name)
+        for entry_name, is_dir, is_symlink in self._list_dir(parent):
+            if _normcase(entry_name) != wanted:
+                continue
+            if is_symlink:
+                path = parent / name
+                return path.is_dir() if need_dir else path.exists()
+            return is_dir if need_dir else True
+        if sys.platform == "darwin":
+            # Case-insensitive volumes resolve names the listing spells differently
+            path = parent / name
+            return path.is_dir() if need_dir else path.exists()
+        return False
@@ -12,13 +12,19 @@ from pathlib import Path
 from typing import Any
 
 from .base import BaseAnalyzer
+from .file_manifest import FileManifest
 
 
 class FrameworkAnalyzer(BaseAnalyzer):
     """Analyzes and detects programming languages and frameworks."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(path, manifest)
         self.analysis = analysis
 
     def detect_language_and_framework(self) -> None:
@@ -76,7 +82,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
             self._detect_rust_framework(content)
 
         # Swift/iOS detection (check BEFORE Ruby - iOS projects often have Gemfile for CocoaPods/Fastlane)
-        elif self._exists("Package.swift") or any(self.path.glob("*.xcodeproj")):
+        elif self._exists("Package.swift") or self._glob("*.xcodeproj"):
             self.analysis["language"] = "Swift"
             if self._exists("Package.swift"):
                 self.analysis["package_manager"] = "Swift Package Manager"
@@ -304,7 +310,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
         try:
             # Scan Swift files for imports, excluding hidden/vendor dirs
             swift_files = []
-            for swift_file in self.path.rglob("*.swift"):
+            for swift_file in self._glob("**/*.swift"):
                 # Skip hidden directories, node_modules, .worktrees, etc.
                 if any(
                     part.startswith(".") or part in ("node_modules", "Pods", "Carthage")
@@ -384,7 +390,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
                     dependencies.append(name)
 
         # Also check xcodeproj for XCRemoteSwiftPackageReference
-        for xcodeproj in self.path.glob("*.xcodeproj"):
+        for xcodeproj in self._glob("*.xcodeproj"):
             pbxproj = xcodeproj / "project.pbxproj"
             if pbxproj.exists():
                 try:
@@ -3,22 +3,63 @@ Project Analyzer Module
 =======================
 
 Analyzes entire projects, detecting monorepo structures, services, infrastructure, and conventions.
+
+Services of a monorepo are analyzed in parallel worker processes. Each worker
+shares one FileManifest across all detectors of its service, so a service
+tree is listed once rather than once per glob.
 """
 
 from __future__ import annotations
 
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
+from .file_manifest import FileManifest
 from .service_analyzer import ServiceAnalyzer
 
+logger = logging.getLogger(__name__)
+
+# Max worker processes for per-service analysis (0 = one per CPU)
+DEFAULT_MAX_WORKERS = 0
+
+
+def _get_max_workers() -> int:
+    """Get the service analysis worker count, read at runtime for testability."""
+    try:
+        value = int(
+            os.environ.get("PROJECT_ANALYZER_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))
+        )
+    except (ValueError, TypeError):
+        value = DEFAULT_MAX_WORKERS
+    if value <= 0:
+        value = os.cpu_count() or 1
+    return value
+
+
+def _analyze_service(job: tuple[Path, str]) -> dict[str, Any]:
+    """Analyze one service (process pool worker)."""
+    service_path, service_name = job
+    return ServiceAnalyzer(service_path, service_name).analyze()
+
 
 class ProjectAnalyzer:
     """Analyzes an entire project, detecting monorepo structure and all services."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, max_workers: int | None = None):
+        """
+        Args:
+            project_dir: Path to the project root
+            max_workers: Max processes for per-service analysis (1 = analyze
+                services in this process). Defaults to
+                PROJECT_ANALYZER_MAX_WORKERS, or one per CPU.
+        """
         self.project_dir = project_dir.resolve()
+        self.max_workers = max_workers
+        self.manifest = FileManifest(self.project_dir)
         self.index = {
             "project_root": str(self.project_dir),
             "project_type": "single",  # or "monorepo"
@@ -80,6 +121,7 @@ class ProjectAnalyzer:
     def _find_and_analyze_services(self) -> None:
         """Find all services and analyze each."""
         services = {}
+        jobs: list[tuple[Path, str]] = []
 
         if self.index["project_type"] == "monorepo":
             # Look for services in common locations
@@ -109,21 +151,38 @@ class ProjectAnalyzer:
                     if has_root_file or (
                         location == self.project_dir and is_service_name
                     ):
-                        analyzer = ServiceAnalyzer(item, item.name)
-                        service_info = analyzer.analyze()
-                        if service_info.get(
-                            "language"
-                        ):  # Only include if we detected something
-                            services[item.name] = service_info
+                        jobs.append((item, item.name))
         else:
             # Single project - analyze root
-            analyzer = ServiceAnalyzer(self.project_dir, "main")
-            service_info = analyzer.analyze()
-            if service_info.get("language"):
-                services["main"] = service_info
+            jobs.append((self.project_dir, "main"))
+
+        for (_, name), service_info in zip(jobs, self._analyze_services(jobs)):
+            if service_info.get("language"):  # Only include if we detected something
+                services[name] = service_info
 
         self.index["services"] = services
 
+    def _analyze_services(self, jobs: list[tuple[Path, str]]) -> list[dict[str, Any]]:
+        """
+        Analyze services, in worker processes when there are several.
+
+        Returns:
+            Service analyses in the same order as jobs
+        """
+        max_workers = self.max_workers or _get_max_workers()
+        max_workers = min(max_workers, len(jobs))
+        if max_workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                    return list(pool.map(_analyze_service, jobs))
+            except (OSError, RuntimeError, NotImplementedError) as e:
+                # No process support (sandboxes, frozen apps) - analyze in-process
+                logger.debug(f"Parallel service analysis unavailable: {e}")
+
+        return [
+            ServiceAnalyzer(path, name, self.manifest).analyze() for path, name in jobs
+        ]
+
     def _analyze_infrastructure(self) -> None:
         """Analyze infrastructure configuration."""
         infra = {}
@@ -144,9 +203,9 @@ class ProjectAnalyzer:
         # Docker directory
         docker_dir = self.project_dir / "docker"
         if docker_dir.exists():
-            dockerfiles = list(docker_dir.glob("Dockerfile*")) + list(
-                docker_dir.glob("*.Dockerfile")
-            )
+            dockerfiles = self.manifest.glob(
+                docker_dir, "Dockerfile*"
+            ) + self.manifest.glob(docker_dir, "*.Dockerfile")
             if dockerfiles:
                 infra["docker_directory"] = "docker/"
                 infra["dockerfiles"] = [
@@ -156,7 +215,9 @@ class ProjectAnalyzer:
         # CI/CD
         if (self.project_dir / ".github" / "workflows").exists():
             infra["ci"] = "GitHub Actions"
-            workflows = list((self.project_dir / ".github" / "workflows").glob("*.yml"))
+            workflows = self.manifest.glob(
+                self.project_dir / ".github" / "workflows", "*.yml"
+            )
             infra["ci_workflows"] = [f.name for f in workflows]
         elif (self.project_dir / ".gitlab-ci.yml").exists():
             infra["ci"] = "GitLab CI"
@@ -15,6 +15,7 @@ import re
 from pathlib import Path
 
 from .base import BaseAnalyzer
+from .file_manifest import FileManifest
 
 
 class RouteDetector(BaseAnalyzer):
@@ -23,8 +24,8 @@ class RouteDetector(BaseAnalyzer):
     # Directories to exclude from route detection
     EXCLUDED_DIRS = {"node_modules", ".venv", "venv", "__pycache__", ".git"}
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    def __init__(self, path: Path, manifest: FileManifest | None = None):
+        super().__init__(path, manifest)
 
     def _should_include_file(self, file_path: Path) -> bool:
         """Check if file should be included (not in excluded directories)."""
@@ -61,7 +62,7 @@ class RouteDetector(BaseAnalyzer):
         """Detect FastAPI routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f for f in self._glob("**/*.py") if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
@@ -125,7 +126,7 @@ class RouteDetector(BaseAnalyzer):
         """Detect Flask routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f for f in self._glob("**/*.py") if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
@@ -174,7 +175,7 @@ class RouteDetector(BaseAnalyzer):
         """Detect Django routes from urls.py files."""
         routes = []
         url_files = [
-            f for f in self.path.glob("**/urls.py") if self._should_include_file(f)
+            f for f in self._glob("**/urls.py") if self._should_include_file(f)
         ]
 
         for file_path in url_files:
@@ -209,12 +210,8 @@ class RouteDetector(BaseAnalyzer):
     def _detect_express_routes(self) -> list[dict]:
         """Detect Express/Fastify/Koa routes."""
         routes = []
-        js_files = [
-            f for f in self.path.glob("**/*.js") if self._should_include_file(f)
-        ]
-        ts_files = [
-            f for f in self.path.glob("**/*.ts") if self._should_include_file(f)
-        ]
+        js_files = [f for f in self._glob("**/*.js") if self._should_include_file(f)]
+        ts_files = [f for f in self._glob("**/*.ts") if self._should_include_file(f)]
         files_to_check = js_files + ts_files
         for file_path in files_to_check:
             try:
@@ -270,7 +267,7 @@ class RouteDetector(BaseAnalyzer):
             # Find all route.ts/js files
             route_files = [
                 f
-                for f in app_dir.glob("**/route.{ts,js,tsx,jsx}")
+                for f in self._glob("**/route.{ts,js,tsx,jsx}", app_dir)
                 if self._should_include_file(f)
             ]
             for route_file in route_files:
@@ -308,7 +305,7 @@ class RouteDetector(BaseAnalyzer):
         if pages_api.exists():
             api_files = [
                 f
-                for f in pages_api.glob("**/*.{ts,js,tsx,jsx}")
+                for f in self._glob("**/*.{ts,js,tsx,jsx}", pages_api)
                 if self._should_include_file(f)
             ]
             for api_file in api_files:
@@ -342,9 +339,7 @@ class RouteDetector(BaseAnalyzer):
     def _detect_go_routes(self) -> list[dict]:
         """Detect Go framework routes (Gin, Echo, Chi, Fiber)."""
         routes = []
-        go_files = [
-            f for f in self.path.glob("**/*.go") if self._should_include_file(f)
-        ]
+        go_files = [f for f in self._glob("**/*.go") if self._should_include_file(f)]
 
         for file_path in go_files:
             try:
@@ -378,9 +373,7 @@ class RouteDetector(BaseAnalyzer):
     def _detect_rust_routes(self) -> list[dict]:
         """Detect Rust framework routes (Axum, Actix)."""
         routes = []
-        rust_files = [
-            f for f in self.path.glob("**/*.rs") if self._should_include_file(f)
-        ]
+        rust_files = [f for f in self._glob("**/*.rs") if self._should_include_file(f)]
 
         for file_path in rust_files:
             try:
@@ -15,6 +15,7 @@ from typing import Any
 from .base import BaseAnalyzer
 from .context_analyzer import ContextAnalyzer
 from .database_detector import DatabaseDetector
+from .file_manifest import FileManifest
 from .framework_analyzer import FrameworkAnalyzer
 from .route_detector import RouteDetector
 
@@ -22,8 +23,13 @@ from .route_detector import RouteDetector
 class ServiceAnalyzer(BaseAnalyzer):
     """Analyzes a single service/package within a project."""
 
-    def __init__(self, service_path: Path, service_name: str):
-        super().__init__(service_path)
+    def __init__(
+        self,
+        service_path: Path,
+        service_name: str,
+        manifest: FileManifest | None = None,
+    ):
+        super().__init__(service_path, manifest)
         self.name = service_name
         self.analysis = {
             "name": service_name,
@@ -58,7 +64,7 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_language_and_framework(self) -> None:
         """Detect primary language and framework."""
-        framework_analyzer = FrameworkAnalyzer(self.path, self.analysis)
+        framework_analyzer = FrameworkAnalyzer(self.path, self.analysis, self.manifest)
         framework_analyzer.detect_language_and_framework()
 
     def _detect_service_type(self) -> None:
@@ -250,12 +256,12 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_environment_variables(self) -> None:
         """Detect environment variables."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_environment_variables()
 
     def _detect_api_routes(self) -> None:
         """Detect API routes."""
-        route_detector = RouteDetector(self.path)
+        route_detector = RouteDetector(self.path, self.manifest)
         routes = route_detector.detect_all_routes()
 
         if routes:
@@ -272,7 +278,7 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_database_models(self) -> None:
         """Detect database models."""
-        db_detector = DatabaseDetector(self.path)
+        db_detector = DatabaseDetector(self.path, self.manifest)
         models = db_detector.detect_all_models()
 
         if models:
@@ -284,30 +290,30 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def _detect_external_services(self) -> None:
         """Detect external services."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_external_services()
 
     def _detect_auth_patterns(self) -> None:
         """Detect authentication patterns."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_auth_patterns()
 
     def _detect_migrations(self) -> None:
         """Detect database migrations."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_migrations()
 
     def _detect_background_jobs(self) -> None:
         """Detect background jobs."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_background_jobs()
 
     def _detect_api_documentation(self) -> None:
         """Detect API documentation."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_api_documentation()
 
     def _detect_monitoring(self) -> None:
         """Detect monitoring setup."""
-        context = ContextAnalyzer(self.path, self.analysis)
+        context = ContextAnalyzer(self.path, self.analysis, self.manifest)
         context.detect_monitoring()
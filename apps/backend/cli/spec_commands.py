@@ -13,8 +13,7 @@ _PARENT_DIR = Path(__file__).parent.parent
 if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
-from progress import count_subtasks
-from workspace import get_existing_build_worktree
+from core.spec_index import SpecStatusIndex
 
 from .utils import get_specs_dir
 
@@ -35,57 +34,23 @@ def list_specs(project_dir: Path) -> list[dict]:
     if not specs_dir.exists():
         return specs
 
-    for spec_folder in sorted(specs_dir.iterdir()):
-        if not spec_folder.is_dir():
-            continue
-
-        # Parse folder name (e.g., "001-initial-app")
-        folder_name = spec_folder.name
-        parts = folder_name.split("-", 1)
-        if len(parts) != 2 or not parts[0].isdigit():
-            continue
-
-        number = parts[0]
-        name = parts[1]
-
-        # Check for spec.md
-        spec_file = spec_folder / "spec.md"
-        if not spec_file.exists():
-            continue
-
-        # Check for existing build in worktree
-        has_build = get_existing_build_worktree(project_dir, folder_name) is not None
-
-        # Check progress via implementation_plan.json
-        plan_file = spec_folder / "implementation_plan.json"
-        if plan_file.exists():
-            completed, total = count_subtasks(spec_folder)
-            if total > 0:
-                if completed == total:
-                    status = "complete"
-                else:
-                    status = "in_progress"
-                progress = f"{completed}/{total}"
-            else:
-                status = "initialized"
-                progress = "0/0"
-        else:
-            status = "pending"
-            progress = "-"
+    # Statuses come from the spec index; only changed plans are parsed
+    for entry in SpecStatusIndex(specs_dir, project_dir).load():
+        status = entry["status"]
 
         # Add build indicator
-        if has_build:
+        if entry["has_build"]:
             status = f"{status} (has build)"
 
         specs.append(
             {
-                "number": number,
-                "name": name,
-                "folder": folder_name,
-                "path": spec_folder,
+                "number": entry["number"],
+                "name": entry["name"],
+                "folder": entry["folder"],
+                "path": specs_dir / entry["folder"],
                 "status": status,
-                "progress": progress,
-                "has_build": has_build,
+                "progress": entry["progress"],
+                "has_build": entry["has_build"],
             }
         )
 
@@ -263,9 +263,9 @@ def _detect_parallel_task_conflicts(
     """
     Detect potential conflicts between this task and other active tasks.
 
-    Uses existing evolution data to check if any of this task's files
-    have been modified by other active tasks. This is a lightweight check
-    that doesn't require re-processing all files.
+    Uses the evolution store's file -> task index to check if any of this
+    task's files have been modified by other active tasks. This is a
+    lightweight check that doesn't load any evolution records.
 
     Args:
         project_dir: Project root directory
@@ -276,39 +276,19 @@ def _detect_parallel_task_conflicts(
         List of conflict dictionaries with 'file' and 'tasks' keys
     """
     try:
-        from merge import MergeOrchestrator
+        from merge.file_evolution import EvolutionStorage
 
-        # Initialize orchestrator just to access evolution data
-        orchestrator = MergeOrchestrator(
-            project_dir,
-            enable_ai=False,
-            dry_run=True,
-        )
-
-        # Get all active tasks from evolution data
-        active_tasks = orchestrator.evolution_tracker.get_active_tasks()
+        storage = EvolutionStorage(project_dir, project_dir / ".auto-claude")
 
-        # Remove current task from active tasks
-        other_active_tasks = active_tasks - {current_task_id}
-
-        if not other_active_tasks:
-            return []
-
-        # Convert current task files to a set for fast lookup
-        current_files_set = set(current_task_files)
-
-        # Get files modified by other active tasks
+        # Find files modified by both this task and other active task(s)
         conflicts = []
-        other_task_files = orchestrator.evolution_tracker.get_files_modified_by_tasks(
-            list(other_active_tasks)
-        )
-
-        # Find intersection - files modified by both this task and other tasks
-        for file_path, tasks in other_task_files.items():
-            if file_path in current_files_set:
-                # This file was modified by both current task and other task(s)
-                all_tasks = [current_task_id] + tasks
-                conflicts.append({"file": file_path, "tasks": all_tasks})
+        file_tasks = storage.get_active_tasks_by_file(current_task_files)
+        for file_path, tasks in file_tasks.items():
+            other_tasks = [t for t in tasks if t != current_task_id]
+            if other_tasks:
+                conflicts.append(
+                    {"file": file_path, "tasks": [current_task_id] + other_tasks}
+                )
 
         return conflicts
 
@@ -321,6 +301,34 @@ def _detect_parallel_task_conflicts(
         return []
 
 
+def _release_task_files(project_dir: Path, task_id: str, discarded: bool) -> None:
+    """
+    Remove a merged or discarded task from the active file -> task index.
+
+    A merged task's snapshots are marked completed (its history is kept for
+    later merges); a discarded task's snapshots and baselines are deleted.
+
+    Args:
+        project_dir: Project root directory
+        task_id: ID of the task (spec name)
+        discarded: True if the build was discarded rather than merged
+    """
+    try:
+        from merge.file_evolution import EvolutionStorage
+
+        storage = EvolutionStorage(project_dir, project_dir / ".auto-claude")
+        if discarded:
+            storage.remove_task(task_id)
+        else:
+            storage.complete_task(task_id)
+    except Exception as e:
+        # Stale entries only cause extra conflict warnings
+        debug_warning(
+            "workspace_commands",
+            f"Failed to update evolution index for {task_id}: {e}",
+        )
+
+
 # Import debug utilities
 try:
     from debug import (
@@ -388,6 +396,10 @@ def handle_merge_command(
         project_dir, spec_name, no_commit=no_commit, base_branch=base_branch
     )
 
+    if success:
+        # The merged task no longer counts as a parallel active task
+        _release_task_files(project_dir, spec_name, discarded=False)
+
     # Generate commit message suggestion if staging succeeded (no_commit mode)
     if success and no_commit:
         _generate_and_save_commit_message(project_dir, spec_name)
@@ -484,7 +496,8 @@ def handle_discard_command(project_dir: Path, spec_name: str) -> None:
         project_dir: Project root directory
         spec_name: Name of the spec
     """
-    discard_existing_build(project_dir, spec_name)
+    if discard_existing_build(project_dir, spec_name):
+        _release_task_files(project_dir, spec_name, discarded=True)
 
 
 def handle_list_worktrees_command(project_dir: Path) -> None:
@@ -12,6 +12,7 @@ from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
 from .pattern_discovery import PatternDiscoverer
 from .search import CodeSearcher
+from .search_index import SearchIndex
 from .serialization import load_context, save_context, serialize_context
 from .service_matcher import ServiceMatcher
 from .cross_provider_context import (
@@ -30,6 +31,7 @@ __all__ = [
     "TaskContext",
     # Components
     "CodeSearcher",
+    "SearchIndex",
     "ServiceMatcher",
     "KeywordExtractor",
     "FileCategorizer",
@@ -16,6 +16,7 @@ from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
 from .pattern_discovery import PatternDiscoverer
 from .search import CodeSearcher
+from .search_index import SearchIndex
 from .service_matcher import ServiceMatcher
 
 
@@ -27,11 +28,12 @@ class ContextBuilder:
         self.project_index = project_index or self._load_project_index()
 
         # Initialize components
-        self.searcher = CodeSearcher(self.project_dir)
+        self.search_index = SearchIndex(self.project_dir)
+        self.searcher = CodeSearcher(self.project_dir, self.search_index)
         self.service_matcher = ServiceMatcher(self.project_index)
         self.keyword_extractor = KeywordExtractor()
         self.categorizer = FileCategorizer()
-        self.pattern_discoverer = PatternDiscoverer(self.project_dir)
+        self.pattern_discoverer = PatternDiscoverer(self.project_dir, self.search_index)
 
     def _load_project_index(self) -> dict:
         """Load project index from file or create new one (.auto-claude is the installed instance)."""
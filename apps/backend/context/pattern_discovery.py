@@ -8,13 +8,15 @@ Discovers code patterns from reference files to guide implementation.
 from pathlib import Path
 
 from .models import FileMatch
+from .search_index import SearchIndex, is_indexable_keyword
 
 
 class PatternDiscoverer:
     """Discovers code patterns from reference files."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, index: SearchIndex | None = None):
         self.project_dir = project_dir.resolve()
+        self.index = index
 
     def discover_patterns(
         self,
@@ -36,6 +38,8 @@ class PatternDiscoverer:
         patterns = {}
 
         for match in reference_files[:max_files]:
+            if self._index_rules_out(match.path, keywords, patterns):
+                continue
             try:
                 file_path = self.project_dir / match.path
                 content = file_path.read_text(encoding="utf-8", errors="ignore")
@@ -63,3 +67,22 @@ class PatternDiscoverer:
                 continue
 
         return patterns
+
+    def _index_rules_out(
+        self, rel_path: str, keywords: list[str], patterns: dict[str, str]
+    ) -> bool:
+        """
+        Check via the search index that a file cannot add a new pattern.
+
+        Returns False (read the file) whenever the index cannot answer exactly.
+        """
+        if self.index is None or not self.index.is_current(rel_path):
+            return False
+        if not all(is_indexable_keyword(k) for k in keywords):
+            return False
+        file_id = self.index.file_id(rel_path)
+        return not any(
+            f"{keyword}_pattern" not in patterns
+            and file_id in self.index.lookup(keyword)
+            for keyword in keywords
+        )
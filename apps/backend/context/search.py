@@ -3,19 +3,24 @@ Code Search Functionality
 ==========================
 
 Search codebase for relevant files based on keywords.
+
+Searches are answered from the persistent SearchIndex when every keyword is
+indexable; otherwise files are scanned directly.
 """
 
 from pathlib import Path
 
 from .constants import CODE_EXTENSIONS, SKIP_DIRS
 from .models import FileMatch
+from .search_index import SearchIndex, is_indexable_keyword
 
 
 class CodeSearcher:
     """Searches code files for relevant matches."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, index: SearchIndex | None = None):
         self.project_dir = project_dir.resolve()
+        self.index = index
 
     def search_service(
         self,
@@ -34,10 +39,96 @@ class CodeSearcher:
         Returns:
             List of FileMatch objects sorted by relevance
         """
-        matches = []
-
         if not service_path.exists():
-            return matches
+            return []
+
+        indexable = all(is_indexable_keyword(k) for k in keywords)
+        if self.index is not None and indexable:
+            rel_paths = self.index.refresh(service_path)
+            if rel_paths is not None:
+                return self._search_index(rel_paths, service_name, keywords)
+
+        return self._scan_service(service_path, service_name, keywords)
+
+    def _search_index(
+        self,
+        rel_paths: list[str],
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """
+        Score files from the search index.
+
+        Produces the same matches as _scan_service; only the files that make
+        the final cut are read, to fetch their matching line text.
+
+        Args:
+            rel_paths: Indexed code files of the service, in walk order
+            service_name: Name of the service
+            keywords: Indexable keywords to search for
+
+        Returns:
+            List of FileMatch objects sorted by relevance
+        """
+        hits = [self.index.lookup(keyword) for keyword in keywords]
+
+        candidates = []
+        for rel_path in rel_paths:
+            file_id = self.index.file_id(rel_path)
+            if file_id is None:
+                continue
+
+            score = 0
+            matching_keywords = []
+            line_numbers = []
+            for keyword, keyword_hits in zip(keywords, hits):
+                hit = keyword_hits.get(file_id)
+                if hit:
+                    count, lines = hit
+                    score += min(count, 10)  # Cap at 10 per keyword
+                    matching_keywords.append(keyword)
+                    line_numbers.extend(lines)
+
+            if score > 0:
+                candidates.append(
+                    (rel_path, score, matching_keywords, line_numbers[:5])
+                )
+
+        # Sort by relevance (stable, so ties keep walk order like the scan)
+        candidates.sort(key=lambda c: c[1], reverse=True)
+
+        matches = []
+        for rel_path, score, matching_keywords, line_numbers in candidates[:20]:
+            try:
+                lines = (
+                    (self.project_dir / rel_path)
+                    .read_text(encoding="utf-8", errors="ignore")
+                    .split("\n")
+                )
+            except (OSError, UnicodeDecodeError):
+                lines = []
+            matches.append(
+                FileMatch(
+                    path=rel_path,
+                    service=service_name,
+                    reason=f"Contains: {', '.join(matching_keywords)}",
+                    relevance_score=score,
+                    matching_lines=[
+                        (n, lines[n - 1].strip()[:100] if n <= len(lines) else "")
+                        for n in line_numbers
+                    ],
+                )
+            )
+        return matches
+
+    def _scan_service(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """Search a service by reading every code file."""
+        matches = []
 
         for file_path in self._iter_code_files(service_path):
             try:
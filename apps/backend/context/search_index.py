@@ -0,0 +1,490 @@
+"""
+Persistent Keyword Search Index
+===============================
+
+On-disk inverted index backing CodeSearcher and PatternDiscoverer.
+
+Code files are tokenized into maximal runs of ``[a-z0-9_]`` over their
+lowercased content. Because search keywords are identifier-like, every
+substring occurrence of a keyword lies inside exactly one such run, so
+occurrence counts and matching line numbers derived from the postings are
+identical to scanning the raw file text.
+
+The index is a SQLite database at ``.auto-claude/search_index.db`` next to
+``project_index.json``:
+
+- ``files``: each indexed file with the mtime/size it was indexed at; only
+  new or changed files are re-read when a directory is refreshed
+- ``postings``: per token and file, the occurrence count and first matching
+  lines, so re-indexing a file rewrites only that file's rows
+- ``trigrams``: every 3-character substring of every token, so a keyword
+  lookup only tests the tokens sharing all of the keyword's trigrams instead
+  of the whole vocabulary
+
+Nothing is loaded up front; refresh() reads the file records of the
+directory it walks and lookup() reads the postings of matching tokens.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "search_index.db"
+# Single-file JSON index written by earlier versions (removed on open)
+LEGACY_INDEX_FILE = "search_index.json"
+INDEX_VERSION = 2
+
+# Keywords shorter than this are not indexed (KeywordExtractor emits len > 2)
+MIN_TOKEN_LENGTH = 3
+# Matching lines recorded per token per file (CodeSearcher shows 3 per keyword)
+LINES_PER_TOKEN = 3
+
+_TOKEN_RE = re.compile(rf"[a-z0-9_]{{{MIN_TOKEN_LENGTH},}}")
+
+# Files tokenized and written per transaction while refreshing
+UPDATE_BATCH_FILES = 500
+# Bound parameters per IN (...) query (SQLite's default limit is 999)
+_QUERY_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tokens (
+    id INTEGER PRIMARY KEY,
+    token TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS trigrams (
+    trigram TEXT NOT NULL,
+    token_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, token_id)
+) WITHOUT ROWID;
+-- lines: first matching line numbers, comma-separated
+CREATE TABLE IF NOT EXISTS postings (
+    token_id INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    lines TEXT NOT NULL,
+    PRIMARY KEY (token_id, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file_id);
+"""
+
+
+def is_indexable_keyword(keyword: str) -> bool:
+    """Check whether a keyword can be answered exactly from the index."""
+    return _TOKEN_RE.fullmatch(keyword) is not None
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _chunks(items: list, size: int = _QUERY_CHUNK):
+    for i in range(0, len(items), size):
+        yield items[i : i + size]
+
+
+def tokenize_content(content: str) -> dict[str, list[int]]:
+    """
+    Tokenize file content into postings.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        Mapping of token -> [occurrence count, first matching line numbers...]
+    """
+    tokens: dict[str, list[int]] = {}
+    for line_no, line in enumerate(content.lower().split("\n"), 1):
+        for token in _TOKEN_RE.findall(line):
+            posting = tokens.get(token)
+            if posting is None:
+                tokens[token] = [1, line_no]
+                continue
+            posting[0] += 1
+            if len(posting) <= LINES_PER_TOKEN and posting[-1] != line_no:
+                posting.append(line_no)
+    return tokens
+
+
+class SearchIndex:
+    """Incrementally maintained token -> file/line postings for a project."""
+
+    def __init__(self, project_dir: Path, index_file: Path | None = None):
+        self.project_dir = project_dir.resolve()
+        auto_claude_dir = self.project_dir / ".auto-claude"
+        self.index_file = index_file or (auto_claude_dir / INDEX_FILE)
+        self._lock = threading.RLock()
+        # rel_path -> (id, mtime_ns, size) for files read from the database
+        self._files: dict[str, tuple[int, int, int]] = {}
+        self._keyword_cache: dict[str, dict[int, tuple[int, list[int]]]] = {}
+        self._conn = self._connect()
+        if index_file is None:
+            try:
+                (auto_claude_dir / LEGACY_INDEX_FILE).unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index, falling back to memory if it cannot be stored."""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.index_file, timeout=30.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._init_schema(conn)
+            return conn
+        except (OSError, sqlite3.Error) as e:
+            # The index is only a cache; keep it for this instance
+            logger.warning(f"Search index unavailable, not persisting it: {e}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self._init_schema(conn)
+            return conn
+
+    @staticmethod
+    def _init_schema(conn: sqlite3.Connection) -> None:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            # Derived data only - rebuilt by refresh()
+            conn.executescript(
+                "DROP TABLE IF EXISTS files;"
+                "DROP TABLE IF EXISTS tokens;"
+                "DROP TABLE IF EXISTS trigrams;"
+                "DROP TABLE IF EXISTS postings;"
+            )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _iter_code_entries(self, directory: Path):
+        """
+        Walk a directory for code files, pruning skipped directories.
+
+        Yields entries in the same order as ``Path.rglob("*")``: a directory's
+        own files first, then its subdirectories depth-first.
+        """
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif (
+                    os.path.splitext(entry.name)[1] in CODE_EXTENSIONS
+                    and entry.is_file()
+                ):
+                    yield entry
+            except OSError:
+                continue
+
+        for subdir in subdirs:
+            yield from self._iter_code_entries(Path(subdir))
+
+    def refresh(self, directory: Path) -> list[str] | None:
+        """
+        Bring the index up to date for a directory.
+
+        Only files whose mtime or size changed are re-read.
+
+        Args:
+            directory: Directory to refresh (must be inside the project)
+
+        Returns:
+            Code file paths (relative to the project) in walk order,
+            or None if the directory is outside the project or the index
+            could not be updated
+        """
+        try:
+            dir_rel = directory.relative_to(self.project_dir)
+        except ValueError:
+            return None
+
+        with self._lock:
+            try:
+                records = self._load_records(dir_rel)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to read search index: {e}")
+                return None
+
+            seen: list[str] = []
+            stale: dict[str, tuple[int, int]] = {}
+            for entry in self._iter_code_entries(directory):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                rel_path = str(Path(entry.path).relative_to(self.project_dir))
+                seen.append(rel_path)
+                record = records.get(rel_path)
+                if record is None or record[1:] != (stat.st_mtime_ns, stat.st_size):
+                    stale[rel_path] = (stat.st_mtime_ns, stat.st_size)
+
+            # Files previously indexed under this directory that have
+            # disappeared. Files under skipped directories were indexed by a
+            # narrower walk and are left alone.
+            seen_set = set(seen)
+            removed = []
+            for rel_path in records:
+                if rel_path in seen_set:
+                    continue
+                parts = Path(rel_path).relative_to(dir_rel).parts
+                if not any(part in SKIP_DIRS for part in parts[:-1]):
+                    removed.append(rel_path)
+
+            if stale or removed:
+                try:
+                    self._update(stale, removed)
+                except sqlite3.Error as e:
+                    logger.warning(f"Failed to update search index: {e}")
+                    self._files.clear()
+                    return None
+
+        return seen
+
+    def _load_records(self, dir_rel: Path) -> dict[str, tuple[int, int, int]]:
+        """Read the file records under a directory into the record cache."""
+        sql = "SELECT path, id, mtime_ns, size FROM files"
+        params: tuple[str, ...] = ()
+        if dir_rel.parts:
+            # Paths under "<dir>/": between "<dir>/" and "<dir>" + next char
+            prefix = str(dir_rel) + os.sep
+            sql += " WHERE path >= ? AND path < ?"
+            params = (prefix, prefix[:-1] + chr(ord(os.sep) + 1))
+        records = {
+            path: (file_id, mtime_ns, size)
+            for path, file_id, mtime_ns, size in self._conn.execute(sql, params)
+        }
+        self._files.update(records)
+        return records
+
+    def _update(self, stale: dict[str, tuple[int, int]], removed: list[str]) -> None:
+        """Re-index changed files and drop removed ones."""
+        self._keyword_cache.clear()
+        with self._conn:
+            for rel_path in removed:
+                record = self._files.pop(rel_path, None)
+                if record is not None:
+                    self._drop_postings([record[0]])
+                    self._conn.execute("DELETE FROM files WHERE id = ?", (record[0],))
+
+        stale_paths = list(stale)
+        for batch in _chunks(stale_paths, UPDATE_BATCH_FILES):
+            tokenized: dict[str, dict[str, list[int]] | None] = {}
+            for rel_path in batch:
+                try:
+                    content = (self.project_dir / rel_path).read_text(
+                        encoding="utf-8", errors="ignore"
+                    )
+                except (OSError, UnicodeDecodeError):
+                    tokenized[rel_path] = None
+                    continue
+                tokenized[rel_path] = tokenize_content(content)
+            with self._conn:
+                self._write_batch(tokenized, stale)
+
+    def _write_batch(
+        self,
+        tokenized: dict[str, dict[str, list[int]] | None],
+        stale: dict[str, tuple[int, int]],
+    ) -> None:
+        """Replace the postings of a batch of files (inside a transaction)."""
+        old_ids = [
+            self._files[rel_path][0]
+            for rel_path in tokenized
+            if rel_path in self._files
+        ]
+        self._drop_postings(old_ids)
+
+        all_tokens = {
+            token for tokens in tokenized.values() if tokens for token in tokens
+        }
+        token_ids = self._token_ids(sorted(all_tokens))
+
+        for rel_path, tokens in tokenized.items():
+            record = self._files.pop(rel_path, None)
+            if tokens is None:
+                # Unreadable: drop it so it is retried on the next refresh
+                if record is not None:
+                    self._conn.execute("DELETE FROM files WHERE id = ?", (record[0],))
+                continue
+            mtime_ns, size = stale[rel_path]
+            if record is not None:
+                file_id = record[0]
+                self._conn.execute(
+                    "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                    (mtime_ns, size, file_id),
+                )
+            else:
+                file_id = self._conn.execute(
+                    "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                    (rel_path, mtime_ns, size),
+                ).lastrowid
+            self._files[rel_path] = (file_id, mtime_ns, size)
+            self._conn.executemany(
+                "INSERT INTO postings (token_id, file_id, count, lines) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    (token_ids[token], file_id, count, ",".join(map(str, lines)))
+                    for token, (count, *lines) in tokens.items()
+                ),
+            )
+
+    def _token_ids(self, tokens: list[str]) -> dict[str, int]:
+        """Get ids for tokens, adding new ones (and their trigrams)."""
+        ids: dict[str, int] = {}
+        for chunk in _chunks(tokens):
+            placeholders = ",".join("?" * len(chunk))
+            ids.update(
+                self._conn.execute(
+                    f"SELECT token, id FROM tokens WHERE token IN ({placeholders})",
+                    chunk,
+                )
+            )
+        for token in tokens:
+            if token in ids:
+                continue
+            token_id = self._conn.execute(
+                "INSERT INTO tokens (token) VALUES (?)", (token,)
+            ).lastrowid
+            ids[token] = token_id
+            self._conn.executemany(
+                "INSERT INTO trigrams (trigram, token_id) VALUES (?, ?)",
+                ((trigram, token_id) for trigram in _trigrams(token)),
+            )
+        return ids
+
+    def _drop_postings(self, file_ids: list[int]) -> None:
+        """Delete files' postings and any tokens left without postings."""
+        for chunk in _chunks(file_ids):
+            placeholders = ",".join("?" * len(chunk))
+            token_ids = [
+                row[0]
+                for row in self._conn.execute(
+                    "SELECT DISTINCT token_id FROM postings "
+                    f"WHERE file_id IN ({placeholders})",
+                    chunk,
+                )
+            ]
+            self._conn.execute(
+                f"DELETE FROM postings WHERE file_id IN ({placeholders})", chunk
+            )
+            for token_id in token_ids:
+                if self._conn.execute(
+                    "SELECT 1 FROM postings WHERE token_id = ? LIMIT 1", (token_id,)
+                ).fetchone():
+                    continue
+                row = self._conn.execute(
+                    "SELECT token FROM tokens WHERE id = ?", (token_id,)
+                ).fetchone()
+                if row is None:
+                    continue
+                self._conn.executemany(
+                    "DELETE FROM trigrams WHERE trigram = ? AND token_id = ?",
+                    ((trigram, token_id) for trigram in _trigrams(row[0])),
+                )
+                self._conn.execute("DELETE FROM tokens WHERE id = ?", (token_id,))
+
+    def _record(self, rel_path: str) -> tuple[int, int, int] | None:
+        record = self._files.get(rel_path)
+        if record is None:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT id, mtime_ns, size FROM files WHERE path = ?", (rel_path,)
+                ).fetchone()
+            if row is not None:
+                record = self._files[rel_path] = tuple(row)
+        return record
+
+    def file_id(self, rel_path: str) -> int | None:
+        """Get the index id of a file, or None if it is not indexed."""
+        record = self._record(rel_path)
+        return record[0] if record else None
+
+    def is_current(self, rel_path: str) -> bool:
+        """Check whether a file's index entry matches its on-disk stat."""
+        record = self._record(rel_path)
+        if record is None:
+            return False
+        try:
+            stat = (self.project_dir / rel_path).stat()
+        except OSError:
+            return False
+        return record[1:] == (stat.st_mtime_ns, stat.st_size)
+
+    def lookup(self, keyword: str) -> dict[int, tuple[int, list[int]]]:
+        """
+        Find files containing a keyword as a substring.
+
+        Args:
+            keyword: Indexable keyword (see is_indexable_keyword)
+
+        Returns:
+            Mapping of file id -> (occurrence count, first matching line numbers)
+        """
+        cached = self._keyword_cache.get(keyword)
+        if cached is not None:
+            return cached
+
+        # Tokens containing the keyword contain all of its trigrams
+        trigrams = sorted(_trigrams(keyword))
+        candidates = " INTERSECT ".join(
+            ["SELECT token_id FROM trigrams WHERE trigram = ?"] * len(trigrams)
+        )
+        with self._lock:
+            per_token = {
+                token_id: token.count(keyword)
+                for token_id, token in self._conn.execute(
+                    f"SELECT id, token FROM tokens WHERE id IN ({candidates})",
+                    trigrams,
+                )
+                if keyword in token
+            }
+
+            counts: dict[int, int] = {}
+            lines: dict[int, set[int]] = {}
+            for chunk in _chunks(list(per_token)):
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT token_id, file_id, count, lines FROM postings "
+                    f"WHERE token_id IN ({placeholders})",
+                    chunk,
+                )
+                for token_id, file_id, count, line_nos in rows:
+                    counts[file_id] = (
+                        counts.get(file_id, 0) + count * per_token[token_id]
+                    )
+                    lines.setdefault(file_id, set()).update(
+                        int(n) for n in line_nos.split(",")
+                    )
+
+        result = {
+            file_id: (count, sorted(lines[file_id])[:LINES_PER_TOKEN])
+            for file_id, count in counts.items()
+        }
+        self._keyword_cache[keyword] = result
+        return result
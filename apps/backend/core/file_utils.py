@@ -23,6 +23,11 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import IO, Any, Literal
 
+# Files changed this recently may be rewritten again within the same mtime
+# tick at the same size, so (mtime, size) signatures taken inside the window
+# are not trusted by the caches keyed on them
+RACY_WINDOW_SECONDS = 2.0
+
 
 @contextmanager
 def atomic_write(
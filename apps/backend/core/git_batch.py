@@ -0,0 +1,287 @@
+"""
+Batched Git Object Access
+=========================
+
+Reads many blobs through one long-lived ``git cat-file --batch`` process and
+splits one multi-file ``git diff`` into per-file sections, instead of forking
+``git show`` / ``git diff`` once per file.
+
+Shared by merge orchestration (merge.git_utils) and the GitHub PR context
+gatherer.
+
+Usage:
+    with GitBatchSession(repo_path) as git:
+        contents = git.read_files(merge_base, changed_files)
+        diffs = git.diff_files(merge_base, "HEAD", changed_files)
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import threading
+import weakref
+from pathlib import Path
+
+from core.git_executable import get_git_executable, get_isolated_git_env
+
+# Start of a file section in unified git diff output
+_DIFF_HEADER_RE = re.compile(r"^diff --git ", re.MULTILINE)
+
+
+def _decode_git_text(data: bytes) -> str:
+    """
+    Decode git output the way ``subprocess.run(..., text=True)`` does.
+
+    Uses universal newlines so content matches what per-file ``git show``
+    calls returned.
+    """
+    text = data.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _close_process(process: subprocess.Popen) -> None:
+    """Shut down a git cat-file process."""
+    try:
+        if process.stdin:
+            process.stdin.close()
+        process.wait(timeout=5)
+    except Exception:
+        process.kill()
+
+
+def split_diff(diff_text: str) -> dict[str, str]:
+    """
+    Split a multi-file diff into sections keyed by (unquoted) path.
+
+    Sections whose header is quoted or names a rename are left out; callers
+    diff those paths individually.
+    """
+    sections: dict[str, str] = {}
+    starts = [m.start() for m in _DIFF_HEADER_RE.finditer(diff_text)]
+    starts.append(len(diff_text))
+
+    for start, end in zip(starts, starts[1:]):
+        section = diff_text[start:end]
+        header = section[: section.find("\n")]
+        names = header[len("diff --git ") :]
+        # Unquoted header for an unrenamed path: "a/<path> b/<path>"
+        half = (len(names) - 1) // 2
+        a_name, b_name = names[:half], names[half + 1 :]
+        if (
+            names[half : half + 1] == " "
+            and a_name.startswith("a/")
+            and b_name.startswith("b/")
+            and a_name[2:] == b_name[2:]
+        ):
+            sections[a_name[2:]] = section
+    return sections
+
+
+class GitBatchSession:
+    """
+    Long-lived git session for reading many objects and diffs cheaply.
+
+    File contents are read through one ``git cat-file --batch`` process
+    that stays open for the session's lifetime, and per-file diffs are
+    produced by a single ``git diff`` run split by file. This replaces one
+    ``git show`` / ``git diff`` fork per file with a few round-trips.
+
+    Usage:
+        with GitBatchSession(repo_path) as git:
+            contents = git.read_files(merge_base, changed_files)
+            diffs = git.diff_files(merge_base, "HEAD", changed_files)
+    """
+
+    def __init__(self, repo_path: Path):
+        """
+        Initialize the session.
+
+        Args:
+            repo_path: Repository (or worktree) directory to run git in
+        """
+        self.repo_path = Path(repo_path)
+        self._env = get_isolated_git_env()
+        self._process: subprocess.Popen | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> GitBatchSession:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the cat-file process (restarted on next use)."""
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._process = None
+            self._finalizer = None
+
+    def _get_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                [get_git_executable(), "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=self._env,
+            )
+            self._finalizer = weakref.finalize(self, _close_process, self._process)
+        return self._process
+
+    def read_objects(self, specs: list[str]) -> dict[str, bytes | None]:
+        """
+        Read raw blob contents in one round-trip.
+
+        Args:
+            specs: Object names such as ``"<commit>:<path>"``
+
+        Returns:
+            Dictionary mapping each spec to its bytes, or None if it does not
+            name a blob (or could not be read)
+        """
+        results: dict[str, bytes | None] = {}
+        # cat-file reads one spec per line; other specs need no batching
+        batchable = []
+        for spec in dict.fromkeys(specs):
+            if "\n" in spec:
+                results[spec] = None
+            else:
+                batchable.append(spec)
+        if not batchable:
+            return results
+
+        with self._lock:
+            process = self._get_process()
+            request = "".join(f"{spec}\n" for spec in batchable).encode("utf-8")
+
+            # Write from a thread so large outputs can't deadlock the pipes
+            def write_request() -> None:
+                try:
+                    process.stdin.write(request)
+                    process.stdin.flush()
+                except OSError:
+                    pass
+
+            writer = threading.Thread(target=write_request, daemon=True)
+            writer.start()
+            try:
+                for spec in batchable:
+                    header = process.stdout.readline()
+                    if not header:
+                        raise OSError("git cat-file exited unexpectedly")
+                    header = header.rstrip(b"\n")
+                    # "<spec> missing" / "<spec> ambiguous"; the spec may
+                    # itself contain spaces, so only the suffix is reliable
+                    if header.endswith((b" missing", b" ambiguous")):
+                        results[spec] = None
+                        continue
+                    # "<oid> <type> <size>"
+                    parts = header.rsplit(b" ", 2)
+                    if len(parts) != 3 or not parts[2].isdigit():
+                        raise OSError(f"unexpected git cat-file reply: {header!r}")
+                    size = int(parts[2])
+                    data = process.stdout.read(size + 1)[:size]
+                    results[spec] = data if parts[1] == b"blob" else None
+            except OSError:
+                # The stream is out of sync: restart the session next time
+                # and read the remaining objects one by one
+                process.kill()
+                self._process = None
+            finally:
+                writer.join()
+
+        for spec in batchable:
+            if spec not in results:
+                results[spec] = self._read_object_single(spec)
+        return results
+
+    def _read_object_single(self, spec: str) -> bytes | None:
+        """Read one blob with its own git process (None if unreadable)."""
+        try:
+            result = subprocess.run(
+                [get_git_executable(), "cat-file", "blob", spec],
+                cwd=self.repo_path,
+                capture_output=True,
+                env=self._env,
+            )
+        except OSError:
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def read_files(self, commit: str, file_paths: list[str]) -> dict[str, str | None]:
+        """
+        Read the contents of many files at one commit.
+
+        Args:
+            commit: Commit-ish to read from
+            file_paths: Paths relative to the repository root
+
+        Returns:
+            Dictionary mapping each path to its text content, or None if the
+            file does not exist at that commit
+        """
+        objects = self.read_objects([f"{commit}:{path}" for path in file_paths])
+        return {
+            path: None
+            if (data := objects.get(f"{commit}:{path}")) is None
+            else _decode_git_text(data)
+            for path in file_paths
+        }
+
+    def read_file(self, commit: str, file_path: str) -> str | None:
+        """Read one file at a commit (see read_files)."""
+        return self.read_files(commit, [file_path])[file_path]
+
+    def diff_files(self, base: str, head: str, file_paths: list[str]) -> dict[str, str]:
+        """
+        Get the ``git diff base..head -- <path>`` output for many files at once.
+
+        Runs a single diff (rename detection off, matching per-path diffs) and
+        splits it into per-file sections. Files whose section can't be
+        identified unambiguously are diffed individually.
+
+        Args:
+            base: Base commit-ish
+            head: Head commit-ish
+            file_paths: Paths relative to the repository root
+
+        Returns:
+            Dictionary mapping each path to its diff text ("" if unchanged or
+            if git could not diff it)
+        """
+        if not file_paths:
+            return {}
+
+        result = self._run_diff(["--no-renames", f"{base}..{head}"])
+        sections = split_diff(result) if result is not None else {}
+
+        diffs = {}
+        for path in file_paths:
+            section = sections.get(path)
+            if section is None:
+                # Quoted/unusual path or genuinely unchanged - ask git directly
+                section = self._run_diff([f"{base}..{head}", "--", path]) or ""
+            diffs[path] = section
+        return diffs
+
+    def _run_diff(self, args: list[str]) -> str | None:
+        """Run git diff, returning its decoded output or None on failure."""
+        try:
+            result = subprocess.run(
+                [get_git_executable(), "diff", *args],
+                cwd=self.repo_path,
+                capture_output=True,
+                env=self._env,
+            )
+        except OSError:
+            return None
+        if result.returncode != 0:
+            return None
+        return _decode_git_text(result.stdout)
@@ -0,0 +1,234 @@
+"""
+Implementation Plan Repository
+==============================
+
+Shared, stat-keyed cache of parsed implementation_plan.json files.
+
+Progress display, next-subtask selection, QA checks and the subtask tools
+all read the plan several times per agent turn. Instead of each reopening
+and parsing the file, they share a PlanSnapshot that is reparsed only when
+the file's (mtime_ns, size) changes. A snapshot indexes subtasks by id and
+counts them by status, so lookups and counts do not rescan every phase.
+
+Snapshots are shared between callers and must be treated as read-only;
+use update_subtask_status() (or load, modify and write the file yourself)
+to change the plan. Updates made through this module are applied to the
+cached snapshot and written atomically, without a reparse.
+
+Usage:
+    plan = get_plan(spec_dir)
+    if plan:
+        completed, total = plan.count("completed"), plan.total
+        subtask = plan.get_subtask("subtask-1-2")
+
+    update_subtask_status(spec_dir, "subtask-1-2", "completed", "Done")
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import Counter, OrderedDict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from core.file_utils import RACY_WINDOW_SECONDS, atomic_write
+
+PLAN_FILENAME = "implementation_plan.json"
+
+# Number of plans kept in memory (one per spec directory)
+MAX_CACHED_PLANS = 32
+
+
+def phase_subtasks(phase: dict[str, Any]) -> list[dict[str, Any]]:
+    """Get a phase's subtasks, accepting the legacy "chunks" key."""
+    return phase.get("subtasks", phase.get("chunks", []))
+
+
+def phase_key(phase: dict[str, Any], index: int) -> str:
+    """Key a phase by id (or phase number) as used in depends_on lists."""
+    phase_id = phase.get("id")
+    if phase_id is None:
+        phase_id = phase.get("phase")
+    return str(phase_id) if phase_id is not None else f"unknown:{index}"
+
+
+class PlanSnapshot:
+    """
+    A parsed implementation plan with subtask indexes.
+
+    Attributes:
+        data: The parsed plan (shared; do not modify)
+        total: Number of subtasks across all phases
+        status_counts: Subtask count by raw status ("pending" if missing)
+        phase_complete: Whether each phase (by phase_key) has all subtasks completed
+    """
+
+    def __init__(self, path: Path, data: dict[str, Any], mtime_ns: int, size: int):
+        self.path = path
+        self.data = data
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.trusted = False
+        self._reindex()
+
+    @property
+    def phases(self) -> list[dict[str, Any]]:
+        return self.data.get("phases", [])
+
+    def count(self, status: str) -> int:
+        """Number of subtasks with the given status."""
+        return self.status_counts.get(status, 0)
+
+    def get_subtask(self, subtask_id: str) -> dict[str, Any] | None:
+        """Find a subtask by id (first match, as a linear scan would)."""
+        location = self._subtasks_by_id.get(subtask_id)
+        return location[1] if location else None
+
+    def get_phase_for_subtask(self, subtask_id: str) -> dict[str, Any] | None:
+        """Find the phase containing a subtask."""
+        location = self._subtasks_by_id.get(subtask_id)
+        return location[0] if location else None
+
+    def _reindex(self) -> None:
+        self._subtasks_by_id: dict[str, tuple[dict, dict]] = {}
+        self.status_counts: Counter[str] = Counter()
+        self.phase_complete: dict[str, bool] = {}
+        self.total = 0
+        for index, phase in enumerate(self.phases):
+            subtasks = phase_subtasks(phase)
+            complete = True
+            for subtask in subtasks:
+                status = subtask.get("status", "pending")
+                self.status_counts[status] += 1
+                complete = complete and status == "completed"
+                subtask_id = subtask.get("id")
+                if subtask_id is not None:
+                    self._subtasks_by_id.setdefault(subtask_id, (phase, subtask))
+            self.phase_complete[phase_key(phase, index)] = complete
+            self.total += len(subtasks)
+
+
+_cache: OrderedDict[Path, PlanSnapshot] = OrderedDict()
+_lock = threading.RLock()
+
+
+def _plan_path(spec_dir: Path) -> Path:
+    return Path(spec_dir).resolve() / PLAN_FILENAME
+
+
+def _load(path: Path) -> PlanSnapshot:
+    """
+    Get the snapshot for a plan file, parsing it only if it changed.
+
+    Raises:
+        OSError: If the file cannot be read
+        json.JSONDecodeError, UnicodeDecodeError: If it is not valid JSON
+    """
+    stat = os.stat(path)
+    with _lock:
+        snapshot = _cache.get(path)
+        if (
+            snapshot is not None
+            and snapshot.trusted
+            and snapshot.mtime_ns == stat.st_mtime_ns
+            and snapshot.size == stat.st_size
+        ):
+            _cache.move_to_end(path)
+            return snapshot
+
+    read_at = time.time()
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, dict):
+        raise json.JSONDecodeError("Implementation plan must be an object", "", 0)
+
+    snapshot = PlanSnapshot(path, data, stat.st_mtime_ns, stat.st_size)
+    snapshot.trusted = read_at - stat.st_mtime_ns / 1e9 > RACY_WINDOW_SECONDS
+    _store(snapshot)
+    return snapshot
+
+
+def _store(snapshot: PlanSnapshot) -> None:
+    with _lock:
+        _cache[snapshot.path] = snapshot
+        _cache.move_to_end(snapshot.path)
+        while len(_cache) > MAX_CACHED_PLANS:
+            _cache.popitem(last=False)
+
+
+def get_plan(spec_dir: Path) -> PlanSnapshot | None:
+    """
+    Get the parsed implementation plan of a spec.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+
+    Returns:
+        Shared read-only PlanSnapshot, or None if the plan is missing or invalid
+    """
+    try:
+        return _load(_plan_path(spec_dir))
+    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+        return None
+
+
+def update_subtask_status(
+    spec_dir: Path, subtask_id: str, status: str, notes: str = ""
+) -> bool:
+    """
+    Update a subtask's status and write the plan atomically.
+
+    Args:
+        spec_dir: Directory containing implementation_plan.json
+        subtask_id: ID of the subtask to update
+        status: New status (pending, in_progress, completed, failed)
+        notes: Optional notes to add
+
+    Returns:
+        True if the subtask was found and updated, False otherwise
+
+    Raises:
+        OSError: If the plan cannot be read or written
+        json.JSONDecodeError, UnicodeDecodeError: If the plan is not valid JSON
+    """
+    path = _plan_path(spec_dir)
+    with _lock:
+        snapshot = _load(path)
+        subtask = snapshot.get_subtask(subtask_id)
+        if subtask is None:
+            return False
+
+        now = datetime.now(timezone.utc).isoformat()
+        subtask["status"] = status
+        if notes:
+            subtask["notes"] = notes
+        subtask["updated_at"] = now
+        snapshot.data["last_updated"] = now
+        snapshot._reindex()
+
+        content = json.dumps(snapshot.data, indent=2, ensure_ascii=False)
+        try:
+            with atomic_write(path) as f:
+                f.write(content)
+            stat = os.stat(path)
+        except OSError:
+            # The cached copy no longer matches the file
+            _cache.pop(path, None)
+            raise
+
+        snapshot.mtime_ns = stat.st_mtime_ns
+        snapshot.size = stat.st_size
+        # Trust our own write only if nothing else replaced the file since
+        snapshot.trusted = stat.st_size == len(content.encode("utf-8"))
+        _store(snapshot)
+        return True
+
+
+def clear_plan_cache() -> None:
+    """Forget all cached plans (for testing)."""
+    with _lock:
+        _cache.clear()
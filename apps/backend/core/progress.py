@@ -8,10 +8,11 @@ Uses subtask-based implementation plans (implementation_plan.json).
 Enhanced with colored output, icons, and better visual formatting.
 """
 
-import json
+import copy
 from pathlib import Path
 
 from core.plan_normalization import normalize_subtask_aliases
+from core.plan_repository import get_plan, phase_key, phase_subtasks
 from ui import (
     Icons,
     bold,
@@ -26,6 +27,9 @@ from ui import (
     warning,
 )
 
+# Subtask statuses that mean "not started yet"
+PENDING_STATUSES = ("pending", "not_started", "not started")
+
 
 def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     """
@@ -37,27 +41,10 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
-        return 0, 0
-
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        total = 0
-        completed = 0
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+    plan = get_plan(spec_dir)
+    if plan is None:
         return 0, 0
+    return plan.count("completed"), plan.total
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -67,8 +54,6 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
     result = {
         "completed": 0,
         "in_progress": 0,
@@ -77,25 +62,18 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         "total": 0,
     }
 
-    if not plan_file.exists():
+    plan = get_plan(spec_dir)
+    if plan is None:
         return result
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
-
-        return result
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return result
+    result["total"] = plan.total
+    for status in ("completed", "in_progress", "failed"):
+        result[status] = plan.count(status)
+    # Unknown statuses count as pending
+    result["pending"] = (
+        plan.total - result["completed"] - result["in_progress"] - result["failed"]
+    )
+    return result
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -181,12 +159,10 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json", encoding="utf-8") as f:
-                plan = json.load(f)
-
+        plan = get_plan(spec_dir)
+        if plan is not None:
             print("\nPhases:")
-            for phase in plan.get("phases", []):
+            for phase in plan.phases:
                 phase_subtasks = phase.get("subtasks", [])
                 phase_completed = sum(
                     1 for s in phase_subtasks if s.get("status") == "completed"
@@ -205,7 +181,7 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
                     deps = phase.get("depends_on", [])
                     all_deps_complete = True
                     for dep_id in deps:
-                        for p in plan.get("phases", []):
+                        for p in plan.phases:
                             if p.get("id") == dep_id or p.get("phase") == dep_id:
                                 p_subtasks = p.get("subtasks", [])
                                 if not all(
@@ -229,9 +205,6 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
                     print(
                         f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                     )
-
-        except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-            pass  # Ignore corrupted/unreadable progress files
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -287,9 +260,9 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = get_plan(spec_dir)
 
-    if not plan_file.exists():
+    if plan is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -301,103 +274,64 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    completed = plan.count("completed")
+    in_progress = plan.count("in_progress")
+    failed = plan.count("failed")
+    summary = {
+        "workflow_type": plan.data.get("workflow_type"),
+        "total_phases": len(plan.phases),
+        "total_subtasks": plan.total,
+        "completed_subtasks": completed,
+        "pending_subtasks": plan.total - completed - in_progress - failed,
+        "in_progress_subtasks": in_progress,
+        "failed_subtasks": failed,
+        "phases": [],
+    }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
+    for phase in plan.phases:
+        subtasks = [
+            {
+                "id": subtask.get("id"),
+                "description": subtask.get("description"),
+                "status": subtask.get("status", "pending"),
+                "service": subtask.get("service"),
+            }
+            for subtask in phase_subtasks(phase)
+        ]
+        summary["phases"].append(
+            {
                 "id": phase.get("id"),
                 "phase": phase.get("phase"),
                 "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
+                "depends_on": list(phase.get("depends_on", [])),
+                "subtasks": subtasks,
+                "completed": sum(1 for s in subtasks if s["status"] == "completed"),
+                "total": len(subtasks),
             }
+        )
 
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
-
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> dict | None:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    plan = get_plan(spec_dir)
+    if plan is None:
         return None
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
-
-        return None
+    for index, phase in enumerate(plan.phases):
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        if not plan.phase_complete[phase_key(phase, index)]:
+            subtasks = phase_subtasks(phase)
+            return {
+                "id": phase.get("id"),
+                "phase": phase.get("phase"),
+                "name": phase.get("name"),
+                "completed": sum(1 for s in subtasks if s.get("status") == "completed"),
+                "total": len(subtasks),
+            }
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    return None
 
 
 def get_next_subtask(spec_dir: Path) -> dict | None:
@@ -410,68 +344,51 @@ def get_next_subtask(spec_dir: Path) -> dict | None:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = get_plan(spec_dir)
+    if plan is None:
+        return None
 
-    if not plan_file.exists():
+    # Nothing can be pending if every subtask is accounted for elsewhere
+    pending = sum(plan.count(status) for status in PENDING_STATUSES)
+    if pending == 0:
         return None
 
-    try:
-        with open(plan_file, encoding="utf-8") as f:
-            plan = json.load(f)
-
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete: dict[str, bool] = {}
-        for i, phase in enumerate(phases):
-            phase_id_value = phase.get("id")
-            phase_id_raw = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            phase_id_key = (
-                str(phase_id_raw) if phase_id_raw is not None else f"unknown:{i}"
-            )
-            subtasks = phase.get("subtasks", phase.get("chunks", []))
-            phase_complete[phase_id_key] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
-
-        # Find next available subtask
-        for phase in phases:
-            phase_id_value = phase.get("id")
-            phase_id = (
-                phase_id_value if phase_id_value is not None else phase.get("phase")
-            )
-            depends_on_raw = phase.get("depends_on", [])
-            if isinstance(depends_on_raw, list):
-                depends_on = [str(d) for d in depends_on_raw if d is not None]
-            elif depends_on_raw is None:
-                depends_on = []
-            else:
-                depends_on = [str(depends_on_raw)]
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", phase.get("chunks", [])):
-                status = subtask.get("status", "pending")
-                if status in {"pending", "not_started", "not started"}:
-                    subtask_out, _changed = normalize_subtask_aliases(subtask)
-                    subtask_out["status"] = "pending"
-                    return {
-                        **subtask_out,
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                    }
+    for index, phase in enumerate(plan.phases):
+        # Completed phases have nothing left to pick
+        if plan.phase_complete[phase_key(phase, index)]:
+            continue
 
-        return None
+        depends_on_raw = phase.get("depends_on", [])
+        if isinstance(depends_on_raw, list):
+            depends_on = [str(d) for d in depends_on_raw if d is not None]
+        elif depends_on_raw is None:
+            depends_on = []
+        else:
+            depends_on = [str(depends_on_raw)]
+
+        # Check if dependencies are satisfied
+        if not all(plan.phase_complete.get(dep, False) for dep in depends_on):
+            continue
+
+        # Find first pending subtask in this phase
+        for subtask in phase_subtasks(phase):
+            if subtask.get("status", "pending") in PENDING_STATUSES:
+                # Copy so callers cannot modify the shared plan
+                subtask_out, _changed = normalize_subtask_aliases(
+                    copy.deepcopy(subtask)
+                )
+                subtask_out["status"] = "pending"
+                phase_id = phase.get("id")
+                return {
+                    **subtask_out,
+                    "phase_id": phase_id
+                    if phase_id is not None
+                    else phase.get("phase"),
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                }
 
-    except (OSError, json.JSONDecodeError, UnicodeDecodeError):
-        return None
+    return None
 
 
 def format_duration(seconds: float) -> str:
@@ -0,0 +1,199 @@
+"""
+Spec Status Index
+=================
+
+Persisted index of spec status for fast spec listing.
+
+Listing specs reports each spec's status, subtask progress and whether it
+has a build worktree. Deriving that means parsing every spec's
+implementation_plan.json, and the CLI and UI poll the list. The index in
+.auto-claude/specs/.spec_index.json records the result per spec together
+with the (mtime_ns, size) of spec.md and the plan it was derived from, so a
+listing reads one small file and stats two files per spec; only specs whose
+plan changed are parsed again.
+
+Worktree presence is taken from one listing of each worktree directory
+rather than two path checks per spec.
+
+Usage:
+    index = SpecStatusIndex(specs_dir, project_dir)
+    for entry in index.load():
+        print(entry["folder"], entry["status"], entry["progress"])
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+
+from core.file_utils import RACY_WINDOW_SECONDS, write_json_atomic
+from core.plan_repository import PLAN_FILENAME, get_plan
+
+SPEC_INDEX_FILENAME = ".spec_index.json"
+INDEX_VERSION = 1
+
+
+def _signature(path: str) -> list[int] | None:
+    """(mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _worktree_names(project_dir: Path) -> set[str]:
+    """Names of spec worktrees in the new and legacy locations."""
+    names: set[str] = set()
+    for directory in (
+        project_dir / ".auto-claude" / "worktrees" / "tasks",
+        project_dir / ".worktrees",
+    ):
+        try:
+            names.update(os.listdir(directory))
+        except OSError:
+            continue
+    return names
+
+
+def plan_status(completed: int, total: int, has_plan: bool) -> tuple[str, str]:
+    """
+    Derive a spec's (status, progress) from its subtask counts.
+
+    Returns:
+        status: "complete", "in_progress", "initialized" or "pending"
+        progress: "completed/total", or "-" without a plan
+    """
+    if not has_plan:
+        return "pending", "-"
+    if total == 0:
+        return "initialized", "0/0"
+    status = "complete" if completed == total else "in_progress"
+    return status, f"{completed}/{total}"
+
+
+class SpecStatusIndex:
+    """Status of every spec, reusing entries whose files are unchanged."""
+
+    def __init__(
+        self, specs_dir: Path, project_dir: Path, index_path: Path | None = None
+    ):
+        """
+        Initialize index.
+
+        Args:
+            specs_dir: The .auto-claude/specs directory
+            project_dir: Project root (for worktree presence)
+            index_path: Optional path of the index file
+                (default: specs_dir/.spec_index.json)
+        """
+        self.specs_dir = Path(specs_dir)
+        self.project_dir = Path(project_dir)
+        self.index_path = (
+            Path(index_path) if index_path else self.specs_dir / SPEC_INDEX_FILENAME
+        )
+        # Plans parsed (rather than served from the index) by the last load()
+        self.parsed_plans = 0
+
+    def load(self) -> list[dict]:
+        """
+        Get the status of all specs, sorted by folder name.
+
+        Only folders named "<number>-<name>" that contain spec.md are specs.
+
+        Returns:
+            List of dicts with keys: folder, number, name, status, progress,
+            completed, total, has_build
+        """
+        self.parsed_plans = 0
+        try:
+            with os.scandir(self.specs_dir) as entries:
+                folders = sorted(entry.name for entry in entries if entry.is_dir())
+        except OSError:
+            return []
+
+        index = self._load_index()
+        new_index: dict[str, dict] = {}
+        worktrees = _worktree_names(self.project_dir)
+        racy_after = (time.time() - RACY_WINDOW_SECONDS) * 1e9
+        specs = []
+
+        for folder in folders:
+            number, separator, name = folder.partition("-")
+            if not separator or not number.isdigit():
+                continue
+
+            spec_folder = os.path.join(self.specs_dir, folder)
+            spec_sig = _signature(os.path.join(spec_folder, "spec.md"))
+            if spec_sig is None:
+                continue
+            plan_sig = _signature(os.path.join(spec_folder, PLAN_FILENAME))
+
+            entry = index.get(folder)
+            if (
+                not isinstance(entry, dict)
+                or entry.get("spec") != spec_sig
+                or entry.get("plan") != plan_sig
+            ):
+                entry = self._build_entry(folder, spec_sig, plan_sig)
+            entry = {**entry, "has_build": folder in worktrees}
+
+            if plan_sig is None or plan_sig[0] < racy_after:
+                new_index[folder] = entry
+
+            specs.append(
+                {
+                    "folder": folder,
+                    "number": number,
+                    "name": name,
+                    "status": entry["status"],
+                    "progress": entry["progress"],
+                    "completed": entry["completed"],
+                    "total": entry["total"],
+                    "has_build": entry["has_build"],
+                }
+            )
+
+        self._save_index(index, new_index)
+        return specs
+
+    def _build_entry(
+        self, folder: str, spec_sig: list[int], plan_sig: list[int] | None
+    ) -> dict:
+        completed = total = 0
+        if plan_sig is not None:
+            self.parsed_plans += 1
+            plan = get_plan(self.specs_dir / folder)
+            if plan is not None:
+                completed, total = plan.count("completed"), plan.total
+        status, progress = plan_status(completed, total, plan_sig is not None)
+        return {
+            "spec": spec_sig,
+            "plan": plan_sig,
+            "status": status,
+            "progress": progress,
+            "completed": completed,
+            "total": total,
+        }
+
+    def _load_index(self) -> dict[str, dict]:
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        specs = data.get("specs")
+        return specs if isinstance(specs, dict) else {}
+
+    def _save_index(self, old: dict[str, dict], new: dict[str, dict]) -> None:
+        if new == old:
+            return
+        data = {"version": INDEX_VERSION, "specs": new}
+        try:
+            write_json_atomic(self.index_path, data)
+        except OSError:
+            pass  # Specs whose entry was not saved are derived again next time
@@ -33,6 +33,13 @@ from core.git_executable import get_git_executable, get_isolated_git_env, run_gi
 from core.git_provider import detect_git_provider
 from core.glab_executable import get_glab_executable, invalidate_glab_cache
 from core.model_config import get_utility_model_config
+from core.worktree_status import (
+    STATUS_CACHE_FILENAME,
+    WorktreeStatusCollector,
+    empty_stats,
+    parse_commit_date,
+    parse_shortstat,
+)
 from debug import debug_warning
 
 logger = logging.getLogger(__name__)
@@ -516,14 +523,7 @@ class WorktreeManager:
         """Get diff statistics for a worktree."""
         worktree_path = self.get_worktree_path(spec_name)
 
-        stats = {
-            "commit_count": 0,
-            "files_changed": 0,
-            "additions": 0,
-            "deletions": 0,
-            "last_commit_date": None,
-            "days_since_last_commit": None,
-        }
+        stats = empty_stats()
 
         if not worktree_path.exists():
             return stats
@@ -539,63 +539,15 @@ class WorktreeManager:
         result = self._run_git(
             ["log", "-1", "--format=%cd", "--date=iso"], cwd=worktree_path
         )
-        if result.returncode == 0 and result.stdout.strip():
-            try:
-                # Parse ISO date format: "2026-01-04 00:25:25 +0100"
-                date_str = result.stdout.strip()
-                # Convert git format to ISO format for fromisoformat()
-                # "2026-01-04 00:25:25 +0100" -> "2026-01-04T00:25:25+01:00"
-                parts = date_str.rsplit(" ", 1)
-                if len(parts) == 2:
-                    date_part, tz_part = parts
-                    # Convert timezone format: "+0100" -> "+01:00"
-                    if len(tz_part) == 5 and (
-                        tz_part.startswith("+") or tz_part.startswith("-")
-                    ):
-                        tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
-                        iso_str = f"{date_part.replace(' ', 'T')}{tz_formatted}"
-                        last_commit_date = datetime.fromisoformat(iso_str)
-                        stats["last_commit_date"] = last_commit_date
-                        # Use timezone-aware now() for accurate comparison
-                        now_aware = datetime.now(last_commit_date.tzinfo)
-                        stats["days_since_last_commit"] = (
-                            now_aware - last_commit_date
-                        ).days
-                    else:
-                        # Fallback for unexpected timezone format
-                        last_commit_date = datetime.strptime(
-                            parts[0], "%Y-%m-%d %H:%M:%S"
-                        )
-                        stats["last_commit_date"] = last_commit_date
-                        stats["days_since_last_commit"] = (
-                            datetime.now() - last_commit_date
-                        ).days
-                else:
-                    # No timezone in output
-                    last_commit_date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    stats["last_commit_date"] = last_commit_date
-                    stats["days_since_last_commit"] = (
-                        datetime.now() - last_commit_date
-                    ).days
-            except (ValueError, TypeError) as e:
-                # If parsing fails, silently continue without date info
-                pass
+        if result.returncode == 0:
+            stats.update(parse_commit_date(result.stdout))
 
         # Diff stats
         result = self._run_git(
             ["diff", "--shortstat", f"{self.base_branch}...HEAD"], cwd=worktree_path
         )
-        if result.returncode == 0 and result.stdout.strip():
-            # Parse: "3 files changed, 50 insertions(+), 10 deletions(-)"
-            match = re.search(r"(\d+) files? changed", result.stdout)
-            if match:
-                stats["files_changed"] = int(match.group(1))
-            match = re.search(r"(\d+) insertions?", result.stdout)
-            if match:
-                stats["additions"] = int(match.group(1))
-            match = re.search(r"(\d+) deletions?", result.stdout)
-            if match:
-                stats["deletions"] = int(match.group(1))
+        if result.returncode == 0:
+            stats.update(parse_shortstat(result.stdout))
 
         return stats
 
@@ -894,27 +846,53 @@ class WorktreeManager:
     # ==================== Listing & Discovery ====================
 
     def list_all_worktrees(self) -> list[WorktreeInfo]:
-        """List all spec worktrees (includes legacy .worktrees/ location)."""
+        """
+        List all spec worktrees (includes legacy .worktrees/ location).
+
+        Statuses are collected in one batch (see core.worktree_status);
+        directories git does not know as worktrees are checked one by one.
+        """
+        # New location first; a spec in both locations is listed once
+        candidates: dict[str, Path] = {}
+        for directory in (self.worktrees_dir, self.project_dir / ".worktrees"):
+            if directory.exists():
+                for item in directory.iterdir():
+                    if item.is_dir() and item.name not in candidates:
+                        candidates[item.name] = self.get_worktree_path(item.name)
+        if not candidates:
+            return []
+
+        collector = WorktreeStatusCollector(
+            self.project_dir,
+            self.base_branch,
+            cache_path=self.worktrees_dir.parent / STATUS_CACHE_FILENAME,
+        )
+        statuses = collector.collect(list(candidates.values()))
+
         worktrees = []
-        seen_specs = set()
-
-        # Check new location first
-        if self.worktrees_dir.exists():
-            for item in self.worktrees_dir.iterdir():
-                if item.is_dir():
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
-                        seen_specs.add(item.name)
-
-        # Check legacy location (.worktrees/)
-        legacy_dir = self.project_dir / ".worktrees"
-        if legacy_dir.exists():
-            for item in legacy_dir.iterdir():
-                if item.is_dir() and item.name not in seen_specs:
-                    info = self.get_worktree_info(item.name)
-                    if info:
-                        worktrees.append(info)
+        for spec_name, worktree_path in candidates.items():
+            status = statuses.get(worktree_path)
+            if status is None:
+                info = self.get_worktree_info(spec_name)
+            else:
+                branch = status.branch
+                if branch is None:
+                    branch = self.get_branch_name(spec_name)
+                    debug_warning(
+                        "worktree",
+                        f"Worktree '{spec_name}' is in detached HEAD state. "
+                        f"Using expected branch name: {branch}",
+                    )
+                info = WorktreeInfo(
+                    path=worktree_path,
+                    branch=branch,
+                    spec_name=spec_name,
+                    base_branch=self.base_branch,
+                    is_active=True,
+                    **status.stats,
+                )
+            if info:
+                worktrees.append(info)
 
         return worktrees
 
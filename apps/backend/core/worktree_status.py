@@ -0,0 +1,333 @@
+"""
+Batched Worktree Status
+=======================
+
+Collects commit counts, last commit dates and diff statistics for many spec
+worktrees at once, for the list/summary/cleanup commands.
+
+Querying each worktree separately costs four git processes per worktree
+(branch, commit count, last commit date, diffstat). Instead:
+
+- one `git worktree list --porcelain` maps every worktree to its HEAD and branch
+- one `git for-each-ref` reads the tip and committer date of those branches
+- commit counts come from one `for-each-ref --format=%(ahead-behind:...)`
+  (git 2.41+); older gits fall back to `rev-list --count` per worktree
+- `git diff --shortstat` runs per worktree in a bounded thread pool
+
+Counts and diffstats depend only on the (HEAD, base) commit pair, so they are
+cached under that key in .auto-claude/worktrees/status_cache.json. Listing
+unchanged worktrees again costs a fixed handful of git processes regardless
+of how many worktrees exist.
+
+Usage:
+    collector = WorktreeStatusCollector(project_dir, "main")
+    statuses = collector.collect([path_a, path_b])
+    status = statuses.get(path_a)  # None if not a registered worktree
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+from core.git_executable import run_git
+
+STATUS_CACHE_FILENAME = "status_cache.json"
+CACHE_VERSION = 1
+
+# Upper bound on concurrent `git diff` processes
+MAX_STATUS_WORKERS = 8
+
+# Stats that depend only on the (HEAD, base) commit pair
+CACHED_STAT_KEYS = ("commit_count", "files_changed", "additions", "deletions")
+
+
+def empty_stats() -> dict:
+    """Stats of a worktree with no commits or changes (WorktreeInfo fields)."""
+    return {
+        "commit_count": 0,
+        "files_changed": 0,
+        "additions": 0,
+        "deletions": 0,
+        "last_commit_date": None,
+        "days_since_last_commit": None,
+    }
+
+
+def parse_commit_date(date_str: str) -> dict:
+    """
+    Parse a git ISO date into last_commit_date / days_since_last_commit.
+
+    Args:
+        date_str: Date as printed by --date=iso, e.g. "2026-01-04 00:25:25 +0100"
+
+    Returns:
+        Dict with both keys, or an empty dict if the date cannot be parsed
+    """
+    date_str = date_str.strip()
+    if not date_str:
+        return {}
+    try:
+        parts = date_str.rsplit(" ", 1)
+        if len(parts) == 2:
+            date_part, tz_part = parts
+            # Convert timezone format: "+0100" -> "+01:00"
+            if len(tz_part) == 5 and (
+                tz_part.startswith("+") or tz_part.startswith("-")
+            ):
+                tz_formatted = f"{tz_part[:3]}:{tz_part[3:]}"
+                iso_str = f"{date_part.replace(' ', 'T')}{tz_formatted}"
+                last_commit_date = datetime.fromisoformat(iso_str)
+                # Use timezone-aware now() for accurate comparison
+                now = datetime.now(last_commit_date.tzinfo)
+            else:
+                # Fallback for unexpected timezone format
+                last_commit_date = datetime.strptime(parts[0], "%Y-%m-%d %H:%M:%S")
+                now = datetime.now()
+        else:
+            # No timezone in output
+            last_commit_date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+            now = datetime.now()
+    except (ValueError, TypeError):
+        return {}
+    return {
+        "last_commit_date": last_commit_date,
+        "days_since_last_commit": (now - last_commit_date).days,
+    }
+
+
+def parse_shortstat(output: str) -> dict:
+    """Parse "3 files changed, 50 insertions(+), 10 deletions(-)"."""
+    stats = {}
+    match = re.search(r"(\d+) files? changed", output)
+    if match:
+        stats["files_changed"] = int(match.group(1))
+    match = re.search(r"(\d+) insertions?", output)
+    if match:
+        stats["additions"] = int(match.group(1))
+    match = re.search(r"(\d+) deletions?", output)
+    if match:
+        stats["deletions"] = int(match.group(1))
+    return stats
+
+
+def _path_key(path: Path | str) -> str:
+    return os.path.normcase(str(Path(path).resolve()))
+
+
+@dataclass
+class WorktreeStatus:
+    """Status of one registered worktree."""
+
+    path: Path
+    head: str
+    branch: str | None  # None if the worktree is on a detached HEAD
+    stats: dict = field(default_factory=empty_stats)
+
+
+class WorktreeStatusCollector:
+    """Collects the status of several worktrees with a few batched git calls."""
+
+    def __init__(
+        self,
+        project_dir: Path,
+        base_branch: str,
+        cache_path: Path | None = None,
+        max_workers: int = MAX_STATUS_WORKERS,
+    ):
+        """
+        Initialize collector.
+
+        Args:
+            project_dir: Main project directory
+            base_branch: Branch that commit counts and diffstats compare against
+            cache_path: Optional path for the persisted stats cache
+                (default: .auto-claude/worktrees/status_cache.json, used only
+                if that directory exists)
+            max_workers: Maximum number of concurrent git processes
+        """
+        self.project_dir = Path(project_dir)
+        self.base_branch = base_branch
+        if cache_path is None:
+            worktrees_dir = self.project_dir / ".auto-claude" / "worktrees"
+            if worktrees_dir.is_dir():
+                cache_path = worktrees_dir / STATUS_CACHE_FILENAME
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_workers = max(1, max_workers)
+        # Worktrees whose stats were computed (rather than cached) by the last collect()
+        self.computed = 0
+
+    def collect(self, worktree_paths: list[Path]) -> dict[Path, WorktreeStatus]:
+        """
+        Get the status of the given worktrees.
+
+        Args:
+            worktree_paths: Worktree directories to report on
+
+        Returns:
+            Status by the given path. Paths that are not registered git
+            worktrees (or whose HEAD cannot be read) are omitted.
+        """
+        self.computed = 0
+        registered = self._registered_worktrees()
+        statuses: dict[Path, WorktreeStatus] = {}
+        for path in worktree_paths:
+            entry = registered.get(_path_key(path))
+            if entry:
+                statuses[path] = WorktreeStatus(
+                    path=path, head=entry[0], branch=entry[1]
+                )
+        if not statuses:
+            return statuses
+
+        base = self._git(["rev-parse", "--verify", f"{self.base_branch}^{{commit}}"])
+        base_sha = base.strip() if base else ""
+
+        self._fill_commit_dates(statuses.values())
+        if base_sha:
+            self._fill_change_stats(list(statuses.values()), base_sha)
+        return statuses
+
+    def _git(self, args: list[str]) -> str | None:
+        result = run_git(args, cwd=self.project_dir)
+        return result.stdout if result.returncode == 0 else None
+
+    def _registered_worktrees(self) -> dict[str, tuple[str, str | None]]:
+        """Map each registered worktree path to (HEAD sha, branch)."""
+        output = self._git(["worktree", "list", "--porcelain"])
+        worktrees: dict[str, tuple[str, str | None]] = {}
+        if not output:
+            return worktrees
+        for block in output.split("\n\n"):
+            path = head = branch = None
+            for line in block.splitlines():
+                if line.startswith("worktree "):
+                    path = line[len("worktree ") :]
+                elif line.startswith("HEAD "):
+                    head = line[len("HEAD ") :]
+                elif line.startswith("branch refs/heads/"):
+                    branch = line[len("branch refs/heads/") :]
+            if path and head:
+                worktrees[_path_key(path)] = (head, branch)
+        return worktrees
+
+    def _fill_commit_dates(self, statuses) -> None:
+        """Read the HEAD commit dates: branch tips in bulk, detached HEADs after."""
+        dates: dict[str, str] = {}
+        refs = sorted({f"refs/heads/{s.branch}" for s in statuses if s.branch})
+        if refs:
+            output = self._git(
+                ["for-each-ref", "--format=%(objectname) %(committerdate:iso)", *refs]
+            )
+            for line in (output or "").splitlines():
+                sha, _, date = line.partition(" ")
+                dates[sha] = date
+
+        missing = sorted({s.head for s in statuses if s.head not in dates})
+        if missing:
+            output = self._git(
+                ["log", "--no-walk=unsorted", "--format=%H %cd", "--date=iso", *missing]
+            )
+            for line in (output or "").splitlines():
+                sha, _, date = line.partition(" ")
+                dates[sha] = date
+
+        for status in statuses:
+            status.stats.update(parse_commit_date(dates.get(status.head, "")))
+
+    def _fill_change_stats(self, statuses: list[WorktreeStatus], base_sha: str) -> None:
+        """Fill commit counts and diffstats from the cache or from git."""
+        cache = self._load_cache()
+        new_cache: dict[str, dict] = {}
+        misses: list[WorktreeStatus] = []
+        for status in statuses:
+            key = f"{status.head}:{base_sha}"
+            cached = cache.get(key)
+            if isinstance(cached, dict) and all(k in cached for k in CACHED_STAT_KEYS):
+                status.stats.update({k: cached[k] for k in CACHED_STAT_KEYS})
+                new_cache[key] = cached
+            else:
+                misses.append(status)
+
+        if misses:
+            counts = self._ahead_counts(misses, base_sha)
+
+            def compute(status: WorktreeStatus) -> dict | None:
+                stats = {"commit_count": counts.get(status.head)}
+                if stats["commit_count"] is None:
+                    output = self._git(
+                        ["rev-list", "--count", f"{base_sha}..{status.head}"]
+                    )
+                    if output is None:
+                        return None
+                    stats["commit_count"] = int(output.strip() or "0")
+                output = self._git(
+                    ["diff", "--shortstat", f"{base_sha}...{status.head}"]
+                )
+                if output is None:
+                    return None
+                stats.update({"files_changed": 0, "additions": 0, "deletions": 0})
+                stats.update(parse_shortstat(output))
+                return stats
+
+            workers = min(self.max_workers, len(misses))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(compute, misses))
+
+            for status, stats in zip(misses, results):
+                if stats is None:
+                    continue
+                status.stats.update(stats)
+                new_cache[f"{status.head}:{base_sha}"] = stats
+                self.computed += 1
+
+        self._save_cache(cache, new_cache)
+
+    def _ahead_counts(
+        self, statuses: list[WorktreeStatus], base_sha: str
+    ) -> dict[str, int]:
+        """
+        Count commits ahead of base for all branch tips in one call.
+
+        Requires git 2.41+ (%(ahead-behind:)); returns an empty dict on older
+        versions so counts are taken per worktree instead.
+        """
+        refs = sorted({f"refs/heads/{s.branch}" for s in statuses if s.branch})
+        if not refs:
+            return {}
+        ahead_format = f"--format=%(objectname) %(ahead-behind:{base_sha})"
+        output = self._git(["for-each-ref", ahead_format, *refs])
+        counts: dict[str, int] = {}
+        for line in (output or "").splitlines():
+            parts = line.split()
+            if len(parts) == 3 and parts[1].isdigit():
+                counts[parts[0]] = int(parts[1])
+        return counts
+
+    def _load_cache(self) -> dict[str, dict]:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+            return {}
+        entries = data.get("entries")
+        return entries if isinstance(entries, dict) else {}
+
+    def _save_cache(self, old: dict[str, dict], new: dict[str, dict]) -> None:
+        if not self.cache_path or new == old:
+            return
+        data = {"version": CACHE_VERSION, "entries": new}
+        try:
+            write_json_atomic(self.cache_path, data, indent=None)
+        except OSError:
+            pass  # The cache is an optimization; stats are recomputed next time
@@ -15,8 +15,9 @@ import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from ..git_utils import GitBatchSession
 from ..semantic_analyzer import SemanticAnalyzer
-from ..types import FileEvolution, TaskSnapshot, compute_content_hash
+from ..types import FileAnalysis, FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
 
 # Import debug utilities
@@ -58,7 +59,9 @@ class ModificationTracker:
             semantic_analyzer: Optional pre-configured semantic analyzer
         """
         self.storage = storage
-        self.analyzer = semantic_analyzer or SemanticAnalyzer()
+        self.analyzer = semantic_analyzer or SemanticAnalyzer(
+            cache_dir=storage.storage_dir
+        )
 
     def record_modification(
         self,
@@ -69,6 +72,7 @@ class ModificationTracker:
         evolutions: dict[str, FileEvolution],
         raw_diff: str | None = None,
         skip_semantic_analysis: bool = False,
+        analysis: FileAnalysis | None = None,
     ) -> TaskSnapshot | None:
         """
         Record a file modification by a task.
@@ -83,6 +87,8 @@ class ModificationTracker:
             skip_semantic_analysis: If True, skip expensive semantic analysis.
                 Use this for lightweight file tracking when only conflict
                 detection is needed (not conflict resolution).
+            analysis: Precomputed semantic analysis of old -> new content
+                (e.g. from SemanticAnalyzer.analyze_many)
 
         Returns:
             Updated TaskSnapshot, or None if file not being tracked
@@ -120,7 +126,10 @@ class ModificationTracker:
             )
         else:
             # Full analysis (only for conflict files)
-            analysis = self.analyzer.analyze_diff(rel_path, old_content, new_content)
+            if analysis is None:
+                analysis = self.analyzer.analyze_diff(
+                    rel_path, old_content, new_content
+                )
             semantic_changes = analysis.changes
 
         # Update snapshot
@@ -146,7 +155,7 @@ class ModificationTracker:
         evolutions: dict[str, FileEvolution],
         target_branch: str | None = None,
         analyze_only_files: set[str] | None = None,
-    ) -> None:
+    ) -> list[str]:
         """
         Refresh task snapshots by analyzing git diff from worktree.
 
@@ -162,7 +171,12 @@ class ModificationTracker:
                 these files. Other files will be tracked with lightweight mode
                 (no semantic analysis). This optimizes performance by only
                 analyzing files that have actual conflicts.
+
+        Returns:
+            Relative paths of evolution entries that were created or updated
         """
+        touched: list[str] = []
+
         # Determine the target branch to compare against
         if not target_branch:
             # Try to detect the base branch from the worktree's upstream
@@ -210,31 +224,19 @@ class ModificationTracker:
                 else changed_files,
             )
 
-            processed_count = 0
+            # Fetch every diff and base blob in a couple of git round-trips
+            # instead of forking git show/diff per file
+            with GitBatchSession(worktree_path) as git:
+                diffs = git.diff_files(merge_base, "HEAD", changed_files)
+                base_contents = git.read_files(merge_base, changed_files)
+
+            # Gather old/new content for every file, then analyze them as a batch
+            modifications = []
             for file_path in changed_files:
                 try:
-                    # Get the diff for this file (using merge-base for accurate task-only diff)
-                    diff_result = subprocess.run(
-                        ["git", "diff", f"{merge_base}..HEAD", "--", file_path],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                    )
-
-                    # Get content before (from merge-base - the point where task branched)
-                    try:
-                        show_result = subprocess.run(
-                            ["git", "show", f"{merge_base}:{file_path}"],
-                            cwd=worktree_path,
-                            capture_output=True,
-                            text=True,
-                            check=True,
-                        )
-                        old_content = show_result.stdout
-                    except subprocess.CalledProcessError:
-                        # File is new
-                        old_content = ""
+                    # Content before (from merge-base - the point where task branched);
+                    # None means the file is new
+                    old_content = base_contents.get(file_path) or ""
 
                     current_file = worktree_path / file_path
                     if current_file.exists():
@@ -247,51 +249,66 @@ class ModificationTracker:
                     else:
                         # File was deleted
                         new_content = ""
-
-                    # Auto-create FileEvolution entry if not already tracked
-                    # This handles retroactive tracking when capture_baselines wasn't called
-                    rel_path = self.storage.get_relative_path(file_path)
-                    if rel_path not in evolutions:
-                        evolutions[rel_path] = FileEvolution(
-                            file_path=rel_path,
-                            baseline_commit=merge_base,
-                            baseline_captured_at=datetime.now(),
-                            baseline_content_hash=compute_content_hash(old_content),
-                            baseline_snapshot_path="",  # Not storing baseline file
-                            task_snapshots=[],
-                        )
-                        debug(
-                            MODULE,
-                            f"Auto-created evolution entry for {rel_path}",
-                            baseline_commit=merge_base[:8],
-                        )
-
-                    # Determine if this file needs full semantic analysis
-                    # If analyze_only_files is provided, only analyze files in that set
-                    # Otherwise, analyze all files (backward compatible)
-                    skip_analysis = False
-                    if analyze_only_files is not None:
-                        skip_analysis = rel_path not in analyze_only_files
-
-                    # Record the modification
-                    self.record_modification(
-                        task_id=task_id,
-                        file_path=file_path,
-                        old_content=old_content,
-                        new_content=new_content,
-                        evolutions=evolutions,
-                        raw_diff=diff_result.stdout,
-                        skip_semantic_analysis=skip_analysis,
-                    )
-                    processed_count += 1
-
-                except subprocess.CalledProcessError as e:
+                except OSError as e:
                     # Log error but continue with remaining files
                     logger.warning(
                         f"Failed to process {file_path} in refresh_from_git: {e}"
                     )
                     continue
 
+                # Auto-create FileEvolution entry if not already tracked
+                # This handles retroactive tracking when capture_baselines wasn't called
+                rel_path = self.storage.get_relative_path(file_path)
+                if rel_path not in evolutions:
+                    evolutions[rel_path] = FileEvolution(
+                        file_path=rel_path,
+                        baseline_commit=merge_base,
+                        baseline_captured_at=datetime.now(),
+                        baseline_content_hash=compute_content_hash(old_content),
+                        baseline_snapshot_path="",  # Not storing baseline file
+                        task_snapshots=[],
+                    )
+                    debug(
+                        MODULE,
+                        f"Auto-created evolution entry for {rel_path}",
+                        baseline_commit=merge_base[:8],
+                    )
+
+                # Determine if this file needs full semantic analysis
+                # If analyze_only_files is provided, only analyze files in that set
+                # Otherwise, analyze all files (backward compatible)
+                skip_analysis = False
+                if analyze_only_files is not None:
+                    skip_analysis = rel_path not in analyze_only_files
+
+                modifications.append(
+                    (file_path, rel_path, old_content, new_content, skip_analysis)
+                )
+
+            # Analyze all files needing it at once (cached / process pool)
+            to_analyze = [
+                (rel_path, old_content, new_content)
+                for _, rel_path, old_content, new_content, skip in modifications
+                if not skip
+            ]
+            analyses = iter(self.analyzer.analyze_many(to_analyze))
+
+            processed_count = 0
+            for file_path, rel_path, old_content, new_content, skip in modifications:
+                # Record the modification
+                touched.append(rel_path)
+                self.record_modification(
+                    task_id=task_id,
+                    file_path=file_path,
+                    old_content=old_content,
+                    new_content=new_content,
+                    evolutions=evolutions,
+                    raw_diff=diffs.get(file_path, ""),
+                    skip_semantic_analysis=skip,
+                    analysis=None if skip else next(analyses),
+                )
+                processed_count += 1
+
             # Calculate how many files were fully analyzed vs just tracked
             if analyze_only_files is not None:
                 analyzed_count = len(
@@ -308,9 +325,11 @@ class ModificationTracker:
                     "(full analysis on all files)"
                 )
 
-        except subprocess.CalledProcessError as e:
+        except (subprocess.CalledProcessError, OSError) as e:
             logger.error(f"Failed to refresh from git: {e}")
 
+        return touched
+
     def mark_task_completed(
         self,
         task_id: str,
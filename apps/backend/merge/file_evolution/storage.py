@@ -6,25 +6,63 @@ Handles file system operations for evolution tracking:
 - Loading/saving evolution data from JSON
 - Storing baseline content snapshots
 - Reading file contents from disk
+
+Evolution data is sharded: each tracked file's FileEvolution is its own JSON
+record under ``file-evolution/records/``, and ``file-evolution/index.json``
+maps file paths to their record and task ids. Saves rewrite only records
+whose content changed, and single files or tasks can be loaded without
+reading everything. A legacy ``file_evolution.json`` is migrated on first
+use and kept as ``file_evolution.json.migrated``.
+
+The index doubles as a reverse index from file path to the tasks touching
+it: each entry also lists the tasks with an uncompleted snapshot and the
+tasks that actually modified the file. Active tasks and parallel-task
+overlaps are answered from the index alone, and the index is maintained by
+every save (baseline capture, refresh from git, completion and cleanup).
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import shutil
+from collections.abc import Iterable
+from datetime import datetime
 from pathlib import Path
 
-from ..types import FileEvolution
+from core.file_utils import atomic_write, write_json_atomic
+
+from ..types import FileEvolution, sanitize_path_for_storage
 
 logger = logging.getLogger(__name__)
 
+EVOLUTION_DIR = "file-evolution"
+EVOLUTION_INDEX_VERSION = 2
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def _index_tasks(evolution: FileEvolution) -> dict[str, list[str]]:
+    """Task id lists kept in a file's index entry."""
+    snapshots = evolution.task_snapshots
+    return {
+        "tasks": [ts.task_id for ts in snapshots],
+        # Tasks with an uncompleted snapshot of this file
+        "active": [ts.task_id for ts in snapshots if ts.completed_at is None],
+        # Tasks whose snapshot actually changed this file
+        "modified": [ts.task_id for ts in snapshots if ts.has_modifications],
+    }
+
 
 class EvolutionStorage:
     """
     Manages persistence of file evolution data.
 
     Responsibilities:
-    - Load/save evolution data to JSON
+    - Load/save evolution data to sharded JSON records
     - Store baseline content snapshots
     - Read file contents safely
     """
@@ -44,58 +82,309 @@ class EvolutionStorage:
         self.project_dir = Path(project_dir).resolve()
         self.storage_dir = Path(storage_dir).resolve()
         self.baselines_dir = self.storage_dir / "baselines"
+        # Legacy single-file store (migrated into evolution_dir)
         self.evolution_file = self.storage_dir / "file_evolution.json"
+        self.evolution_dir = self.storage_dir / EVOLUTION_DIR
+        self.records_dir = self.evolution_dir / "records"
+        self.index_file = self.evolution_dir / "index.json"
 
         # Ensure directories exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
         self.baselines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_evolutions(self) -> dict[str, FileEvolution]:
-        """
-        Load evolution data from disk.
+        # file_path -> {"record": record file name, "tasks": [task ids],
+        #               "active": [task ids], "modified": [task ids]}
+        self._index: dict[str, dict] = {}
+        # file_path -> digest of its record as last read/written
+        self._digests: dict[str, str] = {}
 
-        Returns:
-            Dictionary mapping file paths to FileEvolution objects
-        """
-        if not self.evolution_file.exists():
-            return {}
+        self._migrate_legacy_file()
+        self._load_index()
+
+    # =========================================================================
+    # SHARDED RECORD STORE
+    # =========================================================================
+
+    def _record_name(self, file_path: str) -> str:
+        """Get a collision-free record file name for a file path."""
+        path_hash = hashlib.sha1(file_path.encode("utf-8")).hexdigest()[:10]
+        return f"{sanitize_path_for_storage(file_path)[-100:]}-{path_hash}.json"
+
+    def _load_index(self) -> None:
+        if not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load evolution index: {e}")
+            return
+        version = data.get("version")
+        if version == EVOLUTION_INDEX_VERSION:
+            self._index = data.get("files", {})
+        elif version == 1:
+            # Version 1 entries lack the active/modified task lists
+            self._index = data.get("files", {})
+            for file_path in list(self._index):
+                evolution = self._read_record(file_path)
+                if evolution is None:
+                    self._index.pop(file_path)
+                else:
+                    self._index[file_path].update(_index_tasks(evolution))
+            self._save_index()
+
+    def _save_index(self) -> None:
+        write_json_atomic(
+            self.index_file,
+            {"version": EVOLUTION_INDEX_VERSION, "files": self._index},
+            indent=None,
+        )
+
+    def _migrate_legacy_file(self) -> None:
+        """Split a legacy file_evolution.json into per-file records."""
+        if self.index_file.exists() or not self.evolution_file.exists():
+            return
 
         try:
             with open(self.evolution_file, encoding="utf-8") as f:
                 data = json.load(f)
+            evolutions = {
+                file_path: FileEvolution.from_dict(evolution_data)
+                for file_path, evolution_data in data.items()
+            }
+        except Exception as e:
+            logger.error(f"Failed to migrate legacy evolution data: {e}")
+            return
+
+        self.save_evolutions(evolutions)
+        self.evolution_file.replace(
+            self.evolution_file.with_name(self.evolution_file.name + ".migrated")
+        )
+        logger.info(f"Migrated evolution data for {len(evolutions)} files")
+
+    def _read_record(self, file_path: str) -> FileEvolution | None:
+        entry = self._index.get(file_path)
+        if entry is None:
+            return None
+        try:
+            text = (self.records_dir / entry["record"]).read_text(encoding="utf-8")
+            evolution = FileEvolution.from_dict(json.loads(text))
+        except Exception as e:
+            logger.error(f"Failed to load evolution data for {file_path}: {e}")
+            return None
+        self._digests[file_path] = _digest(text)
+        return evolution
 
-            evolutions = {}
-            for file_path, evolution_data in data.items():
-                evolutions[file_path] = FileEvolution.from_dict(evolution_data)
+    def get_tracked_files(self) -> list[str]:
+        """Get all file paths with stored evolution data."""
+        return list(self._index)
 
-            logger.debug(f"Loaded evolution data for {len(evolutions)} files")
-            return evolutions
+    def get_files_for_task(self, task_id: str) -> list[str]:
+        """
+        Get stored file paths that have a snapshot from a task.
 
-        except Exception as e:
-            logger.error(f"Failed to load evolution data: {e}")
-            return {}
+        Answered from the index without loading any records.
+        """
+        return [
+            file_path
+            for file_path, entry in self._index.items()
+            if task_id in entry.get("tasks", [])
+        ]
+
+    def get_active_tasks(self) -> set[str]:
+        """
+        Get task IDs with an uncompleted snapshot of any file.
+
+        Answered from the index without loading any records.
+        """
+        return {
+            task_id
+            for entry in self._index.values()
+            for task_id in entry.get("active", [])
+        }
+
+    def get_active_tasks_by_file(
+        self, file_paths: Iterable[str] | None = None
+    ) -> dict[str, list[str]]:
+        """
+        Map files to the active tasks that modified them.
+
+        Answered from the index without loading any records.
+
+        Args:
+            file_paths: Files to look up (default: all tracked files)
+
+        Returns:
+            Dictionary mapping file paths to task IDs; files no active task
+            modified are omitted
+        """
+        active = self.get_active_tasks()
+        if file_paths is None:
+            file_paths = self._index
+        result = {}
+        for file_path in file_paths:
+            entry = self._index.get(file_path)
+            if entry is None:
+                continue
+            tasks = [t for t in entry.get("modified", []) if t in active]
+            if tasks:
+                result[file_path] = tasks
+        return result
+
+    def load_evolution(self, file_path: str) -> FileEvolution | None:
+        """
+        Load one file's evolution data.
+
+        Args:
+            file_path: Path relative to the project root
+
+        Returns:
+            FileEvolution, or None if not tracked
+        """
+        return self._read_record(file_path)
+
+    def load_task_evolutions(self, task_id: str) -> dict[str, FileEvolution]:
+        """
+        Load evolution data only for the files a task touched.
+
+        Args:
+            task_id: The task identifier
 
-    def save_evolutions(self, evolutions: dict[str, FileEvolution]) -> None:
+        Returns:
+            Dictionary mapping file paths to FileEvolution objects
+        """
+        evolutions = {}
+        for file_path in self.get_files_for_task(task_id):
+            evolution = self._read_record(file_path)
+            if evolution is not None:
+                evolutions[file_path] = evolution
+        return evolutions
+
+    def load_evolutions(self) -> dict[str, FileEvolution]:
+        """
+        Load evolution data from disk.
+
+        Returns:
+            Dictionary mapping file paths to FileEvolution objects
+        """
+        evolutions = {}
+        for file_path in self._index:
+            evolution = self._read_record(file_path)
+            if evolution is not None:
+                evolutions[file_path] = evolution
+
+        logger.debug(f"Loaded evolution data for {len(evolutions)} files")
+        return evolutions
+
+    def save_evolutions(
+        self,
+        evolutions: dict[str, FileEvolution],
+        file_paths: Iterable[str] | None = None,
+    ) -> None:
         """
         Persist evolution data to disk.
 
+        Only records whose serialized content changed are rewritten, and
+        records for files no longer in ``evolutions`` are removed.
+
         Args:
             evolutions: Dictionary mapping file paths to FileEvolution objects
+            file_paths: Optional paths known to have changed; when given, only
+                these are considered (others are assumed unchanged)
         """
         try:
-            data = {
-                file_path: evolution.to_dict()
-                for file_path, evolution in evolutions.items()
-            }
-
-            with open(self.evolution_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-
-            logger.debug(f"Saved evolution data for {len(evolutions)} files")
+            candidates = evolutions if file_paths is None else file_paths
+            self.records_dir.mkdir(parents=True, exist_ok=True)
+
+            written = 0
+            index_changed = False
+            for file_path in candidates:
+                evolution = evolutions.get(file_path)
+                if evolution is None:
+                    index_changed |= self._remove_record(file_path)
+                    continue
+
+                text = json.dumps(evolution.to_dict(), indent=2)
+                digest = _digest(text)
+                entry = self._index.get(file_path)
+                if entry is not None and self._digests.get(file_path) == digest:
+                    continue
+
+                if entry is None:
+                    entry = {"record": self._record_name(file_path), "tasks": []}
+                    self._index[file_path] = entry
+                with atomic_write(self.records_dir / entry["record"]) as f:
+                    f.write(text)
+                self._digests[file_path] = digest
+                entry.update(_index_tasks(evolution))
+                index_changed = True
+                written += 1
+
+            if file_paths is None:
+                for file_path in list(self._index):
+                    if file_path not in evolutions:
+                        index_changed |= self._remove_record(file_path)
+
+            if index_changed:
+                self._save_index()
+
+            logger.debug(
+                f"Saved evolution data: {written} of {len(evolutions)} files changed"
+            )
 
         except Exception as e:
             logger.error(f"Failed to save evolution data: {e}")
 
+    def complete_task(self, task_id: str) -> None:
+        """
+        Mark a task's snapshots completed, e.g. once it has been merged.
+
+        Only the task's own records are loaded and rewritten.
+
+        Args:
+            task_id: The task identifier
+        """
+        evolutions = self.load_task_evolutions(task_id)
+        now = datetime.now()
+        for evolution in evolutions.values():
+            snapshot = evolution.get_task_snapshot(task_id)
+            if snapshot and snapshot.completed_at is None:
+                snapshot.completed_at = now
+        self.save_evolutions(evolutions, list(evolutions))
+
+    def remove_task(self, task_id: str, remove_baselines: bool = True) -> None:
+        """
+        Drop a task's snapshots, e.g. when its build is discarded.
+
+        Only the task's own records are loaded; records left without
+        snapshots are deleted.
+
+        Args:
+            task_id: The task identifier
+            remove_baselines: Whether to remove stored baseline files
+        """
+        task_files = self.get_files_for_task(task_id)
+        evolutions = {}
+        for file_path, evolution in self.load_task_evolutions(task_id).items():
+            evolution.task_snapshots = [
+                ts for ts in evolution.task_snapshots if ts.task_id != task_id
+            ]
+            if evolution.task_snapshots:
+                evolutions[file_path] = evolution
+        self.save_evolutions(evolutions, task_files)
+
+        if remove_baselines:
+            shutil.rmtree(self.baselines_dir / task_id, ignore_errors=True)
+
+    def _remove_record(self, file_path: str) -> bool:
+        """Remove a file's record; returns True if it existed."""
+        entry = self._index.pop(file_path, None)
+        self._digests.pop(file_path, None)
+        if entry is None:
+            return False
+        (self.records_dir / entry["record"]).unlink(missing_ok=True)
+        return True
+
     def store_baseline_content(
         self,
         file_path: str,
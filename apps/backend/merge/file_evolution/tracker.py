@@ -118,9 +118,22 @@ class FileEvolutionTracker:
         """Get the evolution file path."""
         return self.storage.evolution_file
 
-    def _save_evolutions(self) -> None:
-        """Persist evolution data to disk."""
-        self.storage.save_evolutions(self._evolutions)
+    def _save_evolutions(self, file_paths: list[str] | None = None) -> None:
+        """
+        Persist evolution data to disk.
+
+        Args:
+            file_paths: Paths whose evolution changed (default: detect changes)
+        """
+        self.storage.save_evolutions(self._evolutions, file_paths)
+
+    def _get_task_files(self, task_id: str) -> list[str]:
+        """Get tracked files that have a snapshot from a task."""
+        return [
+            file_path
+            for file_path, evolution in self._evolutions.items()
+            if evolution.get_task_snapshot(task_id)
+        ]
 
     def capture_baselines(
         self,
@@ -147,7 +160,7 @@ class FileEvolutionTracker:
             intent=intent,
             evolutions=self._evolutions,
         )
-        self._save_evolutions()
+        self._save_evolutions(list(captured))
         logger.info(f"Captured baselines for {len(captured)} files for task {task_id}")
         return captured
 
@@ -182,7 +195,8 @@ class FileEvolutionTracker:
             evolutions=self._evolutions,
             raw_diff=raw_diff,
         )
-        self._save_evolutions()
+        if snapshot is not None:
+            self._save_evolutions([self.storage.get_relative_path(file_path)])
         return snapshot
 
     def get_file_evolution(self, file_path: Path | str) -> FileEvolution | None:
@@ -259,7 +273,7 @@ class FileEvolutionTracker:
             task_id: The task identifier
         """
         self.modification_tracker.mark_task_completed(task_id, self._evolutions)
-        self._save_evolutions()
+        self._save_evolutions(self._get_task_files(task_id))
 
     def cleanup_task(
         self,
@@ -273,12 +287,16 @@ class FileEvolutionTracker:
             task_id: The task identifier
             remove_baselines: Whether to remove stored baseline files
         """
+        task_files = self._get_task_files(task_id)
+        previous_files = list(self._evolutions)
         self._evolutions = self.queries.cleanup_task(
             task_id=task_id,
             evolutions=self._evolutions,
             remove_baselines=remove_baselines,
         )
-        self._save_evolutions()
+        # Task files changed; entries left without snapshots were dropped
+        dropped = [f for f in previous_files if f not in self._evolutions]
+        self._save_evolutions(list(dict.fromkeys(task_files + dropped)))
 
     def get_active_tasks(self) -> set[str]:
         """
@@ -344,11 +362,11 @@ class FileEvolutionTracker:
                 (no semantic analysis). This optimizes performance by only
                 analyzing files that have actual conflicts.
         """
-        self.modification_tracker.refresh_from_git(
+        touched = self.modification_tracker.refresh_from_git(
             task_id=task_id,
             worktree_path=worktree_path,
             evolutions=self._evolutions,
             target_branch=target_branch,
             analyze_only_files=analyze_only_files,
         )
-        self._save_evolutions()
+        self._save_evolutions(touched)
@@ -59,7 +59,7 @@ from .timeline_models import (
     TaskIntent,
     WorktreeState,
 )
-from .timeline_persistence import TimelinePersistence
+from .timeline_persistence import TimelineLoadError, TimelinePersistence
 
 # Re-export the main tracker service
 from .timeline_tracker import FileTimelineTracker
@@ -78,4 +78,5 @@ __all__ = [
     # Helper components (advanced usage)
     "TimelineGitHelper",
     "TimelinePersistence",
+    "TimelineLoadError",
 ]
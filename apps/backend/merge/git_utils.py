@@ -8,6 +8,7 @@ This module provides utilities for:
 - Finding git worktrees
 - Getting file content from branches
 - Working with git repositories
+- Batched object and diff access (GitBatchSession, from core.git_batch)
 """
 
 from __future__ import annotations
@@ -15,6 +16,15 @@ from __future__ import annotations
 import subprocess
 from pathlib import Path
 
+from core.git_batch import GitBatchSession, split_diff
+
+__all__ = [
+    "GitBatchSession",
+    "find_worktree",
+    "get_file_from_branch",
+    "split_diff",
+]
+
 
 def find_worktree(project_dir: Path, task_id: str) -> Path | None:
     """
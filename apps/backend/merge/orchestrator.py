@@ -147,7 +147,7 @@ class MergeOrchestrator:
 
         # Initialize components
         debug_detailed(MODULE, "Initializing sub-components...")
-        self.analyzer = SemanticAnalyzer()
+        self.analyzer = SemanticAnalyzer(cache_dir=self.storage_dir)
         self.conflict_detector = ConflictDetector()
         self.auto_merger = AutoMerger()
         self.evolution_tracker = FileEvolutionTracker(
@@ -7,14 +7,27 @@ Analyzes code changes at a semantic level using regex-based heuristics.
 This module provides analysis of code changes, extracting meaningful
 semantic changes like "added import", "modified function", "wrapped JSX element"
 rather than line-level diffs.
+
+Results are cached by (content hash before, content hash after, extension):
+in memory, and on disk under ``<cache_dir>/semantic-cache/`` when a cache
+directory is given. Many files can be analyzed at once in a process pool
+with ``analyze_many``.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-from .types import FileAnalysis
+from core.file_utils import atomic_write
+
+from .types import FileAnalysis, compute_content_hash
 
 # Import debug utilities
 try:
@@ -46,6 +59,18 @@ MODULE = "merge.semantic_analyzer"
 from .semantic_analysis.models import ExtractedElement
 from .semantic_analysis.regex_analyzer import analyze_with_regex
 
+# Bump when analyze_with_regex output changes to invalidate cached results
+ANALYSIS_CACHE_VERSION = 1
+# Analyses kept in memory per analyzer
+ANALYSIS_CACHE_SIZE = 512
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 16
+
+
+def _analyze_job(job: tuple[str, str, str, str]) -> dict:
+    """Process pool entry point: analyze one (file_path, before, after, ext)."""
+    return analyze_with_regex(*job).to_dict()
+
 
 class SemanticAnalyzer:
     """
@@ -58,9 +83,86 @@ class SemanticAnalyzer:
             print(f"{change.change_type.value}: {change.target}")
     """
 
-    def __init__(self):
-        """Initialize the analyzer."""
+    def __init__(self, cache_dir: Path | None = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            cache_dir: Optional directory (e.g. .auto-claude/) to persist
+                analysis results in; results are only cached in memory if None
+        """
         debug(MODULE, "Initializing SemanticAnalyzer (regex-based)")
+        self.cache_dir = (
+            Path(cache_dir) / "semantic-cache" if cache_dir is not None else None
+        )
+        # cache key -> FileAnalysis.to_dict() as JSON (file_path is per-call)
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    # =========================================================================
+    # CACHE
+    # =========================================================================
+
+    @staticmethod
+    def _cache_key(before: str, after: str, ext: str) -> str:
+        return (
+            f"{ANALYSIS_CACHE_VERSION}:{ext}:"
+            f"{compute_content_hash(before)}:{compute_content_hash(after)}"
+        )
+
+    def _cache_path(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        name = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.cache_dir / name[:2] / f"{name}.json"
+
+    def _get_cached(self, key: str, file_path: str) -> FileAnalysis | None:
+        with self._cache_lock:
+            text = self._cache.get(key)
+            if text is not None:
+                self._cache.move_to_end(key)
+
+        if text is None:
+            cache_path = self._cache_path(key)
+            if cache_path is None or not cache_path.exists():
+                return None
+            try:
+                text = cache_path.read_text(encoding="utf-8")
+            except OSError:
+                return None
+            self._remember(key, text, persist=False)
+
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return None
+        # Decoded per call so callers can mutate results freely
+        data["file_path"] = file_path
+        return FileAnalysis.from_dict(data)
+
+    def _remember(self, key: str, text: str, persist: bool = True) -> None:
+        with self._cache_lock:
+            self._cache[key] = text
+            self._cache.move_to_end(key)
+            while len(self._cache) > ANALYSIS_CACHE_SIZE:
+                self._cache.popitem(last=False)
+
+        cache_path = self._cache_path(key) if persist else None
+        if cache_path is not None:
+            try:
+                with atomic_write(cache_path) as f:
+                    f.write(text)
+            except OSError as e:
+                logger.debug(f"Could not persist semantic analysis: {e}")
+
+    def clear_cache(self) -> None:
+        """Clear the in-memory analysis cache."""
+        with self._cache_lock:
+            self._cache.clear()
+
+    # =========================================================================
+    # ANALYSIS
+    # =========================================================================
 
     def analyze_diff(
         self,
@@ -93,8 +195,15 @@ class SemanticAnalyzer:
             task_id=task_id,
         )
 
+        key = self._cache_key(before, after, ext)
+        analysis = self._get_cached(key, file_path)
+        if analysis is not None:
+            debug_verbose(MODULE, f"Cache hit for {file_path}")
+            return analysis
+
         # Use regex-based analysis
         analysis = analyze_with_regex(file_path, before, after, ext)
+        self._remember(key, json.dumps(analysis.to_dict()))
 
         debug_success(
             MODULE,
@@ -118,6 +227,56 @@ class SemanticAnalyzer:
 
         return analysis
 
+    def analyze_many(
+        self,
+        items: list[tuple[str, str, str]],
+        max_workers: int | None = None,
+    ) -> list[FileAnalysis]:
+        """
+        Analyze many (file_path, before, after) diffs.
+
+        Cached results are reused; the rest are analyzed in a process pool
+        when there are enough of them to be worth it.
+
+        Args:
+            items: (file_path, before, after) tuples
+            max_workers: Worker processes (default: CPU count; 1 = in-process)
+
+        Returns:
+            FileAnalysis per item, in input order
+        """
+        results: list[FileAnalysis | None] = []
+        pending: list[tuple[int, str, tuple[str, str, str, str]]] = []
+
+        for i, (file_path, before, after) in enumerate(items):
+            ext = Path(file_path).suffix.lower()
+            key = self._cache_key(before, after, ext)
+            results.append(self._get_cached(key, file_path))
+            if results[i] is None:
+                pending.append((i, key, (file_path, before, after, ext)))
+
+        workers = max_workers or os.cpu_count() or 1
+        debug(
+            MODULE,
+            f"Batch analysis of {len(items)} files",
+            cached=len(items) - len(pending),
+            to_analyze=len(pending),
+        )
+
+        if workers > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            jobs = [job for _, _, job in pending]
+            chunksize = max(1, len(jobs) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                analyzed = list(pool.map(_analyze_job, jobs, chunksize=chunksize))
+        else:
+            analyzed = [_analyze_job(job) for _, _, job in pending]
+
+        for (i, key, _job), data in zip(pending, analyzed):
+            self._remember(key, json.dumps(data))
+            results[i] = FileAnalysis.from_dict(data)
+
+        return results
+
     def analyze_file(self, file_path: str, content: str) -> FileAnalysis:
         """
         Analyze a single file's structure (not a diff).
@@ -14,11 +14,14 @@ This module handles all Git interactions including:
 from __future__ import annotations
 
 import logging
+import re
 import subprocess
 from pathlib import Path
 
 from core.git_executable import get_isolated_git_env
 
+from .git_utils import GitBatchSession
+
 logger = logging.getLogger(__name__)
 
 # Import debug utilities
@@ -38,6 +41,8 @@ except ImportError:
 
 MODULE = "merge.timeline_git"
 
+_FULL_HASH_RE = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
 
 class TimelineGitHelper:
     """
@@ -54,6 +59,14 @@ class TimelineGitHelper:
             project_path: Root directory of the git repository
         """
         self.project_path = Path(project_path).resolve()
+        # Long-lived cat-file session shared by all content lookups
+        self._batch = GitBatchSession(self.project_path)
+        # Commit metadata never changes, so it is cached by hash
+        self._commit_info_cache: dict[str, dict] = {}
+
+    def close(self) -> None:
+        """Stop the background git process (restarted on next use)."""
+        self._batch.close()
 
     def get_current_main_commit(self) -> str:
         """Get the current HEAD commit on main branch."""
@@ -83,6 +96,33 @@ class TimelineGitHelper:
         Returns:
             File content as string, or None if file doesn't exist at that commit
         """
+        return self.get_files_content_at_commit([file_path], commit_hash)[file_path]
+
+    def get_files_content_at_commit(
+        self, file_paths: list[str], commit_hash: str
+    ) -> dict[str, str | None]:
+        """
+        Get the content of many files at a commit in one git round-trip.
+
+        Args:
+            file_paths: Paths to the files (relative to project root)
+            commit_hash: Git commit hash
+
+        Returns:
+            Dictionary mapping each path to its content, or None if the file
+            doesn't exist at that commit
+        """
+        try:
+            return self._batch.read_files(commit_hash, file_paths)
+        except OSError as e:
+            debug_warning(MODULE, f"Batched read failed, falling back: {e}")
+            return {
+                file_path: self._show_file_at_commit(file_path, commit_hash)
+                for file_path in file_paths
+            }
+
+    def _show_file_at_commit(self, file_path: str, commit_hash: str) -> str | None:
+        """Get file content at a commit with a dedicated git show."""
         try:
             result = subprocess.run(
                 ["git", "show", f"{commit_hash}:{file_path}"],
@@ -137,28 +177,24 @@ class TimelineGitHelper:
         Returns:
             Dictionary with keys: message, author, diff_summary
         """
+        cached = self._commit_info_cache.get(commit_hash)
+        if cached is not None:
+            return dict(cached)
+
         info = {}
         env = get_isolated_git_env()
         try:
             result = subprocess.run(
-                ["git", "log", "-1", "--format=%s", commit_hash],
+                ["git", "log", "-1", "--format=%an%x00%s", commit_hash],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
                 env=env,
             )
             if result.returncode == 0:
-                info["message"] = result.stdout.strip()
-
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%an", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-                env=env,
-            )
-            if result.returncode == 0:
-                info["author"] = result.stdout.strip()
+                author, _, message = result.stdout.strip().partition("\0")
+                info["message"] = message.strip()
+                info["author"] = author.strip()
 
             result = subprocess.run(
                 ["git", "diff-tree", "--stat", "--no-commit-id", commit_hash],
@@ -175,9 +211,12 @@ class TimelineGitHelper:
                 )
 
         except Exception:
-            pass
+            return info
 
-        return info
+        # Only full hashes are immutable (refs like HEAD move)
+        if _FULL_HASH_RE.fullmatch(commit_hash):
+            self._commit_info_cache[commit_hash] = info
+        return dict(info)
 
     def get_worktree_file_content(self, task_id: str, file_path: str) -> str:
         """
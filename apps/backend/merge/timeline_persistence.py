@@ -8,16 +8,27 @@ This module handles:
 - Saving/loading timelines to/from disk
 - Managing the timeline index
 - File path encoding for safe storage
+- Content-addressed storage of file contents
+
+File contents (main branch events, branch points, worktree states) are not
+stored inline. Each distinct content is written once to
+``file-timelines/blobs/`` as a zlib-compressed blob named by its SHA-256,
+and timeline JSON references it via ``content_hash``. Timelines written
+before this format (inline ``content``) are still read.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import zlib
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from core.file_utils import atomic_write
+
 if TYPE_CHECKING:
     from .timeline_models import FileTimeline
 
@@ -35,11 +46,65 @@ except ImportError:
 MODULE = "merge.timeline_persistence"
 
 
+class TimelineLoadError(Exception):
+    """A stored timeline exists but could not be read (e.g. a missing blob)."""
+
+
+class ContentBlobStore:
+    """
+    Content-addressed store for file contents.
+
+    Blobs are zlib-compressed UTF-8 text stored at ``<dir>/<hash[:2]>/<hash>``.
+    Identical contents are stored once, however many events reference them.
+    """
+
+    def __init__(self, blobs_dir: Path):
+        self.blobs_dir = blobs_dir
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Get the content address of a string."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.blobs_dir / content_hash[:2] / content_hash
+
+    def put(self, content: str) -> str:
+        """
+        Store content (no-op if already stored).
+
+        Returns:
+            The content hash
+        """
+        content_hash = self.hash_content(content)
+        blob_path = self._blob_path(content_hash)
+        if not blob_path.exists():
+            with atomic_write(blob_path, "wb") as f:
+                f.write(zlib.compress(content.encode("utf-8")))
+        return content_hash
+
+    def get(self, content_hash: str) -> str:
+        """
+        Load content by hash.
+
+        Raises:
+            OSError: If the blob does not exist
+        """
+        data = self._blob_path(content_hash).read_bytes()
+        return zlib.decompress(data).decode("utf-8")
+
+    def has(self, content_hash: str) -> bool:
+        """Check whether a blob is stored."""
+        return self._blob_path(content_hash).exists()
+
+
 class TimelinePersistence:
     """
     Handles persistence of file timelines to disk.
 
     Timelines are stored as JSON files with an index for quick lookup.
+    The index also records which task ids each timeline has, so callers
+    can find a task's files without loading every timeline.
     """
 
     def __init__(self, storage_path: Path):
@@ -51,77 +116,164 @@ class TimelinePersistence:
         """
         self.storage_path = Path(storage_path).resolve()
         self.timelines_dir = self.storage_path / "file-timelines"
+        self.blobs = ContentBlobStore(self.timelines_dir / "blobs")
 
         # Ensure storage directory exists
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_all_timelines(self) -> dict[str, FileTimeline]:
+    def load_index(self) -> dict[str, list[str] | None]:
         """
-        Load all timelines from disk on startup.
+        Load the timeline index.
 
         Returns:
-            Dictionary mapping file_path to FileTimeline objects
+            Dictionary mapping tracked file_path to its task ids, in index
+            order. Task ids are None for indexes written before task ids were
+            recorded; load the timeline to find them.
         """
-        from .timeline_models import FileTimeline
-
-        timelines = {}
         index_path = self.timelines_dir / "index.json"
-
         if not index_path.exists():
-            return timelines
+            return {}
 
         try:
             with open(index_path, encoding="utf-8") as f:
                 index = json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load timeline index: {e}")
+            return {}
+
+        file_tasks = index.get("file_tasks", {})
+        return {
+            file_path: file_tasks.get(file_path) for file_path in index.get("files", [])
+        }
 
-            for file_path in index.get("files", []):
-                timeline_file = self._get_timeline_file_path(file_path)
-                if timeline_file.exists():
-                    with open(timeline_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    timelines[file_path] = FileTimeline.from_dict(data)
+    def load_timeline(self, file_path: str) -> FileTimeline | None:
+        """
+        Load a single timeline from disk.
+
+        Args:
+            file_path: The file path (used as key)
+
+        Returns:
+            FileTimeline object, or None if not stored
+
+        Raises:
+            TimelineLoadError: If the stored timeline or one of its content
+                blobs cannot be read
+        """
+        from .timeline_models import FileTimeline
 
-            debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
+        timeline_file = self._get_timeline_file_path(file_path)
+        if not timeline_file.exists():
+            return None
 
+        try:
+            with open(timeline_file, encoding="utf-8") as f:
+                data = json.load(f)
+            return FileTimeline.from_dict(self._resolve_contents(data))
         except Exception as e:
-            logger.error(f"Failed to load timelines: {e}")
+            raise TimelineLoadError(
+                f"Failed to load timeline for {file_path}: {e}"
+            ) from e
+
+    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        """
+        Load all timelines from disk.
 
+        FileTimelineTracker loads timelines lazily; this is kept for callers
+        that need every timeline at once.
+
+        Returns:
+            Dictionary mapping file_path to FileTimeline objects
+        """
+        timelines = {}
+        for file_path in self.load_index():
+            try:
+                timeline = self.load_timeline(file_path)
+            except TimelineLoadError as e:
+                logger.error(str(e))
+                continue
+            if timeline is not None:
+                timelines[file_path] = timeline
+
+        debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
         return timelines
 
     def save_timeline(self, file_path: str, timeline: FileTimeline) -> None:
         """
         Save a single timeline to disk.
 
+        File contents go to the blob store; the timeline JSON only holds
+        their hashes.
+
         Args:
             file_path: The file path (used as key)
             timeline: The FileTimeline object to save
         """
         try:
+            data = self._externalize_contents(timeline.to_dict())
+
             # Save timeline file
             timeline_file = self._get_timeline_file_path(file_path)
-            timeline_file.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(timeline_file, "w", encoding="utf-8") as f:
-                json.dump(timeline.to_dict(), f, indent=2)
+            with atomic_write(timeline_file) as f:
+                json.dump(data, f, indent=2)
 
         except Exception as e:
             logger.error(f"Failed to persist timeline for {file_path}: {e}")
 
-    def update_index(self, file_paths: list[str]) -> None:
+    def update_index(
+        self,
+        file_paths: list[str],
+        file_tasks: dict[str, list[str]] | None = None,
+    ) -> None:
         """
         Update the index file with all tracked files.
 
         Args:
             file_paths: List of all file paths being tracked
+            file_tasks: Optional mapping of file_path to the task ids in its
+                timeline (lets readers skip loading unrelated timelines)
         """
         index_path = self.timelines_dir / "index.json"
         index = {
             "files": file_paths,
+            "file_tasks": file_tasks or {},
             "last_updated": datetime.now().isoformat(),
         }
-        with open(index_path, "w", encoding="utf-8") as f:
+        with atomic_write(index_path) as f:
             json.dump(index, f, indent=2)
 
+    def _externalize_contents(self, data: dict) -> dict:
+        """Replace inline contents in a timeline dict with blob hashes."""
+        for event in data.get("main_branch_history", []):
+            self._store_content(event)
+        for view in data.get("task_views", {}).values():
+            self._store_content(view["branch_point"])
+            if view.get("worktree_state"):
+                self._store_content(view["worktree_state"])
+        return data
+
+    def _store_content(self, record: dict) -> None:
+        record["content_hash"] = self.blobs.put(record.pop("content"))
+
+    def _resolve_contents(self, data: dict) -> dict:
+        """Replace blob hashes in a stored timeline dict with their contents."""
+        loaded: dict[str, str] = {}
+        for event in data.get("main_branch_history", []):
+            self._load_content(event, loaded)
+        for view in data.get("task_views", {}).values():
+            self._load_content(view["branch_point"], loaded)
+            if view.get("worktree_state"):
+                self._load_content(view["worktree_state"], loaded)
+        return data
+
+    def _load_content(self, record: dict, loaded: dict[str, str]) -> None:
+        content_hash = record.pop("content_hash", None)
+        if content_hash is None:
+            return  # Legacy timeline with inline content
+        if content_hash not in loaded:
+            loaded[content_hash] = self.blobs.get(content_hash)
+        record["content"] = loaded[content_hash]
+
     def _get_timeline_file_path(self, file_path: str) -> Path:
         """
         Get the storage path for a file's timeline.
@@ -8,6 +8,9 @@ This service is the "brain" of the intent-aware merge system. It:
 - Creates and manages FileTimeline objects
 - Handles events from git hooks and task lifecycle
 - Provides merge context to the AI resolver
+
+Timelines are loaded lazily: only the index is read at startup, and each
+file's timeline is loaded on first access.
 """
 
 from __future__ import annotations
@@ -26,7 +29,7 @@ from .timeline_models import (
     TaskIntent,
     WorktreeState,
 )
-from .timeline_persistence import TimelinePersistence
+from .timeline_persistence import TimelineLoadError, TimelinePersistence
 
 logger = logging.getLogger(__name__)
 
@@ -74,16 +77,27 @@ class FileTimelineTracker:
         self.git = TimelineGitHelper(self.project_path)
         self.persistence = TimelinePersistence(self.storage_path)
 
-        # In-memory cache of timelines
+        # In-memory cache of timelines loaded so far
         self._timelines: dict[str, FileTimeline] = {}
 
-        # Load existing timelines
-        self._timelines = self.persistence.load_all_timelines()
+        # Files whose stored timeline could not be read; never overwritten
+        self._unreadable_files: set[str] = set()
+
+        # All tracked files -> task ids in their timeline (from the index)
+        self._tracked_files: dict[str, list[str]] = {}
+        for file_path, task_ids in self.persistence.load_index().items():
+            if task_ids is None:
+                # Index predates task ids - load the timeline to find them
+                timeline = self._load_timeline(file_path)
+                if timeline is None and file_path not in self._unreadable_files:
+                    continue
+                task_ids = list(timeline.task_views) if timeline else []
+            self._tracked_files[file_path] = task_ids
 
         debug_success(
             MODULE,
             "FileTimelineTracker initialized",
-            timelines_loaded=len(self._timelines),
+            timelines_tracked=len(self._tracked_files),
         )
 
     # =========================================================================
@@ -127,14 +141,17 @@ class FileTimelineTracker:
 
         timestamp = datetime.now()
 
+        # Fetch all branch-point contents in one git round-trip
+        contents = self.git.get_files_content_at_commit(
+            files_to_modify, branch_point_commit
+        )
+
         for file_path in files_to_modify:
             # Get or create timeline for this file
             timeline = self._get_or_create_timeline(file_path)
 
             # Get file content at branch point
-            content = self.git.get_file_content_at_commit(
-                file_path, branch_point_commit
-            )
+            content = contents.get(file_path)
             if content is None:
                 # File doesn't exist at this commit - might be created by task
                 content = ""
@@ -178,21 +195,23 @@ class FileTimelineTracker:
         # Get list of files changed in this commit
         changed_files = self.git.get_files_changed_in_commit(commit_hash)
 
-        for file_path in changed_files:
-            # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
-                continue
+        # Only update existing timelines (we don't create new ones for random files)
+        tracked_files = [f for f in changed_files if self.has_timeline(f)]
+        if tracked_files:
+            # One batched read for all contents, one metadata lookup per commit
+            contents = self.git.get_files_content_at_commit(tracked_files, commit_hash)
+            commit_info = self.git.get_commit_info(commit_hash)
 
-            timeline = self._timelines[file_path]
+        for file_path in tracked_files:
+            timeline = self._get_loaded_timeline(file_path)
+            if not timeline:
+                continue
 
             # Get file content at this commit
-            content = self.git.get_file_content_at_commit(file_path, commit_hash)
+            content = contents.get(file_path)
             if content is None:
                 continue
 
-            # Get commit metadata
-            commit_info = self.git.get_commit_info(commit_hash)
-
             # Create main branch event
             event = MainBranchEvent(
                 commit_hash=commit_hash,
@@ -232,10 +251,8 @@ class FileTimelineTracker:
         """
         debug(MODULE, f"on_task_worktree_change: {task_id} -> {file_path}")
 
-        timeline = self._timelines.get(file_path)
-        if not timeline:
-            # Create timeline if it doesn't exist
-            timeline = self._get_or_create_timeline(file_path)
+        # Create timeline if it doesn't exist
+        timeline = self._get_or_create_timeline(file_path)
 
         task_view = timeline.get_task_view(task_id)
         if not task_view:
@@ -266,9 +283,10 @@ class FileTimelineTracker:
 
         # Get list of files this task modified
         task_files = self.get_files_for_task(task_id)
+        contents = self.git.get_files_content_at_commit(task_files, merge_commit)
 
         for file_path in task_files:
-            timeline = self._timelines.get(file_path)
+            timeline = self._get_loaded_timeline(file_path)
             if not timeline:
                 continue
 
@@ -281,7 +299,7 @@ class FileTimelineTracker:
             task_view.merged_at = datetime.now()
 
             # Add main branch event for the merge
-            content = self.git.get_file_content_at_commit(file_path, merge_commit)
+            content = contents.get(file_path)
             if content:
                 event = MainBranchEvent(
                     commit_hash=merge_commit,
@@ -309,7 +327,7 @@ class FileTimelineTracker:
         task_files = self.get_files_for_task(task_id)
 
         for file_path in task_files:
-            timeline = self._timelines.get(file_path)
+            timeline = self._get_loaded_timeline(file_path)
             if not timeline:
                 continue
 
@@ -339,7 +357,7 @@ class FileTimelineTracker:
         """
         debug(MODULE, f"get_merge_context: {task_id} -> {file_path}")
 
-        timeline = self._timelines.get(file_path)
+        timeline = self._get_loaded_timeline(file_path)
         if not timeline:
             debug_warning(MODULE, f"No timeline found for {file_path}")
             return None
@@ -422,11 +440,11 @@ class FileTimelineTracker:
         Returns:
             List of file paths
         """
-        files = []
-        for file_path, timeline in self._timelines.items():
-            if task_id in timeline.task_views:
-                files.append(file_path)
-        return files
+        return [
+            file_path
+            for file_path, task_ids in self._tracked_files.items()
+            if task_id in task_ids
+        ]
 
     def get_pending_tasks_for_file(self, file_path: str) -> list[TaskFileView]:
         """
@@ -438,7 +456,7 @@ class FileTimelineTracker:
         Returns:
             List of TaskFileView objects
         """
-        timeline = self._timelines.get(file_path)
+        timeline = self._get_loaded_timeline(file_path)
         if not timeline:
             return []
         return timeline.get_active_tasks()
@@ -454,8 +472,9 @@ class FileTimelineTracker:
             Dictionary mapping file_path to commits_behind_main count
         """
         drift = {}
-        for file_path, timeline in self._timelines.items():
-            task_view = timeline.get_task_view(task_id)
+        for file_path in self.get_files_for_task(task_id):
+            timeline = self._get_loaded_timeline(file_path)
+            task_view = timeline.get_task_view(task_id) if timeline else None
             if task_view and task_view.status == "active":
                 drift[file_path] = task_view.commits_behind_main
         return drift
@@ -470,7 +489,16 @@ class FileTimelineTracker:
         Returns:
             True if timeline exists
         """
-        return file_path in self._timelines
+        return file_path in self._tracked_files
+
+    def get_tracked_files(self) -> list[str]:
+        """
+        Get all files with a timeline, without loading the timelines.
+
+        Returns:
+            List of file paths
+        """
+        return list(self._tracked_files)
 
     def get_timeline(self, file_path: str) -> FileTimeline | None:
         """
@@ -482,7 +510,7 @@ class FileTimelineTracker:
         Returns:
             FileTimeline object, or None if not found
         """
-        return self._timelines.get(file_path)
+        return self._get_loaded_timeline(file_path)
 
     # =========================================================================
     # CAPTURE METHODS (for integration with existing code)
@@ -576,7 +604,7 @@ class FileTimelineTracker:
             )
             drift = self.git.count_commits_between(branch_point, actual_target)
             for file_path in changed_files:
-                timeline = self._timelines.get(file_path)
+                timeline = self._get_loaded_timeline(file_path)
                 if timeline:
                     task_view = timeline.get_task_view(task_id)
                     if task_view:
@@ -598,17 +626,49 @@ class FileTimelineTracker:
     # INTERNAL HELPERS
     # =========================================================================
 
+    def _load_timeline(self, file_path: str) -> FileTimeline | None:
+        """Load a timeline from storage into the in-memory cache."""
+        try:
+            timeline = self.persistence.load_timeline(file_path)
+        except TimelineLoadError as e:
+            logger.error(str(e))
+            self._unreadable_files.add(file_path)
+            return None
+        if timeline is not None:
+            self._timelines[file_path] = timeline
+        return timeline
+
+    def _get_loaded_timeline(self, file_path: str) -> FileTimeline | None:
+        """Get a tracked file's timeline, loading it on first access."""
+        timeline = self._timelines.get(file_path)
+        if timeline is None and file_path in self._tracked_files:
+            timeline = self._load_timeline(file_path)
+        return timeline
+
     def _get_or_create_timeline(self, file_path: str) -> FileTimeline:
         """Get existing timeline or create new one."""
-        if file_path not in self._timelines:
-            self._timelines[file_path] = FileTimeline(file_path=file_path)
-        return self._timelines[file_path]
+        timeline = self._get_loaded_timeline(file_path)
+        if timeline is None:
+            timeline = FileTimeline(file_path=file_path)
+            self._timelines[file_path] = timeline
+            self._tracked_files.setdefault(file_path, [])
+        return timeline
 
     def _persist_timeline(self, file_path: str) -> None:
         """Save a single timeline to disk."""
         timeline = self._timelines.get(file_path)
         if not timeline:
             return
+        if file_path in self._unreadable_files:
+            # Saving would replace the stored history with this partial one
+            logger.error(
+                f"Not persisting timeline for {file_path}: "
+                "its stored timeline could not be read"
+            )
+            return
 
+        self._tracked_files[file_path] = list(timeline.task_views)
         self.persistence.save_timeline(file_path, timeline)
-        self.persistence.update_index(list(self._timelines.keys()))
+        self.persistence.update_index(
+            list(self._tracked_files.keys()), self._tracked_files
+        )
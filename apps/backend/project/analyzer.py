@@ -6,7 +6,6 @@ Orchestrates project analysis to build dynamic security profiles.
 Coordinates stack detection, framework detection, and structure analysis.
 """
 
-import hashlib
 import json
 from datetime import datetime
 from pathlib import Path
@@ -23,6 +22,7 @@ from .command_registry import (
     VERSION_MANAGER_COMMANDS,
 )
 from .config_parser import ConfigParser
+from .fingerprint import ProjectFingerprint
 from .framework_detector import FrameworkDetector
 from .models import SecurityProfile
 from .stack_detector import StackDetector
@@ -87,105 +87,10 @@ class ProjectAnalyzer:
         """
         Compute a hash of key project files to detect changes.
 
-        This allows us to know when to re-analyze.
+        This allows us to know when to re-analyze. See ProjectFingerprint
+        for what is hashed and how repeated checks stay cheap.
         """
-        hash_files = [
-            # JavaScript/TypeScript
-            "package.json",
-            "package-lock.json",
-            "yarn.lock",
-            "pnpm-lock.yaml",
-            # Python
-            "pyproject.toml",
-            "requirements.txt",
-            "Pipfile",
-            "poetry.lock",
-            # Rust
-            "Cargo.toml",
-            "Cargo.lock",
-            # Go
-            "go.mod",
-            "go.sum",
-            # Ruby
-            "Gemfile",
-            "Gemfile.lock",
-            # PHP
-            "composer.json",
-            "composer.lock",
-            # Dart/Flutter
-            "pubspec.yaml",
-            "pubspec.lock",
-            # Java/Kotlin/Scala
-            "pom.xml",
-            "build.gradle",
-            "build.gradle.kts",
-            "settings.gradle",
-            "settings.gradle.kts",
-            "build.sbt",
-            # Swift
-            "Package.swift",
-            # Infrastructure
-            "Makefile",
-            "Dockerfile",
-            "docker-compose.yml",
-            "docker-compose.yaml",
-        ]
-
-        # Glob patterns for project files that can be anywhere in the tree
-        glob_patterns = [
-            "*.csproj",  # C# projects
-            "*.sln",  # Visual Studio solutions
-            "*.fsproj",  # F# projects
-            "*.vbproj",  # VB.NET projects
-        ]
-
-        hasher = hashlib.md5(usedforsecurity=False)
-        files_found = 0
-
-        for filename in hash_files:
-            filepath = self.project_dir / filename
-            if filepath.exists():
-                try:
-                    stat = filepath.stat()
-                    hasher.update(f"{filename}:{stat.st_mtime}:{stat.st_size}".encode())
-                    files_found += 1
-                except OSError:
-                    continue
-
-        # Check glob patterns for project files that can be anywhere
-        for pattern in glob_patterns:
-            for filepath in self.project_dir.glob(f"**/{pattern}"):
-                try:
-                    stat = filepath.stat()
-                    rel_path = filepath.relative_to(self.project_dir)
-                    hasher.update(f"{rel_path}:{stat.st_mtime}:{stat.st_size}".encode())
-                    files_found += 1
-                except OSError:
-                    continue
-
-        # If no config files found, hash the project directory structure
-        # to at least detect when files are added/removed
-        if files_found == 0:
-            # Count source files as a proxy for project structure
-            source_exts = [
-                "*.py",
-                "*.js",
-                "*.ts",
-                "*.go",
-                "*.rs",
-                "*.dart",
-                "*.cs",
-                "*.swift",
-                "*.kt",
-                "*.java",
-            ]
-            for ext in source_exts:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
-                hasher.update(f"{ext}:{count}".encode())
-            # Also include the project directory name for uniqueness
-            hasher.update(self.project_dir.name.encode())
-
-        return hasher.hexdigest()
+        return ProjectFingerprint(self.project_dir).compute()
 
     def should_reanalyze(self, profile: SecurityProfile) -> bool:
         """Check if project has changed since last analysis.
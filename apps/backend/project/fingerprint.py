@@ -0,0 +1,301 @@
+"""
+Project Fingerprint
+===================
+
+Cheap change detection for deciding when a security profile must be
+re-analyzed.
+
+The fingerprint covers:
+- stat data (mtime, size) of well-known config files in the project root
+- stat data of project files that can live anywhere (*.csproj, *.sln, ...)
+- when neither exists, per-extension source file counts
+
+Project files and source counts come from a single pruned walk of the tree:
+dependency, VCS and cache directories (node_modules, .venv, .git, ...) are
+never entered. Each directory's listing is summarized and cached against the
+directory's mtime, which changes whenever an entry is added, removed or
+renamed, so a repeated check costs one stat() per directory plus one per
+project file, and only directories whose mtime changed are listed again.
+
+The cache is persisted to .auto-claude/fingerprint_cache.json when the
+project has an .auto-claude directory; otherwise every check walks afresh.
+
+Usage:
+    fingerprint = ProjectFingerprint(project_dir)
+    project_hash = fingerprint.compute()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from core.file_utils import RACY_WINDOW_SECONDS, write_json_atomic
+
+# Config files in the project root whose changes affect the detected stack
+HASH_FILES = (
+    # JavaScript/TypeScript
+    "package.json",
+    "package-lock.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+    # Python
+    "pyproject.toml",
+    "requirements.txt",
+    "Pipfile",
+    "poetry.lock",
+    # Rust
+    "Cargo.toml",
+    "Cargo.lock",
+    # Go
+    "go.mod",
+    "go.sum",
+    # Ruby
+    "Gemfile",
+    "Gemfile.lock",
+    # PHP
+    "composer.json",
+    "composer.lock",
+    # Dart/Flutter
+    "pubspec.yaml",
+    "pubspec.lock",
+    # Java/Kotlin/Scala
+    "pom.xml",
+    "build.gradle",
+    "build.gradle.kts",
+    "settings.gradle",
+    "settings.gradle.kts",
+    "build.sbt",
+    # Swift
+    "Package.swift",
+    # Infrastructure
+    "Makefile",
+    "Dockerfile",
+    "docker-compose.yml",
+    "docker-compose.yaml",
+)
+
+# Project files that can be anywhere in the tree
+PROJECT_FILE_PATTERNS = (
+    "*.csproj",  # C# projects
+    "*.sln",  # Visual Studio solutions
+    "*.fsproj",  # F# projects
+    "*.vbproj",  # VB.NET projects
+)
+
+# Source files counted as a proxy for project structure
+SOURCE_PATTERNS = (
+    "*.py",
+    "*.js",
+    "*.ts",
+    "*.go",
+    "*.rs",
+    "*.dart",
+    "*.cs",
+    "*.swift",
+    "*.kt",
+    "*.java",
+)
+
+# Directories never entered by the walk
+SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".auto-claude",
+        "node_modules",
+        "bower_components",
+        ".venv",
+        "venv",
+        "__pycache__",
+        ".tox",
+        ".nox",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".next",
+        ".nuxt",
+        ".turbo",
+        ".gradle",
+        ".dart_tool",
+        ".idea",
+        ".vscode",
+    }
+)
+
+FINGERPRINT_CACHE_FILENAME = "fingerprint_cache.json"
+CACHE_VERSION = 1
+
+
+def _suffix(pattern: str) -> str:
+    """'*.py' -> '.py'"""
+    return os.path.normcase(pattern[1:])
+
+
+class ProjectFingerprint:
+    """
+    Hash of the project files that determine its security profile.
+
+    Equal hashes mean the detected stack cannot have changed; the hash is
+    stable across runs and independent of directory listing order.
+    """
+
+    def __init__(self, project_dir: Path, cache_path: Path | None = None):
+        """
+        Initialize fingerprint.
+
+        Args:
+            project_dir: Root directory of the project
+            cache_path: Optional path for the persisted directory cache
+                (default: .auto-claude/fingerprint_cache.json, used only if
+                the .auto-claude directory exists)
+        """
+        self.project_dir = Path(project_dir).resolve()
+        if cache_path is None:
+            auto_claude_dir = self.project_dir / ".auto-claude"
+            if auto_claude_dir.is_dir():
+                cache_path = auto_claude_dir / FINGERPRINT_CACHE_FILENAME
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._project_suffixes = {_suffix(p): p for p in PROJECT_FILE_PATTERNS}
+        self._source_suffixes = {_suffix(p): p for p in SOURCE_PATTERNS}
+        # Directories listed (rather than served from cache) by the last walk
+        self.scanned_dirs = 0
+
+    def compute(self) -> str:
+        """Compute the project hash."""
+        hasher = hashlib.md5(usedforsecurity=False)
+        files_found = 0
+
+        for filename in HASH_FILES:
+            try:
+                stat = (self.project_dir / filename).stat()
+            except OSError:
+                continue
+            hasher.update(f"{filename}:{stat.st_mtime}:{stat.st_size}".encode())
+            files_found += 1
+
+        project_files, source_counts = self._walk()
+
+        for rel_path in sorted(project_files):
+            try:
+                stat = (self.project_dir / rel_path).stat()
+            except OSError:
+                continue
+            hasher.update(f"{rel_path}:{stat.st_mtime}:{stat.st_size}".encode())
+            files_found += 1
+
+        # If no config files found, hash the project directory structure
+        # to at least detect when files are added/removed
+        if files_found == 0:
+            for pattern in SOURCE_PATTERNS:
+                hasher.update(f"{pattern}:{source_counts.get(pattern, 0)}".encode())
+            # Also include the project directory name for uniqueness
+            hasher.update(self.project_dir.name.encode())
+
+        return hasher.hexdigest()
+
+    def _walk(self) -> tuple[list[str], dict[str, int]]:
+        """
+        Walk the pruned tree, reusing cached summaries of unchanged directories.
+
+        Returns:
+            (project file paths relative to the root, source counts by pattern)
+        """
+        cache = self._load_cache()
+        new_cache: dict[str, dict] = {}
+        project_files: list[str] = []
+        source_counts: dict[str, int] = {}
+        racy_after = (time.time() - RACY_WINDOW_SECONDS) * 1e9
+        self.scanned_dirs = 0
+
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            path = os.path.join(self.project_dir, rel_dir)
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+
+            entry = cache.get(rel_dir)
+            if entry is None or entry.get("mtime_ns") != mtime_ns:
+                entry = self._scan_dir(path, mtime_ns)
+                if entry is None:
+                    continue
+                self.scanned_dirs += 1
+            if mtime_ns < racy_after:
+                new_cache[rel_dir] = entry
+
+            for name in entry["projects"]:
+                project_files.append(os.path.join(rel_dir, name))
+            for pattern, count in entry["counts"].items():
+                source_counts[pattern] = source_counts.get(pattern, 0) + count
+            stack.extend(os.path.join(rel_dir, name) for name in entry["dirs"])
+
+        self._save_cache(cache, new_cache)
+        return project_files, source_counts
+
+    def _scan_dir(self, path: str, mtime_ns: int) -> dict | None:
+        """Summarize one directory listing."""
+        dirs: list[str] = []
+        projects: list[str] = []
+        counts: dict[str, int] = {}
+        try:
+            with os.scandir(path) as entries:
+                for dir_entry in entries:
+                    try:
+                        is_dir = dir_entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    if is_dir:
+                        if dir_entry.name not in SKIP_DIRS:
+                            dirs.append(dir_entry.name)
+                        continue
+                    suffix = os.path.normcase(os.path.splitext(dir_entry.name)[1])
+                    if suffix in self._project_suffixes:
+                        projects.append(dir_entry.name)
+                    pattern = self._source_suffixes.get(suffix)
+                    if pattern:
+                        counts[pattern] = counts.get(pattern, 0) + 1
+        except OSError:
+            return None
+        return {
+            "mtime_ns": mtime_ns,
+            "dirs": dirs,
+            "projects": projects,
+            "counts": counts,
+        }
+
+    def _load_cache(self) -> dict[str, dict]:
+        if not self.cache_path:
+            return {}
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != CACHE_VERSION
+            or data.get("project_dir") != str(self.project_dir)
+        ):
+            return {}
+        dirs = data.get("dirs")
+        return dirs if isinstance(dirs, dict) else {}
+
+    def _save_cache(self, old: dict[str, dict], new: dict[str, dict]) -> None:
+        if not self.cache_path or new == old:
+            return
+        data = {
+            "version": CACHE_VERSION,
+            "project_dir": str(self.project_dir),
+            "dirs": new,
+        }
+        try:
+            write_json_atomic(self.cache_path, data, indent=None)
+        except OSError:
+            pass  # Uncached directories are scanned again next time
@@ -5,9 +5,11 @@ QA Acceptance Criteria Handling
 Manages acceptance criteria validation and status tracking.
 """
 
+import copy
 import json
 from pathlib import Path
 
+from core.plan_repository import get_plan
 from progress import is_build_complete
 
 # =============================================================================
@@ -16,7 +18,12 @@ from progress import is_build_complete
 
 
 def load_implementation_plan(spec_dir: Path) -> dict | None:
-    """Load the implementation plan JSON."""
+    """
+    Load the implementation plan JSON as a fresh, modifiable dict.
+
+    Read-only checks should use core.plan_repository.get_plan() instead,
+    which reuses the parsed plan while the file is unchanged.
+    """
     plan_file = spec_dir / "implementation_plan.json"
     if not plan_file.exists():
         return None
@@ -45,10 +52,11 @@ def save_implementation_plan(spec_dir: Path, plan: dict) -> bool:
 
 def get_qa_signoff_status(spec_dir: Path) -> dict | None:
     """Get the current QA sign-off status from implementation plan."""
-    plan = load_implementation_plan(spec_dir)
-    if not plan:
+    plan = get_plan(spec_dir)
+    if plan is None:
         return None
-    return plan.get("qa_signoff")
+    # Copy so callers cannot modify the shared plan
+    return copy.deepcopy(plan.data.get("qa_signoff"))
 
 
 def is_qa_approved(spec_dir: Path) -> bool:
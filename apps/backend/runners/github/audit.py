@@ -11,6 +11,7 @@ Features:
 - Actor tracking (user/bot/automation)
 - Duration and token usage tracking
 - Log rotation with configurable retention
+- SQLite sidecar index (audit_index) for fast queries and hourly statistics
 """
 
 from __future__ import annotations
@@ -26,6 +27,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .audit_index import AuditIndex
+    from .file_lock import FileLock
+except (ImportError, ValueError, SystemError):
+    from audit_index import AuditIndex
+    from file_lock import FileLock
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -161,6 +169,24 @@ class AuditEntry:
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), default=str)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AuditEntry:
+        return cls(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            correlation_id=data["correlation_id"],
+            action=AuditAction(data["action"]),
+            actor_type=ActorType(data["actor_type"]),
+            actor_id=data.get("actor_id"),
+            repo=data.get("repo"),
+            pr_number=data.get("pr_number"),
+            issue_number=data.get("issue_number"),
+            result=data["result"],
+            duration_ms=data.get("duration_ms"),
+            error=data.get("error"),
+            details=data.get("details", {}),
+            token_usage=data.get("token_usage"),
+        )
+
 
 class AuditLogger:
     """
@@ -199,6 +225,7 @@ class AuditLogger:
         retention_days: int = 30,
         max_file_size_mb: int = 100,
         enabled: bool = True,
+        use_index: bool = True,
     ):
         """
         Initialize audit logger.
@@ -208,11 +235,16 @@ class AuditLogger:
             retention_days: Days to retain logs (default: 30)
             max_file_size_mb: Max size per log file before rotation (default: 100MB)
             enabled: Whether audit logging is enabled (default: True)
+            use_index: Maintain the SQLite sidecar index used by query_logs()
+                and get_statistics() (default: True). Without it they scan
+                the log files.
         """
         self.log_dir = log_dir or Path(".auto-claude/github/audit")
         self.retention_days = retention_days
         self.max_file_size_mb = max_file_size_mb
         self.enabled = enabled
+        self.use_index = use_index
+        self._index: AuditIndex | None = None
 
         if enabled:
             self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -255,6 +287,12 @@ class AuditLogger:
                 rotated = log_file.with_suffix(f".{timestamp}.jsonl")
                 log_file.rename(rotated)
                 logger.info(f"Rotated audit log to {rotated}")
+                index = self._get_index()
+                if index is not None:
+                    try:
+                        index.rename_file(log_file.name, rotated.name)
+                    except Exception as e:
+                        logger.error(f"Failed to update audit index: {e}")
 
         self._current_log_file = log_file
 
@@ -272,6 +310,29 @@ class AuditLogger:
                 log_file.unlink()
                 logger.info(f"Deleted old audit log: {log_file}")
 
+    def _get_index(self) -> AuditIndex | None:
+        """Open the sidecar index on first use, or None if unavailable."""
+        if not self.enabled or not self.use_index:
+            return None
+        if self._index is None:
+            try:
+                self._index = AuditIndex(self.log_dir)
+            except Exception as e:
+                logger.error(f"Audit index unavailable, scanning logs instead: {e}")
+                self.use_index = False
+        return self._index
+
+    def _get_synced_index(self) -> AuditIndex | None:
+        """Get the index after catching it up with the log files."""
+        index = self._get_index()
+        if index is not None:
+            try:
+                index.sync()
+            except Exception as e:
+                logger.error(f"Failed to sync audit index: {e}")
+                return None
+        return index
+
     def generate_correlation_id(self) -> str:
         """Generate a unique correlation ID for an operation."""
         return f"gh-{uuid.uuid4().hex[:12]}"
@@ -365,14 +426,28 @@ class AuditLogger:
         if not self.enabled:
             return
 
-        self._rotate_if_needed()
-
+        data = entry.to_dict()
+        line = (json.dumps(data, default=str) + "\n").encode("utf-8")
+        log_file = self._get_log_file_path()
         try:
-            log_file = self._get_log_file_path()
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(entry.to_json() + "\n")
+            # Other runner processes append to the same file; the lock keeps
+            # the indexed offset ours and stops rotation mid-write
+            with FileLock(log_file, timeout=5.0):
+                self._rotate_if_needed()
+                with open(log_file, "ab") as f:
+                    offset = f.tell()
+                    f.write(line)
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
+            return
+
+        index = self._get_index()
+        if index is not None:
+            try:
+                index.add(log_file.name, offset, len(line), data)
+            except Exception as e:
+                # The next query's sync() indexes the line from the file
+                logger.error(f"Failed to index audit entry: {e}")
 
     @contextmanager
     def operation(
@@ -581,6 +656,61 @@ class AuditLogger:
         if not self.enabled or not self.log_dir.exists():
             return []
 
+        index = self._get_synced_index()
+        if index is None:
+            return self._scan_logs(
+                correlation_id=correlation_id,
+                action=action,
+                repo=repo,
+                pr_number=pr_number,
+                issue_number=issue_number,
+                since=since,
+                limit=limit,
+            )
+
+        try:
+            locations = index.query(
+                correlation_id=correlation_id,
+                action=action.value if action else None,
+                repo=repo,
+                pr_number=pr_number,
+                issue_number=issue_number,
+                since=since,
+                limit=limit,
+            )
+        except Exception as e:
+            logger.error(f"Audit index query failed: {e}")
+            return []
+
+        results = []
+        handles: dict[str, Any] = {}
+        try:
+            for file_name, offset, length in locations:
+                try:
+                    f = handles.get(file_name)
+                    if f is None:
+                        f = handles[file_name] = open(self.log_dir / file_name, "rb")
+                    f.seek(offset)
+                    results.append(AuditEntry.from_dict(json.loads(f.read(length))))
+                except Exception as e:
+                    logger.error(f"Error reading audit log {file_name}: {e}")
+        finally:
+            for f in handles.values():
+                f.close()
+
+        return results
+
+    def _scan_logs(
+        self,
+        correlation_id: str | None = None,
+        action: AuditAction | None = None,
+        repo: str | None = None,
+        pr_number: int | None = None,
+        issue_number: int | None = None,
+        since: datetime | None = None,
+        limit: int = 100,
+    ) -> list[AuditEntry]:
+        """Query by reading every log file (used when the index is unavailable)."""
         results = []
 
         for log_file in sorted(self.log_dir.glob("audit_*.jsonl"), reverse=True):
@@ -615,22 +745,7 @@ class AuditLogger:
                                 continue
 
                         # Reconstruct entry
-                        entry = AuditEntry(
-                            timestamp=datetime.fromisoformat(data["timestamp"]),
-                            correlation_id=data["correlation_id"],
-                            action=AuditAction(data["action"]),
-                            actor_type=ActorType(data["actor_type"]),
-                            actor_id=data.get("actor_id"),
-                            repo=data.get("repo"),
-                            pr_number=data.get("pr_number"),
-                            issue_number=data.get("issue_number"),
-                            result=data["result"],
-                            duration_ms=data.get("duration_ms"),
-                            error=data.get("error"),
-                            details=data.get("details", {}),
-                            token_usage=data.get("token_usage"),
-                        )
-                        results.append(entry)
+                        results.append(AuditEntry.from_dict(data))
 
                         if len(results) >= limit:
                             return results
@@ -652,10 +767,21 @@ class AuditLogger:
         """
         Get aggregate statistics from audit logs.
 
+        Answered from the index's hourly rollups when available; otherwise
+        computed from up to 10,000 scanned entries.
+
         Returns:
             Dictionary with counts by action, result, and actor type
         """
-        entries = self.query_logs(repo=repo, since=since, limit=10000)
+        if self.enabled and self.log_dir.exists():
+            index = self._get_synced_index()
+            if index is not None:
+                try:
+                    return index.statistics(repo=repo, since=since)
+                except Exception as e:
+                    logger.error(f"Audit index statistics failed: {e}")
+
+        entries = self._scan_logs(repo=repo, since=since, limit=10000)
 
         stats = {
             "total_entries": len(entries),
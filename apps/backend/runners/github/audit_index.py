@@ -0,0 +1,430 @@
+"""
+Audit Log Index
+===============
+
+SQLite sidecar index for the JSONL audit logs written by AuditLogger.
+
+The JSONL files stay the source of truth; the index only records where each
+entry lives (file, byte offset, length) together with the fields queries
+filter on, so query_logs() can seek straight to matching lines instead of
+decoding every file.
+
+- Entry rows keyed on correlation_id, repo, pr/issue number, action and
+  timestamp, written as AuditLogger appends
+- Hourly rollups (counts, durations, token usage per action/result/actor)
+  so get_statistics() never reads the logs
+- Catch-up indexing of any unindexed file tail (older logs, other processes,
+  crashes between append and index update)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = "audit_index.db"
+INDEX_VERSION = 1
+HOUR_SECONDS = 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    file TEXT NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    ts REAL NOT NULL,
+    correlation_id TEXT,
+    action TEXT,
+    actor_type TEXT,
+    repo TEXT,
+    pr_number INTEGER,
+    issue_number INTEGER,
+    result TEXT,
+    duration_ms INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    PRIMARY KEY (file, offset)
+);
+CREATE INDEX IF NOT EXISTS entries_correlation ON entries (correlation_id);
+CREATE INDEX IF NOT EXISTS entries_repo ON entries (repo, ts);
+CREATE INDEX IF NOT EXISTS entries_pr ON entries (pr_number);
+CREATE INDEX IF NOT EXISTS entries_issue ON entries (issue_number);
+CREATE INDEX IF NOT EXISTS entries_action ON entries (action);
+CREATE INDEX IF NOT EXISTS entries_ts ON entries (ts);
+
+-- Bytes of each log file indexed contiguously from the start
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rollups (
+    hour INTEGER NOT NULL,
+    repo TEXT NOT NULL,
+    action TEXT NOT NULL,
+    result TEXT NOT NULL,
+    actor_type TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL,
+    input_tokens INTEGER NOT NULL,
+    output_tokens INTEGER NOT NULL,
+    PRIMARY KEY (hour, repo, action, result, actor_type)
+);
+"""
+
+_ROLLUP_UPSERT = """
+INSERT INTO rollups (hour, repo, action, result, actor_type, count,
+                     duration_ms, input_tokens, output_tokens)
+VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?)
+ON CONFLICT (hour, repo, action, result, actor_type) DO UPDATE SET
+    count = count + 1,
+    duration_ms = duration_ms + excluded.duration_ms,
+    input_tokens = input_tokens + excluded.input_tokens,
+    output_tokens = output_tokens + excluded.output_tokens
+"""
+
+_ROLLUP_REBUILD = """
+INSERT INTO rollups (hour, repo, action, result, actor_type, count,
+                     duration_ms, input_tokens, output_tokens)
+SELECT CAST(ts / 3600 AS INTEGER) * 3600, COALESCE(repo, ''), action, result,
+       actor_type, COUNT(*), SUM(duration_ms), SUM(input_tokens),
+       SUM(output_tokens)
+FROM entries
+WHERE CAST(ts / 3600 AS INTEGER) * 3600 = ?
+GROUP BY 1, 2, 3, 4, 5
+"""
+
+
+def _timestamp(value: datetime) -> float:
+    """Epoch seconds, treating naive datetimes as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class AuditIndex:
+    """
+    Offset index and hourly rollups over a directory of audit JSONL files.
+
+    Usage:
+        index = AuditIndex(log_dir)
+        index.add(log_file.name, offset, line_bytes, entry.to_dict())
+        locations = index.query(repo="owner/repo", limit=100)
+        stats = index.statistics(since=datetime(...))
+    """
+
+    def __init__(self, log_dir: Path):
+        self.log_dir = Path(log_dir)
+        self.path = self.log_dir / INDEX_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            # Derived data only - rebuilt from the logs by sync()
+            self._conn.executescript(
+                "DROP TABLE IF EXISTS entries;"
+                "DROP TABLE IF EXISTS files;"
+                "DROP TABLE IF EXISTS rollups;"
+            )
+        self._conn.executescript(_SCHEMA)
+        self._conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def add(self, file_name: str, offset: int, length: int, data: dict) -> None:
+        """
+        Index one entry appended to a log file.
+
+        Args:
+            file_name: Log file name (relative to log_dir)
+            offset: Byte offset of the entry's line
+            length: Byte length of the line, including the newline
+            data: The entry as written (AuditEntry.to_dict())
+        """
+        with self._lock, self._conn:
+            self._insert(file_name, offset, length, data)
+            # Only advance the contiguous mark; gaps are filled by sync()
+            self._conn.execute(
+                "UPDATE files SET size = ? WHERE name = ? AND size = ?",
+                (offset + length, file_name, offset),
+            )
+            self._conn.execute(
+                "INSERT OR IGNORE INTO files (name, size) VALUES (?, ?)",
+                (file_name, offset + length if offset == 0 else 0),
+            )
+
+    def _insert(self, file_name: str, offset: int, length: int, data: dict) -> None:
+        ts = _timestamp(datetime.fromisoformat(data["timestamp"]))
+        token_usage = data.get("token_usage") or {}
+        row = (
+            data["correlation_id"],
+            data["action"],
+            data["actor_type"],
+            data.get("repo"),
+            data.get("pr_number"),
+            data.get("issue_number"),
+            data["result"],
+            data.get("duration_ms") or 0,
+            token_usage.get("input_tokens", 0),
+            token_usage.get("output_tokens", 0),
+        )
+        cursor = self._conn.execute(
+            "INSERT OR IGNORE INTO entries (file, offset, length, ts, "
+            "correlation_id, action, actor_type, repo, pr_number, issue_number, "
+            "result, duration_ms, input_tokens, output_tokens) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (file_name, offset, length, ts) + row,
+        )
+        if cursor.rowcount:
+            self._conn.execute(
+                _ROLLUP_UPSERT,
+                (
+                    int(ts // HOUR_SECONDS) * HOUR_SECONDS,
+                    row[3] or "",
+                    row[1],
+                    row[6],
+                    row[2],
+                    row[7],
+                    row[8],
+                    row[9],
+                ),
+            )
+
+    def rename_file(self, old_name: str, new_name: str) -> None:
+        """Follow a log file rotated from old_name to new_name."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE entries SET file = ? WHERE file = ?", (new_name, old_name)
+            )
+            self._conn.execute(
+                "UPDATE files SET name = ? WHERE name = ?", (new_name, old_name)
+            )
+
+    def sync(self) -> None:
+        """
+        Bring the index up to date with the log files on disk.
+
+        Indexes unindexed tails (logs written before the index existed, by
+        other processes, or lost to a crash) and drops deleted files.
+        """
+        on_disk = {
+            log_file.name: log_file for log_file in self.log_dir.glob("audit_*.jsonl")
+        }
+        with self._lock:
+            indexed = dict(self._conn.execute("SELECT name, size FROM files"))
+
+            removed = [name for name in indexed if name not in on_disk]
+            if removed:
+                with self._conn:
+                    for name in removed:
+                        self._drop_file(name)
+
+            for name, log_file in on_disk.items():
+                start = indexed.get(name, 0)
+                try:
+                    size = log_file.stat().st_size
+                except OSError:
+                    continue
+                if size < start:
+                    # Truncated or replaced - reindex from scratch
+                    with self._conn:
+                        self._drop_file(name)
+                    start = 0
+                if size > start:
+                    self._index_tail(name, log_file, start)
+
+    def _drop_file(self, name: str) -> None:
+        hours = [
+            row[0]
+            for row in self._conn.execute(
+                "SELECT DISTINCT CAST(ts / 3600 AS INTEGER) * 3600 "
+                "FROM entries WHERE file = ?",
+                (name,),
+            )
+        ]
+        self._conn.execute("DELETE FROM entries WHERE file = ?", (name,))
+        self._conn.execute("DELETE FROM files WHERE name = ?", (name,))
+        for hour in hours:
+            self._conn.execute("DELETE FROM rollups WHERE hour = ?", (hour,))
+            self._conn.execute(_ROLLUP_REBUILD, (hour,))
+
+    def _index_tail(self, name: str, log_file: Path, start: int) -> None:
+        try:
+            with open(log_file, "rb") as f:
+                f.seek(start)
+                data = f.read()
+        except OSError as e:
+            logger.error(f"Error indexing audit log {log_file}: {e}")
+            return
+
+        # Leave a partially written last line for the next sync
+        end = data.rfind(b"\n") + 1
+        offset = start
+        with self._conn:
+            for line in data[:end].splitlines(keepends=True):
+                if line.strip():
+                    try:
+                        self._insert(name, offset, len(line), json.loads(line))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        pass
+                offset += len(line)
+            self._conn.execute(
+                "INSERT INTO files (name, size) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET size = excluded.size",
+                (name, start + end),
+            )
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        correlation_id: str | None = None,
+        action: str | None = None,
+        repo: str | None = None,
+        pr_number: int | None = None,
+        issue_number: int | None = None,
+        since: datetime | None = None,
+        limit: int = 100,
+    ) -> list[tuple[str, int, int]]:
+        """
+        Find matching entries.
+
+        Results come in the order a scan of the log files yields them:
+        files newest name first, entries in append order within a file.
+
+        Returns:
+            (file name, offset, length) for each match
+        """
+        clauses, params = self._filters(
+            correlation_id=correlation_id,
+            action=action,
+            repo=repo,
+            pr_number=pr_number,
+            issue_number=issue_number,
+            since=since,
+        )
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT file, offset, length FROM entries {where} "
+                "ORDER BY file DESC, offset ASC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+
+    def statistics(
+        self, repo: str | None = None, since: datetime | None = None
+    ) -> dict[str, Any]:
+        """
+        Aggregate counts, durations and token usage.
+
+        Whole hours come from the rollups; only the partial hour at the start
+        of a `since` window is aggregated from entry rows.
+        """
+        stats: dict[str, Any] = {
+            "total_entries": 0,
+            "by_action": {},
+            "by_result": {},
+            "by_actor_type": {},
+            "total_duration_ms": 0,
+            "total_input_tokens": 0,
+            "total_output_tokens": 0,
+        }
+
+        queries = []
+        if since is None:
+            rollup_clauses, rollup_params = [], []
+        else:
+            since_ts = _timestamp(since)
+            first_hour = -(-since_ts // HOUR_SECONDS) * HOUR_SECONDS
+            rollup_clauses, rollup_params = ["hour >= ?"], [first_hour]
+            if since_ts < first_hour:
+                entry_clauses, entry_params = self._filters(repo=repo, since=since)
+                entry_clauses.append("ts < ?")
+                entry_params.append(first_hour)
+                queries.append(
+                    "SELECT action, result, actor_type, COUNT(*), "
+                    "SUM(duration_ms), SUM(input_tokens), SUM(output_tokens) "
+                    f"FROM entries WHERE {' AND '.join(entry_clauses)} "
+                    "GROUP BY 1, 2, 3",
+                    entry_params,
+                )
+        if repo:
+            rollup_clauses.append("repo = ?")
+            rollup_params.append(repo)
+        where = f"WHERE {' AND '.join(rollup_clauses)}" if rollup_clauses else ""
+        queries.insert(
+            0,
+            (
+                "SELECT action, result, actor_type, SUM(count), SUM(duration_ms), "
+                f"SUM(input_tokens), SUM(output_tokens) FROM rollups {where} "
+                "GROUP BY 1, 2, 3",
+                rollup_params,
+            ),
+        )
+
+        with self._lock:
+            rows = [
+                row
+                for sql, params in queries
+                for row in self._conn.execute(sql, params).fetchall()
+            ]
+
+        for action, result, actor_type, count, duration, tokens_in, tokens_out in rows:
+            stats["total_entries"] += count
+            for key, value in (
+                ("by_action", action),
+                ("by_result", result),
+                ("by_actor_type", actor_type),
+            ):
+                stats[key][value] = stats[key].get(value, 0) + count
+            stats["total_duration_ms"] += duration or 0
+            stats["total_input_tokens"] += tokens_in or 0
+            stats["total_output_tokens"] += tokens_out or 0
+        return stats
+
+    @staticmethod
+    def _filters(
+        correlation_id: str | None = None,
+        action: str | None = None,
+        repo: str | None = None,
+        pr_number: int | None = None,
+        issue_number: int | None = None,
+        since: datetime | None = None,
+    ) -> tuple[list[str], list[Any]]:
+        """Build WHERE clauses; falsy filters are ignored like query_logs()."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        for column, value in (
+            ("correlation_id", correlation_id),
+            ("action", action),
+            ("repo", repo),
+            ("pr_number", pr_number),
+            ("issue_number", issue_number),
+        ):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since:
+            clauses.append("ts >= ?")
+            params.append(_timestamp(since))
+        return clauses, params
@@ -4,13 +4,14 @@ Issue Batching Service
 
 Groups similar issues together for combined auto-fix:
 - Uses semantic similarity from duplicates.py
-- Creates issue clusters using agglomerative clustering
+- Creates issue clusters using heap-driven average-linkage clustering
 - Generates combined specs for issue batches
 - Tracks batch state and progress
 """
 
 from __future__ import annotations
 
+import heapq
 import json
 import logging
 from dataclasses import dataclass, field
@@ -730,53 +731,80 @@ class IssueBatcher:
         similarity_matrix: dict[tuple[int, int], float],
     ) -> list[list[int]]:
         """
-        Cluster issues using simple agglomerative approach.
+        Cluster issues with heap-driven average-linkage agglomeration.
+
+        Only pairs present in the (sparse) similarity matrix link clusters;
+        a cluster pair's score is the average over its linked member pairs.
+        The best-scoring pair is merged until no pair reaches the similarity
+        threshold. Merges that would exceed max_batch_size are skipped. Each
+        merge only updates the merged clusters' neighbors, so the cost is
+        O(E log E) in the number of similar pairs instead of rescanning every
+        cluster pair per merge.
 
         Returns list of clusters, each cluster is a list of issue numbers.
         """
-        issue_numbers = [i["number"] for i in issues]
-
-        # Start with each issue in its own cluster
-        clusters: list[set[int]] = [{n} for n in issue_numbers]
-
-        # Merge clusters that have similar issues
-        def cluster_similarity(c1: set[int], c2: set[int]) -> float:
-            """Average similarity between clusters."""
-            scores = []
-            for a in c1:
-                for b in c2:
-                    if (a, b) in similarity_matrix:
-                        scores.append(similarity_matrix[(a, b)])
-            return sum(scores) / len(scores) if scores else 0.0
-
-        # Iteratively merge most similar clusters
-        while len(clusters) > 1:
-            best_score = 0.0
-            best_pair = (-1, -1)
-
-            for i in range(len(clusters)):
-                for j in range(i + 1, len(clusters)):
-                    score = cluster_similarity(clusters[i], clusters[j])
-                    if score > best_score:
-                        best_score = score
-                        best_pair = (i, j)
-
-            # Stop if best similarity is below threshold
-            if best_score < self.similarity_threshold:
-                break
+        issue_numbers = list(dict.fromkeys(i["number"] for i in issues))
+        position = {n: idx for idx, n in enumerate(issue_numbers)}
+
+        # Start with each issue in its own cluster (cluster id = list index)
+        members: list[list[int]] = [[n] for n in issue_numbers]
+        alive = [True] * len(members)
+        # cluster id -> neighbor cluster id -> (similarity sum, linked pairs)
+        links: list[dict[int, tuple[float, int]]] = [{} for _ in members]
+
+        # Undirected edges; a pair stored in both directions counts once
+        # (with the mean of its two scores)
+        edges: dict[tuple[int, int], list[float]] = {}
+        for (a, b), score in similarity_matrix.items():
+            if a != b and a in position and b in position:
+                ca, cb = sorted((position[a], position[b]))
+                edges.setdefault((ca, cb), []).append(score)
+        for (ca, cb), scores in edges.items():
+            links[ca][cb] = links[cb][ca] = (sum(scores) / len(scores), 1)
+
+        heap: list[tuple[float, int, int]] = [
+            (-total / count, ca, cb)
+            for ca, neighbors in enumerate(links)
+            for cb, (total, count) in neighbors.items()
+            if ca < cb
+        ]
+        heapq.heapify(heap)
 
-            # Merge clusters
-            i, j = best_pair
-            merged = clusters[i] | clusters[j]
+        while heap:
+            neg_score, ca, cb = heapq.heappop(heap)
+            if not (alive[ca] and alive[cb]):
+                continue  # Stale: one side was merged away
 
-            # Don't exceed max batch size
-            if len(merged) > self.max_batch_size:
+            # Stop if best similarity is below threshold
+            if -neg_score < self.similarity_threshold:
                 break
 
-            clusters = [c for k, c in enumerate(clusters) if k not in (i, j)]
-            clusters.append(merged)
+            # Don't exceed max batch size (sizes only grow, so drop the pair)
+            if len(members[ca]) + len(members[cb]) > self.max_batch_size:
+                continue
 
-        return [list(c) for c in clusters]
+            # Merge into a new cluster and re-link its neighbors
+            merged = len(members)
+            members.append(members[ca] + members[cb])
+            alive.append(True)
+            alive[ca] = alive[cb] = False
+            combined: dict[int, tuple[float, int]] = {}
+            for old in (ca, cb):
+                for other, (total, count) in links[old].items():
+                    if other in (ca, cb):
+                        continue
+                    prev_total, prev_count = combined.get(other, (0.0, 0))
+                    combined[other] = (prev_total + total, prev_count + count)
+                    links[other].pop(old, None)
+                links[old] = {}
+            links.append(combined)
+            for other, (total, count) in combined.items():
+                links[other][merged] = (total, count)
+                heapq.heappush(heap, (-total / count, other, merged))
+
+        clusters = [members[c] for c in range(len(members)) if alive[c]]
+        clusters.sort(key=lambda cluster: min(position[n] for n in cluster))
+        return [sorted(cluster, key=position.__getitem__) for cluster in clusters]
 
     def _extract_common_themes(
         self,
@@ -860,6 +888,7 @@ class IssueBatcher:
         clusters = self._cluster_issues(available_issues, similarity_matrix)
 
         # Create initial batches from clusters
+        issues_by_number = {i["number"]: i for i in available_issues}
         initial_batches = []
         for cluster in clusters:
             if len(cluster) < self.min_batch_size:
@@ -876,7 +905,7 @@ class IssueBatcher:
             )
 
             # Build batch items
-            cluster_issues = [i for i in available_issues if i["number"] in cluster]
+            cluster_issues = [issues_by_number[n] for n in cluster]
             items = []
             for issue in cluster_issues:
                 similarity = (
@@ -19,6 +19,7 @@ from __future__ import annotations
 import ast
 import asyncio
 import json
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -33,6 +34,8 @@ except (ImportError, ValueError, SystemError):
     from core.io_utils import safe_print
     from gh_client import GHClient, PRTooLargeError
 
+from core.git_batch import GitBatchSession, split_diff
+
 # Validation patterns for git refs and paths (defense-in-depth)
 # These patterns allow common valid characters while rejecting potentially dangerous ones
 SAFE_REF_PATTERN = re.compile(r"^[a-zA-Z0-9._/\-]+$")
@@ -52,6 +55,69 @@ CONFIG_FILE_NAMES = [
     "vite.config.ts",
 ]
 
+# One query for everything gather() needs from the API besides the diff.
+# Each connection pages independently; finished ones are dropped from
+# follow-up requests with @include.
+PR_BULK_QUERY = """
+query(
+  $owner: String!, $name: String!, $number: Int!,
+  $filesAfter: String, $commitsAfter: String,
+  $threadsAfter: String, $commentsAfter: String,
+  $withFiles: Boolean!, $withCommits: Boolean!,
+  $withThreads: Boolean!, $withComments: Boolean!
+) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      number title body state
+      headRefName baseRefName headRefOid baseRefOid
+      additions deletions changedFiles
+      mergeable mergeStateStatus
+      author { login }
+      labels(first: 100) { nodes { name } }
+      files(first: 100, after: $filesAfter) @include(if: $withFiles) {
+        nodes { path additions deletions changeType }
+        pageInfo { hasNextPage endCursor }
+      }
+      commits(first: 100, after: $commitsAfter) @include(if: $withCommits) {
+        nodes {
+          commit {
+            oid messageHeadline messageBody authoredDate committedDate
+            authors(first: 10) { nodes { name email user { id login } } }
+          }
+        }
+        pageInfo { hasNextPage endCursor }
+      }
+      reviewThreads(first: 50, after: $threadsAfter) @include(if: $withThreads) {
+        nodes {
+          comments(first: 50) {
+            nodes { databaseId author { login } body path line originalLine createdAt }
+          }
+        }
+        pageInfo { hasNextPage endCursor }
+      }
+      comments(first: 100, after: $commentsAfter) @include(if: $withComments) {
+        nodes { databaseId author { login } body createdAt }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+  }
+}
+"""
+
+# Paginated connections of PR_BULK_QUERY: (field, cursor variable, flag variable)
+_BULK_CONNECTIONS = [
+    ("files", "filesAfter", "withFiles"),
+    ("commits", "commitsAfter", "withCommits"),
+    ("reviewThreads", "threadsAfter", "withThreads"),
+    ("comments", "commentsAfter", "withComments"),
+]
+_BULK_MAX_PAGES = 50  # Safety limit per query (5000 files at 100 per page)
+
+
+def _get_bulk_fetch_enabled() -> bool:
+    """Whether PRContextGatherer uses the bulk GraphQL fetch (GITHUB_BULK_CONTEXT)."""
+    return os.environ.get("GITHUB_BULK_CONTEXT", "").lower() in ("1", "true", "yes")
+
 
 def _validate_git_ref(ref: str) -> bool:
     """
@@ -233,10 +299,28 @@ class PRContext:
 class PRContextGatherer:
     """Gathers all context needed for PR review BEFORE the AI starts."""
 
-    def __init__(self, project_dir: Path, pr_number: int, repo: str | None = None):
+    def __init__(
+        self,
+        project_dir: Path,
+        pr_number: int,
+        repo: str | None = None,
+        bulk_fetch: bool | None = None,
+    ):
+        """
+        Args:
+            project_dir: Local checkout of the repository
+            pr_number: PR to gather context for
+            repo: Repository in 'owner/repo' format (default: from git remotes)
+            bulk_fetch: Fetch metadata, files, commits and comments with one
+                paginated GraphQL query instead of one gh call each.
+                Defaults to the GITHUB_BULK_CONTEXT environment variable.
+        """
         self.project_dir = Path(project_dir)
         self.pr_number = pr_number
         self.repo = repo
+        self.bulk_fetch = (
+            _get_bulk_fetch_enabled() if bulk_fetch is None else bulk_fetch
+        )
         self.gh_client = GHClient(
             project_dir=self.project_dir,
             default_timeout=30.0,
@@ -253,8 +337,16 @@ class PRContextGatherer:
         """
         safe_print(f"[Context] Gathering context for PR #{self.pr_number}...")
 
+        # In bulk mode the diff downloads while the GraphQL query pages
+        bulk = None
+        diff = None
+        if self.bulk_fetch:
+            bulk, diff = await asyncio.gather(
+                self._fetch_pr_bulk(), self._fetch_pr_diff()
+            )
+
         # Fetch basic PR metadata
-        pr_data = await self._fetch_pr_metadata()
+        pr_data = bulk["pr"] if bulk else await self._fetch_pr_metadata()
         safe_print(
             f"[Context] PR metadata: {pr_data['title']} by {pr_data['author']['login']}",
             flush=True,
@@ -278,7 +370,8 @@ class PRContextGatherer:
         safe_print(f"[Context] Fetched {len(changed_files)} changed files")
 
         # Fetch full diff
-        diff = await self._fetch_pr_diff()
+        if diff is None:
+            diff = await self._fetch_pr_diff()
         safe_print(f"[Context] Fetched diff: {len(diff)} chars")
 
         # Detect repo structure
@@ -290,11 +383,16 @@ class PRContextGatherer:
         safe_print(f"[Context] Found {len(related_files)} related files")
 
         # Fetch commits
-        commits = await self._fetch_commits()
+        commits = bulk["commits"] if bulk else await self._fetch_commits()
         safe_print(f"[Context] Fetched {len(commits)} commits")
 
         # Fetch AI bot comments for triage
-        ai_bot_comments = await self._fetch_ai_bot_comments()
+        if bulk:
+            ai_bot_comments = self._collect_ai_bot_comments(
+                bulk["review_comments"], bulk["issue_comments"]
+            )
+        else:
+            ai_bot_comments = await self._fetch_ai_bot_comments()
         safe_print(f"[Context] Fetched {len(ai_bot_comments)} AI bot comments")
 
         # Check if diff was truncated (empty diff but files were changed)
@@ -359,6 +457,133 @@ class PRContextGatherer:
             ],
         )
 
+    async def _fetch_pr_bulk(self) -> dict | None:
+        """
+        Fetch metadata, files, commits and comments with one GraphQL query.
+
+        Results are shaped like the per-call fetches return them: "pr" like
+        _fetch_pr_metadata(), "commits" like `gh pr view --json commits`, and
+        "review_comments" / "issue_comments" like the REST comment listings.
+        Review threads contribute at most 50 comments each.
+
+        Returns:
+            Dictionary with "pr", "commits", "review_comments" and
+            "issue_comments", or None if the query failed (callers fall back
+            to the per-call fetches)
+        """
+        if self.repo and "/" in self.repo:
+            owner, name = self.repo.split("/", 1)
+        else:
+            owner, name = "{owner}", "{repo}"
+        variables: dict = {"owner": owner, "name": name, "number": self.pr_number}
+        for _, cursor, flag in _BULK_CONNECTIONS:
+            variables[cursor] = None
+            variables[flag] = True
+
+        pr: dict | None = None
+        nodes: dict[str, list] = {conn: [] for conn, _, _ in _BULK_CONNECTIONS}
+        try:
+            for _ in range(_BULK_MAX_PAGES):
+                data = await self.gh_client.graphql(
+                    PR_BULK_QUERY, variables, timeout=60.0
+                )
+                page = (data.get("repository") or {}).get("pullRequest")
+                if page is None:
+                    raise ValueError(f"PR #{self.pr_number} not found")
+                if pr is None:
+                    pr = page
+
+                more = False
+                for conn, cursor, flag in _BULK_CONNECTIONS:
+                    if not variables[flag]:
+                        continue
+                    connection = page.get(conn) or {}
+                    nodes[conn].extend(connection.get("nodes") or [])
+                    page_info = connection.get("pageInfo") or {}
+                    variables[flag] = bool(page_info.get("hasNextPage"))
+                    variables[cursor] = page_info.get("endCursor")
+                    more = more or variables[flag]
+                if not more:
+                    break
+            else:
+                safe_print(
+                    f"[Context] PR #{self.pr_number} exceeds {_BULK_MAX_PAGES} "
+                    "pages, stopping pagination"
+                )
+        except Exception as e:
+            safe_print(f"[Context] Bulk fetch failed, using per-call fetches: {e}")
+            return None
+
+        safe_print(f"[Context] Bulk-fetched PR #{self.pr_number} via GraphQL")
+
+        pr_data = {key: value for key, value in pr.items() if key not in nodes}
+        pr_data["author"] = pr.get("author") or {"login": ""}
+        pr_data["labels"] = (pr.get("labels") or {}).get("nodes") or []
+        pr_data["files"] = [
+            {
+                "path": f["path"],
+                "status": (f.get("changeType") or "modified").lower(),
+                "additions": f.get("additions", 0),
+                "deletions": f.get("deletions", 0),
+            }
+            for f in nodes["files"]
+        ]
+
+        commits = []
+        for node in nodes["commits"]:
+            commit = node.get("commit") or {}
+            authors = []
+            for author in (commit.get("authors") or {}).get("nodes") or []:
+                user = author.get("user") or {}
+                authors.append(
+                    {
+                        "email": author.get("email", ""),
+                        "id": user.get("id", ""),
+                        "login": user.get("login", ""),
+                        "name": author.get("name", ""),
+                    }
+                )
+            commits.append(
+                {
+                    "authoredDate": commit.get("authoredDate", ""),
+                    "authors": authors,
+                    "committedDate": commit.get("committedDate", ""),
+                    "messageBody": commit.get("messageBody", ""),
+                    "messageHeadline": commit.get("messageHeadline", ""),
+                    "oid": commit.get("oid", ""),
+                }
+            )
+
+        review_comments = [
+            {
+                "id": comment.get("databaseId") or 0,
+                "author": comment.get("author"),
+                "body": comment.get("body", ""),
+                "path": comment.get("path"),
+                "line": comment.get("line"),
+                "original_line": comment.get("originalLine"),
+                "createdAt": comment.get("createdAt", ""),
+            }
+            for thread in nodes["reviewThreads"]
+            for comment in ((thread.get("comments") or {}).get("nodes") or [])
+        ]
+        issue_comments = [
+            {
+                "id": comment.get("databaseId") or 0,
+                "author": comment.get("author"),
+                "body": comment.get("body", ""),
+                "createdAt": comment.get("createdAt", ""),
+            }
+            for comment in nodes["comments"]
+        ]
+
+        return {
+            "pr": pr_data,
+            "commits": commits,
+            "review_comments": review_comments,
+            "issue_comments": issue_comments,
+        }
+
     async def _ensure_pr_refs_available(self, head_sha: str, base_sha: str) -> bool:
         """
         Ensure PR refs are available locally by fetching the commit SHAs.
@@ -444,40 +669,37 @@ class PRContextGatherer:
         - Current content (HEAD of PR branch)
         - Base content (before changes)
         - Diff patch
+
+        Contents of all files are read in one batch and patches come from a
+        single git diff, instead of three git processes per file.
         """
         changed_files = []
         files = pr_data.get("files", [])
+        if not files:
+            return changed_files
+
+        # Use commit SHAs if available (works for fork PRs), fallback to branch names
+        head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
+        base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
+
+        paths = [file_info["path"] for file_info in files]
+        contents = await self._read_file_contents(paths, [head_ref, base_ref])
+        patches = await self._get_file_patches(paths, base_ref, head_ref)
 
         for file_info in files:
             path = file_info["path"]
             status = self._normalize_status(file_info.get("status", "modified"))
-            additions = file_info.get("additions", 0)
-            deletions = file_info.get("deletions", 0)
-
             safe_print(f"[Context]   Processing {path} ({status})...")
 
-            # Use commit SHAs if available (works for fork PRs), fallback to branch names
-            head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
-            base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
-
-            # Get current content (from PR head commit)
-            content = await self._read_file_content(path, head_ref)
-
-            # Get base content (from base commit)
-            base_content = await self._read_file_content(path, base_ref)
-
-            # Get the patch for this specific file
-            patch = await self._get_file_patch(path, base_ref, head_ref)
-
             changed_files.append(
                 ChangedFile(
                     path=path,
                     status=status,
-                    additions=additions,
-                    deletions=deletions,
-                    content=content,
-                    base_content=base_content,
-                    patch=patch,
+                    additions=file_info.get("additions", 0),
+                    deletions=file_info.get("deletions", 0),
+                    content=contents.get((head_ref, path), ""),
+                    base_content=contents.get((base_ref, path), ""),
+                    patch=patches.get(path, ""),
                 )
             )
 
@@ -540,6 +762,97 @@ class PRContextGatherer:
             safe_print(f"[Context] Error reading {path} from {ref}: {e}")
             return ""
 
+    async def _read_file_contents(
+        self, paths: list[str], refs: list[str]
+    ) -> dict[tuple[str, str], str]:
+        """
+        Read many files at several refs through one ``git cat-file --batch``.
+
+        Args:
+            paths: File paths relative to repo root
+            refs: Git refs to read every path at
+
+        Returns:
+            Dictionary mapping (ref, path) to content; missing, binary and
+            rejected entries map to an empty string
+        """
+        contents: dict[tuple[str, str], str] = {}
+        specs: list[tuple[str, str]] = []
+        for ref in dict.fromkeys(refs):
+            if not _validate_git_ref(ref):
+                safe_print(f"[Context] Invalid git ref rejected: {ref[:50]}...")
+                continue
+            for path in dict.fromkeys(paths):
+                if _validate_file_path(path):
+                    specs.append((ref, path))
+                else:
+                    safe_print(f"[Context] Invalid file path rejected: {path[:50]}...")
+        if not specs:
+            return contents
+
+        def read_objects() -> dict[str, bytes | None]:
+            with GitBatchSession(self.project_dir) as git:
+                return git.read_objects([f"{ref}:{path}" for ref, path in specs])
+
+        try:
+            objects = await asyncio.wait_for(
+                asyncio.to_thread(read_objects), timeout=60.0
+            )
+        except asyncio.TimeoutError:
+            safe_print("[Context] Timeout reading changed files")
+            return contents
+        except Exception as e:
+            safe_print(f"[Context] Error reading changed files: {e}")
+            return contents
+
+        for ref, path in specs:
+            data = objects.get(f"{ref}:{path}")
+            try:
+                contents[(ref, path)] = data.decode("utf-8") if data else ""
+            except UnicodeDecodeError:
+                contents[(ref, path)] = ""
+        return contents
+
+    async def _get_file_patches(
+        self, paths: list[str], base_ref: str, head_ref: str
+    ) -> dict[str, str]:
+        """
+        Get the diff patch for many files from a single git diff.
+
+        Files whose section can't be identified in the combined diff (e.g.
+        quoted paths) are diffed individually with _get_file_patch().
+
+        Returns:
+            Dictionary mapping each path to its unified diff patch
+        """
+        sections: dict[str, str] = {}
+        if _validate_git_ref(base_ref) and _validate_git_ref(head_ref):
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    "git",
+                    "diff",
+                    "--no-renames",
+                    f"{base_ref}...{head_ref}",
+                    cwd=self.project_dir,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=60.0)
+                if proc.returncode == 0:
+                    sections = split_diff(stdout.decode("utf-8", errors="replace"))
+            except asyncio.TimeoutError:
+                safe_print("[Context] Timeout getting combined patch")
+            except Exception as e:
+                safe_print(f"[Context] Error getting combined patch: {e}")
+
+        patches = {}
+        for path in paths:
+            patch = sections.get(path)
+            if patch is None:
+                patch = await self._get_file_patch(path, base_ref, head_ref)
+            patches[path] = patch
+        return patches
+
     async def _get_file_patch(self, path: str, base_ref: str, head_ref: str) -> str:
         """
         Get the diff patch for a specific file using git diff.
@@ -631,26 +944,31 @@ class PRContextGatherer:
 
         Returns comments from known AI tools like CodeRabbit, Cursor, Greptile, etc.
         """
-        ai_comments: list[AIBotComment] = []
-
         try:
             # Fetch review comments (inline comments on files)
             review_comments = await self._fetch_pr_review_comments()
-            for comment in review_comments:
-                ai_comment = self._parse_ai_comment(comment, is_review_comment=True)
-                if ai_comment:
-                    ai_comments.append(ai_comment)
 
             # Fetch issue comments (general PR comments)
             issue_comments = await self._fetch_pr_issue_comments()
-            for comment in issue_comments:
-                ai_comment = self._parse_ai_comment(comment, is_review_comment=False)
-                if ai_comment:
-                    ai_comments.append(ai_comment)
 
+            return self._collect_ai_bot_comments(review_comments, issue_comments)
         except Exception as e:
             safe_print(f"[Context] Error fetching AI bot comments: {e}")
+            return []
 
+    def _collect_ai_bot_comments(
+        self, review_comments: list[dict], issue_comments: list[dict]
+    ) -> list[AIBotComment]:
+        """Keep the review and issue comments written by known AI tools."""
+        ai_comments: list[AIBotComment] = []
+        for comment in review_comments:
+            ai_comment = self._parse_ai_comment(comment, is_review_comment=True)
+            if ai_comment:
+                ai_comments.append(ai_comment)
+        for comment in issue_comments:
+            ai_comment = self._parse_ai_comment(comment, is_review_comment=False)
+            if ai_comment:
+                ai_comments.append(ai_comment)
         return ai_comments
 
     def _parse_ai_comment(
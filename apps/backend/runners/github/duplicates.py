@@ -5,22 +5,32 @@ Semantic Duplicate Detection
 Uses embeddings-based similarity to detect duplicate issues:
 - Replaces simple word overlap with semantic similarity
 - Integrates with OpenAI/Voyage AI embeddings
-- Caches embeddings with TTL
+- Caches embeddings with TTL in a per-repo float32 matrix (see embedding_store)
+- Ranks candidates with one vectorized similarity pass
 - Extracts entities (error codes, file paths, function names)
 - Provides similarity breakdown by component
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
 import logging
 import re
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from .embedding_store import EmbeddingStore
+except (ImportError, ValueError, SystemError):
+    from embedding_store import EmbeddingStore
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
 logger = logging.getLogger(__name__)
 
 # Thresholds for duplicate detection
@@ -28,6 +38,13 @@ DUPLICATE_THRESHOLD = 0.85  # Cosine similarity for "definitely duplicate"
 SIMILAR_THRESHOLD = 0.70  # Cosine similarity for "potentially related"
 EMBEDDING_CACHE_TTL_HOURS = 24
 
+# Batched embedding requests
+EMBEDDING_BATCH_SIZE = 64  # Texts per embedding API request
+EMBEDDING_MAX_CONCURRENCY = 4  # Embedding API requests in flight at once
+EMBEDDING_MAX_CHARS = 8000  # Input truncation per text
+
+VOYAGE_API_URL = "https://api.voyageai.com/v1"
+
 
 @dataclass
 class EntityExtraction:
@@ -97,34 +114,6 @@ class SimilarityResult:
         }
 
 
-@dataclass
-class CachedEmbedding:
-    """Cached embedding with metadata."""
-
-    issue_number: int
-    content_hash: str
-    embedding: list[float]
-    created_at: str
-    expires_at: str
-
-    def is_expired(self) -> bool:
-        expires = datetime.fromisoformat(self.expires_at)
-        return datetime.now(timezone.utc) > expires
-
-    def to_dict(self) -> dict[str, Any]:
-        return {
-            "issue_number": self.issue_number,
-            "content_hash": self.content_hash,
-            "embedding": self.embedding,
-            "created_at": self.created_at,
-            "expires_at": self.expires_at,
-        }
-
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> CachedEmbedding:
-        return cls(**data)
-
-
 class EntityExtractor:
     """Extracts entities from issue content."""
 
@@ -209,6 +198,11 @@ class EmbeddingProvider:
     - OpenAI (text-embedding-3-small)
     - Voyage AI (voyage-large-2)
     - Local (sentence-transformers)
+
+    get_embeddings() sends up to batch_size texts per request (all three
+    backends accept arrays of inputs) with at most max_concurrency requests
+    in flight. base_url points the OpenAI or Voyage backend at another
+    server, such as a local stub in tests.
     """
 
     def __init__(
@@ -216,10 +210,18 @@ class EmbeddingProvider:
         provider: str = "openai",
         api_key: str | None = None,
         model: str | None = None,
+        base_url: str | None = None,
+        batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
     ):
         self.provider = provider
         self.api_key = api_key
         self.model = model or self._default_model()
+        self.base_url = base_url
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max(1, max_concurrency)
+        self._openai_client = None
+        self._local_model = None
 
     def _default_model(self) -> str:
         defaults = {
@@ -231,60 +233,106 @@ class EmbeddingProvider:
 
     async def get_embedding(self, text: str) -> list[float]:
         """Get embedding for text."""
+        return (await self._embed_batch([text]))[0]
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float] | None]:
+        """
+        Get embeddings for many texts using batched, concurrent requests.
+
+        A failed request is logged and does not affect other batches.
+
+        Returns:
+            Embeddings in input order; None for texts whose batch failed
+        """
+        batches = [
+            texts[i : i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(batch: list[str]) -> list[list[float]] | None:
+            async with semaphore:
+                try:
+                    return await self._embed_batch(batch)
+                except Exception as e:
+                    logger.error(f"Embedding batch of {len(batch)} failed: {e}")
+                    return None
+
+        results: list[list[float] | None] = []
+        for batch, embeddings in zip(
+            batches, await asyncio.gather(*(run(batch) for batch in batches))
+        ):
+            results.extend(
+                embeddings if embeddings is not None else [None] * len(batch)
+            )
+        return results
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed one batch of texts in a single request."""
+        texts = [text[:EMBEDDING_MAX_CHARS] for text in texts]  # Limit input
         if self.provider == "openai":
-            return await self._openai_embedding(text)
+            return await self._openai_embeddings(texts)
         elif self.provider == "voyage":
-            return await self._voyage_embedding(text)
+            return await self._voyage_embeddings(texts)
         else:
-            return await self._local_embedding(text)
+            return await self._local_embeddings(texts)
 
-    async def _openai_embedding(self, text: str) -> list[float]:
-        """Get embedding from OpenAI."""
+    async def _openai_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings from OpenAI."""
         try:
-            import openai
+            if self._openai_client is None:
+                import openai
 
-            client = openai.AsyncOpenAI(api_key=self.api_key)
-            response = await client.embeddings.create(
+                self._openai_client = openai.AsyncOpenAI(
+                    api_key=self.api_key, base_url=self.base_url
+                )
+            response = await self._openai_client.embeddings.create(
                 model=self.model,
-                input=text[:8000],  # Limit input
+                input=texts,
             )
-            return response.data[0].embedding
+            return [
+                item.embedding
+                for item in sorted(response.data, key=lambda item: item.index)
+            ]
         except Exception as e:
             logger.error(f"OpenAI embedding error: {e}")
             raise Exception(
                 f"OpenAI embeddings required but failed: {e}. Configure OPENAI_API_KEY or use 'local' provider."
             )
 
-    async def _voyage_embedding(self, text: str) -> list[float]:
-        """Get embedding from Voyage AI."""
+    async def _voyage_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings from Voyage AI."""
         try:
             import httpx
 
             async with httpx.AsyncClient() as client:
                 response = await client.post(
-                    "https://api.voyageai.com/v1/embeddings",
+                    f"{(self.base_url or VOYAGE_API_URL).rstrip('/')}/embeddings",
                     headers={"Authorization": f"Bearer {self.api_key}"},
                     json={
                         "model": self.model,
-                        "input": text[:8000],
+                        "input": texts,
                     },
                 )
                 data = response.json()
-                return data["data"][0]["embedding"]
+                items = sorted(data["data"], key=lambda item: item["index"])
+                return [item["embedding"] for item in items]
         except Exception as e:
             logger.error(f"Voyage embedding error: {e}")
             raise Exception(
                 f"Voyage embeddings required but failed: {e}. Configure VOYAGE_API_KEY or use 'local' provider."
             )
 
-    async def _local_embedding(self, text: str) -> list[float]:
-        """Get embedding from local model."""
+    async def _local_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings from local model."""
         try:
-            from sentence_transformers import SentenceTransformer
+            if self._local_model is None:
+                from sentence_transformers import SentenceTransformer
 
-            model = SentenceTransformer(self.model)
-            embedding = model.encode(text[:8000])
-            return embedding.tolist()
+                self._local_model = SentenceTransformer(self.model)
+            # Encoding is CPU-bound; keep the event loop responsive
+            embeddings = await asyncio.to_thread(self._local_model.encode, texts)
+            return embeddings.tolist()
         except Exception as e:
             logger.error(f"Local embedding error: {e}")
             raise Exception(
@@ -319,6 +367,9 @@ class DuplicateDetector:
         duplicate_threshold: float = DUPLICATE_THRESHOLD,
         similar_threshold: float = SIMILAR_THRESHOLD,
         cache_ttl_hours: int = EMBEDDING_CACHE_TTL_HOURS,
+        embedding_base_url: str | None = None,
+        embedding_batch_size: int = EMBEDDING_BATCH_SIZE,
+        embedding_concurrency: int = EMBEDDING_MAX_CONCURRENCY,
     ):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -329,45 +380,26 @@ class DuplicateDetector:
         self.embedding_provider = EmbeddingProvider(
             provider=embedding_provider,
             api_key=api_key,
+            base_url=embedding_base_url,
+            batch_size=embedding_batch_size,
+            max_concurrency=embedding_concurrency,
         )
         self.entity_extractor = EntityExtractor()
+        self._stores: dict[str, EmbeddingStore] = {}
 
-    def _get_cache_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.cache_dir / f"{safe_name}_embeddings.json"
+    def _get_store(self, repo: str) -> EmbeddingStore:
+        """Get the embedding store for a repo (one instance per detector)."""
+        store = self._stores.get(repo)
+        if store is None:
+            store = EmbeddingStore(self.cache_dir, repo, self.cache_ttl_hours)
+            self._stores[repo] = store
+        return store
 
     def _content_hash(self, title: str, body: str) -> str:
         """Generate hash of issue content."""
         content = f"{title}\n{body}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
-    def _load_cache(self, repo: str) -> dict[int, CachedEmbedding]:
-        """Load embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        if not cache_file.exists():
-            return {}
-
-        with open(cache_file, encoding="utf-8") as f:
-            data = json.load(f)
-
-        cache = {}
-        for item in data.get("embeddings", []):
-            embedding = CachedEmbedding.from_dict(item)
-            if not embedding.is_expired():
-                cache[embedding.issue_number] = embedding
-
-        return cache
-
-    def _save_cache(self, repo: str, cache: dict[int, CachedEmbedding]) -> None:
-        """Save embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        data = {
-            "embeddings": [e.to_dict() for e in cache.values()],
-            "last_updated": datetime.now(timezone.utc).isoformat(),
-        }
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f)
-
     async def get_embedding(
         self,
         repo: str,
@@ -376,30 +408,76 @@ class DuplicateDetector:
         body: str,
     ) -> list[float]:
         """Get embedding for an issue, using cache if available."""
-        cache = self._load_cache(repo)
-        content_hash = self._content_hash(title, body)
+        store = self._get_store(repo)
+        embedding = await self._get_or_compute_embedding(
+            store, issue_number, title, body
+        )
+        store.flush()
+        return embedding
 
-        # Check cache
-        if issue_number in cache:
-            cached = cache[issue_number]
-            if cached.content_hash == content_hash and not cached.is_expired():
-                return cached.embedding
+    async def get_embeddings(
+        self,
+        repo: str,
+        issues: list[dict[str, Any]],
+    ) -> dict[int, list[float]]:
+        """
+        Get embeddings for several issues.
+
+        Issues whose content hash matches the cache are not re-embedded. The
+        rest are embedded in batched, concurrent requests, and written to the
+        store after every round of requests so a long backfill keeps its
+        progress if interrupted. Issues whose embedding fails are logged and
+        left out.
+
+        Returns:
+            Dictionary mapping issue number to embedding
+        """
+        store = self._get_store(repo)
+        embeddings: dict[int, list[float]] = {}
+        missing: dict[int, tuple[str, str]] = {}  # number -> (content hash, text)
+
+        for issue in issues:
+            title, body = issue.get("title", ""), issue.get("body", "")
+            content_hash = self._content_hash(title, body)
+            cached = store.get(issue["number"], content_hash)
+            if cached is not None:
+                embeddings[issue["number"]] = cached
+            else:
+                missing[issue["number"]] = (content_hash, f"{title}\n\n{body}")
+
+        provider = self.embedding_provider
+        round_size = provider.batch_size * provider.max_concurrency
+        pending = list(missing.items())
+        for start in range(0, len(pending), round_size):
+            chunk = pending[start : start + round_size]
+            results = await provider.get_embeddings([text for _, (_, text) in chunk])
+            for (number, (content_hash, _)), embedding in zip(chunk, results):
+                if embedding is None:
+                    logger.error(f"Error computing embedding for #{number}")
+                    continue
+                store.put(number, content_hash, embedding)
+                embeddings[number] = embedding
+            store.flush()
+
+        return embeddings
+
+    async def _get_or_compute_embedding(
+        self,
+        store: EmbeddingStore,
+        issue_number: int,
+        title: str,
+        body: str,
+    ) -> list[float]:
+        """Get a cached embedding or compute and stage a new one."""
+        content_hash = self._content_hash(title, body)
+        cached = store.get(issue_number, content_hash)
+        if cached is not None:
+            return cached
 
         # Generate new embedding
         content = f"{title}\n\n{body}"
         embedding = await self.embedding_provider.get_embedding(content)
-
-        # Cache it
-        now = datetime.now(timezone.utc)
-        cache[issue_number] = CachedEmbedding(
-            issue_number=issue_number,
-            content_hash=content_hash,
-            embedding=embedding,
-            created_at=now.isoformat(),
-            expires_at=(now + timedelta(hours=self.cache_ttl_hours)).isoformat(),
-        )
-        self._save_cache(repo, cache)
-
+        store.put(issue_number, content_hash, embedding)
         return embedding
 
     def cosine_similarity(self, a: list[float], b: list[float]) -> float:
@@ -407,6 +485,12 @@ class DuplicateDetector:
         if len(a) != len(b):
             return 0.0
 
+        if np is not None:
+            vec_a = np.asarray(a, dtype=np.float64)
+            vec_b = np.asarray(b, dtype=np.float64)
+            magnitude = float(np.linalg.norm(vec_a) * np.linalg.norm(vec_b))
+            return float(vec_a @ vec_b) / magnitude if magnitude else 0.0
+
         dot_product = sum(x * y for x, y in zip(a, b))
         magnitude_a = sum(x * x for x in a) ** 0.5
         magnitude_b = sum(x * x for x in b) ** 0.5
@@ -440,6 +524,15 @@ class DuplicateDetector:
         # Calculate embedding similarity
         overall_score = self.cosine_similarity(embed_a, embed_b)
 
+        return await self._score_breakdown(issue_a, issue_b, overall_score)
+
+    async def _score_breakdown(
+        self,
+        issue_a: dict[str, Any],
+        issue_b: dict[str, Any],
+        overall_score: float,
+    ) -> SimilarityResult:
+        """Build a SimilarityResult (title, body and entity scores) for a pair."""
         # Get title-only embeddings
         title_embed_a = await self.embedding_provider.get_embedding(
             issue_a.get("title", "")
@@ -547,22 +640,41 @@ class DuplicateDetector:
             "title": title,
             "body": body,
         }
+        candidates = [
+            issue for issue in open_issues if issue.get("number") != issue_number
+        ]
+        if not candidates:
+            return []
 
-        results = []
-        for issue in open_issues:
-            if issue.get("number") == issue_number:
-                continue
+        try:
+            target_embedding = await self.get_embedding(repo, issue_number, title, body)
+        except Exception as e:
+            logger.error(f"Error comparing issues: {e}")
+            return []
+
+        # Cached or newly computed embeddings for every candidate, then a single
+        # vectorized similarity pass instead of one comparison per issue
+        embedded = await self.get_embeddings(repo, candidates)
+        matches = self._get_store(repo).search(
+            target_embedding,
+            [issue["number"] for issue in candidates if issue["number"] in embedded],
+            min_score=self.similar_threshold,
+            limit=limit,
+        )
 
+        issues_by_number = {issue["number"]: issue for issue in candidates}
+        results = []
+        for number, score in matches:
             try:
-                result = await self.compare_issues(repo, target_issue, issue)
-                if result.is_similar:
-                    results.append(result)
+                results.append(
+                    await self._score_breakdown(
+                        target_issue, issues_by_number[number], score
+                    )
+                )
             except Exception as e:
                 logger.error(f"Error comparing issues: {e}")
 
-        # Sort by overall score, descending
-        results.sort(key=lambda r: r.overall_score, reverse=True)
-        return results[:limit]
+        return results
 
     async def precompute_embeddings(
         self,
@@ -579,23 +691,8 @@ class DuplicateDetector:
         Returns:
             Number of embeddings computed
         """
-        count = 0
-        for issue in issues:
-            try:
-                await self.get_embedding(
-                    repo,
-                    issue["number"],
-                    issue.get("title", ""),
-                    issue.get("body", ""),
-                )
-                count += 1
-            except Exception as e:
-                logger.error(f"Error computing embedding for #{issue['number']}: {e}")
-
-        return count
+        return len(await self.get_embeddings(repo, issues))
 
     def clear_cache(self, repo: str) -> None:
         """Clear embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        if cache_file.exists():
-            cache_file.unlink()
+        self._get_store(repo).clear()
@@ -0,0 +1,556 @@
+"""
+Embedding Store
+===============
+
+Per-repo store of issue embeddings with vectorized similarity search.
+
+Layout (in the detector's cache dir, per repo):
+- ``{repo}_embeddings.f32``: float32 matrix, one row per stored embedding,
+  memory-mapped for search when NumPy is available
+- ``{repo}_embeddings.idx.jsonl``: sidecar index. The first line is a header
+  (``{"version": 1, "dim": N}``); each further line maps an issue number to a
+  matrix row with its content hash and expiry. The last line for an issue wins.
+
+Both files are append-only: updating an embedding appends a new row and a new
+index line, so a write costs O(1) instead of rewriting the whole cache. Rows
+superseded or expired are dropped when the store is compacted. Writers hold a
+FileLock on the index so rows appended by concurrent processes never
+interleave.
+
+Search normalizes the query once and computes one matrix-vector product over
+the memory-mapped rows. Above APPROX_INDEX_MIN_ROWS rows, an inverted-file
+index (rows bucketed by nearest centroid) limits the product to the rows of
+the closest buckets. Without NumPy everything still works in pure Python.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import random
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+try:
+    from .file_lock import FileLock, atomic_write
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock, atomic_write
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+logger = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+
+# Compact once superseded/expired rows exceed this and the live row count
+COMPACT_MIN_DEAD_ROWS = 1024
+
+# Use the approximate (inverted-file) index from this many live rows
+APPROX_INDEX_MIN_ROWS = 20_000
+APPROX_INDEX_PROBES = 8  # Nearest buckets searched per query
+
+# Seconds to wait for another process to finish writing the store
+LOCK_TIMEOUT_SECONDS = 30.0
+
+
+@dataclass
+class EmbeddingEntry:
+    """Index entry for one stored embedding."""
+
+    issue_number: int
+    content_hash: str
+    row: int
+    created_at: str
+    expires_at: str
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        expires = datetime.fromisoformat(self.expires_at)
+        return (now or datetime.now(timezone.utc)) > expires
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "issue_number": self.issue_number,
+            "content_hash": self.content_hash,
+            "row": self.row,
+            "created_at": self.created_at,
+            "expires_at": self.expires_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> EmbeddingEntry:
+        return cls(**data)
+
+
+class EmbeddingStore:
+    """
+    Append-only embedding matrix plus issue index for one repo.
+
+    Usage:
+        store = EmbeddingStore(cache_dir, "owner/repo", ttl_hours=24)
+        store.put(123, content_hash, embedding)
+        store.flush()
+        matches = store.search(query_embedding, [124, 125], min_score=0.7)
+    """
+
+    def __init__(self, cache_dir: Path, repo: str, ttl_hours: int = 24):
+        safe_name = repo.replace("/", "_")
+        self.cache_dir = Path(cache_dir)
+        self.matrix_file = self.cache_dir / f"{safe_name}_embeddings.f32"
+        self.index_file = self.cache_dir / f"{safe_name}_embeddings.idx.jsonl"
+        self.legacy_file = self.cache_dir / f"{safe_name}_embeddings.json"
+        self.ttl_hours = ttl_hours
+
+        self.dim = 0
+        self._entries: dict[int, EmbeddingEntry] = {}
+        self._row_count = 0  # Rows in the matrix file, live or not
+        self._pending: list[tuple[EmbeddingEntry, list[float]]] = []
+        self._index_size: int | None = None  # Index file size after our last read/write
+        self._matrix = None  # Memory-mapped rows (numpy) or flat array('f')
+        self._norms = None
+        self._approx_index: _InvertedFileIndex | None = None
+        self._lock_held = False
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the store's cross-process write lock (reentrant)."""
+        if self._lock_held:
+            yield
+            return
+        with FileLock(self.index_file, timeout=LOCK_TIMEOUT_SECONDS):
+            self._lock_held = True
+            try:
+                yield
+            finally:
+                self._lock_held = False
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _ensure_loaded(self) -> None:
+        """(Re)load the index if it changed on disk since we last saw it."""
+        try:
+            size = self.index_file.stat().st_size
+        except OSError:
+            size = None
+
+        if size is not None and size == self._index_size:
+            return
+        if size is None:
+            if self._index_size is None and self.legacy_file.exists():
+                self._migrate_legacy()
+            elif self._index_size is not None:
+                self._reset()  # Cleared by another process
+            return
+        self._load_index()
+
+    def _reset(self) -> None:
+        self.dim = 0
+        self._entries = {}
+        self._row_count = 0
+        self._index_size = None
+        self._invalidate_matrix()
+
+    def _load_index(self) -> None:
+        self._reset()
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                lines = f.read().split("\n")
+            header = json.loads(lines[0])
+        except (OSError, ValueError, IndexError) as e:
+            logger.warning(f"Unreadable embedding index {self.index_file}: {e}")
+            return
+        if header.get("version") != STORE_VERSION:
+            return
+
+        self.dim = int(header["dim"])
+        self._row_count = self._matrix_rows()
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                entry = EmbeddingEntry.from_dict(json.loads(line))
+            except (ValueError, TypeError):
+                continue  # Partially written final line
+            if entry.row < self._row_count:
+                self._entries[entry.issue_number] = entry
+        self._index_size = self.index_file.stat().st_size
+
+    def _matrix_rows(self) -> int:
+        if not self.dim:
+            return 0
+        try:
+            return self.matrix_file.stat().st_size // (4 * self.dim)
+        except OSError:
+            return 0
+
+    def _migrate_legacy(self) -> None:
+        """Import a ``{repo}_embeddings.json`` cache from before the matrix store."""
+        try:
+            with open(self.legacy_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable embedding cache {self.legacy_file}: {e}")
+            return
+        # Removed up front: flush() checks for it again via _ensure_loaded()
+        self.legacy_file.unlink(missing_ok=True)
+
+        now = datetime.now(timezone.utc)
+        for item in data.get("embeddings", []):
+            try:
+                entry = EmbeddingEntry(
+                    issue_number=item["issue_number"],
+                    content_hash=item["content_hash"],
+                    row=-1,
+                    created_at=item["created_at"],
+                    expires_at=item["expires_at"],
+                )
+                if not entry.is_expired(now):
+                    self._stage(entry, item["embedding"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        self.flush()
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._live_entries())
+
+    def _live_entries(self) -> dict[int, EmbeddingEntry]:
+        now = datetime.now(timezone.utc)
+        live = {
+            number: entry
+            for number, entry in self._entries.items()
+            if not entry.is_expired(now)
+        }
+        for entry, _ in self._pending:
+            live[entry.issue_number] = entry
+        return live
+
+    def get_entry(self, issue_number: int) -> EmbeddingEntry | None:
+        """Get the live index entry for an issue, if stored and not expired."""
+        self._ensure_loaded()
+        for entry, _ in reversed(self._pending):
+            if entry.issue_number == issue_number:
+                return entry
+        entry = self._entries.get(issue_number)
+        if entry is None or entry.is_expired():
+            return None
+        return entry
+
+    def get(self, issue_number: int, content_hash: str) -> list[float] | None:
+        """
+        Get a stored embedding.
+
+        Returns:
+            The embedding, or None if missing, expired or for other content
+        """
+        entry = self.get_entry(issue_number)
+        if entry is None or entry.content_hash != content_hash:
+            return None
+        for pending, embedding in reversed(self._pending):
+            if pending is entry:
+                return list(embedding)
+        return self._read_row(entry.row)
+
+    def _load_matrix(self) -> None:
+        if self._matrix is not None or not self._row_count:
+            return
+        if np is not None:
+            self._matrix = np.memmap(
+                self.matrix_file,
+                dtype=np.float32,
+                mode="r",
+                shape=(self._row_count, self.dim),
+            )
+            self._norms = np.linalg.norm(self._matrix, axis=1)
+        else:
+            matrix = array("f")
+            with open(self.matrix_file, "rb") as f:
+                matrix.fromfile(f, self._row_count * self.dim)
+            self._matrix = matrix
+
+    def _invalidate_matrix(self) -> None:
+        self._matrix = None
+        self._norms = None
+        self._approx_index = None
+
+    def _read_row(self, row: int) -> list[float]:
+        self._load_matrix()
+        if np is not None:
+            return self._matrix[row].astype(float).tolist()
+        start = row * self.dim
+        return list(self._matrix[start : start + self.dim])
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def put(self, issue_number: int, content_hash: str, embedding: list[float]) -> None:
+        """Stage an embedding; call flush() to write staged embeddings."""
+        self._ensure_loaded()
+        now = datetime.now(timezone.utc)
+        entry = EmbeddingEntry(
+            issue_number=issue_number,
+            content_hash=content_hash,
+            row=-1,
+            created_at=now.isoformat(),
+            expires_at=(now + timedelta(hours=self.ttl_hours)).isoformat(),
+        )
+        self._stage(entry, embedding)
+
+    def _stage(self, entry: EmbeddingEntry, embedding: list[float]) -> None:
+        if self.dim and len(embedding) != self.dim:
+            # A different embedding model; old vectors are not comparable
+            logger.warning(
+                f"Embedding dimension changed ({self.dim} -> {len(embedding)}), "
+                "clearing embedding store"
+            )
+            self.clear()
+        if not self.dim:
+            self.dim = len(embedding)
+        self._pending.append((entry, embedding))
+
+    def flush(self) -> None:
+        """Append staged embeddings to the matrix and index files."""
+        if not self._pending:
+            return
+
+        with self._locked():
+            self._append_pending()
+            live_count = len(self._live_entries())
+            if self._row_count - live_count > max(COMPACT_MIN_DEAD_ROWS, live_count):
+                self.compact()
+
+    def _append_pending(self) -> None:
+        """Append staged rows; the caller holds the store lock."""
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        # Pick up rows appended by other processes before choosing ours
+        self._ensure_loaded()
+        self._invalidate_matrix()  # Release the memory map before resizing
+        dim = len(pending[0][1])
+        if self.dim != dim or not self.index_file.exists():
+            for path in (self.matrix_file, self.index_file):
+                path.unlink(missing_ok=True)
+            self._reset()
+            self.dim = dim
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        new_index = not self.index_file.exists()
+        self._row_count = self._matrix_rows()
+        aligned_size = self._row_count * 4 * self.dim
+        if (
+            self.matrix_file.exists()
+            and self.matrix_file.stat().st_size != aligned_size
+        ):
+            # Drop a partially written trailing row so appends stay aligned
+            os.truncate(self.matrix_file, aligned_size)
+
+        rows = array("f")
+        for entry, embedding in pending:
+            rows.extend(embedding)
+        with open(self.matrix_file, "ab") as f:
+            rows.tofile(f)
+
+        lines = []
+        if new_index:
+            lines.append(json.dumps({"version": STORE_VERSION, "dim": self.dim}))
+        for entry, _ in pending:
+            entry.row = self._row_count
+            self._row_count += 1
+            self._entries[entry.issue_number] = entry
+            lines.append(json.dumps(entry.to_dict()))
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+        self._index_size = self.index_file.stat().st_size
+
+    def compact(self) -> None:
+        """Rewrite both files keeping only live rows."""
+        with self._locked():
+            self._append_pending()
+            self._ensure_loaded()
+            live = sorted(self._live_entries().values(), key=lambda e: e.row)
+            if not live:
+                self.clear()
+                return
+
+            rows = array("f")
+            for entry in live:
+                rows.extend(self._read_row(entry.row))
+            lines = [json.dumps({"version": STORE_VERSION, "dim": self.dim})]
+            for row, entry in enumerate(live):
+                entry.row = row
+                lines.append(json.dumps(entry.to_dict()))
+
+            self._invalidate_matrix()
+            with atomic_write(self.matrix_file, "wb") as f:
+                rows.tofile(f)
+            with atomic_write(self.index_file) as f:
+                f.write("\n".join(lines) + "\n")
+
+            self._entries = {entry.issue_number: entry for entry in live}
+            self._row_count = len(live)
+            self._index_size = self.index_file.stat().st_size
+
+    def clear(self) -> None:
+        """Delete all stored embeddings for the repo."""
+        self._invalidate_matrix()
+        self._pending = []
+        with self._locked():
+            for path in (self.matrix_file, self.index_file, self.legacy_file):
+                path.unlink(missing_ok=True)
+            self._reset()
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: list[float],
+        issue_numbers: list[int],
+        min_score: float = -1.0,
+        limit: int | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Find the stored embeddings most similar to a query.
+
+        Args:
+            query: Query embedding
+            issue_numbers: Issues to consider (ties keep this order)
+            min_score: Minimum cosine similarity to include
+            limit: Maximum matches to return
+
+        Returns:
+            (issue_number, cosine similarity) pairs, best first
+        """
+        self.flush()
+        self._ensure_loaded()
+        if not self.dim or len(query) != self.dim:
+            return []
+
+        live = self._live_entries()
+        candidates = [(n, live[n].row) for n in issue_numbers if n in live]
+        if not candidates:
+            return []
+
+        self._load_matrix()
+        if np is not None:
+            scores = self._numpy_scores(
+                query, [row for _, row in candidates], list(live.values())
+            )
+        else:
+            scores = self._python_scores(query, [row for _, row in candidates])
+
+        matches = [
+            (number, score)
+            for (number, _), score in zip(candidates, scores)
+            if score >= min_score
+        ]
+        matches.sort(key=lambda m: m[1], reverse=True)  # Stable: ties keep order
+        return matches[:limit] if limit is not None else matches
+
+    def _numpy_scores(
+        self, query: list[float], rows: list[int], live: list[EmbeddingEntry]
+    ) -> list[float]:
+        q = np.asarray(query, dtype=np.float32)
+        q_norm = float(np.linalg.norm(q))
+        if q_norm == 0:
+            return [0.0] * len(rows)
+
+        rows_arr = np.asarray(rows, dtype=np.intp)
+        if len(live) >= APPROX_INDEX_MIN_ROWS:
+            if self._approx_index is None:
+                self._approx_index = _InvertedFileIndex(
+                    self._matrix, self._norms, [e.row for e in live]
+                )
+            allowed = self._approx_index.probe(q / q_norm, APPROX_INDEX_PROBES)
+            keep = np.isin(rows_arr, allowed)
+        else:
+            keep = np.ones(len(rows_arr), dtype=bool)
+
+        scores = np.zeros(len(rows_arr), dtype=np.float64)
+        selected = rows_arr[keep]
+        if len(selected):
+            dots = self._matrix[selected] @ q
+            norms = self._norms[selected] * q_norm
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sims = np.where(norms > 0, dots / norms, 0.0)
+            scores[keep] = sims
+        # Rows skipped by the approximate index never match
+        scores[~keep] = -np.inf
+        return scores.tolist()
+
+    def _python_scores(self, query: list[float], rows: list[int]) -> list[float]:
+        q_norm = math.sqrt(sum(x * x for x in query))
+        scores = []
+        for row in rows:
+            start = row * self.dim
+            vector = self._matrix[start : start + self.dim]
+            norm = math.sqrt(sum(x * x for x in vector))
+            if q_norm == 0 or norm == 0:
+                scores.append(0.0)
+            else:
+                dot = sum(x * y for x, y in zip(vector, query))
+                scores.append(dot / (norm * q_norm))
+        return scores
+
+
+class _InvertedFileIndex:
+    """
+    Coarse approximate index: live rows bucketed by their nearest centroid.
+
+    Centroids are a random sample of rows refined with a few rounds of
+    spherical k-means. A query only scores rows in its nearest buckets.
+    """
+
+    ITERATIONS = 4
+
+    def __init__(self, matrix, norms, rows: list[int]):
+        rows_arr = np.asarray(rows, dtype=np.intp)
+        safe_norms = np.where(norms[rows_arr] > 0, norms[rows_arr], 1.0)
+        vectors = np.asarray(matrix[rows_arr], dtype=np.float32) / safe_norms[:, None]
+
+        n_buckets = max(1, int(math.sqrt(len(rows_arr))))
+        seed = random.Random(len(rows_arr)).sample(range(len(rows_arr)), n_buckets)
+        centroids = vectors[seed]
+        for _ in range(self.ITERATIONS):
+            assignment = np.argmax(vectors @ centroids.T, axis=1)
+            for bucket in range(n_buckets):
+                members = vectors[assignment == bucket]
+                if len(members):
+                    mean = members.mean(axis=0)
+                    norm = np.linalg.norm(mean)
+                    if norm > 0:
+                        centroids[bucket] = mean / norm
+        assignment = np.argmax(vectors @ centroids.T, axis=1)
+
+        self.centroids = centroids
+        order = np.argsort(assignment, kind="stable")
+        bounds = np.searchsorted(assignment[order], np.arange(n_buckets + 1))
+        self._buckets = [
+            rows_arr[order[bounds[i] : bounds[i + 1]]] for i in range(n_buckets)
+        ]
+
+    def probe(self, unit_query, n_probes: int):
+        """Get the matrix rows in the buckets nearest to a unit query."""
+        n_probes = min(n_probes, len(self._buckets))
+        nearest = np.argsort(-(self.centroids @ unit_query))[:n_probes]
+        return np.concatenate([self._buckets[i] for i in nearest])
@@ -156,7 +156,14 @@ class FileLock:
             try:
                 # Non-blocking lock attempt
                 _try_lock(self._fd, self.exclusive)
-                return  # Lock acquired
+                if not self._lock_file_replaced():
+                    return  # Lock acquired
+                # The previous holder removed the lock file while we waited
+                # on it; a newcomer may already hold the new one
+                _unlock(self._fd)
+                os.close(self._fd)
+                self._fd = os.open(str(self._lock_file), os.O_CREAT | os.O_RDWR)
+                continue
             except (BlockingIOError, OSError):
                 # Lock held by another process
                 elapsed = time.time() - start_time
@@ -171,6 +178,17 @@ class FileLock:
                 # Wait a bit before retrying
                 time.sleep(0.01)
 
+    def _lock_file_replaced(self) -> bool:
+        """Check whether our descriptor no longer refers to the lock file path."""
+        if _IS_WINDOWS:
+            return False  # Open files cannot be removed on Windows
+        try:
+            path_stat = os.stat(self._lock_file)
+        except FileNotFoundError:
+            return True
+        fd_stat = os.fstat(self._fd)
+        return (path_stat.st_dev, path_stat.st_ino) != (fd_stat.st_dev, fd_stat.st_ino)
+
     def _release_lock(self) -> None:
         """Release the file lock."""
         if self._fd is not None:
@@ -7,6 +7,8 @@ Wrapper for gh CLI commands that prevents hung processes through:
 - Exponential backoff retry (3 attempts: 1s, 2s, 4s)
 - Structured logging for monitoring
 - Async subprocess execution for non-blocking operations
+- Optional HTTP transport (gh_http) with keep-alive connections and ETag
+  caching for the hottest read calls, falling back to the gh subprocess
 
 This eliminates the risk of indefinite hangs in GitHub automation workflows.
 """
@@ -16,6 +18,7 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -23,14 +26,21 @@ from typing import Any
 from core.gh_executable import get_gh_executable
 
 try:
+    from .gh_http import GHHttpTransport
     from .rate_limiter import RateLimiter, RateLimitExceeded
 except (ImportError, ValueError, SystemError):
+    from gh_http import GHHttpTransport
     from rate_limiter import RateLimiter, RateLimitExceeded
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
 
+def _get_http_transport_enabled() -> bool:
+    """Whether GHClient uses the HTTP transport by default (GITHUB_HTTP_TRANSPORT)."""
+    return os.environ.get("GITHUB_HTTP_TRANSPORT", "").lower() in ("1", "true", "yes")
+
+
 class GHTimeoutError(Exception):
     """Raised when gh CLI command times out after all retry attempts."""
 
@@ -87,6 +97,7 @@ class GHClient:
         max_retries: int = 3,
         enable_rate_limiting: bool = True,
         repo: str | None = None,
+        http_transport: bool | GHHttpTransport | None = None,
     ):
         """
         Initialize GitHub CLI client.
@@ -98,6 +109,10 @@ class GHClient:
             enable_rate_limiting: Whether to enforce rate limiting (default: True)
             repo: Repository in 'owner/repo' format. If provided, uses -R flag
                   instead of inferring from git remotes.
+            http_transport: Send supported calls over HTTP instead of spawning
+                  gh (True, False, or a GHHttpTransport to use). Defaults to
+                  the GITHUB_HTTP_TRANSPORT environment variable. Falls back
+                  to gh when no token is available or a call is unsupported.
         """
         self.project_dir = Path(project_dir)
         self.default_timeout = default_timeout
@@ -105,6 +120,15 @@ class GHClient:
         self.enable_rate_limiting = enable_rate_limiting
         self.repo = repo
 
+        if http_transport is None:
+            http_transport = _get_http_transport_enabled()
+        if isinstance(http_transport, GHHttpTransport):
+            self._http: GHHttpTransport | None = http_transport
+        elif http_transport:
+            self._http = GHHttpTransport.get_instance()
+        else:
+            self._http = None
+
         # Initialize rate limiter singleton
         if enable_rate_limiting:
             self._rate_limiter = RateLimiter.get_instance()
@@ -131,12 +155,6 @@ class GHClient:
             GHCommandError: If command fails and raise_on_error is True
         """
         timeout = timeout or self.default_timeout
-        gh_exec = get_gh_executable()
-        if not gh_exec:
-            raise GHCommandError(
-                "GitHub CLI (gh) not found. Install from https://cli.github.com/"
-            )
-        cmd = [gh_exec] + args
         start_time = asyncio.get_event_loop().time()
 
         # Pre-flight rate limit check
@@ -151,6 +169,22 @@ class GHClient:
                 # Consume a token for this request
                 await self._rate_limiter.acquire_github(timeout=1.0)
 
+        if self._http is not None:
+            result = await self._run_http(args, timeout, start_time)
+            if result is not None:
+                if self.enable_rate_limiting:
+                    self._rate_limiter.observe_github_rate_limit(
+                        self._http.rate_limit_remaining, self._http.rate_limit_reset
+                    )
+                return self._check_result(result, args, raise_on_error)
+
+        gh_exec = get_gh_executable()
+        if not gh_exec:
+            raise GHCommandError(
+                "GitHub CLI (gh) not found. Install from https://cli.github.com/"
+            )
+        cmd = [gh_exec] + args
+
         for attempt in range(1, self.max_retries + 1):
             try:
                 logger.debug(
@@ -217,35 +251,7 @@ class GHClient:
                     total_time=total_time,
                 )
 
-                if result.returncode != 0:
-                    logger.warning(
-                        f"gh {args[0]} failed with exit code {result.returncode}: {stderr_str}"
-                    )
-
-                    # Check for rate limit errors (403/429)
-                    error_lower = stderr_str.lower()
-                    if (
-                        "403" in stderr_str
-                        or "429" in stderr_str
-                        or "rate limit" in error_lower
-                    ):
-                        if self.enable_rate_limiting:
-                            self._rate_limiter.record_github_error()
-                        raise RateLimitExceeded(
-                            f"GitHub API rate limit (HTTP 403/429): {stderr_str}"
-                        )
-
-                    if raise_on_error:
-                        raise GHCommandError(
-                            f"gh {args[0]} failed: {stderr_str or 'Unknown error'}"
-                        )
-                else:
-                    logger.debug(
-                        f"gh {args[0]} completed successfully "
-                        f"(attempt {attempt}, {total_time:.2f}s)"
-                    )
-
-                return result
+                return self._check_result(result, args, raise_on_error)
 
             except (GHTimeoutError, GHCommandError, RateLimitExceeded):
                 # Re-raise our custom exceptions
@@ -265,6 +271,86 @@ class GHClient:
         # Should never reach here, but for type safety
         raise GHCommandError(f"gh {args[0]} failed after {self.max_retries} attempts")
 
+    async def _run_http(
+        self, args: list[str], timeout: float, start_time: float
+    ) -> GHCommandResult | None:
+        """
+        Run a command over the HTTP transport, retrying timeouts like run().
+
+        Returns:
+            The result, or None if the command must go through gh (unsupported
+            by the transport, or the API could not be reached)
+        """
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                outcome = await asyncio.wait_for(
+                    self._http.execute(args, self.repo, timeout), timeout=timeout
+                )
+            except (asyncio.TimeoutError, TimeoutError):
+                logger.warning(
+                    f"gh {args[0]} over HTTP timed out after {timeout}s "
+                    f"(attempt {attempt}/{self.max_retries})"
+                )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(2 ** (attempt - 1))
+                    continue
+                total_time = asyncio.get_event_loop().time() - start_time
+                raise GHTimeoutError(
+                    f"gh {args[0]} timed out after {self.max_retries} attempts "
+                    f"({timeout}s each, {total_time:.1f}s total)"
+                )
+            except Exception as e:
+                logger.info(f"HTTP transport failed for gh {args[0]}, using gh: {e}")
+                return None
+
+            if outcome is None:
+                return None
+            returncode, stdout, stderr = outcome
+            return GHCommandResult(
+                stdout=stdout,
+                stderr=stderr,
+                returncode=returncode,
+                command=["http"] + args,
+                attempts=attempt,
+                total_time=asyncio.get_event_loop().time() - start_time,
+            )
+        return None
+
+    def _check_result(
+        self, result: GHCommandResult, args: list[str], raise_on_error: bool
+    ) -> GHCommandResult:
+        """Log a finished command and raise for rate limits or (optionally) errors."""
+        if result.returncode != 0:
+            stderr_str = result.stderr
+            logger.warning(
+                f"gh {args[0]} failed with exit code {result.returncode}: {stderr_str}"
+            )
+
+            # Check for rate limit errors (403/429)
+            error_lower = stderr_str.lower()
+            if (
+                "403" in stderr_str
+                or "429" in stderr_str
+                or "rate limit" in error_lower
+            ):
+                if self.enable_rate_limiting:
+                    self._rate_limiter.record_github_error()
+                raise RateLimitExceeded(
+                    f"GitHub API rate limit (HTTP 403/429): {stderr_str}"
+                )
+
+            if raise_on_error:
+                raise GHCommandError(
+                    f"gh {args[0]} failed: {stderr_str or 'Unknown error'}"
+                )
+        else:
+            logger.debug(
+                f"gh {args[0]} completed successfully "
+                f"(attempt {result.attempts}, {result.total_time:.2f}s)"
+            )
+
+        return result
+
     # =========================================================================
     # Helper methods
     # =========================================================================
@@ -589,6 +675,44 @@ class GHClient:
         result = await self.run(args)
         return json.loads(result.stdout)
 
+    async def graphql(
+        self,
+        query: str,
+        variables: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, Any]:
+        """
+        Run a GraphQL query against the GitHub API.
+
+        String variables may use gh's {owner}/{repo} placeholders; those are
+        sent as -F fields, the only fields gh fills them in.
+
+        Args:
+            query: GraphQL query document
+            variables: Query variables (str, int, bool or None values)
+            timeout: Timeout in seconds (default: default_timeout)
+
+        Returns:
+            The response's "data" object
+
+        Raises:
+            GHCommandError: If the request fails or the response has errors
+        """
+        args = ["api", "graphql", "-f", f"query={query}"]
+        for key, value in (variables or {}).items():
+            if isinstance(value, str):
+                # gh fills {owner}/{repo} in -F fields only; -f keeps other
+                # strings from being converted to numbers or booleans
+                placeholder = "{owner}" in value or "{repo}" in value
+                args.extend(["-F" if placeholder else "-f", f"{key}={value}"])
+            else:
+                # -F converts true/false/null/integers to typed JSON values
+                args.extend(["-F", f"{key}={json.dumps(value)}"])
+
+        result = await self.run(args, timeout=timeout)
+        payload = json.loads(result.stdout) if result.stdout.strip() else {}
+        return payload.get("data") or {}
+
     async def pr_merge(
         self,
         pr_number: int,
@@ -0,0 +1,635 @@
+"""
+HTTP Transport for GHClient
+===========================
+
+Talks to the GitHub REST/GraphQL API directly over pooled keep-alive HTTP
+connections, instead of spawning a ``gh`` process (and a TLS handshake) per
+call.
+
+- Translates the gh invocations GHClient issues most (``api`` GETs,
+  ``api graphql``, ``pr diff``, ``pr view --json``) into HTTP requests;
+  anything else returns None so the caller falls back to the gh subprocess
+- Produces the same stdout/stderr/returncode gh would, so GHCommandResult
+  consumers are unchanged
+- Conditional requests: GET responses with an ETag are cached and revalidated
+  with If-None-Match. GitHub does not count 304 responses against the rate
+  limit.
+
+Uses only the standard library (http.client); blocking I/O runs in worker
+threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.client
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlencode, urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_MAX_CONNECTIONS = 8  # Idle keep-alive connections kept per transport
+ETAG_CACHE_SIZE = 512  # Cached GET responses per transport
+ETAG_CACHE_MAX_BODY = 2 * 1024 * 1024  # Larger responses are not cached
+
+USER_AGENT = "auto-claude-gh-http"
+
+# `gh pr view --json` fields that map one-to-one onto GraphQL PullRequest fields
+PR_SCALAR_FIELDS = frozenset(
+    {
+        "additions",
+        "baseRefName",
+        "baseRefOid",
+        "body",
+        "changedFiles",
+        "closed",
+        "closedAt",
+        "createdAt",
+        "deletions",
+        "headRefName",
+        "headRefOid",
+        "id",
+        "isDraft",
+        "mergeable",
+        "mergedAt",
+        "number",
+        "reviewDecision",
+        "state",
+        "title",
+        "updatedAt",
+        "url",
+    }
+)
+PR_OBJECT_FIELDS = frozenset({"author", "files", "labels"})
+
+_PR_VIEW_QUERY = """
+query($owner: String!, $name: String!, $number: Int!%s) {
+  repository(owner: $owner, name: $name) {
+    pullRequest(number: $number) {
+      %s
+    }
+  }
+}
+"""
+
+_PR_OBJECT_SELECTIONS = {
+    "author": "author { __typename login ... on User { id name } ... on Bot { id } }",
+    "files": (
+        "files(first: 100, after: $filesAfter) "
+        "{ nodes { path additions deletions } pageInfo { hasNextPage endCursor } }"
+    ),
+    "labels": "labels(first: 100) { nodes { id name description color } }",
+}
+
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+@dataclass
+class HTTPResponse:
+    """A completed HTTP exchange."""
+
+    status: int
+    body: str
+    headers: dict[str, str] = field(default_factory=dict)
+    from_cache: bool = False
+
+
+@dataclass
+class _CachedResponse:
+    etag: str
+    body: str
+    headers: dict[str, str]
+
+
+def _resolve_token() -> str | None:
+    """Find a GitHub token: GH_TOKEN, GITHUB_TOKEN, then `gh auth token`."""
+    for var in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(var)
+        if token:
+            return token
+
+    try:
+        from core.gh_executable import get_gh_executable
+
+        gh_exec = get_gh_executable()
+    except ImportError:
+        gh_exec = shutil.which("gh")
+    if not gh_exec:
+        return None
+    try:
+        result = subprocess.run(
+            [gh_exec, "auth", "token"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    token = result.stdout.strip()
+    return token if result.returncode == 0 and token else None
+
+
+def get_api_url() -> str:
+    """Get the REST API base URL (GITHUB_API_URL, GH_HOST, or github.com)."""
+    api_url = os.environ.get("GITHUB_API_URL")
+    if api_url:
+        return api_url.rstrip("/")
+    host = os.environ.get("GH_HOST")
+    if host and host != "github.com":
+        return f"https://{host}/api/v3"
+    return DEFAULT_API_URL
+
+
+class GHHttpTransport:
+    """
+    Pooled keep-alive HTTP client for the GitHub API with ETag caching.
+
+    Transports are shared per (api_url, token) so connections and the ETag
+    cache survive across GHClient instances:
+
+        transport = GHHttpTransport.get_instance()
+        if transport:
+            result = await transport.execute(["pr", "diff", "123"], "owner/repo", 30.0)
+    """
+
+    _instances: dict[tuple[str, str], GHHttpTransport] = {}
+    _instances_lock = threading.Lock()
+    _token_cache: str | None = None
+    _token_resolved = False
+
+    def __init__(
+        self,
+        token: str,
+        api_url: str = DEFAULT_API_URL,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        cache_size: int = ETAG_CACHE_SIZE,
+    ):
+        self.token = token
+        self.api_url = api_url.rstrip("/")
+        parts = urlsplit(self.api_url)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._base_path = parts.path.rstrip("/")
+        if self._base_path.endswith("/api/v3"):
+            self._graphql_path = self._base_path[: -len("v3")] + "graphql"
+        else:
+            self._graphql_path = self._base_path + "/graphql"
+
+        self._pool: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(
+            maxsize=max_connections
+        )
+        self._cache: OrderedDict[tuple[str, str], _CachedResponse] = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_lock = threading.Lock()
+
+        # Most recent rate limit headers seen for the REST "core" resource
+        self.rate_limit_remaining: int | None = None
+        self.rate_limit_reset: int | None = None
+
+    @classmethod
+    def get_instance(
+        cls, api_url: str | None = None, token: str | None = None
+    ) -> GHHttpTransport | None:
+        """
+        Get the shared transport for an API URL and token.
+
+        Returns:
+            The transport, or None if no GitHub token is available
+        """
+        api_url = (api_url or get_api_url()).rstrip("/")
+        if token is None:
+            if not cls._token_resolved:
+                cls._token_cache = _resolve_token()
+                cls._token_resolved = True
+            token = cls._token_cache
+        if not token:
+            return None
+
+        key = (api_url, token)
+        with cls._instances_lock:
+            transport = cls._instances.get(key)
+            if transport is None:
+                transport = cls(token, api_url)
+                cls._instances[key] = transport
+            return transport
+
+    @classmethod
+    def reset_instances(cls) -> None:
+        """Close and forget all shared transports (useful for testing)."""
+        with cls._instances_lock:
+            for transport in cls._instances.values():
+                transport.close()
+            cls._instances.clear()
+            cls._token_cache = None
+            cls._token_resolved = False
+
+    # ------------------------------------------------------------------
+    # gh command translation
+    # ------------------------------------------------------------------
+
+    async def execute(
+        self, args: list[str], repo: str | None, timeout: float
+    ) -> tuple[int, str, str] | None:
+        """
+        Run a gh command over HTTP.
+
+        Args:
+            args: gh arguments (e.g. ["pr", "diff", "123", "-R", "owner/repo"])
+            repo: Default repository ('owner/repo') when args carry no -R flag
+            timeout: Per-request timeout in seconds
+
+        Returns:
+            (returncode, stdout, stderr) as gh would produce them, or None if
+            the command has no HTTP translation (run it with gh instead)
+
+        Raises:
+            OSError, http.client.HTTPException: On connection failures
+        """
+        args, repo = _split_repo_flag(args, repo)
+        if len(args) >= 2 and args[0] == "api":
+            return await self._execute_api(args[1:], repo, timeout)
+        if len(args) >= 3 and args[:2] == ["pr", "diff"] and repo:
+            return await self._execute_pr_diff(args[2:], repo, timeout)
+        if len(args) >= 3 and args[:2] == ["pr", "view"] and repo:
+            return await self._execute_pr_view(args[2:], repo, timeout)
+        return None
+
+    async def _execute_api(
+        self, args: list[str], repo: str | None, timeout: float
+    ) -> tuple[int, str, str] | None:
+        method = None
+        endpoint = None
+        fields: list[tuple[str, str]] = []
+        typed_fields: list[tuple[str, str]] = []
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg in ("--method", "-X") and i + 1 < len(args):
+                method = args[i + 1].upper()
+                i += 2
+            elif arg in ("-f", "--raw-field", "-F", "--field") and i + 1 < len(args):
+                key, sep, value = args[i + 1].partition("=")
+                if not sep:
+                    return None
+                if arg in ("-f", "--raw-field"):
+                    fields.append((key, value))
+                else:
+                    typed_fields.append((key, value))
+                i += 2
+            elif arg.startswith("-") or endpoint is not None:
+                return None  # --paginate, --jq, -H, ... are left to gh
+            else:
+                endpoint = arg
+                i += 1
+
+        if endpoint == "graphql" and method in (None, "POST"):
+            return await self._execute_graphql(fields, typed_fields, repo, timeout)
+
+        # gh sends fields as a POST body unless the method is GET
+        method = method or ("POST" if fields or typed_fields else "GET")
+        if endpoint is None or method != "GET" or typed_fields:
+            return None
+        if "{owner}" in endpoint or "{repo}" in endpoint:
+            endpoint = _fill_placeholders(endpoint, repo)
+            if endpoint is None:
+                return None  # gh resolves these from git remotes
+
+        path = endpoint if endpoint.startswith("/") else "/" + endpoint
+        if fields:
+            path += ("&" if "?" in path else "?") + urlencode(fields)
+        response = await self.request("GET", self._base_path + path, timeout=timeout)
+        if response.status >= 400:
+            return 1, response.body, _error_message(response)
+        return 0, response.body, ""
+
+    async def _execute_graphql(
+        self,
+        fields: list[tuple[str, str]],
+        typed_fields: list[tuple[str, str]],
+        repo: str | None,
+        timeout: float,
+    ) -> tuple[int, str, str] | None:
+        """Run `gh api graphql -f query=... [-f/-F var=value]`."""
+        query = None
+        variables: dict[str, Any] = {}
+        tagged = [(k, v, False) for k, v in fields]
+        tagged += [(k, v, True) for k, v in typed_fields]
+        for key, value, typed in tagged:
+            # Like gh, fill placeholders in -F fields only
+            if typed and ("{owner}" in value or "{repo}" in value):
+                value = _fill_placeholders(value, repo)
+                if value is None:
+                    return None
+            if key == "query":
+                query = value
+            elif typed:
+                if value.startswith("@"):
+                    return None  # File and stdin values are left to gh
+                try:
+                    variables[key] = json.loads(value)
+                except json.JSONDecodeError:
+                    variables[key] = value
+            else:
+                variables[key] = value
+        if query is None:
+            return None
+
+        body = json.dumps({"query": query, "variables": variables}).encode("utf-8")
+        response = await self.request(
+            "POST", self._graphql_path, body=body, timeout=timeout
+        )
+        if response.status >= 400:
+            return 1, response.body, _error_message(response)
+        try:
+            errors = json.loads(response.body).get("errors")
+        except (json.JSONDecodeError, AttributeError):
+            return 1, response.body, "gh: invalid GraphQL response"
+        if errors:
+            # gh prints the response and fails when it carries errors
+            messages = "\n".join(e.get("message", "") for e in errors)
+            return 1, response.body, f"gh: {messages}"
+        return 0, response.body, ""
+
+    async def _execute_pr_diff(
+        self, args: list[str], repo: str, timeout: float
+    ) -> tuple[int, str, str] | None:
+        if len(args) != 1 or not args[0].isdigit():
+            return None  # --name-only, --patch, branch names, ...
+        response = await self.request(
+            "GET",
+            f"{self._base_path}/repos/{repo}/pulls/{args[0]}",
+            accept="application/vnd.github.v3.diff",
+            timeout=timeout,
+        )
+        if response.status >= 400:
+            return 1, "", _error_message(response)
+        return 0, response.body, ""
+
+    async def _execute_pr_view(
+        self, args: list[str], repo: str, timeout: float
+    ) -> tuple[int, str, str] | None:
+        if len(args) != 3 or not args[0].isdigit() or args[1] != "--json":
+            return None
+        fields = [f for f in args[2].split(",") if f]
+        if not fields or any(
+            f not in PR_SCALAR_FIELDS and f not in PR_OBJECT_FIELDS for f in fields
+        ):
+            return None
+
+        selections = [
+            _PR_OBJECT_SELECTIONS[f] if f in PR_OBJECT_FIELDS else f
+            for f in dict.fromkeys(fields)
+        ]
+        # GraphQL rejects declared-but-unused variables
+        cursor_variable = ", $filesAfter: String" if "files" in fields else ""
+        query = _PR_VIEW_QUERY % (cursor_variable, "\n      ".join(selections))
+        owner, name = repo.split("/", 1)
+        variables: dict[str, Any] = {
+            "owner": owner,
+            "name": name,
+            "number": int(args[0]),
+        }
+        if "files" in fields:
+            variables["filesAfter"] = None
+
+        files: list[dict[str, Any]] = []
+        while True:
+            data, error = await self.graphql(query, variables, timeout=timeout)
+            if error:
+                return 1, "", error
+            pr = ((data or {}).get("repository") or {}).get("pullRequest")
+            if pr is None:
+                return (
+                    1,
+                    "",
+                    "GraphQL: Could not resolve to a PullRequest with the number "
+                    f"of {args[0]}.",
+                )
+            if "files" not in fields:
+                break
+            page = pr.get("files") or {}
+            files.extend(page.get("nodes") or [])
+            page_info = page.get("pageInfo") or {}
+            if not page_info.get("hasNextPage"):
+                break
+            variables["filesAfter"] = page_info.get("endCursor")
+
+        output: dict[str, Any] = {}
+        for f in fields:
+            if f == "author":
+                author = pr.get("author") or {}
+                output[f] = {
+                    "id": author.get("id", ""),
+                    "is_bot": author.get("__typename") == "Bot",
+                    "login": author.get("login", ""),
+                    "name": author.get("name", ""),
+                }
+            elif f == "files":
+                output[f] = files
+            elif f == "labels":
+                output[f] = (pr.get("labels") or {}).get("nodes") or []
+            else:
+                output[f] = pr.get(f)
+        return 0, json.dumps(output, indent=2, sort_keys=True) + "\n", ""
+
+    async def graphql(
+        self, query: str, variables: dict[str, Any], timeout: float
+    ) -> tuple[dict[str, Any] | None, str | None]:
+        """
+        Run a GraphQL query.
+
+        Returns:
+            (data, error message); error is None on success
+        """
+        body = json.dumps({"query": query, "variables": variables}).encode("utf-8")
+        response = await self.request(
+            "POST", self._graphql_path, body=body, timeout=timeout
+        )
+        if response.status >= 400:
+            return None, _error_message(response)
+        try:
+            payload = json.loads(response.body)
+        except json.JSONDecodeError:
+            return None, "GraphQL: invalid JSON response"
+        if payload.get("errors"):
+            messages = "; ".join(e.get("message", "") for e in payload["errors"])
+            return None, f"GraphQL: {messages}"
+        return payload.get("data"), None
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        accept: str = "application/vnd.github+json",
+        timeout: float = 30.0,
+    ) -> HTTPResponse:
+        """
+        Send a request over a pooled connection.
+
+        GET responses carrying an ETag are cached; later GETs for the same
+        URL send If-None-Match and a 304 is answered from the cache.
+        """
+        headers = {
+            "Accept": accept,
+            "Authorization": f"Bearer {self.token}",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if body is not None:
+            headers["Content-Type"] = "application/json"
+
+        cache_key = (path, accept)
+        cached = None
+        if method == "GET":
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                headers["If-None-Match"] = cached.etag
+
+        status, text, response_headers = await asyncio.to_thread(
+            self._send, method, path, body, headers, timeout
+        )
+        self._record_rate_limit(response_headers)
+
+        if status == 304 and cached is not None:
+            return HTTPResponse(200, cached.body, cached.headers, from_cache=True)
+
+        etag = response_headers.get("etag")
+        if method == "GET" and status == 200 and etag:
+            if len(text) <= ETAG_CACHE_MAX_BODY:
+                with self._cache_lock:
+                    self._cache[cache_key] = _CachedResponse(
+                        etag, text, response_headers
+                    )
+                    self._cache.move_to_end(cache_key)
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+        return HTTPResponse(status, text, response_headers)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        timeout: float,
+    ) -> tuple[int, str, dict[str, str]]:
+        """Blocking request; retries once if a pooled connection went stale."""
+        for attempt in range(2):
+            conn, reused = self._acquire(timeout)
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+
+            if response.will_close:
+                conn.close()
+            else:
+                self._release(conn)
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            body = data.decode("utf-8", errors="replace")
+            return response.status, body, response_headers
+        raise http.client.HTTPException("unreachable")  # pragma: no cover
+
+    def _acquire(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            conn = self._pool.get_nowait()
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            conn.timeout = timeout
+            return conn, True
+        except queue.Empty:
+            pass
+        if self._scheme == "https":
+            return http.client.HTTPSConnection(self._netloc, timeout=timeout), False
+        return http.client.HTTPConnection(self._netloc, timeout=timeout), False
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def _record_rate_limit(self, headers: dict[str, str]) -> None:
+        # GraphQL and search have their own limits; only core feeds the
+        # bucket (servers that omit the resource header only report core)
+        if headers.get("x-ratelimit-resource", "core") != "core":
+            return
+        try:
+            if "x-ratelimit-remaining" in headers:
+                self.rate_limit_remaining = int(headers["x-ratelimit-remaining"])
+            if "x-ratelimit-reset" in headers:
+                self.rate_limit_reset = int(headers["x-ratelimit-reset"])
+        except ValueError:
+            pass
+
+    def close(self) -> None:
+        """Close idle pooled connections."""
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+def _split_repo_flag(args: list[str], repo: str | None) -> tuple[list[str], str | None]:
+    """Remove -R/--repo from args, returning it as the repo."""
+    remaining = []
+    i = 0
+    while i < len(args):
+        if args[i] in ("-R", "--repo") and i + 1 < len(args):
+            repo = args[i + 1]
+            i += 2
+        else:
+            remaining.append(args[i])
+            i += 1
+    return remaining, repo
+
+
+def _fill_placeholders(value: str, repo: str | None) -> str | None:
+    """Replace gh's {owner}/{repo} placeholders, or None if repo is unknown."""
+    if not repo or "/" not in repo:
+        return None
+    owner, name = repo.split("/", 1)
+    return value.replace("{owner}", owner).replace("{repo}", name)
+
+
+def _error_message(response: HTTPResponse) -> str:
+    """Format an error the way gh reports it: 'gh: <message> (HTTP <status>)'."""
+    message = ""
+    try:
+        message = json.loads(response.body).get("message", "")
+    except (json.JSONDecodeError, AttributeError):
+        pass
+    reason = http.client.responses.get(response.status, "")
+    return f"gh: {message or reason} (HTTP {response.status})"
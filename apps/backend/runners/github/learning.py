@@ -21,17 +21,24 @@ Usage:
 
     # Get accuracy metrics
     metrics = tracker.get_accuracy("repo")
+
+Outcomes are stored in the runner's StateStore, indexed by repo, prediction
+type and whether the outcome is still pending.
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import StateStore
+except (ImportError, ValueError, SystemError):
+    from state_store import StateStore
+
 
 class PredictionType(str, Enum):
     """Types of predictions the system makes."""
@@ -283,47 +290,50 @@ class LearningTracker:
         )
     """
 
+    STORE_KIND = "outcome"
+
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
         self.learning_dir = state_dir / "learning"
         self.learning_dir.mkdir(parents=True, exist_ok=True)
+        self._store = StateStore.for_dir(state_dir)
+        # Per-repo outcome files from before the state store
+        self._store.import_legacy(
+            self.STORE_KIND,
+            self.learning_dir.glob("*_outcomes.json"),
+            records=lambda data: data.get("outcomes", []),
+            key=lambda data: data["review_id"],
+            fields=lambda data: self._index_fields(ReviewOutcome.from_dict(data)),
+        )
 
-        self._outcomes: dict[str, ReviewOutcome] = {}
-        self._load_outcomes()
-
-    def _get_outcomes_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.learning_dir / f"{safe_name}_outcomes.json"
-
-    def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
-        for file in self.learning_dir.glob("*_outcomes.json"):
-            try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    for item in data.get("outcomes", []):
-                        outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
-                continue
-
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
-
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
+    @staticmethod
+    def _index_fields(outcome: ReviewOutcome) -> tuple[str, str, bool, str]:
+        return (
+            outcome.repo,
+            outcome.prediction.value,
+            not outcome.is_complete,
+            outcome.created_at.isoformat(),
+        )
 
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
-        }
+    def _save_outcome(self, outcome: ReviewOutcome) -> None:
+        """Upsert a single outcome record."""
+        repo, prediction, pending, created_at = self._index_fields(outcome)
+        self._store.put(
+            self.STORE_KIND,
+            outcome.review_id,
+            outcome.to_dict(),
+            repo=repo,
+            state=prediction,
+            pending=pending,
+            created_at=created_at,
+        )
 
-        # Use file locking and atomic write for safe concurrent access
-        with FileLock(file, timeout=5.0):
-            with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+    def _query_outcomes(self, **filters: Any) -> list[ReviewOutcome]:
+        """Load the outcomes matching StateStore.query() filters."""
+        return [
+            ReviewOutcome.from_dict(data)
+            for data in self._store.query(self.STORE_KIND, **filters)
+        ]
 
     def record_prediction(
         self,
@@ -366,8 +376,7 @@ class LearningTracker:
             categories=categories or [],
         )
 
-        self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._save_outcome(outcome)
 
         return outcome
 
@@ -392,27 +401,23 @@ class LearningTracker:
         Returns:
             Updated ReviewOutcome or None if not found
         """
-        if review_id not in self._outcomes:
+        data = self._store.get(self.STORE_KIND, review_id)
+        if data is None:
             return None
 
-        review_outcome = self._outcomes[review_id]
+        review_outcome = ReviewOutcome.from_dict(data)
         review_outcome.actual_outcome = outcome
         review_outcome.time_to_outcome = time_to_outcome
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
 
-        self._save_outcomes(repo)
+        self._save_outcome(review_outcome)
 
         return review_outcome
 
     def get_pending_outcomes(self, repo: str | None = None) -> list[ReviewOutcome]:
         """Get predictions that don't have outcomes yet."""
-        pending = []
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete:
-                if repo is None or outcome.repo == repo:
-                    pending.append(outcome)
-        return pending
+        return self._query_outcomes(repo=repo, pending=True)
 
     def get_accuracy(
         self,
@@ -434,14 +439,14 @@ class LearningTracker:
         stats = AccuracyStats()
         merge_times = []
 
-        for outcome in self._outcomes.values():
+        outcomes = self._query_outcomes(
+            repo=repo or None,
+            state=prediction_type.value if prediction_type else None,
+        )
+        for outcome in outcomes:
             # Apply filters
-            if repo and outcome.repo != repo:
-                continue
             if since and outcome.created_at < since:
                 continue
-            if prediction_type and outcome.prediction != prediction_type:
-                continue
 
             stats.total_predictions += 1
 
@@ -482,13 +487,7 @@ class LearningTracker:
         limit: int = 50,
     ) -> list[ReviewOutcome]:
         """Get recent outcomes, most recent first."""
-        outcomes = list(self._outcomes.values())
-
-        if repo:
-            outcomes = [o for o in outcomes if o.repo == repo]
-
-        outcomes.sort(key=lambda o: o.created_at, reverse=True)
-        return outcomes[:limit]
+        return self._query_outcomes(repo=repo or None, newest_first=True, limit=limit)
 
     def detect_patterns(self, min_sample_size: int = 20) -> list[LearningPattern]:
         """
@@ -503,10 +502,11 @@ class LearningTracker:
             List of detected patterns
         """
         patterns = []
+        completed = self._query_outcomes(pending=False)
 
         # Pattern: Accuracy by file type
         by_file_type: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
+        for outcome in completed:
             if not outcome.is_complete or outcome.was_correct is None:
                 continue
 
@@ -538,7 +538,7 @@ class LearningTracker:
 
         # Pattern: Accuracy by category
         by_category: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
+        for outcome in completed:
             if not outcome.is_complete or outcome.was_correct is None:
                 continue
 
@@ -570,7 +570,7 @@ class LearningTracker:
 
         # Pattern: Accuracy by change size
         by_size: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
+        for outcome in completed:
             if not outcome.is_complete or outcome.was_correct is None:
                 continue
 
@@ -620,7 +620,9 @@ class LearningTracker:
             "recent_outcomes": [
                 o.to_dict() for o in self.get_recent_outcomes(repo, limit=10)
             ],
-            "pending_count": len(self.get_pending_outcomes(repo)),
+            "pending_count": self._store.count(
+                self.STORE_KIND, repo=repo, pending=True
+            ),
         }
 
     def check_pr_status(
@@ -9,17 +9,23 @@ Prevents conflicting operations:
 - Blocks auto-fix if triage = spam/duplicate
 - Requires triage before auto-fix
 - Auto-generated PRs must pass AI review before human notification
+
+Lifecycles are stored in the runner's StateStore, indexed by repo and state.
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import StateStore
+except (ImportError, ValueError, SystemError):
+    from state_store import StateStore
+
 
 class IssueLifecycleState(str, Enum):
     """Unified issue lifecycle states."""
@@ -394,23 +400,40 @@ class LifecycleManager:
         )
     """
 
+    STORE_KIND = "lifecycle"
+
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
         self.lifecycle_dir = state_dir / "lifecycle"
         self.lifecycle_dir.mkdir(parents=True, exist_ok=True)
+        self._store = StateStore.for_dir(state_dir)
+        # Per-issue JSON files from before the state store
+        self._store.import_legacy(
+            self.STORE_KIND,
+            self.lifecycle_dir.glob("*.json"),
+            records=lambda data: [data],
+            key=lambda data: self._get_key(data["repo"], data["issue_number"]),
+            fields=self._index_fields,
+        )
 
-    def _get_file(self, repo: str, issue_number: int) -> Path:
-        safe_repo = repo.replace("/", "_")
-        return self.lifecycle_dir / f"{safe_repo}_{issue_number}.json"
+    @staticmethod
+    def _get_key(repo: str, issue_number: int) -> str:
+        return f"{repo}#{issue_number}"
+
+    @staticmethod
+    def _index_fields(data: dict[str, Any]) -> tuple[str, str, bool, str | None]:
+        return (
+            data["repo"],
+            data.get("current_state", "new"),
+            False,
+            data.get("created_at"),
+        )
 
     def get(self, repo: str, issue_number: int) -> IssueLifecycle | None:
         """Get lifecycle for an issue."""
-        file = self._get_file(repo, issue_number)
-        if not file.exists():
+        data = self._store.get(self.STORE_KIND, self._get_key(repo, issue_number))
+        if data is None:
             return None
-
-        with open(file, encoding="utf-8") as f:
-            data = json.load(f)
         return IssueLifecycle.from_dict(data)
 
     def get_or_create(self, repo: str, issue_number: int) -> IssueLifecycle:
@@ -425,9 +448,17 @@ class LifecycleManager:
 
     def save(self, lifecycle: IssueLifecycle) -> None:
         """Save lifecycle state."""
-        file = self._get_file(lifecycle.repo, lifecycle.issue_number)
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump(lifecycle.to_dict(), f, indent=2)
+        data = lifecycle.to_dict()
+        repo, state, pending, created_at = self._index_fields(data)
+        self._store.put(
+            self.STORE_KIND,
+            self._get_key(lifecycle.repo, lifecycle.issue_number),
+            data,
+            repo=repo,
+            state=state,
+            pending=pending,
+            created_at=created_at,
+        )
 
     def transition(
         self,
@@ -505,27 +536,11 @@ class LifecycleManager:
         state: IssueLifecycleState,
     ) -> list[IssueLifecycle]:
         """Get all issues in a specific state."""
-        results = []
-        safe_repo = repo.replace("/", "_")
-
-        for file in self.lifecycle_dir.glob(f"{safe_repo}_*.json"):
-            with open(file, encoding="utf-8") as f:
-                data = json.load(f)
-                lifecycle = IssueLifecycle.from_dict(data)
-                if lifecycle.current_state == state:
-                    results.append(lifecycle)
-
-        return results
+        return [
+            IssueLifecycle.from_dict(data)
+            for data in self._store.query(self.STORE_KIND, repo=repo, state=state.value)
+        ]
 
     def get_summary(self, repo: str) -> dict[str, int]:
         """Get count of issues by state."""
-        counts: dict[str, int] = {}
-        safe_repo = repo.replace("/", "_")
-
-        for file in self.lifecycle_dir.glob(f"{safe_repo}_*.json"):
-            with open(file, encoding="utf-8") as f:
-                data = json.load(f)
-                state = data.get("current_state", "new")
-                counts[state] = counts.get(state, 0) + 1
-
-        return counts
+        return self._store.count_by_state(self.STORE_KIND, repo=repo)
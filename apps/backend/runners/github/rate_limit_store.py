@@ -0,0 +1,246 @@
+"""
+Shared Rate Limit Store
+=======================
+
+SQLite-backed state for the rate limiter, shared by every runner process on
+one host (PR review, triage, autofix, multi-repo) that uses the same GitHub
+token and AI budget.
+
+Each operation runs in its own write transaction (BEGIN IMMEDIATE), so
+concurrent processes take and refill tokens from one bucket and charge one
+cost ledger instead of each assuming it owns the full quota. Bucket state is
+kept in wall-clock time since monotonic clocks are not comparable across
+processes.
+
+Usage:
+    store = SharedRateLimitStore.for_path(Path("~/.auto-claude/github_rate_limits.db"))
+    acquired, tokens = store.try_acquire("github", capacity=5000, refill_rate=1.4)
+    store.observe_remaining("github", 5000, 1.4, remaining=120, reset_at=1767225600)
+    accepted, total = store.add_cost("ai", 0.02, limit=10.0, window=86400.0)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    -- Wall-clock time tokens were last refilled from; may be in the future
+    -- while GitHub reports the quota exhausted until its reset time
+    refilled_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS costs (
+    budget TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    operation TEXT,
+    model TEXT,
+    input_tokens INTEGER,
+    output_tokens INTEGER,
+    cost REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS costs_budget_time ON costs (budget, timestamp);
+"""
+
+
+class SharedRateLimitStore:
+    """
+    Token buckets and cost ledgers shared across processes via SQLite.
+
+    One store (and connection) is shared per database file within a
+    process; use for_path() rather than the constructor.
+    """
+
+    _instances: dict[Path, SharedRateLimitStore] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, path: Path):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly with
+        # BEGIN IMMEDIATE so the read-modify-write of a bucket is atomic
+        # across processes
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_path(cls, path: Path | str) -> SharedRateLimitStore:
+        """Get the shared store for a database file."""
+        key = Path(path).expanduser().resolve()
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls(key)
+                cls._instances[key] = store
+            return store
+
+    @classmethod
+    def reset_instances(cls) -> None:
+        """Close and forget all shared stores (for testing)."""
+        with cls._instances_lock:
+            for store in cls._instances.values():
+                store.close()
+            cls._instances.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Token buckets
+    # ------------------------------------------------------------------
+
+    def try_acquire(
+        self, name: str, capacity: int, refill_rate: float, tokens: int = 1
+    ) -> tuple[bool, float]:
+        """
+        Take tokens from a bucket if enough are available.
+
+        Returns:
+            (acquired, tokens left in the bucket) tuple
+        """
+        with self._transaction():
+            available, now = self._refilled(name, capacity, refill_rate)
+            acquired = available >= tokens
+            if acquired:
+                available -= tokens
+                self._save_bucket(name, available, now)
+        return acquired, available
+
+    def available(self, name: str, capacity: int, refill_rate: float) -> float:
+        """Get the tokens currently in a bucket without taking any."""
+        with self._lock:
+            available, _ = self._refilled(name, capacity, refill_rate)
+        return available
+
+    def observe_remaining(
+        self,
+        name: str,
+        capacity: int,
+        refill_rate: float,
+        remaining: int,
+        reset_at: float | None = None,
+    ) -> float:
+        """
+        Apply server-reported quota (X-RateLimit-Remaining) to a bucket.
+
+        The bucket never holds more than the server says is left. When the
+        quota is exhausted, the bucket stays empty until reset_at (epoch
+        seconds), or until the server reports quota again.
+
+        Returns:
+            Tokens left in the bucket
+        """
+        with self._transaction():
+            now = time.time()
+            available, refilled_at = self._refilled(name, capacity, refill_rate)
+            if refilled_at > now:
+                # Blocked until a reset the server has evidently passed
+                available = float(remaining)
+            available = min(available, float(remaining))
+            refilled_at = now
+            if remaining <= 0 and reset_at is not None:
+                refilled_at = max(now, float(reset_at))
+            self._save_bucket(name, available, refilled_at)
+        return available
+
+    def _refilled(
+        self, name: str, capacity: int, refill_rate: float
+    ) -> tuple[float, float]:
+        """Current bucket level after refill, and the time it was computed at."""
+        now = time.time()
+        row = self._conn.execute(
+            "SELECT tokens, refilled_at FROM buckets WHERE name = ?", (name,)
+        ).fetchone()
+        if row is None:
+            return float(capacity), now
+        tokens, refilled_at = row
+        if refilled_at > now:
+            # Exhausted until the server-reported reset time
+            return tokens, refilled_at
+        return min(float(capacity), tokens + (now - refilled_at) * refill_rate), now
+
+    def _save_bucket(self, name: str, tokens: float, refilled_at: float) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO buckets (name, tokens, refilled_at) "
+            "VALUES (?, ?, ?)",
+            (name, tokens, refilled_at),
+        )
+
+    # ------------------------------------------------------------------
+    # Cost ledgers
+    # ------------------------------------------------------------------
+
+    def add_cost(
+        self,
+        budget: str,
+        cost: float,
+        limit: float,
+        window: float,
+        operation: str = "unknown",
+        model: str | None = None,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+    ) -> tuple[bool, float]:
+        """
+        Charge a cost to a budget unless it would exceed the limit.
+
+        Only costs within the last `window` seconds count toward the limit;
+        older entries are pruned.
+
+        Returns:
+            (accepted, total cost in the window) tuple; the total includes
+            this cost only if it was accepted
+        """
+        with self._transaction():
+            now = time.time()
+            self._conn.execute(
+                "DELETE FROM costs WHERE budget = ? AND timestamp < ?",
+                (budget, now - window),
+            )
+            total = self._total(budget, now - window)
+            if total + cost > limit:
+                return False, total
+            self._conn.execute(
+                "INSERT INTO costs (budget, timestamp, operation, model, "
+                "input_tokens, output_tokens, cost) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (budget, now, operation, model, input_tokens, output_tokens, cost),
+            )
+        return True, total + cost
+
+    def total_cost(self, budget: str, window: float) -> float:
+        """Get the total cost charged to a budget in the last `window` seconds."""
+        with self._lock:
+            return self._total(budget, time.time() - window)
+
+    def _total(self, budget: str, since: float) -> float:
+        return self._conn.execute(
+            "SELECT COALESCE(SUM(cost), 0.0) FROM costs "
+            "WHERE budget = ? AND timestamp >= ?",
+            (budget, since),
+        ).fetchone()[0]
+
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Process-local lock plus a cross-process SQLite write transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
@@ -12,6 +12,8 @@ Components:
 - RateLimiter: Singleton managing GitHub and AI cost limits
 - @rate_limited decorator: Automatic pre-flight checks with retry logic
 - Cost tracking: Per-model AI API cost calculation and budgeting
+- Shared state: Optional SQLite backend so runner processes on one host
+  share one GitHub quota and AI budget (GITHUB_SHARED_RATE_LIMIT)
 
 Usage:
     # Singleton instance
@@ -37,21 +39,50 @@ Usage:
     # Manual rate check
     if not await limiter.acquire_github():
         raise RateLimitExceeded("GitHub API rate limit reached")
+
+    # Share limits with other runner processes on this host
+    limiter = RateLimiter.get_instance(shared_state="~/.auto-claude/rate.db")
+    limiter.observe_github_rate_limit(remaining=120, reset_at=1767225600)
 """
 
 from __future__ import annotations
 
 import asyncio
 import functools
+import os
 import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, TypeVar
 
+try:
+    from .rate_limit_store import SharedRateLimitStore
+except (ImportError, ValueError, SystemError):
+    from rate_limit_store import SharedRateLimitStore
+
 # Type for decorated functions
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Shared state file used when GITHUB_SHARED_RATE_LIMIT is enabled without a path
+DEFAULT_SHARED_STATE_PATH = Path.home() / ".auto-claude" / "github_rate_limits.db"
+
+
+def _get_shared_state_path() -> Path | None:
+    """
+    Shared rate limit state file from GITHUB_SHARED_RATE_LIMIT.
+
+    "1"/"true"/"yes" selects the default path; any other non-empty value is
+    used as the path.
+    """
+    value = os.environ.get("GITHUB_SHARED_RATE_LIMIT", "").strip()
+    if not value or value.lower() in ("0", "false", "no"):
+        return None
+    if value.lower() in ("1", "true", "yes"):
+        return DEFAULT_SHARED_STATE_PATH
+    return Path(value).expanduser()
+
 
 class RateLimitExceeded(Exception):
     """Raised when rate limit is exceeded and cannot proceed."""
@@ -74,15 +105,23 @@ class TokenBucket:
     Each operation consumes one token. If bucket is empty, operations
     must wait for refill or be rejected.
 
+    With a shared store, the bucket's level lives in the store and is
+    shared with every process using the same store and name; `tokens`
+    then holds the last level seen by this process.
+
     Args:
         capacity: Maximum number of tokens (e.g., 5000 for GitHub)
         refill_rate: Tokens added per second (e.g., 1.4 for 5000/hour)
+        store: Shared store holding the bucket (None = in-process only)
+        name: Bucket name in the shared store
     """
 
     capacity: int
     refill_rate: float  # tokens per second
     tokens: float = field(init=False)
     last_refill: float = field(init=False)
+    store: SharedRateLimitStore | None = field(default=None, repr=False)
+    name: str = "github"
 
     def __post_init__(self):
         """Initialize bucket as full."""
@@ -91,11 +130,18 @@ class TokenBucket:
 
     def _refill(self) -> None:
         """Refill bucket based on elapsed time."""
+        if self.store is not None:
+            self.tokens = self.store.available(
+                self.name, self.capacity, self.refill_rate
+            )
+            return
         now = time.monotonic()
-        elapsed = now - self.last_refill
+        # last_refill is in the future while the server reports the quota
+        # exhausted (see observe_remaining)
+        elapsed = max(0.0, now - self.last_refill)
         tokens_to_add = elapsed * self.refill_rate
         self.tokens = min(self.capacity, self.tokens + tokens_to_add)
-        self.last_refill = now
+        self.last_refill = max(now, self.last_refill)
 
     def try_acquire(self, tokens: int = 1) -> bool:
         """
@@ -104,6 +150,11 @@ class TokenBucket:
         Returns:
             True if tokens acquired, False if insufficient tokens
         """
+        if self.store is not None:
+            acquired, self.tokens = self.store.try_acquire(
+                self.name, self.capacity, self.refill_rate, tokens
+            )
+            return acquired
         self._refill()
         if self.tokens >= tokens:
             self.tokens -= tokens
@@ -157,6 +208,26 @@ class TokenBucket:
         tokens_needed = tokens - self.tokens
         return tokens_needed / self.refill_rate
 
+    def observe_remaining(self, remaining: int, reset_at: float | None = None) -> None:
+        """
+        Cap the bucket at the server-reported remaining quota.
+
+        Args:
+            remaining: X-RateLimit-Remaining value
+            reset_at: X-RateLimit-Reset value (epoch seconds); when nothing
+                remains, the bucket does not refill before this time
+        """
+        if self.store is not None:
+            self.tokens = self.store.observe_remaining(
+                self.name, self.capacity, self.refill_rate, remaining, reset_at
+            )
+            return
+        self._refill()
+        self.tokens = min(self.tokens, float(remaining))
+        if remaining <= 0 and reset_at is not None:
+            wait = max(0.0, reset_at - time.time())
+            self.last_refill = max(self.last_refill, time.monotonic() + wait)
+
 
 # AI model pricing (per 1M tokens)
 AI_PRICING = {
@@ -173,11 +244,21 @@ AI_PRICING = {
 
 @dataclass
 class CostTracker:
-    """Track AI API costs."""
+    """
+    Track AI API costs.
+
+    With a shared store, the budget is charged in the store and shared with
+    every process using the same store and budget name, counting costs from
+    the last `window` seconds; `total_cost` then holds that shared total and
+    `operations` only this process's operations.
+    """
 
     total_cost: float = 0.0
     cost_limit: float = 10.0
     operations: list[dict] = field(default_factory=list)
+    store: SharedRateLimitStore | None = field(default=None, repr=False)
+    budget: str = "ai"
+    window: float = 86400.0  # seconds
 
     def add_operation(
         self,
@@ -203,14 +284,31 @@ class CostTracker:
         """
         cost = self.calculate_cost(input_tokens, output_tokens, model)
 
+        if self.store is not None:
+            accepted, self.total_cost = self.store.add_cost(
+                self.budget,
+                cost,
+                self.cost_limit,
+                self.window,
+                operation=operation_name,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+            )
+            if not accepted:
+                raise CostLimitExceeded(
+                    f"Operation would exceed shared cost limit: "
+                    f"${self.total_cost + cost:.2f} > ${self.cost_limit:.2f}"
+                )
         # Check if this would exceed limit
-        if self.total_cost + cost > self.cost_limit:
+        elif self.total_cost + cost > self.cost_limit:
             raise CostLimitExceeded(
                 f"Operation would exceed cost limit: "
                 f"${self.total_cost + cost:.2f} > ${self.cost_limit:.2f}"
             )
+        else:
+            self.total_cost += cost
 
-        self.total_cost += cost
         self.operations.append(
             {
                 "timestamp": datetime.now().isoformat(),
@@ -247,10 +345,13 @@ class CostTracker:
 
     def remaining_budget(self) -> float:
         """Get remaining budget in dollars."""
+        if self.store is not None:
+            self.total_cost = self.store.total_cost(self.budget, self.window)
         return max(0.0, self.cost_limit - self.total_cost)
 
     def usage_report(self) -> str:
         """Generate cost usage report."""
+        self.remaining_budget()  # Refresh a shared total
         lines = [
             "Cost Usage Report",
             "=" * 50,
@@ -283,6 +384,10 @@ class RateLimiter:
     - GitHub API rate limits (token bucket)
     - AI cost limits (budget tracking)
     - Request queuing and backoff
+
+    With shared state, the GitHub bucket and AI budget are kept in a SQLite
+    file shared by every runner process on the host, and the AI budget
+    covers the last `cost_window` seconds instead of this process's run.
     """
 
     _instance: RateLimiter | None = None
@@ -294,6 +399,8 @@ class RateLimiter:
         github_refill_rate: float = 1.4,  # ~5000/hour
         cost_limit: float = 10.0,
         max_retry_delay: float = 300.0,  # 5 minutes
+        shared_state: Path | str | None = None,
+        cost_window: float = 86400.0,  # 24 hours
     ):
         """
         Initialize rate limiter.
@@ -303,17 +410,34 @@ class RateLimiter:
             github_refill_rate: Tokens per second refill rate
             cost_limit: Maximum AI cost in dollars per run
             max_retry_delay: Maximum exponential backoff delay
+            shared_state: SQLite file shared with other runner processes
+                (None = from GITHUB_SHARED_RATE_LIMIT, unset = in-process only)
+            cost_window: Seconds of shared AI costs counted toward cost_limit
         """
         if RateLimiter._initialized:
             return
 
+        if shared_state is None:
+            shared_state = _get_shared_state_path()
+        self.shared_store = (
+            SharedRateLimitStore.for_path(shared_state) if shared_state else None
+        )
+
         self.github_bucket = TokenBucket(
             capacity=github_limit,
             refill_rate=github_refill_rate,
+            store=self.shared_store,
+        )
+        self.cost_tracker = CostTracker(
+            cost_limit=cost_limit,
+            store=self.shared_store,
+            window=cost_window,
         )
-        self.cost_tracker = CostTracker(cost_limit=cost_limit)
         self.max_retry_delay = max_retry_delay
 
+        # Last X-RateLimit-Remaining/Reset pair applied to the bucket
+        self._last_observed: tuple[int, int | None] | None = None
+
         # Request statistics
         self.github_requests = 0
         self.github_rate_limited = 0
@@ -329,6 +453,8 @@ class RateLimiter:
         github_refill_rate: float = 1.4,
         cost_limit: float = 10.0,
         max_retry_delay: float = 300.0,
+        shared_state: Path | str | None = None,
+        cost_window: float = 86400.0,
     ) -> RateLimiter:
         """
         Get or create singleton instance.
@@ -338,6 +464,8 @@ class RateLimiter:
             github_refill_rate: Tokens per second refill rate
             cost_limit: Maximum AI cost in dollars
             max_retry_delay: Maximum retry delay
+            shared_state: SQLite file shared with other runner processes
+            cost_window: Seconds of shared AI costs counted toward cost_limit
 
         Returns:
             RateLimiter singleton instance
@@ -348,6 +476,8 @@ class RateLimiter:
                 github_refill_rate=github_refill_rate,
                 cost_limit=cost_limit,
                 max_retry_delay=max_retry_delay,
+                shared_state=shared_state,
+                cost_window=cost_window,
             )
         return cls._instance
 
@@ -388,6 +518,25 @@ class RateLimiter:
         wait_time = self.github_bucket.time_until_available()
         return False, f"Rate limited. Wait {wait_time:.1f}s for next request"
 
+    def observe_github_rate_limit(
+        self, remaining: int | None, reset_at: int | None = None
+    ) -> None:
+        """
+        Apply GitHub's X-RateLimit-Remaining/Reset feedback to the bucket.
+
+        GitHub's count covers every client using the token, so the bucket is
+        capped at it. A pair already applied is ignored, so callers can pass
+        the latest headers seen after every request.
+
+        Args:
+            remaining: X-RateLimit-Remaining (None = not reported)
+            reset_at: X-RateLimit-Reset in epoch seconds
+        """
+        if remaining is None or (remaining, reset_at) == self._last_observed:
+            return
+        self._last_observed = (remaining, reset_at)
+        self.github_bucket.observe_remaining(remaining, reset_at)
+
     def track_ai_cost(
         self,
         input_tokens: int,
@@ -443,9 +592,11 @@ class RateLimiter:
             Dictionary of statistics
         """
         runtime = (datetime.now() - self.start_time).total_seconds()
+        remaining_budget = self.cost_tracker.remaining_budget()
 
         return {
             "runtime_seconds": runtime,
+            "shared_state": str(self.shared_store.path) if self.shared_store else None,
             "github": {
                 "total_requests": self.github_requests,
                 "rate_limited": self.github_rate_limited,
@@ -456,7 +607,7 @@ class RateLimiter:
             "cost": {
                 "total_cost": self.cost_tracker.total_cost,
                 "budget": self.cost_tracker.cost_limit,
-                "remaining": self.cost_tracker.remaining_budget(),
+                "remaining": remaining_budget,
                 "operations": len(self.cost_tracker.operations),
             },
         }
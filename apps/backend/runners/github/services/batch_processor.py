@@ -261,8 +261,9 @@ class BatchProcessor:
             proposed_batches = []
             single_issues = []
 
+            issues_by_number = {i["number"]: i for i in available_issues}
             for cluster in clusters:
-                cluster_issues = [i for i in available_issues if i["number"] in cluster]
+                cluster_issues = [issues_by_number[n] for n in cluster]
 
                 if len(cluster) == 1:
                     # Single issue - no batch needed
@@ -155,14 +155,17 @@ class ParallelFollowupReviewer:
         return ""
 
     def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
-        """Create a temporary worktree at the PR head commit.
+        """Lease a pooled worktree at the PR head commit.
+
+        Follow-ups prefer the slot the PR was last reviewed in, so only the
+        files changed since then are rewritten.
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
 
         Returns:
-            Path to the created worktree
+            Path to the leased worktree
 
         Raises:
             RuntimeError: If worktree creation fails
@@ -175,15 +178,15 @@ class ParallelFollowupReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        return self.worktree_manager.acquire_worktree(head_sha, pr_number)
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
-        """Remove a temporary PR review worktree with fallback chain.
+        """Return a PR review worktree to the pool (or remove it if not pooled).
 
         Args:
-            worktree_path: Path to the worktree to remove
+            worktree_path: Path to the worktree to release
         """
-        self.worktree_manager.remove_worktree(worktree_path)
+        self.worktree_manager.release_worktree(worktree_path)
 
     def _define_specialist_agents(
         self, project_root: Path | None = None
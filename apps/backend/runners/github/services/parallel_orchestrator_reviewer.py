@@ -21,8 +21,10 @@ import asyncio
 import hashlib
 import logging
 import os
+import time
 from collections import defaultdict
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -133,10 +135,51 @@ logger = logging.getLogger(__name__)
 # Check if debug mode is enabled
 DEBUG_MODE = os.environ.get("DEBUG", "").lower() in ("true", "1", "yes")
 
+# Seconds the other specialists wait for the first one to start responding,
+# so its request has written the shared PR context prefix to the prompt cache
+SPECIALIST_CACHE_WARMUP_TIMEOUT = 30.0
+
+
+def _get_max_parallel_specialists() -> int:
+    """Cap on concurrent specialist sessions (PR_REVIEW_MAX_PARALLEL_SPECIALISTS)."""
+    try:
+        value = int(os.environ.get("PR_REVIEW_MAX_PARALLEL_SPECIALISTS", "0"))
+    except ValueError:
+        value = 0
+    return value if value > 0 else len(SPECIALIST_CONFIGS)
+
+
 # Directory for PR review worktrees (inside github/pr for consistency)
 PR_WORKTREE_DIR = ".auto-claude/github/pr/worktrees"
 
 
+@dataclass
+class SpecialistMetrics:
+    """Prompt size, token usage and latency of one specialist session."""
+
+    name: str
+    shared_prompt_chars: int = 0
+    specialist_prompt_chars: int = 0
+    latency_seconds: float = 0.0
+    input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float | None = None
+    findings: int = 0
+    error: str | None = None
+
+    def record_usage(self, usage: dict[str, Any] | None) -> None:
+        """Copy token counts from an SDK ResultMessage usage dict."""
+        for key in (
+            "input_tokens",
+            "cache_creation_input_tokens",
+            "cache_read_input_tokens",
+            "output_tokens",
+        ):
+            setattr(self, key, int((usage or {}).get(key) or 0))
+
+
 def _is_finding_in_scope(
     finding: PRReviewFinding,
     changed_files: list[str],
@@ -198,6 +241,8 @@ class ParallelOrchestratorReviewer:
         self.config = config
         self.progress_callback = progress_callback
         self.worktree_manager = PRWorktreeManager(project_dir, PR_WORKTREE_DIR)
+        # Metrics of the specialist sessions from the latest review
+        self.specialist_metrics: list[SpecialistMetrics] = []
 
     def _report_progress(self, phase: str, progress: int, message: str, **kwargs):
         """Report progress if callback is set."""
@@ -228,15 +273,21 @@ class ParallelOrchestratorReviewer:
         logger.warning(f"Prompt file not found: {prompt_file}")
         return ""
 
-    def _create_pr_worktree(self, head_sha: str, pr_number: int) -> Path:
-        """Create a temporary worktree at the PR head commit.
+    def _create_pr_worktree(
+        self,
+        head_sha: str,
+        pr_number: int,
+        changed_files: list[str] | None = None,
+    ) -> Path:
+        """Lease a pooled worktree at the PR head commit.
 
         Args:
             head_sha: The commit SHA of the PR head (validated before use)
             pr_number: The PR number for naming
+            changed_files: PR file paths (used for sparse checkout if enabled)
 
         Returns:
-            Path to the created worktree
+            Path to the leased worktree
 
         Raises:
             RuntimeError: If worktree creation fails
@@ -249,15 +300,17 @@ class ParallelOrchestratorReviewer:
                 "Must contain only alphanumeric characters, dots, slashes, underscores, and hyphens."
             )
 
-        return self.worktree_manager.create_worktree(head_sha, pr_number)
+        return self.worktree_manager.acquire_worktree(
+            head_sha, pr_number, changed_files=changed_files
+        )
 
     def _cleanup_pr_worktree(self, worktree_path: Path) -> None:
-        """Remove a temporary PR review worktree with fallback chain.
+        """Return a PR review worktree to the pool (or remove it if not pooled).
 
         Args:
-            worktree_path: Path to the worktree to remove
+            worktree_path: Path to the worktree to release
         """
-        self.worktree_manager.remove_worktree(worktree_path)
+        self.worktree_manager.release_worktree(worktree_path)
 
     def _cleanup_stale_pr_worktrees(self) -> None:
         """Clean up orphaned, expired, and excess PR review worktrees on startup."""
@@ -393,35 +446,26 @@ class ParallelOrchestratorReviewer:
     # This replaces the broken Task tool subagent approach.
     # Each specialist runs as its own SDK session in parallel via asyncio.gather()
     # See: https://github.com/anthropics/claude-code/issues/8697
+    #
+    # Specialist prompts start with a byte-identical shared prefix (working
+    # directory + PR context, built once per review) followed by the
+    # specialist's own instructions. Every specialist session has the same
+    # system prompt and tools, so the prefix is served from the prompt cache
+    # after the first session writes it.
 
-    def _build_specialist_prompt(
-        self,
-        config: SpecialistConfig,
-        context: PRContext,
-        project_root: Path,
-    ) -> str:
-        """Build the full prompt for a specialist agent.
+    def _build_shared_pr_context(self, context: PRContext, project_root: Path) -> str:
+        """Build the PR context prefix shared by all specialist prompts.
+
+        Must not depend on the specialist: any difference breaks the shared
+        prompt cache prefix.
 
         Args:
-            config: Specialist configuration
             context: PR context with files and patches
-            project_root: Working directory for the agent
+            project_root: Working directory for the agents
 
         Returns:
-            Full system prompt with context injected
+            Working directory and PR context (title, description, files, diff)
         """
-        # Load base prompt from file
-        base_prompt = self._load_prompt(config.prompt_file)
-        if not base_prompt:
-            base_prompt = f"You are a {config.name} specialist for PR review."
-
-        # Inject working directory using the existing helper
-        with_working_dir = create_working_dir_injector(project_root)
-        prompt_with_cwd = with_working_dir(
-            base_prompt,
-            f"You are a {config.name} specialist. Find {config.description}.",
-        )
-
         # Build file list
         files_list = []
         for file in context.changed_files:
@@ -441,9 +485,7 @@ class ParallelOrchestratorReviewer:
         if len(diff_content) > MAX_DIFF_CHARS:
             diff_content = diff_content[:MAX_DIFF_CHARS] + "\n\n... (diff truncated)"
 
-        # Compose full prompt with PR context
-        pr_context = f"""
-## PR Context
+        pr_context = f"""## PR Context
 
 **PR #{context.pr_number}**: {context.title}
 
@@ -455,6 +497,43 @@ class ParallelOrchestratorReviewer:
 
 ### Diff
 {diff_content}
+"""
+        # Inject working directory using the existing helper
+        with_working_dir = create_working_dir_injector(project_root)
+        return with_working_dir(pr_context, "")
+
+    def _build_specialist_prompt(
+        self,
+        config: SpecialistConfig,
+        context: PRContext,
+        project_root: Path,
+        shared_context: str | None = None,
+    ) -> str:
+        """Build the full prompt for a specialist agent.
+
+        Args:
+            config: Specialist configuration
+            context: PR context with files and patches
+            project_root: Working directory for the agent
+            shared_context: Prefix from _build_shared_pr_context() (built if None)
+
+        Returns:
+            Shared PR context followed by the specialist's instructions
+        """
+        if shared_context is None:
+            shared_context = self._build_shared_pr_context(context, project_root)
+
+        # Load base prompt from file
+        base_prompt = self._load_prompt(config.prompt_file)
+        if not base_prompt:
+            base_prompt = f"You are a {config.name} specialist for PR review."
+
+        return f"""{shared_context}
+---
+
+# Specialist Instructions
+
+{base_prompt}
 
 ## Your Task
 
@@ -463,8 +542,6 @@ Use the Read, Grep, and Glob tools to explore the codebase as needed.
 Report findings with specific file paths, line numbers, and code evidence.
 """
 
-        return prompt_with_cwd + pr_context
-
     async def _run_specialist_session(
         self,
         config: SpecialistConfig,
@@ -472,6 +549,9 @@ Report findings with specific file paths, line numbers, and code evidence.
         project_root: Path,
         model: str,
         thinking_budget: int | None,
+        shared_context: str | None = None,
+        metrics: SpecialistMetrics | None = None,
+        on_first_response: Callable[[], None] | None = None,
     ) -> tuple[str, list[PRReviewFinding]]:
         """Run a single specialist as its own SDK session.
 
@@ -481,6 +561,9 @@ Report findings with specific file paths, line numbers, and code evidence.
             project_root: Working directory
             model: Model to use
             thinking_budget: Max thinking tokens
+            shared_context: Shared PR context prefix (built if None)
+            metrics: Filled with prompt sizes, token usage and latency
+            on_first_response: Called once the model starts responding
 
         Returns:
             Tuple of (specialist_name, findings)
@@ -489,15 +572,32 @@ Report findings with specific file paths, line numbers, and code evidence.
             f"[Specialist:{config.name}] Starting analysis...",
             flush=True,
         )
+        metrics = metrics or SpecialistMetrics(name=config.name)
+        started = time.monotonic()
 
         # Build the specialist prompt with PR context
-        prompt = self._build_specialist_prompt(config, context, project_root)
+        if shared_context is None:
+            shared_context = self._build_shared_pr_context(context, project_root)
+        prompt = self._build_specialist_prompt(
+            config, context, project_root, shared_context
+        )
+        metrics.shared_prompt_chars = len(shared_context)
+        metrics.specialist_prompt_chars = len(prompt) - len(shared_context)
+
+        responded = False
+
+        def mark_responded(*_args: Any) -> None:
+            nonlocal responded
+            if not responded:
+                responded = True
+                if on_first_response:
+                    on_first_response()
 
         try:
             # Create SDK client for this specialist
             # Note: Agent type uses the generic "pr_reviewer" since individual
             # specialist types aren't registered in AGENT_CONFIGS. The specialist-specific
-            # system prompt handles differentiation.
+            # instructions in the prompt handle differentiation.
             client = create_client(
                 project_dir=project_root,
                 spec_dir=self.github_dir,
@@ -516,15 +616,23 @@ Report findings with specific file paths, line numbers, and code evidence.
                 # Process SDK stream
                 stream_result = await process_sdk_stream(
                     client=client,
+                    on_thinking=mark_responded,
+                    on_tool_use=mark_responded,
+                    on_text=mark_responded,
                     context_name=f"Specialist:{config.name}",
                     model=model,
                     system_prompt=prompt,
                     agent_definitions={},  # No subagents for specialists
                 )
+                metrics.record_usage(stream_result.get("usage"))
+                metrics.cost_usd = stream_result.get("total_cost_usd")
 
                 error = stream_result.get("error")
                 if error:
-                    logger.error(f"[Specialist:{config.name}] SDK stream failed: {error}")
+                    metrics.error = str(error)
+                    logger.error(
+                        f"[Specialist:{config.name}] SDK stream failed: {error}"
+                    )
                     safe_print(
                         f"[Specialist:{config.name}] Analysis failed: {error}",
                         flush=True,
@@ -536,6 +644,7 @@ Report findings with specific file paths, line numbers, and code evidence.
                 findings = self._parse_specialist_output(
                     config.name, structured_output, stream_result.get("result_text", "")
                 )
+                metrics.findings = len(findings)
 
                 safe_print(
                     f"[Specialist:{config.name}] Complete: {len(findings)} findings",
@@ -545,6 +654,7 @@ Report findings with specific file paths, line numbers, and code evidence.
                 return (config.name, findings)
 
         except Exception as e:
+            metrics.error = str(e)
             logger.error(
                 f"[Specialist:{config.name}] Session failed: {e}",
                 exc_info=True,
@@ -554,6 +664,10 @@ Report findings with specific file paths, line numbers, and code evidence.
                 flush=True,
             )
             return (config.name, [])
+        finally:
+            metrics.latency_seconds = time.monotonic() - started
+            # Never leave other specialists waiting on a failed session
+            mark_responded()
 
     def _parse_specialist_output(
         self,
@@ -633,6 +747,12 @@ Report findings with specific file paths, line numbers, and code evidence.
     ) -> tuple[list[PRReviewFinding], list[str]]:
         """Run all specialists in parallel and collect findings.
 
+        The shared PR context is built once. The first specialist starts
+        alone; the rest start once it is responding (so the shared prefix is
+        in the prompt cache) or after SPECIALIST_CACHE_WARMUP_TIMEOUT, at most
+        PR_REVIEW_MAX_PARALLEL_SPECIALISTS at a time. Per-specialist metrics
+        are kept in self.specialist_metrics.
+
         Args:
             context: PR context
             project_root: Working directory
@@ -642,25 +762,45 @@ Report findings with specific file paths, line numbers, and code evidence.
         Returns:
             Tuple of (all_findings, agents_invoked)
         """
+        max_parallel = _get_max_parallel_specialists()
         safe_print(
-            f"[ParallelOrchestrator] Launching {len(SPECIALIST_CONFIGS)} specialists in parallel...",
+            f"[ParallelOrchestrator] Launching {len(SPECIALIST_CONFIGS)} specialists "
+            f"in parallel (max {max_parallel} at a time)...",
             flush=True,
         )
 
-        # Create tasks for all specialists
-        tasks = [
-            self._run_specialist_session(
-                config=config,
-                context=context,
-                project_root=project_root,
-                model=model,
-                thinking_budget=thinking_budget,
-            )
-            for config in SPECIALIST_CONFIGS
+        shared_context = self._build_shared_pr_context(context, project_root)
+        self.specialist_metrics = [
+            SpecialistMetrics(name=config.name) for config in SPECIALIST_CONFIGS
         ]
+        semaphore = asyncio.Semaphore(max_parallel)
+        prefix_cached = asyncio.Event()
+
+        async def run(index: int, config: SpecialistConfig):
+            if index > 0:
+                try:
+                    await asyncio.wait_for(
+                        prefix_cached.wait(), timeout=SPECIALIST_CACHE_WARMUP_TIMEOUT
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            async with semaphore:
+                return await self._run_specialist_session(
+                    config=config,
+                    context=context,
+                    project_root=project_root,
+                    model=model,
+                    thinking_budget=thinking_budget,
+                    shared_context=shared_context,
+                    metrics=self.specialist_metrics[index],
+                    on_first_response=prefix_cached.set if index == 0 else None,
+                )
 
         # Run all specialists in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(run(i, config) for i, config in enumerate(SPECIALIST_CONFIGS)),
+            return_exceptions=True,
+        )
 
         # Collect findings and track which agents ran
         all_findings: list[PRReviewFinding] = []
@@ -675,6 +815,8 @@ Report findings with specific file paths, line numbers, and code evidence.
             agents_invoked.append(specialist_name)
             all_findings.extend(findings)
 
+        self._log_specialist_metrics()
+
         safe_print(
             f"[ParallelOrchestrator] All specialists complete. "
             f"Total findings: {len(all_findings)}",
@@ -683,6 +825,28 @@ Report findings with specific file paths, line numbers, and code evidence.
 
         return (all_findings, agents_invoked)
 
+    def _log_specialist_metrics(self) -> None:
+        """Log per-specialist token usage and latency, and the cache totals."""
+        total_input = total_cache_read = total_cache_write = 0
+        for m in self.specialist_metrics:
+            logger.info(f"[ParallelOrchestrator] Specialist metrics: {asdict(m)}")
+            safe_print(
+                f"[Specialist:{m.name}] {m.latency_seconds:.1f}s, "
+                f"input={m.input_tokens} cache_read={m.cache_read_input_tokens} "
+                f"cache_write={m.cache_creation_input_tokens} output={m.output_tokens}",
+                flush=True,
+            )
+            total_input += m.input_tokens
+            total_cache_read += m.cache_read_input_tokens
+            total_cache_write += m.cache_creation_input_tokens
+        prompt_tokens = total_input + total_cache_read + total_cache_write
+        if prompt_tokens:
+            safe_print(
+                f"[ParallelOrchestrator] Specialist prompt tokens: {prompt_tokens} "
+                f"({total_cache_read / prompt_tokens:.0%} from cache)",
+                flush=True,
+            )
+
     def _build_orchestrator_prompt(self, context: PRContext) -> str:
         """Build full prompt for orchestrator with PR context."""
         # Load orchestrator prompt
@@ -1019,7 +1183,9 @@ The SDK will run invoked agents in parallel automatically.
                     )
                 try:
                     worktree_path = self._create_pr_worktree(
-                        head_sha, context.pr_number
+                        head_sha,
+                        context.pr_number,
+                        changed_files=[f.path for f in context.changed_files],
                     )
                     project_root = worktree_path
                     # Count files in worktree to give user visibility (with limit to avoid slowdown)
@@ -1040,7 +1206,7 @@ The SDK will run invoked agents in parallel automatically.
                     )
                     # Always log worktree creation with file count (not gated by DEBUG_MODE)
                     safe_print(
-                        f"[PRReview] Created temporary worktree: {worktree_path.name} ({file_count_str} files)",
+                        f"[PRReview] Prepared worktree: {worktree_path.name} ({file_count_str} files)",
                         flush=True,
                     )
                     safe_print(
@@ -1174,7 +1340,9 @@ The SDK will run invoked agents in parallel automatically.
                                 last_error = error
                                 continue
                             if error:
-                                raise RuntimeError(f"SDK stream processing failed: {error}")
+                                raise RuntimeError(
+                                    f"SDK stream processing failed: {error}"
+                                )
                             result_text = stream_result["result_text"]
                             structured_output = stream_result["structured_output"]
                             agents_invoked = stream_result["agents_invoked"]
@@ -1185,7 +1353,9 @@ The SDK will run invoked agents in parallel automatically.
                             continue
                         raise
                 else:
-                    raise RuntimeError(f"Orchestrator failed after {MAX_RETRIES} attempts")
+                    raise RuntimeError(
+                        f"Orchestrator failed after {MAX_RETRIES} attempts"
+                    )
 
             # END DISABLED BLOCK
 
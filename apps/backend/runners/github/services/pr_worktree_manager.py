@@ -9,6 +9,8 @@ Features:
 - Count-based cleanup (keep only N most recent worktrees)
 - Orphaned worktree cleanup (worktrees not registered with git)
 - Automatic cleanup on review completion
+- Warm pool of reusable detached worktrees (pool-N slots), leased per review
+  and reset to the next PR head instead of re-created
 """
 
 from __future__ import annotations
@@ -18,7 +20,8 @@ import os
 import shutil
 import subprocess
 import time
-from pathlib import Path
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
 from typing import NamedTuple
 
 from core.git_executable import get_isolated_git_env
@@ -29,6 +32,15 @@ logger = logging.getLogger(__name__)
 DEFAULT_MAX_PR_WORKTREES = 10  # Max worktrees to keep
 DEFAULT_PR_WORKTREE_MAX_AGE_DAYS = 7  # Max age in days
 
+# Worktree pool: slot directories and their sidecar files in the worktree dir.
+# A slot is leased while "<slot>.lease" exists (holding the PR number); on
+# release the lease becomes "<slot>.last" (the PR last reviewed in it).
+POOL_SLOT_PREFIX = "pool-"
+LEASE_SUFFIX = ".lease"
+LAST_PR_SUFFIX = ".last"
+# Leases older than this are left over from a crashed review and reclaimed
+STALE_LEASE_SECONDS = 6 * 3600
+
 
 def _get_max_pr_worktrees() -> int:
     """Get max worktrees setting, read at runtime for testability."""
@@ -52,6 +64,23 @@ def _get_max_age_days() -> int:
         return DEFAULT_PR_WORKTREE_MAX_AGE_DAYS
 
 
+def _get_pool_enabled() -> bool:
+    """Get worktree pool setting (PR_WORKTREE_POOL, default on), read at runtime."""
+    return os.environ.get("PR_WORKTREE_POOL", "1").lower() not in ("0", "false", "no")
+
+
+def _get_sparse_enabled() -> bool:
+    """Get sparse pool checkout setting (PR_WORKTREE_SPARSE, default off), read at runtime."""
+    return os.environ.get("PR_WORKTREE_SPARSE", "").lower() in ("1", "true", "yes")
+
+
+def _sparse_dirs(changed_files: Iterable[str]) -> list[str]:
+    """Directories to check out for changed files (cone mode adds top-level files)."""
+    dirs = {str(PurePosixPath(f).parent) for f in changed_files if f}
+    dirs.discard(".")
+    return sorted(dirs)
+
+
 # Safe pattern for git refs (SHA, branch names)
 # Allows: alphanumeric, dots, underscores, hyphens, forward slashes
 import re
@@ -75,6 +104,10 @@ class PRWorktreeManager:
     1. Remove worktrees older than PR_WORKTREE_MAX_AGE_DAYS (default: 7 days)
     2. Keep only MAX_PR_WORKTREES most recent worktrees (default: 10)
     3. Remove orphaned worktrees (not registered with git)
+
+    Pooled worktrees (acquire_worktree/release_worktree) count toward the same
+    limits; leased slots are never expired or evicted, and idle slots are
+    evicted least recently used first.
     """
 
     def __init__(self, project_dir: Path, worktree_dir: str | Path):
@@ -106,15 +139,7 @@ class PRWorktreeManager:
             RuntimeError: If worktree creation fails
             ValueError: If head_sha or pr_number are invalid
         """
-        # Validate inputs to prevent command injection
-        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
-            raise ValueError(
-                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
-            )
-        if not isinstance(pr_number, int) or pr_number <= 0:
-            raise ValueError(
-                f"Invalid pr_number: must be a positive integer, got {pr_number}"
-            )
+        self._validate_inputs(head_sha, pr_number)
 
         # Run cleanup before creating new worktree (can be disabled for tests)
         if auto_cleanup:
@@ -132,24 +157,7 @@ class PRWorktreeManager:
         logger.debug(f"Creating worktree: {worktree_path}")
 
         env = get_isolated_git_env()
-        try:
-            fetch_result = subprocess.run(
-                ["git", "fetch", "origin", head_sha],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                env=env,
-            )
-
-            if fetch_result.returncode != 0:
-                logger.warning(
-                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
-                )
-        except subprocess.TimeoutExpired:
-            logger.warning(
-                f"Timeout fetching {head_sha} from origin, continuing anyway"
-            )
+        self._fetch_commit(head_sha)
 
         try:
             result = subprocess.run(
@@ -184,6 +192,277 @@ class PRWorktreeManager:
         logger.info(f"[WorktreeManager] Created worktree at {worktree_path}")
         return worktree_path
 
+    @staticmethod
+    def _validate_inputs(head_sha: str, pr_number: int) -> None:
+        """Validate inputs to prevent command injection."""
+        if not head_sha or not SAFE_REF_PATTERN.match(head_sha):
+            raise ValueError(
+                f"Invalid head_sha: must match pattern {SAFE_REF_PATTERN.pattern}"
+            )
+        if not isinstance(pr_number, int) or pr_number <= 0:
+            raise ValueError(
+                f"Invalid pr_number: must be a positive integer, got {pr_number}"
+            )
+
+    def _fetch_commit(self, head_sha: str) -> None:
+        """Fetch a PR head commit from origin (best effort)."""
+        try:
+            fetch_result = subprocess.run(
+                ["git", "fetch", "origin", head_sha],
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                timeout=60,
+                env=get_isolated_git_env(),
+            )
+
+            if fetch_result.returncode != 0:
+                logger.warning(
+                    f"Could not fetch {head_sha} from origin (fork PR?): {fetch_result.stderr}"
+                )
+        except subprocess.TimeoutExpired:
+            logger.warning(
+                f"Timeout fetching {head_sha} from origin, continuing anyway"
+            )
+
+    # ------------------------------------------------------------------
+    # Worktree pool
+    # ------------------------------------------------------------------
+
+    def acquire_worktree(
+        self,
+        head_sha: str,
+        pr_number: int,
+        changed_files: Iterable[str] | None = None,
+        auto_cleanup: bool = True,
+    ) -> Path:
+        """
+        Lease a pooled worktree checked out (detached) at head_sha.
+
+        An idle slot is reset to head_sha with a forced detached checkout and
+        clean, so only files that differ from its previous commit are
+        rewritten. The slot last used for this PR is preferred (follow-up
+        reviews), then the least recently used one. A new slot is only added
+        when every slot is leased. Falls back to create_worktree() when the
+        pool is disabled (PR_WORKTREE_POOL=0).
+
+        Args:
+            head_sha: Git commit SHA to checkout
+            pr_number: PR number the worktree is leased for
+            changed_files: PR file paths; with PR_WORKTREE_SPARSE=1 only their
+                directories (plus top-level files) are checked out
+            auto_cleanup: If True (default), run cleanup before leasing
+
+        Returns:
+            Path to the leased worktree; pass it to release_worktree()
+
+        Raises:
+            RuntimeError: If no worktree could be prepared
+            ValueError: If head_sha or pr_number are invalid
+        """
+        if not _get_pool_enabled():
+            return self.create_worktree(head_sha, pr_number, auto_cleanup)
+
+        self._validate_inputs(head_sha, pr_number)
+        if auto_cleanup:
+            self.cleanup_worktrees()
+
+        sparse_dirs = None
+        if changed_files is not None and _get_sparse_enabled():
+            changed_files = list(changed_files)
+            if changed_files:
+                sparse_dirs = _sparse_dirs(changed_files)
+
+        self._fetch_commit(head_sha)
+
+        slot = self._lease_idle_slot(pr_number)
+        if slot is not None:
+            try:
+                self._checkout_slot(slot, head_sha, sparse_dirs)
+                logger.info(
+                    f"[WorktreeManager] Reused pooled worktree {slot.name} for PR #{pr_number}"
+                )
+                return slot
+            except RuntimeError as e:
+                logger.warning(
+                    f"[WorktreeManager] Resetting {slot.name} failed, replacing it: {e}"
+                )
+                self.remove_worktree(slot)
+
+        slot = self._lease_new_slot(pr_number)
+        try:
+            self._add_slot(slot, head_sha, sparse_dirs)
+        except BaseException:
+            self.remove_worktree(slot)
+            raise
+        logger.info(f"[WorktreeManager] Created pooled worktree at {slot}")
+        return slot
+
+    def release_worktree(self, worktree_path: Path) -> None:
+        """
+        Return a worktree from acquire_worktree() to the pool.
+
+        The slot is kept warm for the next review unless the pool is over
+        MAX_PR_WORKTREES, in which case it is removed. Worktrees that are not
+        pool slots (create_worktree) are removed.
+
+        Args:
+            worktree_path: Path returned by acquire_worktree()
+        """
+        if not worktree_path:
+            return
+        if not self._is_slot(worktree_path):
+            self.remove_worktree(worktree_path)
+            return
+
+        lease = self._sidecar(worktree_path, LEASE_SUFFIX)
+        try:
+            os.replace(lease, self._sidecar(worktree_path, LAST_PR_SUFFIX))
+        except OSError:
+            pass  # Lease already reclaimed or removed
+        if not worktree_path.exists():
+            return
+
+        slots = [wt for wt in self.get_worktree_info() if self._is_slot(wt.path)]
+        if not _get_pool_enabled() or len(slots) > _get_max_pr_worktrees():
+            self.remove_worktree(worktree_path)
+            return
+        # Mark as most recently used for LRU eviction
+        os.utime(worktree_path)
+
+    def _is_slot(self, path: Path) -> bool:
+        return (
+            path.name.startswith(POOL_SLOT_PREFIX)
+            and path.parent.resolve() == self.worktree_base_dir.resolve()
+        )
+
+    @staticmethod
+    def _sidecar(slot: Path, suffix: str) -> Path:
+        return slot.with_name(slot.name + suffix)
+
+    def _is_leased(self, slot: Path) -> bool:
+        """Whether a slot holds a live (non-stale) lease."""
+        try:
+            age = time.time() - self._sidecar(slot, LEASE_SUFFIX).stat().st_mtime
+        except OSError:
+            return False
+        return age < STALE_LEASE_SECONDS
+
+    def _try_lease(self, slot: Path, pr_number: int) -> bool:
+        """Atomically take a slot's lease (safe across processes)."""
+        lease = self._sidecar(slot, LEASE_SUFFIX)
+        for _ in range(2):
+            try:
+                fd = os.open(lease, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                if self._is_leased(slot):
+                    return False
+                logger.warning(
+                    f"[WorktreeManager] Reclaiming stale lease on {slot.name}"
+                )
+                lease.unlink(missing_ok=True)
+                continue
+            with os.fdopen(fd, "w") as f:
+                f.write(str(pr_number))
+            return True
+        return False
+
+    def _slot_pr_number(self, slot: Path) -> int | None:
+        """PR a slot is leased for, or was last used for."""
+        for suffix in (LEASE_SUFFIX, LAST_PR_SUFFIX):
+            try:
+                return int(self._sidecar(slot, suffix).read_text().strip())
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def _lease_idle_slot(self, pr_number: int) -> Path | None:
+        """Lease the idle slot last used for this PR, else the least recently used."""
+        registered = {p.resolve() for p in self.get_registered_worktrees()}
+        idle = [
+            wt
+            for wt in self.get_worktree_info()  # oldest first
+            if self._is_slot(wt.path)
+            and wt.path.resolve() in registered
+            and not self._is_leased(wt.path)
+        ]
+        idle.sort(key=lambda wt: wt.pr_number != pr_number)  # stable: keeps LRU order
+        for wt in idle:
+            if self._try_lease(wt.path, pr_number):
+                return wt.path
+        return None
+
+    def _lease_new_slot(self, pr_number: int) -> Path:
+        """Lease the lowest-numbered unused slot name."""
+        self.worktree_base_dir.mkdir(parents=True, exist_ok=True)
+        index = 0
+        while True:
+            slot = self.worktree_base_dir / f"{POOL_SLOT_PREFIX}{index}"
+            if not slot.exists() and self._try_lease(slot, pr_number):
+                if not slot.exists():
+                    return slot
+                # Another process created the slot between the checks
+                self._sidecar(slot, LEASE_SUFFIX).unlink(missing_ok=True)
+            index += 1
+
+    def _run_git(self, args: list[str], cwd: Path, timeout: int = 120) -> None:
+        """Run a git command for a slot, raising RuntimeError on failure."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=cwd,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                env=get_isolated_git_env(),
+            )
+        except subprocess.TimeoutExpired:
+            raise RuntimeError(f"Timeout running git {args[0]} in {cwd.name}")
+        if result.returncode != 0:
+            raise RuntimeError(f"git {args[0]} failed: {result.stderr.strip()}")
+
+    def _add_slot(
+        self, slot: Path, head_sha: str, sparse_dirs: list[str] | None
+    ) -> None:
+        """Create a new slot worktree at head_sha."""
+        if sparse_dirs is None:
+            self._run_git(
+                ["worktree", "add", "--detach", str(slot), head_sha], self.project_dir
+            )
+        else:
+            # Restrict the checkout before any files are written
+            self._run_git(
+                ["worktree", "add", "--detach", "--no-checkout", str(slot), head_sha],
+                self.project_dir,
+            )
+            self._checkout_slot(slot, head_sha, sparse_dirs)
+        if not slot.exists():
+            raise RuntimeError(
+                f"Worktree creation reported success but path does not exist: {slot}"
+            )
+
+    def _checkout_slot(
+        self, slot: Path, head_sha: str, sparse_dirs: list[str] | None
+    ) -> None:
+        """Reset a slot to head_sha, discarding any changes and untracked files."""
+        if sparse_dirs is not None:
+            self._run_git(["sparse-checkout", "set", "--cone", *sparse_dirs], slot)
+        elif (slot / ".git").exists() and self._is_sparse(slot):
+            self._run_git(["sparse-checkout", "disable"], slot)
+        self._run_git(["checkout", "--detach", "--force", head_sha], slot)
+        self._run_git(["clean", "-ffdxq"], slot)
+
+    def _is_sparse(self, slot: Path) -> bool:
+        result = subprocess.run(
+            ["git", "config", "--get", "core.sparseCheckout"],
+            cwd=slot,
+            capture_output=True,
+            text=True,
+            timeout=30,
+            env=get_isolated_git_env(),
+        )
+        return result.stdout.strip() == "true"
+
     def remove_worktree(self, worktree_path: Path) -> None:
         """
         Remove a PR worktree with fallback chain.
@@ -191,7 +470,12 @@ class PRWorktreeManager:
         Args:
             worktree_path: Path to the worktree to remove
         """
-        if not worktree_path or not worktree_path.exists():
+        if not worktree_path:
+            return
+        if self._is_slot(worktree_path):
+            for suffix in (LEASE_SUFFIX, LAST_PR_SUFFIX):
+                self._sidecar(worktree_path, suffix).unlink(missing_ok=True)
+        if not worktree_path.exists():
             return
 
         logger.debug(f"Removing worktree: {worktree_path}")
@@ -263,6 +547,8 @@ class PRWorktreeManager:
                         pr_number = int(parts[1])
                     except ValueError:
                         pass  # Non-numeric PR number in dir name - leave as None
+            elif item.name.startswith(POOL_SLOT_PREFIX):
+                pr_number = self._slot_pr_number(item)
 
             worktrees.append(
                 WorktreeInfo(path=item, age_days=age_days, pr_number=pr_number)
@@ -311,6 +597,8 @@ class PRWorktreeManager:
         2. Remove worktrees older than PR_WORKTREE_MAX_AGE_DAYS
         3. If still over MAX_PR_WORKTREES, remove oldest worktrees
 
+        Leased pool slots are skipped in every phase.
+
         Args:
             force: If True, skip age check and only enforce count limit
 
@@ -336,12 +624,15 @@ class PRWorktreeManager:
 
         # Phase 1: Remove orphaned worktrees
         for wt in worktrees:
-            if wt.path.resolve() not in registered_resolved:
+            if wt.path.resolve() not in registered_resolved and not self._is_leased(
+                wt.path
+            ):
                 logger.info(
                     f"[WorktreeManager] Removing orphaned worktree: {wt.path.name} (age: {wt.age_days:.1f} days)"
                 )
                 shutil.rmtree(wt.path, ignore_errors=True)
                 stats["orphaned"] += 1
+        self._remove_stale_sidecars()
 
         try:
             subprocess.run(
@@ -368,7 +659,7 @@ class PRWorktreeManager:
         max_age_days = _get_max_age_days()
         if not force:
             for wt in worktrees:
-                if wt.age_days > max_age_days:
+                if wt.age_days > max_age_days and not self._is_leased(wt.path):
                     logger.info(
                         f"[WorktreeManager] Removing expired worktree: {wt.path.name} (age: {wt.age_days:.1f} days, max: {max_age_days} days)"
                     )
@@ -386,9 +677,11 @@ class PRWorktreeManager:
         # Phase 3: Remove excess worktrees (keep only max_pr_worktrees most recent)
         max_pr_worktrees = _get_max_pr_worktrees()
         if len(worktrees) > max_pr_worktrees:
-            # worktrees are already sorted by age (oldest first)
+            # worktrees are already sorted by age (oldest first); pool slots
+            # are touched on release, so this evicts least recently used
             excess_count = len(worktrees) - max_pr_worktrees
-            for wt in worktrees[:excess_count]:
+            evictable = [wt for wt in worktrees if not self._is_leased(wt.path)]
+            for wt in evictable[:excess_count]:
                 logger.info(
                     f"[WorktreeManager] Removing excess worktree: {wt.path.name} (count: {len(worktrees)}, max: {max_pr_worktrees})"
                 )
@@ -409,6 +702,16 @@ class PRWorktreeManager:
 
         return stats
 
+    def _remove_stale_sidecars(self) -> None:
+        """Remove pool lease/last-PR files whose slot no longer exists."""
+        for suffix in (LEASE_SUFFIX, LAST_PR_SUFFIX):
+            for sidecar in self.worktree_base_dir.glob(f"{POOL_SLOT_PREFIX}*{suffix}"):
+                slot = sidecar.with_name(sidecar.name[: -len(suffix)])
+                if not slot.exists() and not (
+                    suffix == LEASE_SUFFIX and self._is_leased(slot)
+                ):
+                    sidecar.unlink(missing_ok=True)
+
     def cleanup_all_worktrees(self) -> int:
         """
         Remove ALL PR worktrees (for testing or emergency cleanup).
@@ -209,10 +209,15 @@ async def process_sdk_stream(
         - agents_invoked: List of agent names invoked via Task tool
         - msg_count: Total message count
         - subagent_tool_ids: Mapping of tool_id -> agent_name
+        - usage: Token usage from the ResultMessage (input_tokens, output_tokens,
+          cache_creation_input_tokens, cache_read_input_tokens), or None
+        - total_cost_usd: Session cost from the ResultMessage, or None
         - error: Error message if stream processing failed (None on success)
     """
     result_text = ""
     structured_output = None
+    usage: dict[str, Any] | None = None
+    total_cost_usd: float | None = None
     agents_invoked = []
     msg_count = 0
     stream_error = None
@@ -454,6 +459,8 @@ async def process_sdk_stream(
                 )
                 if is_result_msg:
                     subtype = getattr(msg, "subtype", None)
+                    usage = getattr(msg, "usage", None) or usage
+                    total_cost_usd = getattr(msg, "total_cost_usd", None)
                     if DEBUG_MODE:
                         safe_print(
                             f"[DEBUG {context_name}] ResultMessage: subtype={subtype}"
@@ -561,5 +568,7 @@ async def process_sdk_stream(
         "agents_invoked": agents_invoked,
         "msg_count": msg_count,
         "subagent_tool_ids": subagent_tool_ids,
+        "usage": usage,
+        "total_cost_usd": total_cost_usd,
         "error": stream_error,
     }
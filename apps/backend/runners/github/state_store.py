@@ -0,0 +1,312 @@
+"""
+GitHub Runner State Store
+=========================
+
+Embedded SQLite store shared by the runner's state managers (lifecycle,
+trust, learning) for one state directory.
+
+Records are JSON documents grouped by kind and upserted one at a time,
+with secondary indexes on the fields the managers filter on (repo, state,
+pending flag, creation time), so summaries and queue scans only touch
+matching records instead of reading every state file.
+
+Usage:
+    store = StateStore.for_dir(Path(".auto-claude/github"))
+    store.put("lifecycle", "owner/repo#12", data, repo="owner/repo", state="triaged")
+    counts = store.count_by_state("lifecycle", repo="owner/repo")
+    pending = store.query("outcome", repo="owner/repo", pending=True)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = "state.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    kind TEXT NOT NULL,
+    key TEXT NOT NULL,
+    repo TEXT,
+    state TEXT,
+    pending INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, key)
+);
+CREATE INDEX IF NOT EXISTS records_repo_state ON records (kind, repo, state);
+CREATE INDEX IF NOT EXISTS records_pending ON records (kind, pending, repo);
+CREATE INDEX IF NOT EXISTS records_created ON records (kind, repo, created_at);
+
+-- Legacy JSON imports already performed, by kind
+CREATE TABLE IF NOT EXISTS imports (
+    kind TEXT PRIMARY KEY
+);
+"""
+
+# Index fields extracted from a record's data: (repo, state, pending, created_at)
+IndexFields = tuple[str | None, str | None, bool, str | None]
+
+
+class StateStore:
+    """
+    Per-record JSON document store with secondary indexes.
+
+    One store (and connection) is shared per state directory; use
+    for_dir() rather than the constructor.
+    """
+
+    _instances: dict[Path, StateStore] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, state_dir: Path):
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.state_dir / STORE_FILENAME
+        if not self.path.exists():
+            # Trust state is sensitive: owner read/write only (0o600)
+            os.close(os.open(str(self.path), os.O_WRONLY | os.O_CREAT, 0o600))
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def for_dir(cls, state_dir: Path) -> StateStore:
+        """Get the shared store for a state directory."""
+        key = Path(state_dir).resolve()
+        with cls._instances_lock:
+            store = cls._instances.get(key)
+            if store is None:
+                store = cls(state_dir)
+                cls._instances[key] = store
+            return store
+
+    @classmethod
+    def reset_instances(cls) -> None:
+        """Close and forget all shared stores (for testing)."""
+        with cls._instances_lock:
+            for store in cls._instances.values():
+                store.close()
+            cls._instances.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        kind: str,
+        key: str,
+        data: dict[str, Any],
+        repo: str | None = None,
+        state: str | None = None,
+        pending: bool = False,
+        created_at: str | None = None,
+    ) -> None:
+        """Insert or replace one record."""
+        with self._lock, self._conn:
+            self._put(kind, key, data, (repo, state, pending, created_at))
+
+    def _put(
+        self, kind: str, key: str, data: dict[str, Any], fields: IndexFields
+    ) -> None:
+        repo, state, pending, created_at = fields
+        self._conn.execute(
+            "INSERT OR REPLACE INTO records "
+            "(kind, key, repo, state, pending, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                kind,
+                key,
+                repo,
+                state,
+                int(pending),
+                created_at,
+                json.dumps(data, default=str),
+            ),
+        )
+
+    def get(self, kind: str, key: str) -> dict[str, Any] | None:
+        """Get one record's data, or None if it does not exist."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM records WHERE kind = ? AND key = ?", (kind, key)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def delete(self, kind: str, key: str) -> bool:
+        """Delete one record; returns whether it existed."""
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM records WHERE kind = ? AND key = ?", (kind, key)
+            )
+        return cursor.rowcount > 0
+
+    def query(
+        self,
+        kind: str,
+        repo: str | None = None,
+        state: str | None = None,
+        pending: bool | None = None,
+        since: str | None = None,
+        newest_first: bool = False,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Get the data of matching records.
+
+        Args:
+            kind: Record kind
+            repo: Only records for this repo
+            state: Only records in this state
+            pending: Only records with this pending flag
+            since: Only records created at or after this ISO timestamp
+            newest_first: Order by creation time, newest first
+            limit: Maximum records to return
+        """
+        clauses, params = self._filters(kind, repo, state, pending, since)
+        sql = f"SELECT data FROM records WHERE {' AND '.join(clauses)}"
+        if newest_first:
+            sql += " ORDER BY created_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(
+        self,
+        kind: str,
+        repo: str | None = None,
+        state: str | None = None,
+        pending: bool | None = None,
+    ) -> int:
+        """Count matching records without loading them."""
+        clauses, params = self._filters(kind, repo, state, pending)
+        with self._lock:
+            return self._conn.execute(
+                f"SELECT COUNT(*) FROM records WHERE {' AND '.join(clauses)}", params
+            ).fetchone()[0]
+
+    def count_by_state(self, kind: str, repo: str | None = None) -> dict[str, int]:
+        """Count records per state."""
+        clauses, params = self._filters(kind, repo)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT state, COUNT(*) FROM records "
+                f"WHERE {' AND '.join(clauses)} GROUP BY state",
+                params,
+            ).fetchall()
+        return {state: count for state, count in rows}
+
+    @staticmethod
+    def _filters(
+        kind: str,
+        repo: str | None = None,
+        state: str | None = None,
+        pending: bool | None = None,
+        since: str | None = None,
+    ) -> tuple[list[str], list[Any]]:
+        clauses = ["kind = ?"]
+        params: list[Any] = [kind]
+        if repo is not None:
+            clauses.append("repo = ?")
+            params.append(repo)
+        if state is not None:
+            clauses.append("state = ?")
+            params.append(state)
+        if pending is not None:
+            clauses.append("pending = ?")
+            params.append(int(pending))
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        return clauses, params
+
+    # ------------------------------------------------------------------
+    # Legacy import
+    # ------------------------------------------------------------------
+
+    def import_legacy(
+        self,
+        kind: str,
+        files: Iterable[Path],
+        records: Callable[[Any], Iterable[dict[str, Any]]],
+        key: Callable[[dict[str, Any]], str],
+        fields: Callable[[dict[str, Any]], IndexFields],
+    ) -> int:
+        """
+        Import per-file JSON state written before the store existed, once.
+
+        Records already in the store are kept. The JSON files are left in
+        place.
+
+        Args:
+            kind: Record kind to import into
+            files: Legacy JSON files
+            records: Extracts the record dicts from one file's parsed JSON
+            key: Record key for a record dict
+            fields: Index fields for a record dict
+
+        Returns:
+            Number of records imported
+        """
+        with self._lock:
+            if self._conn.execute(
+                "SELECT 1 FROM imports WHERE kind = ?", (kind,)
+            ).fetchone():
+                return 0
+
+            imported = 0
+            with self._conn:
+                # Take the write lock before re-checking, so concurrent first
+                # runs import once and the others see the imports row
+                self._conn.execute("BEGIN IMMEDIATE")
+                if self._conn.execute(
+                    "SELECT 1 FROM imports WHERE kind = ?", (kind,)
+                ).fetchone():
+                    return 0
+                for file in files:
+                    try:
+                        with open(file, encoding="utf-8") as f:
+                            items = list(records(json.load(f)))
+                    except (OSError, ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Skipping unreadable state file {file}: {e}")
+                        continue
+                    for item in items:
+                        try:
+                            record_key = key(item)
+                            record_fields = fields(item)
+                        except (KeyError, TypeError, ValueError):
+                            continue
+                        if self._conn.execute(
+                            "SELECT 1 FROM records WHERE kind = ? AND key = ?",
+                            (kind, record_key),
+                        ).fetchone():
+                            continue
+                        self._put(kind, record_key, item, record_fields)
+                        imported += 1
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO imports (kind) VALUES (?)", (kind,)
+                )
+
+        if imported:
+            logger.info(f"Imported {imported} legacy {kind} records into {self.path}")
+        return imported
@@ -11,17 +11,22 @@ Progressive trust system that unlocks more autonomous actions as accuracy improv
 - L4: Full auto-fix with merge
 
 Trust increases with accuracy, decreases with overrides.
+Trust states are stored in the runner's StateStore, one record per repo.
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import IntEnum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import StateStore
+except (ImportError, ValueError, SystemError):
+    from state_store import StateStore
+
 
 class TrustLevel(IntEnum):
     """Trust levels with increasing autonomy."""
@@ -403,48 +408,51 @@ class TrustManager:
             print("Trust level upgraded!")
     """
 
+    STORE_KIND = "trust"
+
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
         self.trust_dir = state_dir / "trust"
         self.trust_dir.mkdir(parents=True, exist_ok=True)
         self._states: dict[str, TrustState] = {}
+        self._store = StateStore.for_dir(state_dir)
+        # Per-repo JSON files from before the state store
+        self._store.import_legacy(
+            self.STORE_KIND,
+            self.trust_dir.glob("*.json"),
+            records=lambda data: [data],
+            key=lambda data: data["repo"],
+            fields=lambda data: self._index_fields(TrustState.from_dict(data)),
+        )
 
-    def _get_state_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
-        return self.trust_dir / f"{safe_name}.json"
+    @staticmethod
+    def _index_fields(state: TrustState) -> tuple[str, str, bool, None]:
+        return state.repo, str(state.effective_level.value), False, None
 
     def get_state(self, repo: str) -> TrustState:
         """Get trust state for a repository."""
         if repo in self._states:
             return self._states[repo]
 
-        state_file = self._get_state_file(repo)
-        if state_file.exists():
-            try:
-                with open(state_file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    state = TrustState.from_dict(data)
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Return default state if file is corrupted
-                state = TrustState(repo=repo)
-        else:
-            state = TrustState(repo=repo)
+        data = self._store.get(self.STORE_KIND, repo)
+        state = TrustState.from_dict(data) if data else TrustState(repo=repo)
 
         self._states[repo] = state
         return state
 
     def save_state(self, repo: str) -> None:
-        """Save trust state for a repository with secure file permissions."""
-        import os
-
+        """Save trust state for a repository."""
         state = self.get_state(repo)
-        state_file = self._get_state_file(repo)
-
-        # Write with restrictive permissions (0o600 = owner read/write only)
-        fd = os.open(str(state_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        # os.fdopen takes ownership of fd and will close it when the with block exits
-        with os.fdopen(fd, "w", encoding="utf-8") as f:
-            json.dump(state.to_dict(), f, indent=2)
+        _, level, pending, created_at = self._index_fields(state)
+        self._store.put(
+            self.STORE_KIND,
+            repo,
+            state.to_dict(),
+            repo=repo,
+            state=level,
+            pending=pending,
+            created_at=created_at,
+        )
 
     def get_trust_level(self, repo: str) -> TrustLevel:
         """Get current trust level for a repository."""
@@ -514,13 +522,11 @@ class TrustManager:
     def get_all_states(self) -> list[TrustState]:
         """Get trust states for all repos."""
         states = []
-        for file in self.trust_dir.glob("*.json"):
+        for data in self._store.query(self.STORE_KIND):
             try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    states.append(TrustState.from_dict(data))
-            except (json.JSONDecodeError, UnicodeDecodeError):
-                # Skip corrupted state files
+                states.append(TrustState.from_dict(data))
+            except (KeyError, ValueError):
+                # Skip corrupted states
                 continue
         return states
 
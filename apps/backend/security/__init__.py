@@ -16,11 +16,13 @@ Main functions:
 - bash_security_hook: Pre-tool-use hook for command validation
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
+- get_resolved_profile: Cached profile with precomputed allowlist and validators
 - reset_profile_cache: Reset cached security profile
 
 Command parsing:
 - extract_commands: Extract command names from shell strings
 - split_command_segments: Split compound commands into segments
+- parse_command: Memoized parse of a full command string
 
 Validators:
 - All validators are available via the VALIDATORS dict
@@ -39,13 +41,18 @@ from .hooks import bash_security_hook, validate_command
 
 # Command parsing utilities
 from .parser import (
+    ParsedCommand,
+    clear_parse_cache,
     extract_commands,
     get_command_for_validation,
+    parse_command,
     split_command_segments,
 )
 
 # Profile management
 from .profile import (
+    ResolvedProfile,
+    get_resolved_profile,
     get_security_profile,
     reset_profile_cache,
 )
@@ -86,11 +93,16 @@ __all__ = [
     "bash_security_hook",
     "validate_command",
     "get_security_profile",
+    "get_resolved_profile",
+    "ResolvedProfile",
     "reset_profile_cache",
     # Parsing utilities
     "extract_commands",
     "split_command_segments",
     "get_command_for_validation",
+    "parse_command",
+    "clear_parse_cache",
+    "ParsedCommand",
     # Validators
     "VALIDATORS",
     "validate_pkill_command",
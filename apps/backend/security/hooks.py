@@ -10,11 +10,59 @@ import os
 from pathlib import Path
 from typing import Any
 
-from project_analyzer import BASE_COMMANDS, SecurityProfile, is_command_allowed
+from project_analyzer import BASE_COMMANDS, SecurityProfile
 
-from .parser import extract_commands, get_command_for_validation, split_command_segments
-from .profile import get_security_profile
-from .validator import VALIDATORS
+from .parser import parse_command
+from .profile import ResolvedProfile, get_resolved_profile
+
+
+def _evaluate_command(
+    command: str, resolved: ResolvedProfile
+) -> tuple[bool, str] | None:
+    """
+    Decide whether a full command string may run under a profile.
+
+    Decisions that involved no sensitive-command validator are cached on
+    the profile, so repeated commands skip parsing entirely.
+
+    Args:
+        command: Full command string
+        resolved: Resolved security profile
+
+    Returns:
+        (is_allowed, reason) tuple, or None if the command could not be parsed
+    """
+    decision = resolved.get_cached_decision(command)
+    if decision is not None:
+        return decision
+
+    parsed = parse_command(command)
+    if not parsed.commands:
+        return None
+
+    ran_validator = False
+    decision = (True, "")
+    for cmd in parsed.commands:
+        # Check if command is allowed (and whether it needs extra validation)
+        is_allowed, reason, validator = resolved.check_command(cmd)
+        if not is_allowed:
+            decision = (False, reason)
+            break
+
+        # Additional validation for sensitive commands
+        if validator is not None:
+            ran_validator = True
+            cmd_segment = parsed.validation_segments.get(cmd) or command
+            allowed, reason = validator(cmd_segment)
+            if not allowed:
+                decision = (False, reason)
+                break
+
+    # Validators may inspect state outside the profile (e.g. staged files
+    # for git commit), so only profile-only decisions are reusable
+    if not ran_validator:
+        resolved.cache_decision(command, decision)
+    return decision
 
 
 async def bash_security_hook(
@@ -90,17 +138,17 @@ async def bash_security_hook(
     # Get or create security profile
     # Note: In actual use, spec_dir would be passed through context
     try:
-        profile = get_security_profile(Path(cwd))
+        resolved = get_resolved_profile(Path(cwd))
     except Exception as e:
         # If profile creation fails, fall back to base commands only
         print(f"Warning: Could not load security profile: {e}")
         profile = SecurityProfile()
         profile.base_commands = BASE_COMMANDS.copy()
+        resolved = ResolvedProfile(profile)
 
-    # Extract all commands from the command string
-    commands = extract_commands(command)
+    decision = _evaluate_command(command, resolved)
 
-    if not commands:
+    if decision is None:
         # Could not parse - fail safe by blocking
         return {
             "hookSpecificOutput": {
@@ -110,42 +158,15 @@ async def bash_security_hook(
             }
         }
 
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
-
-    # Get all allowed commands
-    allowed = profile.get_all_allowed_commands()
-
-    # Check each command against the allowlist
-    for cmd in commands:
-        # Check if command is allowed
-        is_allowed, reason = is_command_allowed(cmd, profile)
-
-        if not is_allowed:
-            return {
-                "hookSpecificOutput": {
-                    "hookEventName": "PreToolUse",
-                    "permissionDecision": "deny",
-                    "permissionDecisionReason": reason,
-                }
+    is_allowed, reason = decision
+    if not is_allowed:
+        return {
+            "hookSpecificOutput": {
+                "hookEventName": "PreToolUse",
+                "permissionDecision": "deny",
+                "permissionDecisionReason": reason,
             }
-
-        # Additional validation for sensitive commands
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return {
-                    "hookSpecificOutput": {
-                        "hookEventName": "PreToolUse",
-                        "permissionDecision": "deny",
-                        "permissionDecisionReason": reason,
-                    }
-                }
+        }
 
     return {}
 
@@ -167,27 +188,10 @@ def validate_command(
     if project_dir is None:
         project_dir = Path.cwd()
 
-    profile = get_security_profile(project_dir)
-    commands = extract_commands(command)
+    resolved = get_resolved_profile(project_dir)
+    decision = _evaluate_command(command, resolved)
 
-    if not commands:
+    if decision is None:
         return False, "Could not parse command"
 
-    segments = split_command_segments(command)
-
-    for cmd in commands:
-        is_allowed_result, reason = is_command_allowed(cmd, profile)
-        if not is_allowed_result:
-            return False, reason
-
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return False, reason
-
-    return True, ""
+    return decision
@@ -11,11 +11,20 @@ On Windows, commands containing paths with backslashes can cause shlex.split()
 to fail (e.g., incomplete commands with unclosed quotes). This module includes
 a fallback parser that extracts command names even from malformed commands,
 ensuring security validation can still proceed.
+
+Parsing is memoized: agents issue the same commands (``npm test``,
+``git status``) hundreds of times per session, so ``parse_command`` keeps a
+bounded LRU of parse results keyed by the command string.
 """
 
 import re
 import shlex
+from functools import lru_cache
 from pathlib import PurePosixPath, PureWindowsPath
+from typing import NamedTuple
+
+# Max distinct command strings whose parse results are kept
+PARSE_CACHE_SIZE = 2048
 
 
 def _cross_platform_basename(path: str) -> str:
@@ -190,6 +199,17 @@ def extract_commands(command_string: str) -> list[str]:
     Windows paths in bash-style commands), falls back to regex-based
     extraction to ensure security validation can proceed.
     """
+    return list(_extract_commands_cached(command_string))
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _extract_commands_cached(command_string: str) -> tuple[str, ...]:
+    """Memoized extract_commands returning an immutable result."""
+    return tuple(_extract_commands(command_string))
+
+
+def _extract_commands(command_string: str) -> list[str]:
+    """Uncached implementation of extract_commands."""
     # If command contains Windows paths, use fallback parser directly
     # because shlex.split() interprets backslashes as escape characters
     if _contains_windows_path(command_string):
@@ -283,7 +303,44 @@ def get_command_for_validation(cmd: str, segments: list[str]) -> str:
     Find the specific command segment that contains the given command.
     """
     for segment in segments:
-        segment_commands = extract_commands(segment)
+        segment_commands = _extract_commands_cached(segment)
         if cmd in segment_commands:
             return segment
     return ""
+
+
+class ParsedCommand(NamedTuple):
+    """Cached parse result for a full command string."""
+
+    commands: tuple[str, ...]
+    segments: tuple[str, ...]
+    # Command name -> segment to validate it against ("" if not found)
+    validation_segments: dict[str, str]
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_command(command_string: str) -> ParsedCommand:
+    """
+    Parse a command string once: command names, segments and, for every
+    command name, the segment used for sensitive-command validation.
+
+    Results are cached by command string and must not be mutated.
+
+    Args:
+        command_string: Full command string
+
+    Returns:
+        ParsedCommand for the string
+    """
+    commands = _extract_commands_cached(command_string)
+    segments = tuple(split_command_segments(command_string))
+    validation_segments = {
+        cmd: get_command_for_validation(cmd, segments) for cmd in set(commands)
+    }
+    return ParsedCommand(commands, segments, validation_segments)
+
+
+def clear_parse_cache() -> None:
+    """Clear memoized parse results (useful for testing)."""
+    _extract_commands_cached.cache_clear()
+    parse_command.cache_clear()
@@ -4,27 +4,157 @@ Security Profile Management
 
 Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
+
+Resolved profiles are kept in a bounded LRU keyed by (project_dir, spec_dir), so
+several worktrees or specs in one process do not evict each other. Each entry
+carries a frozen allowlist and a validator dispatch table precomputed for
+the hot path in bash_security_hook.
 """
 
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 from project_analyzer import (
     SecurityProfile,
     get_or_create_profile,
+    is_command_allowed,
 )
 
 from .constants import ALLOWLIST_FILENAME, PROFILE_FILENAME
+from .validation_models import ValidatorFunction
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_PROFILE_CACHE_SIZE = 16  # Max (project_dir, spec_dir) profiles kept
+DEFAULT_PROFILE_RECHECK_INTERVAL = 0.0  # Seconds between mtime checks (0 = always)
+DECISION_CACHE_SIZE = 1024  # Max command strings with a cached decision per profile
+
+
+def _get_profile_cache_size() -> int:
+    """Get profile cache size setting, read at runtime for testability."""
+    try:
+        value = int(
+            os.environ.get(
+                "SECURITY_PROFILE_CACHE_SIZE", str(DEFAULT_PROFILE_CACHE_SIZE)
+            )
+        )
+        return value if value > 0 else DEFAULT_PROFILE_CACHE_SIZE
+    except (ValueError, TypeError):
+        return DEFAULT_PROFILE_CACHE_SIZE
+
+
+def _get_recheck_interval() -> float:
+    """Get mtime recheck interval setting, read at runtime for testability."""
+    try:
+        value = float(
+            os.environ.get(
+                "SECURITY_PROFILE_RECHECK_INTERVAL",
+                str(DEFAULT_PROFILE_RECHECK_INTERVAL),
+            )
+        )
+        return value if value >= 0 else DEFAULT_PROFILE_RECHECK_INTERVAL
+    except (ValueError, TypeError):
+        return DEFAULT_PROFILE_RECHECK_INTERVAL
+
+
+class ResolvedProfile:
+    """
+    A security profile with its lookup structures precomputed.
+
+    Attributes:
+        profile: The underlying SecurityProfile
+        allowed_commands: Frozen set of every allowed command name
+        dispatch: Allowed command -> validator (None when no extra validation)
+
+    Decisions for full command strings that involved no sensitive-command
+    validator depend only on the profile, so they are cached here and
+    discarded together with the profile.
+    """
+
+    __slots__ = ("profile", "allowed_commands", "dispatch", "_decisions")
+
+    def __init__(self, profile: SecurityProfile):
+        # Imported lazily: validators import this module via shell_validators
+        from .validator_registry import VALIDATORS
+
+        self.profile = profile
+        self.allowed_commands: frozenset[str] = frozenset(
+            profile.get_all_allowed_commands()
+        )
+        self.dispatch: Mapping[str, ValidatorFunction | None] = MappingProxyType(
+            {cmd: VALIDATORS.get(cmd) for cmd in self.allowed_commands}
+        )
+        self._decisions: dict[str, tuple[bool, str]] = {}
+
+    def get_cached_decision(self, command: str) -> tuple[bool, str] | None:
+        """Get the cached (is_allowed, reason) decision for a command string."""
+        return self._decisions.get(command)
+
+    def cache_decision(self, command: str, decision: tuple[bool, str]) -> None:
+        """
+        Cache a decision for a command string.
+
+        Only call this for decisions that ran no sensitive-command validator.
+        """
+        if len(self._decisions) >= DECISION_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            self._decisions.pop(next(iter(self._decisions)), None)
+        self._decisions[command] = decision
+
+    def check_command(self, command: str) -> tuple[bool, str, ValidatorFunction | None]:
+        """
+        Check a command name against the profile.
+
+        Args:
+            command: The command name (base command, not full command line)
+
+        Returns:
+            (is_allowed, reason, validator) tuple; validator is the extra
+            validation function to run on the command segment, if any
+        """
+        try:
+            return True, "", self.dispatch[command]
+        except KeyError:
+            pass
+
+        # Script paths (./script.sh) and other non-set matches
+        from .validator_registry import VALIDATORS
+
+        is_allowed, reason = is_command_allowed(command, self.profile)
+        return is_allowed, reason, VALIDATORS.get(command) if is_allowed else None
+
+
+class _CacheEntry:
+    """A cached resolved profile plus the file state it was built from."""
+
+    __slots__ = ("resolved", "profile_mtime", "allowlist_mtime", "checked_at")
+
+    def __init__(
+        self,
+        resolved: ResolvedProfile,
+        profile_mtime: float | None,
+        allowlist_mtime: float | None,
+    ):
+        self.resolved = resolved
+        self.profile_mtime = profile_mtime
+        self.allowlist_mtime = allowlist_mtime
+        self.checked_at = time.monotonic()
+
 
 # =============================================================================
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
-_cached_spec_dir: Path | None = None  # Track spec directory for cache key
-_cached_profile_mtime: float | None = None  # Track file modification time
-_cached_allowlist_mtime: float | None = None  # Track allowlist modification time
+# LRU of resolved profiles to avoid re-analyzing on every command
+_profile_cache: "OrderedDict[tuple[Path, Path | None], _CacheEntry]" = OrderedDict()
+_profile_cache_lock = threading.Lock()  # Protects _profile_cache access
 
 
 def _get_profile_path(project_dir: Path) -> Path:
@@ -55,74 +185,88 @@ def _get_allowlist_mtime(project_dir: Path) -> float | None:
         return None
 
 
-def get_security_profile(
+def get_resolved_profile(
     project_dir: Path, spec_dir: Path | None = None
-) -> SecurityProfile:
+) -> ResolvedProfile:
     """
-    Get the security profile for a project, using cache when possible.
+    Get the resolved security profile for a project, using cache when possible.
 
-    The cache is invalidated when:
-    - The project directory changes
+    The cache entry for (project_dir, spec_dir) is invalidated when:
     - The security profile file is created (was None, now exists)
     - The security profile file is modified (mtime changed)
     - The allowlist file is created, modified, or deleted
 
+    File mtimes are checked at most once per SECURITY_PROFILE_RECHECK_INTERVAL
+    seconds per entry (default 0: every call).
+
     Args:
         project_dir: Project root directory
         spec_dir: Optional spec directory
 
     Returns:
-        SecurityProfile for the project
+        ResolvedProfile for the project
     """
-    global _cached_profile
-    global _cached_project_dir
-    global _cached_spec_dir
-    global _cached_profile_mtime
-    global _cached_allowlist_mtime
-
     project_dir = Path(project_dir).resolve()
     resolved_spec_dir = Path(spec_dir).resolve() if spec_dir else None
+    key = (project_dir, resolved_spec_dir)
 
-    # Check if cache is valid (both project_dir and spec_dir must match)
-    if (
-        _cached_profile is not None
-        and _cached_project_dir == project_dir
-        and _cached_spec_dir == resolved_spec_dir
-    ):
-        # Check if files have been created or modified since caching
-        current_profile_mtime = _get_profile_mtime(project_dir)
-        current_allowlist_mtime = _get_allowlist_mtime(project_dir)
+    with _profile_cache_lock:
+        entry = _profile_cache.get(key)
+        if entry is not None:
+            _profile_cache.move_to_end(key)
+            now = time.monotonic()
+            if now - entry.checked_at < _get_recheck_interval():
+                return entry.resolved
+
+            # Check if files have been created or modified since caching
+            if (
+                _get_profile_mtime(project_dir) == entry.profile_mtime
+                and _get_allowlist_mtime(project_dir) == entry.allowlist_mtime
+            ):
+                entry.checked_at = now
+                return entry.resolved
+
+            # File was created, modified, or deleted - invalidate cache
+            # (This happens when analyzer creates the file after agent starts,
+            # or when user adds/updates the allowlist)
+
+    # Analyze outside the lock - project analysis can be slow
+    resolved = ResolvedProfile(get_or_create_profile(project_dir, spec_dir))
+    entry = _CacheEntry(
+        resolved,
+        _get_profile_mtime(project_dir),
+        _get_allowlist_mtime(project_dir),
+    )
 
-        # Cache is valid if both mtimes are unchanged
-        if (
-            current_profile_mtime == _cached_profile_mtime
-            and current_allowlist_mtime == _cached_allowlist_mtime
-        ):
-            return _cached_profile
+    with _profile_cache_lock:
+        _profile_cache[key] = entry
+        _profile_cache.move_to_end(key)
+        max_size = _get_profile_cache_size()
+        while len(_profile_cache) > max_size:
+            _profile_cache.popitem(last=False)
 
-        # File was created, modified, or deleted - invalidate cache
-        # (This happens when analyzer creates the file after agent starts,
-        # or when user adds/updates the allowlist)
+    return resolved
 
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
-    _cached_spec_dir = resolved_spec_dir
-    _cached_profile_mtime = _get_profile_mtime(project_dir)
-    _cached_allowlist_mtime = _get_allowlist_mtime(project_dir)
 
-    return _cached_profile
+def get_security_profile(
+    project_dir: Path, spec_dir: Path | None = None
+) -> SecurityProfile:
+    """
+    Get the security profile for a project, using cache when possible.
+
+    See get_resolved_profile for cache invalidation rules.
+
+    Args:
+        project_dir: Project root directory
+        spec_dir: Optional spec directory
+
+    Returns:
+        SecurityProfile for the project
+    """
+    return get_resolved_profile(project_dir, spec_dir).profile
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile
-    global _cached_project_dir
-    global _cached_spec_dir
-    global _cached_profile_mtime
-    global _cached_allowlist_mtime
-    _cached_profile = None
-    _cached_project_dir = None
-    _cached_spec_dir = None
-    _cached_profile_mtime = None
-    _cached_allowlist_mtime = None
+    """Reset the cached profiles (useful for testing or re-analysis)."""
+    with _profile_cache_lock:
+        _profile_cache.clear()
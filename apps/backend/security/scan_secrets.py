@@ -7,7 +7,15 @@ Scans staged git files for potential secrets before commit.
 Designed to prevent accidental exposure of API keys, tokens, and credentials.
 
 Usage:
-    python scan_secrets.py [--staged-only] [--all-files] [--path PATH]
+    python scan_secrets.py [--staged-only] [--all-files] [--path PATH] [--jobs N] [--no-cache]
+
+Performance:
+    - All patterns are precompiled; one combined alternation locates the
+      leftmost candidate in the whole file, and only lines containing a
+      candidate are checked against each individual pattern.
+    - Files are scanned in a process pool for --all-files / --path scans.
+    - Hashes of files found clean are cached in .auto-claude/ (when that
+      directory exists), so unchanged files are skipped on the next run.
 
 Exit codes:
     0 - No secrets detected
@@ -16,9 +24,14 @@ Exit codes:
 """
 
 import argparse
+import bisect
+import hashlib
+import json
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -251,6 +264,43 @@ FALSE_POSITIVE_PATTERNS = [
 ]
 
 
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+
+
+def _compile_patterns(
+    patterns: list[tuple[str, str]],
+) -> list[tuple[re.Pattern, str]]:
+    """Compile (pattern, name) pairs, dropping invalid regexes."""
+    compiled = []
+    for pattern, pattern_name in patterns:
+        try:
+            compiled.append((re.compile(pattern, re.IGNORECASE), pattern_name))
+        except re.error:
+            # Invalid regex, skip
+            continue
+    return compiled
+
+
+_COMPILED_PATTERNS = _compile_patterns(ALL_PATTERNS)
+
+# One alternation of every secret pattern. Patterns contain no anchors or
+# lookarounds, so the leftmost match of the alternation in a file is never
+# to the right of the leftmost per-line match of any individual pattern.
+_COMBINED_PATTERN = re.compile(
+    "|".join(f"(?:{p.pattern})" for p, _ in _COMPILED_PATTERNS), re.IGNORECASE
+)
+
+_FALSE_POSITIVE_RE = re.compile("|".join(f"(?:{p})" for p in FALSE_POSITIVE_PATTERNS))
+_TYPE_HINT_RE = re.compile(r"^[a-z_]+:\s*str\s*$", re.IGNORECASE)
+_LONG_KEY_RE = re.compile(r"[a-zA-Z0-9_-]{40,}")
+
+# Changes to any pattern invalidate the clean-file cache
+PATTERNS_FINGERPRINT = hashlib.sha256(
+    json.dumps([ALL_PATTERNS, FALSE_POSITIVE_PATTERNS]).encode("utf-8")
+).hexdigest()[:16]
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -297,27 +347,34 @@ def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
     return False
 
 
-def is_false_positive(line: str, matched_text: str) -> bool:
-    """Check if a match is likely a false positive."""
-    line_lower = line.lower()
-
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, line_lower):
-            return True
+def _is_false_positive_line(line: str) -> bool:
+    """Check the match-independent false positive rules for a line."""
+    if _FALSE_POSITIVE_RE.search(line.lower()):
+        return True
 
     # Check if it's just a variable name or type hint
-    if re.match(r"^[a-z_]+:\s*str\s*$", line.strip(), re.IGNORECASE):
-        return True
+    return bool(_TYPE_HINT_RE.match(line.strip()))
 
-    # Check if it's in a comment
+
+def _is_comment_line(line: str) -> bool:
+    """Check if a line is a comment."""
     stripped = line.strip()
-    if (
+    return (
         stripped.startswith("#")
         or stripped.startswith("//")
         or stripped.startswith("*")
-    ):
+    )
+
+
+def is_false_positive(line: str, matched_text: str) -> bool:
+    """Check if a match is likely a false positive."""
+    if _is_false_positive_line(line):
+        return True
+
+    # Check if it's in a comment
+    if _is_comment_line(line):
         # But still flag if there's an actual long key-like string
-        if not re.search(r"[a-zA-Z0-9_-]{40,}", matched_text):
+        if not _LONG_KEY_RE.search(matched_text):
             return True
 
     return False
@@ -330,33 +387,61 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
     return text[:visible_chars] + "***"
 
 
+def _scan_line(line: str, line_num: int, file_path: str) -> list[SecretMatch]:
+    """Check a single line against every secret pattern."""
+    matches = []
+    line_is_false_positive = None
+    for pattern, pattern_name in _COMPILED_PATTERNS:
+        for match in pattern.finditer(line):
+            matched_text = match.group(0)
+
+            # Skip false positives (line-level rules evaluated once per line)
+            if line_is_false_positive is None:
+                line_is_false_positive = _is_false_positive_line(line)
+            if line_is_false_positive:
+                return []
+            if _is_comment_line(line) and not _LONG_KEY_RE.search(matched_text):
+                continue
+
+            matches.append(
+                SecretMatch(
+                    file_path=file_path,
+                    line_number=line_num,
+                    pattern_name=pattern_name,
+                    matched_text=matched_text,
+                    line_content=line.strip()[:100],  # Truncate long lines
+                )
+            )
+    return matches
+
+
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
-    """Scan file content for potential secrets."""
+    """
+    Scan file content for potential secrets.
+
+    The combined pattern is searched over the whole content; each hit is
+    mapped back to its line, that line is checked against every pattern,
+    and the search resumes at the next line.
+    """
+    match = _COMBINED_PATTERN.search(content)
+    if match is None:
+        return []
+
     matches = []
     lines = content.splitlines()
+    line_starts = []
+    offset = 0
+    for line_with_end in content.splitlines(keepends=True):
+        line_starts.append(offset)
+        offset += len(line_with_end)
 
-    for line_num, line in enumerate(lines, 1):
-        for pattern, pattern_name in ALL_PATTERNS:
-            try:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    matched_text = match.group(0)
-
-                    # Skip false positives
-                    if is_false_positive(line, matched_text):
-                        continue
-
-                    matches.append(
-                        SecretMatch(
-                            file_path=file_path,
-                            line_number=line_num,
-                            pattern_name=pattern_name,
-                            matched_text=matched_text,
-                            line_content=line.strip()[:100],  # Truncate long lines
-                        )
-                    )
-            except re.error:
-                # Invalid regex, skip
-                continue
+    while match is not None:
+        line_index = bisect.bisect_right(line_starts, match.start()) - 1
+        matches.extend(_scan_line(lines[line_index], line_index + 1, file_path))
+
+        if line_index + 1 >= len(lines):
+            break
+        match = _COMBINED_PATTERN.search(content, line_starts[line_index + 1])
 
     return matches
 
@@ -391,16 +476,99 @@ def get_all_tracked_files() -> list[str]:
         return []
 
 
+# Clean-file cache (content hashes of files with no findings)
+CLEAN_CACHE_FILE = "secret_scan_cache.json"
+CLEAN_CACHE_MAX_ENTRIES = 100_000
+# Below this many files a process pool costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+
+def _get_clean_cache_path(project_dir: Path) -> Path | None:
+    """Get the clean-file cache path, or None if the project has no .auto-claude dir."""
+    auto_claude_dir = project_dir / ".auto-claude"
+    if not auto_claude_dir.is_dir():
+        return None
+    return auto_claude_dir / CLEAN_CACHE_FILE
+
+
+def _load_clean_cache(cache_path: Path) -> dict[str, None]:
+    """Load clean content hashes (insertion-ordered, oldest first)."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if data.get("fingerprint") != PATTERNS_FINGERPRINT:
+        return {}
+    return dict.fromkeys(data.get("clean", []))
+
+
+def _save_clean_cache(cache_path: Path, clean: dict[str, None]) -> None:
+    """Persist clean content hashes, keeping the most recent entries."""
+    hashes = list(clean)[-CLEAN_CACHE_MAX_ENTRIES:]
+    tmp_path = cache_path.with_suffix(".tmp")
+    try:
+        tmp_path.write_text(
+            json.dumps({"fingerprint": PATTERNS_FINGERPRINT, "clean": hashes}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+
+def _scan_file(
+    full_path: str, file_path: str, clean: frozenset[str] | dict[str, None]
+) -> tuple[str | None, list[SecretMatch]]:
+    """
+    Read and scan one file.
+
+    Returns:
+        (content hash, matches); the hash is None if the file could not be read
+    """
+    try:
+        data = Path(full_path).read_bytes()
+    except OSError:
+        return None, []
+
+    digest = hashlib.sha256(data).hexdigest()
+    if digest in clean:
+        return digest, []
+
+    content = data.decode("utf-8", errors="ignore")
+    return digest, scan_content(content, file_path)
+
+
+def _scan_file_batch(
+    batch: list[tuple[str, str]], clean: frozenset[str]
+) -> list[tuple[str | None, list[SecretMatch]]]:
+    """Process pool entry point: scan a batch of (full_path, file_path) pairs."""
+    return [_scan_file(full_path, file_path, clean) for full_path, file_path in batch]
+
+
 def scan_files(
     files: list[str],
     project_dir: Path | None = None,
+    jobs: int = 1,
+    use_cache: bool = True,
 ) -> list[SecretMatch]:
-    """Scan a list of files for secrets."""
+    """
+    Scan a list of files for secrets.
+
+    Args:
+        files: File paths relative to project_dir
+        project_dir: Project root (defaults to cwd)
+        jobs: Worker processes to scan with (1 = scan in-process)
+        use_cache: Skip files whose content hash was previously found clean
+            (cache lives in .auto-claude/, only used if that directory exists)
+
+    Returns:
+        Matches in file order
+    """
     if project_dir is None:
         project_dir = Path.cwd()
 
     custom_ignores = load_secretsignore(project_dir)
-    all_matches = []
+    to_scan = []
 
     for file_path in files:
         # Skip files based on ignore patterns
@@ -413,13 +581,40 @@ def scan_files(
         if not full_path.exists() or full_path.is_dir():
             continue
 
-        try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            matches = scan_content(content, file_path)
-            all_matches.extend(matches)
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
-            continue
+        to_scan.append((str(full_path), file_path))
+
+    cache_path = _get_clean_cache_path(project_dir) if use_cache else None
+    clean = _load_clean_cache(cache_path) if cache_path else {}
+
+    if jobs > 1 and len(to_scan) >= PARALLEL_MIN_FILES:
+        clean_snapshot = frozenset(clean)
+        batch_size = max(1, len(to_scan) // (jobs * 4))
+        batches = [
+            to_scan[i : i + batch_size] for i in range(0, len(to_scan), batch_size)
+        ]
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = [
+                result
+                for batch_results in pool.map(
+                    _scan_file_batch, batches, [clean_snapshot] * len(batches)
+                )
+                for result in batch_results
+            ]
+    else:
+        results = [
+            _scan_file(full_path, file_path, clean) for full_path, file_path in to_scan
+        ]
+
+    all_matches = []
+    cache_dirty = False
+    for digest, matches in results:
+        all_matches.extend(matches)
+        if digest is not None and not matches and digest not in clean:
+            clean[digest] = None
+            cache_dirty = True
+
+    if cache_path and cache_dirty:
+        _save_clean_cache(cache_path, clean)
 
     return all_matches
 
@@ -514,6 +709,18 @@ def main() -> int:
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Only output if secrets are found"
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count for --all-files/--path, else 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan files previously found clean",
+    )
 
     args = parser.parse_args()
 
@@ -544,8 +751,11 @@ def main() -> int:
     if not args.quiet and not args.json:
         print(f"Scanning {len(files)} file(s) for secrets...")
 
-    # Scan files
-    matches = scan_files(files, project_dir)
+    # Scan files (in parallel for whole-repo scans)
+    jobs = args.jobs
+    if jobs is None:
+        jobs = (os.cpu_count() or 1) if (args.all_files or args.path) else 1
+    matches = scan_files(files, project_dir, jobs=jobs, use_cache=not args.no_cache)
 
     # Output results
     if args.json:
@@ -1,43 +1,182 @@
 """
 Storage functionality for task logs.
+
+Two storage modes are supported:
+
+- Snapshot mode (default): every entry rewrites ``task_logs.json``.
+- Journaled mode: entries are appended to a per-phase JSONL segment
+  (``task_logs.<phase>.jsonl``) and periodically compacted into the
+  ``task_logs.json`` snapshot. Enable with ``TASK_LOG_JOURNAL=true``.
+
+The snapshot keeps the legacy format; it only gains a ``journal_seq`` key
+recording the last journal entry folded into it. ``load_task_logs`` merges
+the snapshot with any journal tail, so readers see every entry either way.
 """
 
+import atexit
 import json
 import os
 import sys
 import tempfile
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .models import LogEntry, LogPhase
 
+JOURNAL_SUFFIX = ".jsonl"
+DEFAULT_COMPACT_EVERY = 200  # Journal entries between snapshot compactions
+DEFAULT_COMPACT_INTERVAL = 5.0  # Max seconds the snapshot may lag the journal
+
+
+# Journaled storages with entries that may still need compacting at exit
+_open_storages: "weakref.WeakSet[LogStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_storages() -> None:
+    """Fold every open journal into its snapshot before the process exits."""
+    for storage in list(_open_storages):
+        storage.close()
+
+
+def _journal_enabled() -> bool:
+    """Check whether journaled task log storage is enabled via environment."""
+    return os.environ.get("TASK_LOG_JOURNAL", "").lower() in ("true", "1", "yes")
+
+
+def _journal_files(spec_dir: Path) -> list[Path]:
+    """List the per-phase journal segments present in a spec directory."""
+    stem = Path(LogStorage.LOG_FILE).stem
+    try:
+        return sorted(spec_dir.glob(f"{stem}.*{JOURNAL_SUFFIX}"))
+    except OSError:
+        return []
+
+
+def _read_journal(journal_file: Path) -> list[tuple[int, dict]]:
+    """
+    Read the records of a journal segment.
+
+    A partially written trailing line (writer mid-append) is skipped.
+
+    Args:
+        journal_file: Path to the JSONL segment
+
+    Returns:
+        List of (seq, entry) tuples in file order
+    """
+    records = []
+    try:
+        with open(journal_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    seq = int(record["seq"])
+                    entry = record["entry"]
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+                records.append((seq, entry))
+    except (OSError, UnicodeDecodeError):
+        pass
+    return records
+
+
+def _merge_journal(data: dict, journal_records: list[tuple[int, dict]]) -> int:
+    """
+    Append journal records that are not yet in the snapshot.
+
+    Args:
+        data: Snapshot data (modified in place)
+        journal_records: (seq, entry) tuples read from the journal segments
+
+    Returns:
+        Highest sequence number seen (snapshot or journal)
+    """
+    last_seq = int(data.get("journal_seq", 0) or 0)
+    phases = data.setdefault("phases", {})
+    for seq, entry in sorted(journal_records, key=lambda r: r[0]):
+        if seq <= last_seq:
+            continue
+        phase_key = entry.get("phase", LogPhase.CODING.value)
+        if phase_key not in phases:
+            phases[phase_key] = {
+                "phase": phase_key,
+                "status": "active",
+                "started_at": None,
+                "completed_at": None,
+                "entries": [],
+            }
+        phases[phase_key]["entries"].append(entry)
+        last_seq = seq
+    return last_seq
+
 
 class LogStorage:
     """Handles persistent storage of task logs."""
 
     LOG_FILE = "task_logs.json"
 
-    def __init__(self, spec_dir: Path):
+    def __init__(
+        self,
+        spec_dir: Path,
+        journaled: bool | None = None,
+        compact_every: int = DEFAULT_COMPACT_EVERY,
+        compact_interval: float = DEFAULT_COMPACT_INTERVAL,
+    ):
         """
         Initialize log storage.
 
         Args:
             spec_dir: Path to the spec directory
+            journaled: Use append-only journal segments (default: TASK_LOG_JOURNAL env)
+            compact_every: Journal entries between snapshot compactions
+            compact_interval: Max seconds between snapshot compactions
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
+        self.journaled = _journal_enabled() if journaled is None else journaled
+        self.compact_every = max(1, compact_every)
+        self.compact_interval = compact_interval
+        self._seq = 0
+        self._pending = 0
+        self._meta_dirty = False
+        self._last_compact = time.monotonic()
+        self._lock = threading.RLock()
+        self._flush_timer: threading.Timer | None = None
         self._data: dict = self._load_or_create()
+        if self.journaled:
+            # Fold the journal tail into the snapshot if the process exits
+            # without ending its phase, so snapshot-only readers catch up
+            _open_storages.add(self)
+
+    def _journal_file(self, phase: str) -> Path:
+        """Get the journal segment path for a phase."""
+        return self.spec_dir / f"{Path(self.LOG_FILE).stem}.{phase}{JOURNAL_SUFFIX}"
 
     def _load_or_create(self) -> dict:
-        """Load existing logs or create new structure."""
+        """Load existing logs (snapshot plus journal tail) or create new structure."""
+        # Journal is read before the snapshot so a concurrent compaction can
+        # only move entries into the snapshot, never drop them from our view
+        journal_records = []
+        for journal_file in _journal_files(self.spec_dir):
+            journal_records.extend(_read_journal(journal_file))
+
+        data = None
         if self.log_file.exists():
             try:
                 with open(self.log_file, encoding="utf-8") as f:
-                    return json.load(f)
+                    data = json.load(f)
             except (OSError, json.JSONDecodeError, UnicodeDecodeError):
                 pass
 
-        return {
+        if data is not None:
+            self._seq = _merge_journal(data, journal_records)
+            return data
+
+        data = {
             "spec_id": self.spec_dir.name,
             "created_at": self._timestamp(),
             "updated_at": self._timestamp(),
@@ -65,10 +204,24 @@ class LogStorage:
                 },
             },
         }
+        self._seq = _merge_journal(data, journal_records)
+        return data
 
     def save(self) -> None:
-        """Save logs to file atomically to prevent corruption from concurrent reads."""
+        """
+        Save logs to file atomically to prevent corruption from concurrent reads.
+
+        In journaled mode this is the compaction step: the snapshot absorbs
+        every journaled entry and the journal segments are discarded.
+        """
+        with self._lock:
+            self._cancel_flush()
+            self._save()
+
+    def _save(self) -> None:
         self._data["updated_at"] = self._timestamp()
+        if self.journaled or self._seq:
+            self._data["journal_seq"] = self._seq
         try:
             self.spec_dir.mkdir(parents=True, exist_ok=True)
             # Write to temp file first, then atomic rename to prevent corruption
@@ -88,6 +241,66 @@ class LogStorage:
                 raise
         except OSError as e:
             print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+            return
+
+        # Snapshot now covers the whole journal; readers skip any records
+        # they still see via journal_seq, so removal order is not critical
+        for journal_file in _journal_files(self.spec_dir):
+            try:
+                journal_file.unlink()
+            except OSError:
+                pass
+        self._pending = 0
+        self._meta_dirty = False
+        self._last_compact = time.monotonic()
+
+    def _append_journal(self, entry_dict: dict) -> bool:
+        """
+        Append an entry to its phase journal segment.
+
+        Returns:
+            True if the entry was written, False on I/O failure
+        """
+        self._seq += 1
+        record = {"seq": self._seq, "entry": entry_dict}
+        try:
+            self.spec_dir.mkdir(parents=True, exist_ok=True)
+            with open(
+                self._journal_file(entry_dict["phase"]), "a", encoding="utf-8"
+            ) as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            return True
+        except OSError as e:
+            print(f"Warning: Failed to append task log journal: {e}", file=sys.stderr)
+            return False
+
+    def _should_compact(self) -> bool:
+        """Check whether the snapshot should absorb the journal now."""
+        if self._meta_dirty or not self.log_file.exists():
+            return True
+        if self._pending >= self.compact_every:
+            return True
+        return time.monotonic() - self._last_compact >= self.compact_interval
+
+    def _schedule_flush(self) -> None:
+        """
+        Compact pending journal entries within compact_interval.
+
+        Compaction is otherwise only checked when an entry arrives, so the
+        last entries of a burst would stay out of the snapshot indefinitely.
+        """
+        if self._flush_timer is not None:
+            return
+        elapsed = time.monotonic() - self._last_compact
+        timer = threading.Timer(max(0.0, self.compact_interval - elapsed), self.flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _cancel_flush(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
 
     def _timestamp(self) -> str:
         """Get current timestamp in ISO format."""
@@ -100,19 +313,48 @@ class LogStorage:
         Args:
             entry: The log entry to add
         """
-        phase_key = entry.phase
-        if phase_key not in self._data["phases"]:
-            # Create phase if it doesn't exist
-            self._data["phases"][phase_key] = {
-                "phase": phase_key,
-                "status": "active",
-                "started_at": self._timestamp(),
-                "completed_at": None,
-                "entries": [],
-            }
-
-        self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
+        with self._lock:
+            phase_key = entry.phase
+            if phase_key not in self._data["phases"]:
+                # Create phase if it doesn't exist
+                self._data["phases"][phase_key] = {
+                    "phase": phase_key,
+                    "status": "active",
+                    "started_at": self._timestamp(),
+                    "completed_at": None,
+                    "entries": [],
+                }
+                self._meta_dirty = True
+
+            entry_dict = entry.to_dict()
+            self._data["phases"][phase_key]["entries"].append(entry_dict)
+
+            if not self.journaled or not self._append_journal(entry_dict):
+                self.save()
+                return
+
+            self._pending += 1
+            if self._should_compact():
+                self.save()
+            else:
+                self._schedule_flush()
+
+    def flush(self) -> None:
+        """Compact any journaled entries into the snapshot."""
+        with self._lock:
+            self._cancel_flush()
+            if self._pending or self._meta_dirty:
+                self._save()
+
+    def close(self) -> None:
+        """Flush pending entries and stop tracking this storage for exit."""
+        self.flush()
+        _open_storages.discard(self)
+
+    def _mark_meta_dirty(self) -> None:
+        self._meta_dirty = True
+        if self.journaled:
+            self._schedule_flush()
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: str | None = None
@@ -125,10 +367,12 @@ class LogStorage:
             status: New status (pending, active, completed, failed)
             completed_at: Optional completion timestamp
         """
-        if phase in self._data["phases"]:
-            self._data["phases"][phase]["status"] = status
-            if completed_at:
-                self._data["phases"][phase]["completed_at"] = completed_at
+        with self._lock:
+            if phase in self._data["phases"]:
+                self._data["phases"][phase]["status"] = status
+                if completed_at:
+                    self._data["phases"][phase]["completed_at"] = completed_at
+                self._mark_meta_dirty()
 
     def set_phase_started(self, phase: str, started_at: str) -> None:
         """
@@ -138,8 +382,10 @@ class LogStorage:
             phase: Phase name
             started_at: Start timestamp
         """
-        if phase in self._data["phases"]:
-            self._data["phases"][phase]["started_at"] = started_at
+        with self._lock:
+            if phase in self._data["phases"]:
+                self._data["phases"][phase]["started_at"] = started_at
+                self._mark_meta_dirty()
 
     def get_data(self) -> dict:
         """Get all log data."""
@@ -156,29 +402,50 @@ class LogStorage:
         Args:
             new_spec_id: New spec ID
         """
-        self._data["spec_id"] = new_spec_id
+        with self._lock:
+            self._data["spec_id"] = new_spec_id
+            self._mark_meta_dirty()
 
 
 def load_task_logs(spec_dir: Path) -> dict | None:
     """
     Load task logs from a spec directory.
 
+    Merges the task_logs.json snapshot with any journaled entries that have
+    not been compacted yet.
+
     Args:
         spec_dir: Path to the spec directory
 
     Returns:
         Logs dictionary or None if not found
     """
+    spec_dir = Path(spec_dir)
     log_file = spec_dir / LogStorage.LOG_FILE
+
+    # Read the journal first: a compaction racing with us can only move
+    # entries into the snapshot we read afterwards
+    journal_records = []
+    for journal_file in _journal_files(spec_dir):
+        journal_records.extend(_read_journal(journal_file))
+
     if not log_file.exists():
-        return None
+        if not journal_records:
+            return None
+        logs = {"spec_id": spec_dir.name, "phases": {}}
+        _merge_journal(logs, journal_records)
+        return logs
 
     try:
         with open(log_file, encoding="utf-8") as f:
-            return json.load(f)
+            logs = json.load(f)
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return None
 
+    if journal_records:
+        _merge_journal(logs, journal_records)
+    return logs
+
 
 def get_active_phase(spec_dir: Path) -> str | None:
     """
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared analyzer FileManifest
+==========================================
+
+The manifest replaces per-detector Path.glob calls, so it must return the
+same paths in the same order, and project analysis must not change whether
+services are analyzed in worker processes or in-process.
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from analysis.analyzers import ProjectAnalyzer
+from analysis.analyzers.file_manifest import FileManifest
+
+GLOB_PATTERNS = [
+    "**/*.py",
+    "**/*.ts",
+    "**/models.py",
+    "**/models/*.py",
+    "**/*.entity.ts",
+    "**/db/schema.ts",
+    "**/migrations",
+    "**/route.{ts,js,tsx,jsx}",
+    "*.xcodeproj",
+    "Dockerfile*",
+    "src/**/*.js",
+]
+
+
+def _make_tree(root: Path) -> None:
+    files = {
+        "app/main.py": "from fastapi import FastAPI\n",
+        "app/models.py": "",
+        "app/models/user.py": "",
+        "app/db/schema.ts": "",
+        "app/migrations/0001.py": "",
+        "src/user.entity.ts": "",
+        "src/lib/index.js": "",
+        "src/route.{ts,js,tsx,jsx}": "",
+        "node_modules/pkg/index.ts": "",
+        ".venv/lib/site.py": "",
+        "Dockerfile": "",
+        "Dockerfile.dev": "",
+        "App.xcodeproj/project.pbxproj": "",
+        ".py": "",
+    }
+    for rel_path, content in files.items():
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text(content)
+    (root / "empty.py").mkdir()  # Directories match file patterns too
+
+
+@pytest.mark.parametrize("pattern", GLOB_PATTERNS)
+def test_glob_matches_pathlib(temp_dir: Path, pattern: str):
+    """Manifest globs return exactly what Path.glob returns, in order."""
+    _make_tree(temp_dir)
+    manifest = FileManifest(temp_dir)
+
+    assert manifest.glob(temp_dir, pattern) == list(temp_dir.glob(pattern))
+    assert manifest.glob(temp_dir / "app", pattern) == list(
+        (temp_dir / "app").glob(pattern)
+    )
+
+
+def test_directories_listed_once(temp_dir: Path, monkeypatch):
+    """Repeated and overlapping globs reuse cached directory listings."""
+    _make_tree(temp_dir)
+    manifest = FileManifest(temp_dir)
+    scanned = []
+    original = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(Path(path))
+        return original(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+
+    for pattern in GLOB_PATTERNS:
+        manifest.glob(temp_dir, pattern)
+    manifest.glob(temp_dir / "app", "**/*.py")
+
+    assert len(scanned) == len(set(scanned))
+
+
+def test_missing_base(temp_dir: Path):
+    """Globbing a missing directory yields nothing."""
+    assert FileManifest(temp_dir).glob(temp_dir / "missing", "**/*.py") == []
+
+
+def test_parallel_analysis_matches_serial(temp_dir: Path):
+    """Worker-process service analysis produces the same index."""
+    (temp_dir / "turbo.json").write_text("{}")
+    api = temp_dir / "packages" / "api"
+    (api / "app").mkdir(parents=True)
+    (api / "requirements.txt").write_text("fastapi\nsqlalchemy\n")
+    (api / "app" / "main.py").write_text(
+        'from fastapi import FastAPI\napp = FastAPI()\n@app.get("/items")\ndef f(): pass\n'
+    )
+    web = temp_dir / "packages" / "web"
+    (web / "src").mkdir(parents=True)
+    (web / "package.json").write_text('{"dependencies": {"express": "1"}}')
+    (web / "src" / "server.js").write_text('app.post("/x", h)\n')
+
+    serial = ProjectAnalyzer(temp_dir, max_workers=1).analyze()
+    parallel = ProjectAnalyzer(temp_dir, max_workers=2).analyze()
+
+    assert sorted(serial["services"]) == ["api", "web"]
+    assert json.dumps(parallel, indent=2) == json.dumps(serial, indent=2)
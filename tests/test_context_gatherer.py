@@ -12,6 +12,7 @@ import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
+import subprocess
 import tempfile
 
 import pytest
@@ -24,7 +25,7 @@ if str(_github_dir) not in sys.path:
 if str(_backend_dir) not in sys.path:
     sys.path.insert(0, str(_backend_dir))
 
-from context_gatherer import AI_BOT_PATTERNS, FollowupContextGatherer
+from context_gatherer import AI_BOT_PATTERNS, FollowupContextGatherer, PRContextGatherer
 from models import PRReviewResult, FollowupReviewContext
 
 
@@ -235,3 +236,190 @@ class TestAIReviewsInclusion:
 
         # 1 contributor review should be in contributor_comments_since_review
         assert len(context.contributor_comments_since_review) == 1
+
+
+class TestBulkContextFetch:
+    """Tests for the bulk GraphQL fetch and batched git reads in PRContextGatherer."""
+
+    @staticmethod
+    def _page(files_page, comments_page):
+        pr = {
+            "number": 7,
+            "title": "Add feature",
+            "body": "Body",
+            "state": "OPEN",
+            "headRefName": "feature",
+            "baseRefName": "main",
+            "headRefOid": "",
+            "baseRefOid": "",
+            "additions": 3,
+            "deletions": 1,
+            "changedFiles": 2,
+            "mergeable": "CONFLICTING",
+            "mergeStateStatus": "DIRTY",
+            "author": {"login": "dev"},
+            "labels": {"nodes": [{"name": "bug"}]},
+        }
+        if files_page == 1:
+            pr["files"] = {
+                "nodes": [{"path": "a.py", "additions": 2, "deletions": 0, "changeType": "ADDED"}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "f1"},
+            }
+            pr["commits"] = {
+                "nodes": [
+                    {
+                        "commit": {
+                            "oid": "c1",
+                            "messageHeadline": "Add a",
+                            "messageBody": "",
+                            "authoredDate": "2026-01-01T00:00:00Z",
+                            "committedDate": "2026-01-01T00:00:00Z",
+                            "authors": {
+                                "nodes": [
+                                    {"name": "Dev", "email": "d@x", "user": {"id": "U1", "login": "dev"}}
+                                ]
+                            },
+                        }
+                    }
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+            pr["reviewThreads"] = {
+                "nodes": [
+                    {
+                        "comments": {
+                            "nodes": [
+                                {
+                                    "databaseId": 11,
+                                    "author": {"login": "coderabbitai[bot]"},
+                                    "body": "Nit",
+                                    "path": "a.py",
+                                    "line": None,
+                                    "originalLine": 4,
+                                    "createdAt": "2026-01-02T00:00:00Z",
+                                }
+                            ]
+                        }
+                    }
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        else:
+            pr["files"] = {
+                "nodes": [{"path": "b.py", "additions": 1, "deletions": 1, "changeType": "MODIFIED"}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        if comments_page:
+            pr["comments"] = {
+                "nodes": [
+                    {"databaseId": 12, "author": {"login": "developer"}, "body": "Thanks", "createdAt": ""},
+                    {"databaseId": 13, "author": {"login": "copilot[bot]"}, "body": "Summary", "createdAt": ""},
+                ],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        return {"repository": {"pullRequest": pr}}
+
+    @pytest.mark.asyncio
+    async def test_bulk_fetch_pages_connections_independently(self, tmp_path):
+        """Finished connections are dropped from later pages; results are merged."""
+        pages = [self._page(1, True), self._page(2, False)]
+        sent = []
+
+        async def graphql(query, variables, timeout=None):
+            sent.append(dict(variables))
+            return pages[len(sent) - 1]
+
+        mock_gh_client = AsyncMock()
+        mock_gh_client.graphql.side_effect = graphql
+
+        with patch("context_gatherer.GHClient", return_value=mock_gh_client):
+            gatherer = PRContextGatherer(tmp_path, 7, repo="owner/repo", bulk_fetch=True)
+        bulk = await gatherer._fetch_pr_bulk()
+
+        assert sent[0]["owner"] == "owner"
+        assert sent[0]["withFiles"] is True and sent[0]["withComments"] is True
+        second = sent[1]
+        assert second["withFiles"] is True and second["filesAfter"] == "f1"
+        assert not (second["withCommits"] or second["withThreads"] or second["withComments"])
+
+        assert bulk["pr"]["files"] == [
+            {"path": "a.py", "status": "added", "additions": 2, "deletions": 0},
+            {"path": "b.py", "status": "modified", "additions": 1, "deletions": 1},
+        ]
+        assert bulk["pr"]["labels"] == [{"name": "bug"}]
+        assert bulk["commits"][0]["oid"] == "c1"
+        assert bulk["commits"][0]["authors"][0]["login"] == "dev"
+
+        ai_comments = gatherer._collect_ai_bot_comments(
+            bulk["review_comments"], bulk["issue_comments"]
+        )
+        assert [(c.comment_id, c.tool_name, c.file, c.line) for c in ai_comments] == [
+            (11, "CodeRabbit", "a.py", 4),
+            (13, "GitHub Copilot", None, None),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_gather_falls_back_when_bulk_fetch_fails(self, tmp_path):
+        """A failing GraphQL query falls back to the per-call fetches."""
+        mock_gh_client = AsyncMock()
+        mock_gh_client.graphql.side_effect = RuntimeError("boom")
+        mock_gh_client.pr_diff.return_value = ""
+        mock_gh_client.pr_get.return_value = {
+            "title": "T",
+            "author": {"login": "dev"},
+            "baseRefName": "main",
+            "headRefName": "feature",
+            "files": [],
+            "commits": [],
+        }
+        mock_gh_client.run.return_value = MagicMock(returncode=0, stdout="[]")
+
+        with patch("context_gatherer.GHClient", return_value=mock_gh_client):
+            gatherer = PRContextGatherer(tmp_path, 7, bulk_fetch=True)
+        context = await gatherer.gather()
+
+        assert context.title == "T"
+        assert mock_gh_client.pr_get.await_count == 2  # metadata + commits
+
+    @pytest.mark.asyncio
+    async def test_changed_files_read_in_batch(self, tmp_path):
+        """Contents and patches for all files come from batched git calls."""
+
+        def git(*args):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "t@example.com")
+        git("config", "user.name", "Test")
+        (tmp_path / "keep.py").write_text("old\n")
+        (tmp_path / "gone.py").write_text("bye\n")
+        git("add", "-A")
+        git("commit", "-qm", "base")
+        git("tag", "base")
+        (tmp_path / "keep.py").write_text("new\n")
+        (tmp_path / "gone.py").unlink()
+        (tmp_path / "added.py").write_text("hi\n")
+        git("add", "-A")
+        git("commit", "-qm", "head")
+
+        gatherer = PRContextGatherer(tmp_path, 1, bulk_fetch=False)
+        pr_data = {
+            "headRefName": "HEAD",
+            "baseRefName": "base",
+            "files": [
+                {"path": "keep.py", "status": "modified"},
+                {"path": "gone.py", "status": "removed"},
+                {"path": "added.py", "status": "added"},
+            ],
+        }
+        with patch.object(gatherer, "_get_file_patch", AsyncMock(return_value="")) as single:
+            files = await gatherer._fetch_changed_files(pr_data)
+
+        by_path = {f.path: f for f in files}
+        assert (by_path["keep.py"].base_content, by_path["keep.py"].content) == ("old\n", "new\n")
+        assert (by_path["gone.py"].base_content, by_path["gone.py"].content) == ("bye\n", "")
+        assert (by_path["added.py"].base_content, by_path["added.py"].content) == ("", "hi\n")
+        assert "+new" in by_path["keep.py"].patch
+        assert by_path["gone.py"].patch.startswith("diff --git a/gone.py b/gone.py")
+        assert by_path["gone.py"].status == "deleted"
+        single.assert_not_awaited()
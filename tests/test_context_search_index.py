@@ -0,0 +1,139 @@
+"""
+Tests for the persistent keyword search index used by context.CodeSearcher.
+"""
+
+from pathlib import Path
+
+from context.pattern_discovery import PatternDiscoverer
+from context.search import CodeSearcher
+from context.search_index import SearchIndex, tokenize_content
+
+
+def _make_project(root: Path) -> Path:
+    service = root / "backend"
+    (service / "api").mkdir(parents=True)
+    (service / "node_modules" / "pkg").mkdir(parents=True)
+    (service / "api" / "auth.py").write_text(
+        "def authenticate(user):\n"
+        "    token = make_token(user)\n"
+        "    # AUTH check\n"
+        "    return user_auth_token(token)\n"
+    )
+    (service / "api" / "users.py").write_text(
+        "class UserService:\n    def get_user(self, user_id):\n        return user_id\n"
+    )
+    (service / "main.py").write_text("from api.auth import authenticate\n")
+    (service / "README.md").write_text("auth auth auth\n")
+    (service / "node_modules" / "pkg" / "index.js").write_text("auth()\n")
+    return service
+
+
+def test_tokenize_counts_and_lines():
+    tokens = tokenize_content("foo_bar foo_bar\nx foo_bar\n\nfoo_bar\nfoo_bar")
+    assert tokens["foo_bar"] == [5, 1, 2, 4]
+    assert "x" not in tokens
+
+
+def test_index_matches_scan(tmp_path: Path):
+    service = _make_project(tmp_path)
+    keywords = ["auth", "user", "token", "missing"]
+
+    scanned = CodeSearcher(tmp_path).search_service(service, "backend", keywords)
+    indexed = CodeSearcher(tmp_path, SearchIndex(tmp_path)).search_service(
+        service, "backend", keywords
+    )
+
+    assert indexed == scanned
+    assert (tmp_path / ".auto-claude" / "search_index.db").exists()
+
+
+def test_update_rewrites_only_changed_file(tmp_path: Path):
+    service = _make_project(tmp_path)
+    legacy = tmp_path / ".auto-claude" / "search_index.json"
+    legacy.parent.mkdir(exist_ok=True)
+    legacy.write_text("{}")
+    index = SearchIndex(tmp_path)
+    assert not legacy.exists()
+    index.refresh(service)
+    users_id = index.file_id(str(Path("backend/api/users.py")))
+    before = index.lookup("user")
+    index.close()
+
+    (service / "main.py").write_text("import os\n")
+    index = SearchIndex(tmp_path)
+    index.refresh(service)
+
+    after = index.lookup("user")
+    assert after[users_id] == before[users_id]
+    assert index.lookup("import") == {
+        index.file_id(str(Path("backend/main.py"))): (1, [1])
+    }
+    # Tokens only main.py used are pruned along with their trigrams
+    tokens = index._conn.execute("SELECT COUNT(*) FROM tokens WHERE token = 'api'")
+    assert tokens.fetchone()[0] == 0
+    index.close()
+
+
+def test_unchanged_files_are_not_reread(tmp_path: Path, monkeypatch):
+    service = _make_project(tmp_path)
+    SearchIndex(tmp_path).refresh(service)
+
+    index = SearchIndex(tmp_path)
+    reads = []
+    original = Path.read_text
+
+    def tracking_read_text(self, *args, **kwargs):
+        reads.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking_read_text)
+    index.refresh(service)
+    assert reads == []
+
+
+def test_changed_and_removed_files_are_reindexed(tmp_path: Path):
+    service = _make_project(tmp_path)
+    index = SearchIndex(tmp_path)
+    searcher = CodeSearcher(tmp_path, index)
+    searcher.search_service(service, "backend", ["auth"])
+
+    (service / "main.py").write_text("import os\n")
+    (service / "api" / "users.py").unlink()
+    (service / "api" / "billing.py").write_text("charge_user = 1\n")
+
+    indexed = searcher.search_service(service, "backend", ["auth", "user"])
+    scanned = CodeSearcher(tmp_path).search_service(
+        service, "backend", ["auth", "user"]
+    )
+
+    assert indexed == scanned
+    assert index.file_id(str(Path("backend/api/users.py"))) is None
+
+
+def test_unindexable_keywords_fall_back_to_scan(tmp_path: Path):
+    service = _make_project(tmp_path)
+    keywords = ["make_token(user)"]
+
+    scanned = CodeSearcher(tmp_path).search_service(service, "backend", keywords)
+    indexed = CodeSearcher(tmp_path, SearchIndex(tmp_path)).search_service(
+        service, "backend", keywords
+    )
+
+    assert indexed == scanned
+    assert len(indexed) == 1
+
+
+def test_pattern_discovery_matches_scan(tmp_path: Path):
+    service = _make_project(tmp_path)
+    index = SearchIndex(tmp_path)
+    matches = CodeSearcher(tmp_path, index).search_service(
+        service, "backend", ["auth", "user"]
+    )
+
+    expected = PatternDiscoverer(tmp_path).discover_patterns(matches, ["auth", "user"])
+    actual = PatternDiscoverer(tmp_path, index).discover_patterns(
+        matches, ["auth", "user"]
+    )
+
+    assert actual == expected
+    assert "auth_pattern" in actual
@@ -0,0 +1,200 @@
+"""
+Tests for the Audit Log Index
+=============================
+
+Checks that AuditLogger's indexed query_logs/get_statistics return the same
+results as scanning the JSONL files, including logs written before the index
+existed and rotated or deleted files.
+"""
+
+import json
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+import audit as audit_module
+from audit import ActorType, AuditAction, AuditEntry, AuditLogger
+from audit_index import INDEX_FILENAME, AuditIndex
+
+
+def _entry(hours_ago, action, repo="owner/repo", pr_number=1, result="success"):
+    return AuditEntry(
+        timestamp=datetime.now(timezone.utc) - timedelta(hours=hours_ago),
+        correlation_id=f"gh-{action.value}-{pr_number}",
+        action=action,
+        actor_type=ActorType.AUTOMATION,
+        actor_id=None,
+        repo=repo,
+        pr_number=pr_number,
+        issue_number=None,
+        result=result,
+        duration_ms=100,
+        error=None,
+        details={"n": pr_number},
+        token_usage={"input_tokens": 10, "output_tokens": 5},
+    )
+
+
+@pytest.fixture
+def audit(tmp_path):
+    logger = AuditLogger(log_dir=tmp_path)
+    for i, hours_ago in enumerate([30, 5.5, 2, 0.2]):
+        logger._write_entry(
+            _entry(hours_ago, AuditAction.PR_REVIEW_STARTED, pr_number=i)
+        )
+    logger._write_entry(
+        _entry(1, AuditAction.PR_REVIEW_FAILED, repo="other/repo", result="failure")
+    )
+    return logger
+
+
+def _scan(logger, **filters):
+    return [e.to_dict() for e in logger._scan_logs(**filters)]
+
+
+def _query(logger, **filters):
+    return [e.to_dict() for e in logger.query_logs(**filters)]
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"repo": "owner/repo"},
+        {"pr_number": 2},
+        {"action": AuditAction.PR_REVIEW_FAILED},
+        {"correlation_id": "gh-pr_review_started-3"},
+        {"since": datetime.now(timezone.utc) - timedelta(hours=3)},
+        {"limit": 2},
+    ],
+)
+def test_query_matches_scan(audit, filters):
+    assert (audit.log_dir / INDEX_FILENAME).exists()
+    assert _query(audit, **filters) == _scan(audit, **filters)
+
+
+def test_statistics_use_rollups_and_partial_hour(audit):
+    since = datetime.now(timezone.utc) - timedelta(hours=6)
+    stats = audit.get_statistics(since=since)
+
+    assert stats["total_entries"] == 4
+    assert stats["by_action"] == {"pr_review_started": 3, "pr_review_failed": 1}
+    assert stats["by_result"] == {"success": 3, "failure": 1}
+    assert stats["total_duration_ms"] == 400
+    assert stats["total_input_tokens"] == 40
+    assert stats["total_output_tokens"] == 20
+
+    repo_stats = audit.get_statistics(repo="other/repo")
+    assert repo_stats["total_entries"] == 1
+    assert repo_stats["by_actor_type"] == {"automation": 1}
+
+
+def test_existing_logs_are_indexed_on_first_query(tmp_path):
+    writer = AuditLogger(log_dir=tmp_path, use_index=False)
+    writer._write_entry(_entry(1, AuditAction.PR_REVIEW_STARTED, pr_number=7))
+    assert not (tmp_path / INDEX_FILENAME).exists()
+
+    reader = AuditLogger(log_dir=tmp_path)
+    reader._write_entry(_entry(0, AuditAction.PR_REVIEW_COMPLETED, pr_number=7))
+    entries = reader.query_logs(pr_number=7)
+
+    assert [e.action for e in entries] == [
+        AuditAction.PR_REVIEW_STARTED,
+        AuditAction.PR_REVIEW_COMPLETED,
+    ]
+    assert reader.get_statistics()["total_entries"] == 2
+
+
+def test_rotated_and_deleted_files_follow_index(audit):
+    log_file = audit._get_log_file_path()
+    audit.max_file_size_mb = 0
+    audit._rotate_if_needed()
+    audit.max_file_size_mb = 100
+
+    assert not log_file.exists()
+    assert len(audit.query_logs()) == 5
+
+    for path in audit.log_dir.glob("audit_*.jsonl"):
+        path.unlink()
+    assert audit.query_logs() == []
+    assert audit.get_statistics()["total_entries"] == 0
+
+
+def test_partial_line_left_for_next_sync(tmp_path):
+    line = json.dumps(_entry(0, AuditAction.PR_REVIEW_STARTED).to_dict()) + "\n"
+    log_file = tmp_path / "audit_2026-01-01.jsonl"
+    log_file.write_text(line + line[:20], encoding="utf-8")
+
+    index = AuditIndex(tmp_path)
+    index.sync()
+    assert len(index.query()) == 1
+
+    log_file.write_text(line + line, encoding="utf-8")
+    index.sync()
+    assert index.query() == [
+        (log_file.name, 0, len(line)),
+        (log_file.name, len(line), len(line)),
+    ]
+    index.close()
+
+
+def test_concurrent_writer_cannot_take_our_offset(tmp_path, monkeypatch):
+    first, second = AuditLogger(log_dir=tmp_path), AuditLogger(log_dir=tmp_path)
+    first_opened, second_done = threading.Event(), threading.Event()
+    real_open = open
+
+    class SlowAppend:
+        """Pauses between tell() and write() so another writer can append."""
+
+        def __init__(self, f):
+            self._f = f
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self._f.close()
+
+        def tell(self):
+            return self._f.tell()
+
+        def write(self, data):
+            second_done.wait(timeout=0.5)
+            return self._f.write(data)
+
+    def slow_open(path, mode="r", *args, **kwargs):
+        f = real_open(path, mode, *args, **kwargs)
+        if mode == "ab" and threading.current_thread().name == "first":
+            first_opened.set()
+            return SlowAppend(f)
+        return f
+
+    monkeypatch.setattr(audit_module, "open", slow_open, raising=False)
+    entry = _entry(0, AuditAction.PR_REVIEW_STARTED, pr_number=1)
+    writer = threading.Thread(target=first._write_entry, args=(entry,), name="first")
+    writer.start()
+    assert first_opened.wait(timeout=5)
+    second._write_entry(_entry(0, AuditAction.PR_REVIEW_STARTED, pr_number=2))
+    second_done.set()
+    writer.join()
+
+    # Before any sync(), each indexed row must point at its own line
+    conn = sqlite3.connect(tmp_path / INDEX_FILENAME)
+    rows = conn.execute("SELECT file, offset, length, pr_number FROM entries")
+    rows = rows.fetchall()
+    conn.close()
+    assert sorted(row[3] for row in rows) == [1, 2]
+    for file_name, offset, length, pr_number in rows:
+        with open(tmp_path / file_name, "rb") as f:
+            f.seek(offset)
+            assert json.loads(f.read(length))["pr_number"] == pr_number
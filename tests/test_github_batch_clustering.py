@@ -0,0 +1,80 @@
+"""
+Tests for Issue Batch Clustering
+================================
+
+Covers IssueBatcher's average-linkage clustering over a sparse similarity
+matrix: threshold cut-off, batch size limits and deterministic ordering.
+"""
+
+import sys
+from importlib.machinery import ModuleSpec
+from pathlib import Path
+
+import pytest
+
+# Add the backend and runners/github directories to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+for _path in (_backend_dir, _github_dir):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+
+@pytest.fixture
+def batcher(tmp_path, monkeypatch):
+    # batch_validator calls find_spec("claude_agent_sdk") at import time,
+    # which raises ValueError for the conftest SDK mock unless it has a spec
+    sdk = sys.modules.get("claude_agent_sdk")
+    if sdk is not None and getattr(sdk, "__spec__", None) is None:
+        spec = ModuleSpec("claude_agent_sdk", None)
+        monkeypatch.setattr(sdk, "__spec__", spec, raising=False)
+
+    from batch_issues import IssueBatcher
+
+    return IssueBatcher(
+        github_dir=tmp_path,
+        repo="owner/repo",
+        project_dir=tmp_path,
+        similarity_threshold=0.7,
+        max_batch_size=3,
+        validate_batches=False,
+    )
+
+
+def _issues(*numbers):
+    return [{"number": n} for n in numbers]
+
+
+def _symmetric(pairs):
+    matrix = {}
+    for (a, b), score in pairs.items():
+        matrix[(a, b)] = matrix[(b, a)] = score
+    return matrix
+
+
+def test_clusters_follow_threshold_and_input_order(batcher):
+    matrix = _symmetric({(1, 2): 0.9, (3, 4): 0.8, (4, 5): 0.5})
+    clusters = batcher._cluster_issues(_issues(5, 4, 3, 2, 1), matrix)
+    assert clusters == [[5], [4, 3], [2, 1]]
+
+
+def test_average_linkage_blocks_weakly_linked_merge(batcher):
+    # 1-2 merge first; 3 links to the pair at (0.9 + 0.4) / 2 < threshold
+    matrix = _symmetric({(1, 2): 0.95, (1, 3): 0.9, (2, 3): 0.4})
+    assert batcher._cluster_issues(_issues(1, 2, 3), matrix) == [[1, 2], [3]]
+
+    # Unlinked member pairs do not count against the average
+    matrix = _symmetric({(1, 2): 0.95, (1, 3): 0.9})
+    assert batcher._cluster_issues(_issues(1, 2, 3), matrix) == [[1, 2, 3]]
+
+
+def test_oversized_merge_skipped_without_stopping(batcher):
+    matrix = _symmetric({(1, 2): 0.99, (2, 3): 0.98, (3, 4): 0.97, (5, 6): 0.8})
+    clusters = batcher._cluster_issues(_issues(1, 2, 3, 4, 5, 6), matrix)
+    assert clusters == [[1, 2, 3], [4], [5, 6]]
+
+
+def test_asymmetric_and_unknown_pairs(batcher):
+    # One-directional scores count; pairs with unknown issues are ignored
+    matrix = {(1, 2): 0.8, (2, 1): 0.7, (2, 99): 1.0, (3, 3): 1.0}
+    assert batcher._cluster_issues(_issues(1, 2, 3), matrix) == [[1, 2], [3]]
@@ -0,0 +1,351 @@
+"""
+Tests for Duplicate Detection Embedding Storage
+===============================================
+
+Covers the per-repo embedding matrix store, the vectorized duplicate
+search built on it, and batched embedding requests.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import multiprocessing
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+import embedding_store
+from duplicates import DuplicateDetector, EmbeddingProvider
+from embedding_store import EmbeddingStore
+
+REPO = "owner/repo"
+DIM = 16
+
+
+def _bag_of_words(text: str) -> list[float]:
+    """Deterministic embedding: word hashes bucketed into DIM dimensions."""
+    vector = [0.0] * DIM
+    for word in text.lower().split():
+        digest = hashlib.sha256(word.encode()).digest()
+        vector[digest[0] % DIM] += 1.0
+    return vector
+
+
+class FakeEmbeddingProvider(EmbeddingProvider):
+    """Bag-of-words provider that records every request it receives."""
+
+    def __init__(self, batch_size: int = 64, max_concurrency: int = 4, fail_on=None):
+        super().__init__(
+            provider="fake", batch_size=batch_size, max_concurrency=max_concurrency
+        )
+        self.requests: list[list[str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_on = fail_on
+
+    @property
+    def calls(self) -> int:
+        return sum(len(batch) for batch in self.requests)
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.requests.append(texts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_on and any(self.fail_on in text for text in texts):
+                raise RuntimeError("embedding API error")
+            return [_bag_of_words(text) for text in texts]
+        finally:
+            self.in_flight -= 1
+
+
+def _issue(number: int, title: str, body: str = "") -> dict:
+    return {"number": number, "title": title, "body": body}
+
+
+@pytest.fixture
+def detector(tmp_path):
+    detector = DuplicateDetector(cache_dir=tmp_path / "embeddings")
+    detector.embedding_provider = FakeEmbeddingProvider()
+    return detector
+
+
+def _flush_issues(cache_dir, start, count):
+    store = EmbeddingStore(cache_dir, REPO)
+    for number in range(start, start + count):
+        store.put(number, "h", [float(number)] * DIM)
+        store.flush()
+
+
+class TestEmbeddingStore:
+    """Tests for the append-only embedding matrix."""
+
+    def test_round_trip(self, tmp_path):
+        store = EmbeddingStore(tmp_path, REPO)
+        store.put(1, "h1", [1.0, 2.0, 3.0])
+        store.put(2, "h2", [0.5, 0.0, -1.0])
+        store.flush()
+
+        reloaded = EmbeddingStore(tmp_path, REPO)
+        assert reloaded.get(1, "h1") == [1.0, 2.0, 3.0]
+        assert reloaded.get(2, "h2") == [0.5, 0.0, -1.0]
+        assert reloaded.get(1, "other-hash") is None
+        assert len(reloaded) == 2
+
+    def test_updates_append_and_compact(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(embedding_store, "COMPACT_MIN_DEAD_ROWS", 2)
+        store = EmbeddingStore(tmp_path, REPO)
+        for version in range(5):
+            store.put(1, f"h{version}", [float(version), 1.0])
+            store.flush()
+
+        assert store.get(1, "h4") == [4.0, 1.0]
+        # Superseded rows were dropped once they outnumbered live ones
+        assert store.matrix_file.stat().st_size < 5 * 2 * 4
+        assert EmbeddingStore(tmp_path, REPO).get(1, "h4") == [4.0, 1.0]
+
+    def test_search_ranks_by_cosine(self, tmp_path):
+        store = EmbeddingStore(tmp_path, REPO)
+        store.put(1, "a", [1.0, 0.0])
+        store.put(2, "b", [1.0, 1.0])
+        store.put(3, "c", [0.0, 1.0])
+        store.put(4, "d", [0.0, 0.0])
+
+        matches = store.search([1.0, 0.1], [3, 2, 1, 4], min_score=0.5)
+
+        assert [number for number, _ in matches] == [1, 2]
+        assert matches[0][1] == pytest.approx(1 / math.sqrt(1.01), rel=1e-5)
+        assert store.search([1.0, 0.1], [3, 2, 1], limit=1)[0][0] == 1
+
+    def test_expired_entries_ignored(self, tmp_path):
+        store = EmbeddingStore(tmp_path, REPO, ttl_hours=-1)
+        store.put(1, "h", [1.0, 0.0])
+        store.flush()
+
+        assert store.get(1, "h") is None
+        assert store.search([1.0, 0.0], [1]) == []
+
+    def test_migrates_legacy_json_cache(self, tmp_path):
+        now = datetime.now(timezone.utc)
+        legacy = tmp_path / "owner_repo_embeddings.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "embeddings": [
+                        {
+                            "issue_number": 7,
+                            "content_hash": "abc",
+                            "embedding": [0.25, 0.5],
+                            "created_at": now.isoformat(),
+                            "expires_at": (now + timedelta(hours=1)).isoformat(),
+                        }
+                    ]
+                }
+            )
+        )
+
+        store = EmbeddingStore(tmp_path, REPO)
+
+        assert store.get(7, "abc") == [0.25, 0.5]
+        assert not legacy.exists()
+
+    def test_dimension_change_clears_store(self, tmp_path):
+        store = EmbeddingStore(tmp_path, REPO)
+        store.put(1, "h", [1.0, 0.0])
+        store.flush()
+        store.put(2, "h", [1.0, 0.0, 0.0])
+        store.flush()
+
+        reloaded = EmbeddingStore(tmp_path, REPO)
+        assert reloaded.get(1, "h") is None
+        assert reloaded.get(2, "h") == [1.0, 0.0, 0.0]
+
+    def test_concurrent_flushes_keep_rows_aligned(self, tmp_path):
+        EmbeddingStore(tmp_path, REPO).put(0, "h", [0.0] * DIM)
+        ctx = multiprocessing.get_context("spawn")
+        workers = [
+            ctx.Process(target=_flush_issues, args=(tmp_path, 1 + 40 * i, 40))
+            for i in range(3)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        store = EmbeddingStore(tmp_path, REPO)
+        assert len(store) == 120
+        for number in range(1, 121):
+            assert store.get(number, "h") == [float(number)] * DIM
+
+    def test_approximate_index_finds_near_neighbours(self, tmp_path, monkeypatch):
+        if embedding_store.np is None:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(embedding_store, "APPROX_INDEX_MIN_ROWS", 100)
+        rng = embedding_store.np.random.default_rng(0)
+        vectors = rng.normal(size=(400, 8)).astype("float32")
+        store = EmbeddingStore(tmp_path, REPO)
+        for number, vector in enumerate(vectors):
+            store.put(number, "h", vector.tolist())
+
+        for number in (0, 123, 399):
+            matches = store.search(vectors[number].tolist(), list(range(400)), limit=1)
+            assert matches[0][0] == number
+
+
+class TestFindDuplicates:
+    """Tests for vectorized duplicate search."""
+
+    OPEN_ISSUES = [
+        _issue(1, "Login fails with OAuth", "OAuth login fails on callback"),
+        _issue(2, "Dark mode toggle missing", "Settings page has no toggle"),
+        _issue(3, "OAuth login fails", "Login with OAuth fails on callback page"),
+        _issue(4, "Crash on startup", "App crashes when opened"),
+        _issue(5, "Login fails with OAuth", "OAuth login fails on callback"),
+    ]
+
+    def test_matches_pairwise_comparison(self, detector):
+        target = _issue(9, "Login fails with OAuth", "OAuth login fails on callback")
+
+        results = asyncio.run(
+            detector.find_duplicates(
+                REPO, 9, target["title"], target["body"], self.OPEN_ISSUES
+            )
+        )
+
+        async def pairwise():
+            expected = []
+            for issue in self.OPEN_ISSUES:
+                result = await detector.compare_issues(REPO, target, issue)
+                if result.is_similar:
+                    expected.append(result)
+            expected.sort(key=lambda r: r.overall_score, reverse=True)
+            return expected[:5]
+
+        expected = asyncio.run(pairwise())
+
+        assert [r.issue_b for r in results] == [r.issue_b for r in expected]
+        assert [r.issue_b for r in results][:2] == [1, 5]
+        for got, want in zip(results, expected):
+            assert got.overall_score == pytest.approx(want.overall_score, rel=1e-5)
+            assert got.is_duplicate == want.is_duplicate
+            assert got.entity_scores == want.entity_scores
+
+    def test_embeddings_cached_and_written_in_one_batch(self, detector):
+        provider = detector.embedding_provider
+
+        computed = asyncio.run(detector.precompute_embeddings(REPO, self.OPEN_ISSUES))
+        assert computed == len(self.OPEN_ISSUES)
+        assert provider.calls == len(self.OPEN_ISSUES)
+
+        store = detector._get_store(REPO)
+        index_lines = store.index_file.read_text().splitlines()
+        assert len(index_lines) == 1 + len(self.OPEN_ISSUES)  # Header + rows
+
+        asyncio.run(detector.precompute_embeddings(REPO, self.OPEN_ISSUES))
+        assert provider.calls == len(self.OPEN_ISSUES)
+
+    def test_clear_cache(self, detector):
+        asyncio.run(detector.precompute_embeddings(REPO, self.OPEN_ISSUES))
+        detector.clear_cache(REPO)
+
+        store = EmbeddingStore(detector.cache_dir, REPO)
+        assert len(store) == 0
+        assert not store.matrix_file.exists()
+
+
+class TestBatchedEmbeddings:
+    """Tests for batched, concurrent embedding requests."""
+
+    ISSUES = [_issue(n, f"Issue {n}", f"Body text {n}") for n in range(1, 11)]
+
+    def test_groups_texts_and_bounds_concurrency(self, detector):
+        provider = FakeEmbeddingProvider(batch_size=3, max_concurrency=2)
+        detector.embedding_provider = provider
+
+        computed = asyncio.run(detector.precompute_embeddings(REPO, self.ISSUES))
+
+        assert computed == 10
+        assert [len(batch) for batch in provider.requests] == [3, 3, 3, 1]
+        assert provider.max_in_flight == 2
+        store = detector._get_store(REPO)
+        assert store.get(4, detector._content_hash("Issue 4", "Body text 4")) == (
+            _bag_of_words("Issue 4\n\nBody text 4")
+        )
+
+    def test_only_changed_issues_are_reembedded(self, detector):
+        provider = FakeEmbeddingProvider(batch_size=4)
+        detector.embedding_provider = provider
+        asyncio.run(detector.precompute_embeddings(REPO, self.ISSUES))
+        provider.requests.clear()
+
+        changed = [dict(issue) for issue in self.ISSUES]
+        changed[2]["body"] = "Edited body"
+        asyncio.run(detector.precompute_embeddings(REPO, changed))
+
+        assert provider.requests == [["Issue 3\n\nEdited body"]]
+
+    def test_failed_batch_skips_only_its_issues(self, detector):
+        provider = FakeEmbeddingProvider(batch_size=3, fail_on="Body text 5")
+        detector.embedding_provider = provider
+
+        embeddings = asyncio.run(detector.get_embeddings(REPO, self.ISSUES))
+
+        assert sorted(embeddings) == [1, 2, 3, 7, 8, 9, 10]
+
+    def test_voyage_backend_against_stub_server(self):
+        pytest.importorskip("httpx")
+        requests = []
+
+        class StubEmbeddingHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(
+                    self.rfile.read(int(self.headers["Content-Length"]))
+                )
+                requests.append((self.path, payload["input"]))
+                data = [
+                    {"index": i, "embedding": _bag_of_words(text)}
+                    for i, text in enumerate(payload["input"])
+                ]
+                body = json.dumps({"data": list(reversed(data))}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubEmbeddingHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            provider = EmbeddingProvider(
+                provider="voyage",
+                api_key="test-key",
+                base_url=f"http://127.0.0.1:{server.server_port}/v1",
+                batch_size=2,
+            )
+            texts = ["alpha beta", "gamma", "delta epsilon", "zeta", "eta"]
+
+            embeddings = asyncio.run(provider.get_embeddings(texts))
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert embeddings == [_bag_of_words(text) for text in texts]
+        assert sorted(len(inputs) for _, inputs in requests) == [1, 2, 2]
+        assert {path for path, _ in requests} == {"/v1/embeddings"}
@@ -0,0 +1,264 @@
+"""
+Tests for the GHClient HTTP Transport
+=====================================
+
+Runs GHClient against a local stub of the GitHub API to check that the
+HTTP transport reproduces gh's output, revalidates cached responses with
+ETags, and falls back to the gh subprocess for commands it cannot translate.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from gh_client import GHClient, GHCommandError
+from gh_http import GHHttpTransport
+from rate_limiter import RateLimitExceeded
+
+REPO = "owner/repo"
+DIFF = "diff --git a/x.py b/x.py\n+print('hi')\n"
+
+
+class StubGitHubHandler(BaseHTTPRequestHandler):
+    """Minimal GitHub API: one PR, one file listing, ETags on GET."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, str, dict[str, str]]] = []
+
+    def _send(
+        self,
+        status,
+        body=b"",
+        content_type="application/json",
+        etag=None,
+        resource="core",
+    ):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-RateLimit-Resource", resource)
+        self.send_header(
+            "X-RateLimit-Remaining", "4999" if resource == "core" else "12"
+        )
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path, dict(self.headers)))
+        if self.path == "/repos/owner/repo/pulls/7/files?per_page=100":
+            etag = '"files-v1"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, etag=etag)
+                return
+            body = json.dumps([{"filename": "x.py"}]).encode()
+            self._send(200, body, etag=etag)
+        elif self.path == "/repos/owner/repo/pulls/7":
+            if self.headers.get("Accept") != "application/vnd.github.v3.diff":
+                self._send(406, b'{"message": "Not Acceptable"}')
+                return
+            self._send(200, DIFF.encode(), content_type="text/plain")
+        elif self.path == "/repos/owner/repo/limited":
+            self._send(403, b'{"message": "API rate limit exceeded"}')
+        else:
+            self._send(404, b'{"message": "Not Found"}')
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(("POST", self.path, body))
+        variables = body["variables"]
+        if variables.get("filesAfter") is None:
+            files = {
+                "nodes": [{"path": "a.py", "additions": 1, "deletions": 0}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            }
+        else:
+            files = {
+                "nodes": [{"path": "b.py", "additions": 0, "deletions": 2}],
+                "pageInfo": {"hasNextPage": False, "endCursor": None},
+            }
+        pr = {
+            "title": "Fix it",
+            "headRefOid": "abc123",
+            "author": {"__typename": "Bot", "login": "dependabot", "id": "B1"},
+            "files": files,
+        }
+        payload = {"data": {"repository": {"pullRequest": pr}}}
+        self._send(200, json.dumps(payload).encode(), resource="graphql")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    StubGitHubHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubGitHubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    GHHttpTransport.reset_instances()
+
+
+@pytest.fixture
+def client(api_server, tmp_path):
+    transport = GHHttpTransport("test-token", api_server)
+    return GHClient(
+        tmp_path, enable_rate_limiting=False, repo=REPO, http_transport=transport
+    )
+
+
+def test_api_get_with_etag_revalidation(client):
+    args = ["api", "repos/{owner}/{repo}/pulls/7/files", "--method", "GET"]
+    args += ["-f", "per_page=100"]
+
+    first = asyncio.run(client.run(args))
+    second = asyncio.run(client.run(args))
+
+    assert json.loads(first.stdout) == [{"filename": "x.py"}]
+    assert second.stdout == first.stdout
+    assert first.command[0] == "http"
+    sent = StubGitHubHandler.requests
+    assert [path for _, path, _ in sent] == [
+        "/repos/owner/repo/pulls/7/files?per_page=100"
+    ] * 2
+    assert "If-None-Match" not in sent[0][2]
+    assert sent[1][2]["If-None-Match"] == '"files-v1"'
+    assert sent[0][2]["Authorization"] == "Bearer test-token"
+    assert client._http.rate_limit_remaining == 4999
+
+
+def test_pr_diff_requests_diff_media_type(client):
+    result = asyncio.run(client.pr_diff(7))
+
+    assert result == DIFF
+
+
+def test_pr_view_uses_graphql_with_file_pagination(client):
+    result = asyncio.run(
+        client.run(["pr", "view", "7", "--json", "title,author,files"])
+    )
+
+    assert json.loads(result.stdout) == {
+        "title": "Fix it",
+        "author": {"id": "B1", "is_bot": True, "login": "dependabot", "name": ""},
+        "files": [
+            {"path": "a.py", "additions": 1, "deletions": 0},
+            {"path": "b.py", "additions": 0, "deletions": 2},
+        ],
+    }
+    posts = [request for request in StubGitHubHandler.requests if request[0] == "POST"]
+    assert [body["variables"]["filesAfter"] for _, _, body in posts] == [None, "c1"]
+    assert {path for _, path, _ in posts} == {"/graphql"}
+
+
+def test_graphql_sends_typed_variables_and_fills_placeholders(client):
+    variables = {"owner": "{owner}", "name": "{repo}", "number": 7, "filesAfter": None}
+
+    data = asyncio.run(client.graphql("query { x }", variables))
+
+    assert data["repository"]["pullRequest"]["title"] == "Fix it"
+    ((_, path, body),) = StubGitHubHandler.requests
+    assert path == "/graphql"
+    assert body == {
+        "query": "query { x }",
+        "variables": {
+            "owner": "owner",
+            "name": "repo",
+            "number": 7,
+            "filesAfter": None,
+        },
+    }
+
+
+def test_graphql_placeholders_sent_as_typed_fields(tmp_path):
+    proc = AsyncMock()
+    proc.communicate.return_value = (b'{"data": {}}', b"")
+    proc.returncode = 0
+    client = GHClient(tmp_path, enable_rate_limiting=False, http_transport=False)
+    variables = {"owner": "{owner}", "name": "{repo}", "after": "42"}
+
+    with (
+        patch("gh_client.get_gh_executable", return_value="gh"),
+        patch("asyncio.create_subprocess_exec", return_value=proc) as spawn,
+    ):
+        asyncio.run(client.graphql("query { x }", variables))
+
+    # gh fills {owner}/{repo} in -F fields only; other strings stay raw
+    args = list(spawn.call_args.args)
+    assert args[args.index("owner={owner}") - 1] == "-F"
+    assert args[args.index("name={repo}") - 1] == "-F"
+    assert args[args.index("after=42") - 1] == "-f"
+
+
+def test_raw_graphql_fields_are_not_filled(client):
+    args = ["api", "graphql", "-f", "query=query { x }", "-f", "owner={owner}"]
+
+    asyncio.run(client.run(args))
+
+    ((_, _, body),) = StubGitHubHandler.requests
+    assert body["variables"] == {"owner": "{owner}"}
+
+
+def test_graphql_rate_limit_does_not_update_core(client):
+    asyncio.run(client.pr_diff(7))
+    asyncio.run(client.graphql("query { x }", {"number": 7}))
+
+    assert client._http.rate_limit_remaining == 4999
+
+
+def test_errors_match_gh(client):
+    with pytest.raises(GHCommandError, match="HTTP 404"):
+        asyncio.run(client.run(["api", "repos/{owner}/{repo}/missing"]))
+
+    result = asyncio.run(
+        client.run(["api", "repos/{owner}/{repo}/missing"], raise_on_error=False)
+    )
+    assert result.returncode == 1
+    assert result.stderr == "gh: Not Found (HTTP 404)"
+
+    with pytest.raises(RateLimitExceeded):
+        asyncio.run(client.run(["api", "repos/{owner}/{repo}/limited"]))
+
+
+def test_unsupported_commands_fall_back_to_gh(client):
+    proc = AsyncMock()
+    proc.communicate.return_value = (b"ok", b"")
+    proc.returncode = 0
+
+    with (
+        patch("gh_client.get_gh_executable", return_value="gh"),
+        patch("asyncio.create_subprocess_exec", return_value=proc) as spawn,
+    ):
+        result = asyncio.run(client.run(["pr", "list", "--json", "number"]))
+
+    assert result.stdout == "ok"
+    assert result.command == ["gh", "pr", "list", "--json", "number"]
+    assert spawn.call_args.args[:3] == ("gh", "pr", "list")
+    assert StubGitHubHandler.requests == []
+
+
+def test_transport_disabled_without_token(monkeypatch):
+    monkeypatch.delenv("GH_TOKEN", raising=False)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    GHHttpTransport.reset_instances()
+
+    with patch("gh_http._resolve_token", return_value=None):
+        assert GHHttpTransport.get_instance() is None
+
+    assert GHClient(Path("."), http_transport=False)._http is None
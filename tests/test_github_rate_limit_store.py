@@ -0,0 +1,132 @@
+"""
+Tests for the Shared Rate Limit Store
+=====================================
+
+Covers the SQLite-backed token bucket and cost ledger shared by runner
+processes, and RateLimiter's use of it and of GitHub's rate limit headers.
+"""
+
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from rate_limit_store import SharedRateLimitStore
+from rate_limiter import CostLimitExceeded, CostTracker, RateLimiter, TokenBucket
+
+
+@pytest.fixture(autouse=True)
+def reset_limiters():
+    yield
+    RateLimiter.reset_instance()
+    SharedRateLimitStore.reset_instances()
+
+
+def _take_tokens(path, attempts, results):
+    store = SharedRateLimitStore(path)
+    results.put(sum(store.try_acquire("github", 50, 0.0)[0] for _ in range(attempts)))
+    store.close()
+
+
+def test_processes_share_one_bucket(tmp_path):
+    path = tmp_path / "limits.db"
+    SharedRateLimitStore(path).close()  # Create the schema once up front
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=_take_tokens, args=(path, 30, results)) for _ in range(3)
+    ]
+    for worker in workers:
+        worker.start()
+    acquired = sum(results.get(timeout=60) for _ in workers)
+    for worker in workers:
+        worker.join(timeout=60)
+
+    assert acquired == 50
+
+
+def test_buckets_refill_and_follow_server_feedback(tmp_path):
+    a = SharedRateLimitStore(tmp_path / "limits.db")
+    b = SharedRateLimitStore(tmp_path / "limits.db")
+    bucket_a = TokenBucket(capacity=10, refill_rate=0.0, store=a)
+    bucket_b = TokenBucket(capacity=10, refill_rate=0.0, store=b)
+
+    assert bucket_a.try_acquire(6)
+    assert not bucket_b.try_acquire(6)
+    assert bucket_b.available() == 4
+
+    bucket_b.observe_remaining(1)
+    assert bucket_a.available() == 1
+
+    # Exhausted until the reported reset, even with a fast refill rate
+    fast = TokenBucket(capacity=10, refill_rate=1000.0, store=a, name="fast")
+    fast.observe_remaining(0, reset_at=time.time() + 60)
+    assert not fast.try_acquire()
+    fast.observe_remaining(3)
+    assert fast.available() >= 3
+    a.close()
+    b.close()
+
+
+def test_local_bucket_follows_server_feedback():
+    bucket = TokenBucket(capacity=100, refill_rate=1000.0)
+    bucket.observe_remaining(0, reset_at=time.time() + 60)
+    assert bucket.available() == 0
+    assert bucket.time_until_available() > 0
+
+    bucket = TokenBucket(capacity=100, refill_rate=0.0)
+    bucket.observe_remaining(7)
+    assert bucket.available() == 7
+
+
+def test_cost_budget_shared_within_window(tmp_path):
+    a = SharedRateLimitStore(tmp_path / "limits.db")
+    b = SharedRateLimitStore(tmp_path / "limits.db")
+    model = "claude-sonnet-4-5-20250929"
+    tracker_a = CostTracker(cost_limit=1.0, store=a)
+    tracker_b = CostTracker(cost_limit=1.0, store=b)
+
+    cost = tracker_a.add_operation(100_000, 10_000, model, "review")  # $0.45
+    tracker_b.add_operation(100_000, 10_000, model, "triage")
+    assert tracker_a.remaining_budget() == pytest.approx(1.0 - 2 * cost)
+    with pytest.raises(CostLimitExceeded):
+        tracker_a.add_operation(100_000, 10_000, model, "autofix")
+    assert [op["operation"] for op in tracker_b.operations] == ["triage"]
+
+    # Costs outside the window no longer count
+    expired = CostTracker(cost_limit=1.0, store=a, window=0.0)
+    time.sleep(0.01)
+    expired.add_operation(100_000, 10_000, model, "later")
+    assert expired.total_cost == pytest.approx(cost)
+    a.close()
+    b.close()
+
+
+def test_rate_limiter_shared_state_from_env(tmp_path, monkeypatch):
+    path = tmp_path / "limits.db"
+    monkeypatch.setenv("GITHUB_SHARED_RATE_LIMIT", str(path))
+    limiter = RateLimiter.get_instance(github_limit=100, github_refill_rate=0.0)
+    assert limiter.shared_store.path == path
+    assert limiter.statistics()["shared_state"] == str(path)
+
+    limiter.observe_github_rate_limit(40, reset_at=2_000_000_000)
+    other = SharedRateLimitStore(path)
+    other.try_acquire("github", 100, 0.0, tokens=5)
+    # The same header pair is not applied twice
+    limiter.observe_github_rate_limit(40, reset_at=2_000_000_000)
+    limiter.observe_github_rate_limit(None)
+    assert limiter.check_github_available() == (True, "35 requests available")
+    other.close()
+
+    monkeypatch.setenv("GITHUB_SHARED_RATE_LIMIT", "0")
+    RateLimiter.reset_instance()
+    assert RateLimiter.get_instance().shared_store is None
@@ -0,0 +1,144 @@
+"""
+Tests for Parallel Specialist Prompts
+====================================
+
+Covers ParallelOrchestratorReviewer's shared specialist prompt prefix, the
+concurrency cap with prompt cache warm-up, and per-specialist metrics.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+# Add the backend and runners/github directories to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+for _path in (_backend_dir, _github_dir):
+    if str(_path) not in sys.path:
+        sys.path.insert(0, str(_path))
+
+try:
+    from context_gatherer import ChangedFile, PRContext
+    from services import parallel_orchestrator_reviewer as reviewer_module
+except (ImportError, ValueError) as e:
+    pytest.skip(f"parallel orchestrator unavailable: {e}", allow_module_level=True)
+
+
+@pytest.fixture
+def reviewer(tmp_path):
+    return reviewer_module.ParallelOrchestratorReviewer(
+        project_dir=tmp_path,
+        github_dir=tmp_path / ".auto-claude" / "github",
+        config=MagicMock(repo="owner/repo"),
+    )
+
+
+@pytest.fixture
+def context():
+    return PRContext(
+        pr_number=7,
+        title="Add cache",
+        description="Adds a cache",
+        author="dev",
+        base_branch="main",
+        head_branch="feature",
+        state="open",
+        changed_files=[
+            ChangedFile(
+                path="src/cache.py",
+                status="added",
+                additions=3,
+                deletions=0,
+                content="",
+                base_content="",
+                patch="@@ -0,0 +1,3 @@\n+cache = {}",
+            )
+        ],
+        diff="",
+        repo_structure="",
+        related_files=[],
+        total_additions=3,
+        total_deletions=0,
+    )
+
+
+def test_specialist_prompts_share_byte_identical_prefix(reviewer, context, tmp_path):
+    shared = reviewer._build_shared_pr_context(context, tmp_path)
+    prompts = [
+        reviewer._build_specialist_prompt(config, context, tmp_path, shared)
+        for config in reviewer_module.SPECIALIST_CONFIGS
+    ]
+
+    assert all(prompt.startswith(shared) for prompt in prompts)
+    assert len({prompt[len(shared) :] for prompt in prompts}) == len(prompts)
+    assert "+cache = {}" in shared and "PR #7" in shared
+    assert "Specialist Instructions" not in shared
+    # Built on demand when no shared prefix is passed
+    config = reviewer_module.SPECIALIST_CONFIGS[0]
+    assert reviewer._build_specialist_prompt(config, context, tmp_path) == prompts[0]
+
+
+async def test_specialists_capped_and_wait_for_cache_warmup(
+    reviewer, context, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("PR_REVIEW_MAX_PARALLEL_SPECIALISTS", "2")
+    events = []
+    running = 0
+    max_running = 0
+    shared_prefixes = set()
+
+    async def fake_session(config, shared_context, metrics, on_first_response, **_):
+        nonlocal running, max_running
+        shared_prefixes.add(shared_context)
+        events.append(("start", config.name))
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        if on_first_response:
+            events.append(("responded", config.name))
+            on_first_response()
+        await asyncio.sleep(0.02)
+        running -= 1
+        metrics.record_usage({"input_tokens": 10, "cache_read_input_tokens": 90})
+        return config.name, []
+
+    monkeypatch.setattr(reviewer, "_run_specialist_session", fake_session)
+    findings, agents = await reviewer._run_parallel_specialists(
+        context, tmp_path, model="sonnet", thinking_budget=None
+    )
+
+    names = [config.name for config in reviewer_module.SPECIALIST_CONFIGS]
+    assert agents == names and findings == []
+    assert events[:2] == [("start", names[0]), ("responded", names[0])]
+    assert max_running == 2
+    assert len(shared_prefixes) == 1
+    assert [m.cache_read_input_tokens for m in reviewer.specialist_metrics] == [90] * 4
+
+
+async def test_failed_session_records_metrics_and_releases_waiters(
+    reviewer, context, tmp_path, monkeypatch
+):
+    def failing_client(**_):
+        raise RuntimeError("no sdk")
+
+    monkeypatch.setattr(reviewer_module, "create_client", failing_client)
+    released = []
+    metrics = reviewer_module.SpecialistMetrics(name="security")
+
+    name, findings = await reviewer._run_specialist_session(
+        config=reviewer_module.SPECIALIST_CONFIGS[0],
+        context=context,
+        project_root=tmp_path,
+        model="sonnet",
+        thinking_budget=None,
+        metrics=metrics,
+        on_first_response=lambda: released.append(True),
+    )
+
+    assert (name, findings) == ("security", [])
+    assert released == [True]
+    assert metrics.error == "no sdk"
+    assert metrics.shared_prompt_chars > 0 and metrics.specialist_prompt_chars > 0
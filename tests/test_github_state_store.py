@@ -0,0 +1,170 @@
+"""
+Tests for the GitHub Runner State Store
+=======================================
+
+Covers the shared StateStore and the lifecycle, trust and learning managers
+built on it, including the one-time import of per-file JSON state.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the backend runners/github directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+
+from learning import LearningTracker, OutcomeType, PredictionType
+from lifecycle import IssueLifecycleState, LifecycleManager
+from state_store import StateStore
+from trust import TrustManager
+
+
+@pytest.fixture(autouse=True)
+def reset_stores():
+    yield
+    StateStore.reset_instances()
+
+
+def test_store_indexes_and_upserts(tmp_path):
+    store = StateStore.for_dir(tmp_path)
+    assert StateStore.for_dir(tmp_path) is store
+
+    store.put("k", "a", {"v": 1}, repo="o/r", state="new", created_at="2026-01-01")
+    store.put(
+        "k",
+        "b",
+        {"v": 2},
+        repo="o/r",
+        state="done",
+        pending=True,
+        created_at="2026-01-03",
+    )
+    store.put("k", "c", {"v": 3}, repo="o/x", state="new", created_at="2026-01-02")
+    store.put("k", "a", {"v": 4}, repo="o/r", state="done", created_at="2026-01-01")
+
+    assert store.get("k", "a") == {"v": 4}
+    assert store.count_by_state("k", repo="o/r") == {"done": 2}
+    assert store.query("k", pending=True) == [{"v": 2}]
+    assert store.query("k", newest_first=True, limit=2) == [{"v": 2}, {"v": 3}]
+    assert store.count("k", state="new") == 1
+    assert store.delete("k", "c") and store.get("k", "c") is None
+
+
+def test_lifecycle_summary_and_state_queries(tmp_path):
+    manager = LifecycleManager(tmp_path)
+    for issue in (1, 2, 3):
+        manager.get_or_create("owner/repo", issue)
+    manager.transition("owner/repo", 2, IssueLifecycleState.TRIAGING, actor="bot")
+    manager.get_or_create("owner/other", 1)
+
+    assert manager.get_summary("owner/repo") == {"new": 2, "triaging": 1}
+    triaging = manager.get_all_in_state("owner/repo", IssueLifecycleState.TRIAGING)
+    assert [lc.issue_number for lc in triaging] == [2]
+    assert LifecycleManager(tmp_path).get("owner/repo", 2).current_state == (
+        IssueLifecycleState.TRIAGING
+    )
+
+
+def test_legacy_json_state_imported_once(tmp_path):
+    lifecycle_dir = tmp_path / "lifecycle"
+    lifecycle_dir.mkdir()
+    (lifecycle_dir / "owner_repo_5.json").write_text(
+        json.dumps(
+            {"issue_number": 5, "repo": "owner/repo", "current_state": "triaged"}
+        )
+    )
+    learning_dir = tmp_path / "learning"
+    learning_dir.mkdir()
+    outcome = {
+        "review_id": "r1",
+        "repo": "owner/repo",
+        "pr_number": 3,
+        "prediction": "review_approve",
+        "created_at": "2026-01-01T00:00:00+00:00",
+    }
+    (learning_dir / "owner_repo_outcomes.json").write_text(
+        json.dumps({"repo": "owner/repo", "outcomes": [outcome]})
+    )
+    trust_dir = tmp_path / "trust"
+    trust_dir.mkdir()
+    (trust_dir / "owner_repo.json").write_text(
+        json.dumps({"repo": "owner/repo", "current_level": 2})
+    )
+
+    assert LifecycleManager(tmp_path).get_summary("owner/repo") == {"triaged": 1}
+    assert TrustManager(tmp_path).get_trust_level("owner/repo") == 2
+    tracker = LearningTracker(tmp_path)
+    assert [o.review_id for o in tracker.get_pending_outcomes("owner/repo")] == ["r1"]
+
+    # Later edits to the legacy files are not re-imported
+    (lifecycle_dir / "owner_repo_6.json").write_text(
+        json.dumps({"issue_number": 6, "repo": "owner/repo"})
+    )
+    assert LifecycleManager(tmp_path).get("owner/repo", 6) is None
+
+
+def test_concurrent_legacy_imports_run_once(tmp_path):
+    legacy = tmp_path / "legacy.json"
+    legacy.write_text(json.dumps([{"id": "a"}, {"id": "b"}]))
+    first, second = StateStore(tmp_path), StateStore(tmp_path)
+    results = []
+
+    def run_import(store, records):
+        results.append(
+            store.import_legacy(
+                "k",
+                [legacy],
+                records,
+                lambda r: r["id"],
+                lambda r: (None, None, False, None),
+            )
+        )
+
+    def slow_records(data):
+        # A second process starts its import while the first is mid-way
+        racer = threading.Thread(target=run_import, args=(second, list))
+        racer.start()
+        time.sleep(0.2)
+        yield from data
+        threads.append(racer)
+
+    threads = []
+    try:
+        run_import(first, slow_records)
+        threads[0].join()
+        assert sorted(results) == [0, 2]
+        assert first.count("k") == 2
+    finally:
+        first.close()
+        second.close()
+
+
+def test_learning_outcomes_pending_index(tmp_path):
+    tracker = LearningTracker(tmp_path)
+    tracker.record_prediction("owner/repo", "r1", PredictionType.REVIEW_APPROVE)
+    tracker.record_prediction("owner/repo", "r2", PredictionType.REVIEW_REQUEST_CHANGES)
+    tracker.record_prediction("owner/other", "r3", PredictionType.REVIEW_APPROVE)
+
+    updated = tracker.record_outcome("owner/repo", "r1", OutcomeType.MERGED)
+    assert updated.was_correct is True
+    assert tracker.record_outcome("owner/repo", "missing", OutcomeType.MERGED) is None
+
+    reloaded = LearningTracker(tmp_path)
+    assert {o.review_id for o in reloaded.get_pending_outcomes()} == {"r2", "r3"}
+    stats = reloaded.get_accuracy("owner/repo")
+    assert (
+        stats.total_predictions,
+        stats.correct_predictions,
+        stats.pending_outcomes,
+    ) == (2, 1, 1)
+    approve = reloaded.get_accuracy(prediction_type=PredictionType.REVIEW_APPROVE)
+    assert approve.total_predictions == 2
+    assert [o.review_id for o in reloaded.get_recent_outcomes(limit=1)] == ["r3"]
+    assert reloaded.get_dashboard_data("owner/repo")["pending_count"] == 1
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for FileTimelineTracker persistence
+==========================================
+
+Covers:
+- Content-addressed blob storage of timeline contents
+- Reading timelines written with inline content
+- Lazy loading of timelines on first access
+- Keeping stored timelines whose contents cannot be read
+"""
+
+import json
+import subprocess
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from merge.file_timeline import (
+    BranchPoint,
+    FileTimeline,
+    FileTimelineTracker,
+    MainBranchEvent,
+    TaskFileView,
+    TimelineLoadError,
+    TimelinePersistence,
+)
+
+
+def _commit(repo: Path, rel_path: str, content: str, message: str) -> str:
+    (repo / rel_path).parent.mkdir(parents=True, exist_ok=True)
+    (repo / rel_path).write_text(content)
+    subprocess.run(["git", "add", rel_path], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+def _make_timeline(file_path: str, contents: list[str]) -> FileTimeline:
+    timeline = FileTimeline(file_path=file_path)
+    timeline.add_task_view(
+        TaskFileView(
+            task_id="task-001",
+            branch_point=BranchPoint(
+                commit_hash="base", content=contents[0], timestamp=datetime.now()
+            ),
+        )
+    )
+    for i, content in enumerate(contents):
+        timeline.add_main_event(
+            MainBranchEvent(
+                commit_hash=f"c{i}",
+                timestamp=datetime.now(),
+                content=content,
+                source="human",
+            )
+        )
+    return timeline
+
+
+class TestTimelineBlobStorage:
+    """Tests for content-addressed storage of timeline contents."""
+
+    def test_round_trip(self, temp_dir: Path):
+        """Saved timelines load back with identical contents."""
+        persistence = TimelinePersistence(temp_dir)
+        timeline = _make_timeline("src/app.py", ["v1\n", "v2\n", "v1\n"])
+
+        persistence.save_timeline("src/app.py", timeline)
+        loaded = persistence.load_timeline("src/app.py")
+
+        assert loaded.to_dict() == timeline.to_dict()
+
+    def test_contents_stored_once(self, temp_dir: Path):
+        """Timeline JSON references hashes and duplicate contents share a blob."""
+        persistence = TimelinePersistence(temp_dir)
+        big = "x = 1\n" * 10_000
+        timeline = _make_timeline("src/app.py", [big, big, big, "small\n"])
+
+        persistence.save_timeline("src/app.py", timeline)
+
+        timeline_file = persistence._get_timeline_file_path("src/app.py")
+        data = json.loads(timeline_file.read_text())
+        assert all("content" not in e for e in data["main_branch_history"])
+        assert (
+            data["main_branch_history"][0]["content_hash"]
+            == (data["task_views"]["task-001"]["branch_point"]["content_hash"])
+        )
+        assert len(timeline_file.read_text()) < len(big)
+
+        blobs = [p for p in persistence.blobs.blobs_dir.rglob("*") if p.is_file()]
+        assert len(blobs) == 2
+
+    def test_reads_inline_content_timelines(self, temp_dir: Path):
+        """Timelines saved before the blob store are still readable."""
+        persistence = TimelinePersistence(temp_dir)
+        timeline = _make_timeline("src/app.py", ["v1\n", "v2\n"])
+        timeline_file = persistence._get_timeline_file_path("src/app.py")
+        timeline_file.write_text(json.dumps(timeline.to_dict()))
+        (persistence.timelines_dir / "index.json").write_text(
+            json.dumps({"files": ["src/app.py"]})
+        )
+
+        assert persistence.load_timeline("src/app.py").to_dict() == timeline.to_dict()
+
+        # A legacy index (no task ids) still lets the tracker find task files
+        tracker = FileTimelineTracker(temp_dir, temp_dir)
+        assert tracker.get_files_for_task("task-001") == ["src/app.py"]
+
+    def test_missing_blob_keeps_stored_timeline(self, temp_git_repo: Path):
+        """A timeline with a missing blob is reported, never overwritten."""
+        base = _commit(temp_git_repo, "src/a.py", "a = 1\n", "add a")
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-001", ["src/a.py"], branch_point_commit=base)
+
+        persistence = tracker.persistence
+        timeline_file = persistence._get_timeline_file_path("src/a.py")
+        stored = timeline_file.read_bytes()
+        for blob in persistence.blobs.blobs_dir.rglob("*"):
+            if blob.is_file():
+                blob.unlink()
+
+        with pytest.raises(TimelineLoadError):
+            persistence.load_timeline("src/a.py")
+
+        reloaded = FileTimelineTracker(temp_git_repo)
+        reloaded.on_task_start("task-002", ["src/a.py"], branch_point_commit=base)
+        assert timeline_file.read_bytes() == stored
+        assert reloaded.get_files_for_task("task-001") == ["src/a.py"]
+
+
+class TestLazyTimelineLoading:
+    """Tests for loading timelines on first access."""
+
+    def test_timelines_load_on_demand(self, temp_git_repo: Path, monkeypatch):
+        """Only the index is read at startup; timelines load when used."""
+        base = _commit(temp_git_repo, "src/a.py", "a = 1\n", "add a")
+        _commit(temp_git_repo, "src/b.py", "b = 1\n", "add b")
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-001", ["src/a.py"], branch_point_commit=base)
+        tracker.on_task_start("task-002", ["src/b.py"], branch_point_commit=base)
+        head = _commit(temp_git_repo, "src/a.py", "a = 2\n", "change a")
+        tracker.on_main_branch_commit(head)
+
+        loads = []
+        original = TimelinePersistence.load_timeline
+
+        def tracking_load(self, file_path):
+            loads.append(file_path)
+            return original(self, file_path)
+
+        monkeypatch.setattr(TimelinePersistence, "load_timeline", tracking_load)
+
+        reloaded = FileTimelineTracker(temp_git_repo)
+        assert loads == []
+        assert sorted(reloaded.get_tracked_files()) == ["src/a.py", "src/b.py"]
+        assert reloaded.get_files_for_task("task-001") == ["src/a.py"]
+        assert loads == []
+
+        context = reloaded.get_merge_context("task-001", "src/a.py")
+        assert loads == ["src/a.py"]
+        assert context.current_main_content == "a = 2\n"
+        assert context.task_branch_point.content == "a = 1\n"
+        assert reloaded.get_task_drift("task-001") == {"src/a.py": 1}
+        assert loads == ["src/a.py"]
@@ -13,6 +13,7 @@ Covers:
 - Detecting conflicting files
 - Task cleanup
 - Evolution summaries
+- Sharded evolution storage and legacy migration
 """
 
 import sys
@@ -242,3 +243,149 @@ class TestEvolutionSummary:
         summary = file_tracker.get_evolution_summary()
 
         assert summary["total_tasks"] >= 2
+
+
+class TestEvolutionStorage:
+    """Tests for the sharded evolution store."""
+
+    def test_round_trip_across_instances(self, file_tracker, temp_project):
+        """Evolutions persist and reload from per-file records."""
+        from merge import FileEvolutionTracker
+
+        files = [temp_project / "src" / "utils.py", temp_project / "src" / "App.tsx"]
+        file_tracker.capture_baselines("task-001", files)
+        file_tracker.record_modification(
+            "task-001", "src/utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+
+        reloaded = FileEvolutionTracker(temp_project)
+
+        assert {
+            path: evolution.to_dict()
+            for path, evolution in reloaded._evolutions.items()
+        } == {
+            path: evolution.to_dict()
+            for path, evolution in file_tracker._evolutions.items()
+        }
+        assert not file_tracker.evolution_file.exists()
+
+    def test_only_changed_records_are_written(self, file_tracker, temp_project):
+        """Recording one modification rewrites only that file's record."""
+        files = [temp_project / "src" / "utils.py", temp_project / "src" / "App.tsx"]
+        file_tracker.capture_baselines("task-001", files)
+        storage = file_tracker.storage
+        app_record = storage.records_dir / storage._index["src/App.tsx"]["record"]
+        app_mtime = app_record.stat().st_mtime_ns
+
+        file_tracker.record_modification(
+            "task-001", "src/utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+
+        assert app_record.stat().st_mtime_ns == app_mtime
+
+    def test_query_by_task_without_loading_all(self, file_tracker, temp_project):
+        """Task and file lookups are answered from the index."""
+        from merge.file_evolution import EvolutionStorage
+
+        file_tracker.capture_baselines("task-001", [temp_project / "src" / "utils.py"])
+        file_tracker.capture_baselines("task-002", [temp_project / "src" / "App.tsx"])
+
+        storage = EvolutionStorage(temp_project, file_tracker.storage_dir)
+
+        assert storage.get_files_for_task("task-002") == ["src/App.tsx"]
+        assert list(storage.load_task_evolutions("task-001")) == ["src/utils.py"]
+        assert storage.load_evolution("src/missing.py") is None
+
+    def test_cleanup_removes_records(self, file_tracker, temp_project):
+        """Records for files left without snapshots are deleted."""
+        file_tracker.capture_baselines("task-001", [temp_project / "src" / "utils.py"])
+        storage = file_tracker.storage
+        record = storage.records_dir / storage._index["src/utils.py"]["record"]
+
+        file_tracker.cleanup_task("task-001")
+
+        assert not record.exists()
+        assert storage.get_tracked_files() == []
+
+    def test_migrates_legacy_json(self, file_tracker, temp_project):
+        """An existing file_evolution.json is split into records once."""
+        import json
+
+        from merge import FileEvolutionTracker
+
+        file_tracker.capture_baselines("task-001", [temp_project / "src" / "utils.py"])
+        legacy = {
+            path: evolution.to_dict()
+            for path, evolution in file_tracker._evolutions.items()
+        }
+        storage_dir = temp_project / ".auto-claude-legacy"
+        storage_dir.mkdir()
+        (storage_dir / "file_evolution.json").write_text(json.dumps(legacy))
+
+        migrated = FileEvolutionTracker(temp_project, storage_dir=storage_dir)
+
+        assert {
+            path: evolution.to_dict() for path, evolution in migrated._evolutions.items()
+        } == legacy
+        assert not (storage_dir / "file_evolution.json").exists()
+        assert (storage_dir / "file_evolution.json.migrated").exists()
+        assert migrated.storage.get_files_for_task("task-001") == ["src/utils.py"]
+
+    def test_active_file_task_index(self, file_tracker, temp_project):
+        """Active tasks per file are answered from the index and pruned."""
+        from merge.file_evolution import EvolutionStorage
+
+        # Tasks stay active while they hold uncompleted (baseline-only) snapshots
+        files = [temp_project / "src" / "utils.py", temp_project / "src" / "App.tsx"]
+        file_tracker.capture_baselines("task-001", files)
+        file_tracker.capture_baselines("task-002", files)
+        for task_id, content in (
+            ("task-001", SAMPLE_PYTHON_WITH_NEW_FUNCTION),
+            ("task-002", SAMPLE_PYTHON_WITH_NEW_IMPORT),
+        ):
+            file_tracker.record_modification(
+                task_id, "src/utils.py", SAMPLE_PYTHON_MODULE, content
+            )
+
+        storage = EvolutionStorage(temp_project, file_tracker.storage_dir)
+        assert storage.get_active_tasks() == file_tracker.get_active_tasks()
+        # Baseline-only snapshots do not count as modifications
+        assert storage.get_active_tasks_by_file() == {
+            "src/utils.py": ["task-001", "task-002"]
+        }
+
+        storage.complete_task("task-001")
+        reloaded = EvolutionStorage(temp_project, file_tracker.storage_dir)
+        assert reloaded.get_active_tasks() == {"task-002"}
+        assert reloaded.get_active_tasks_by_file(["src/utils.py", "x.py"]) == {
+            "src/utils.py": ["task-002"]
+        }
+
+        reloaded.remove_task("task-002")
+        assert reloaded.get_active_tasks() == set()
+        assert reloaded.get_files_for_task("task-002") == []
+        assert not (reloaded.baselines_dir / "task-002").exists()
+        assert sorted(reloaded.get_tracked_files()) == ["src/App.tsx", "src/utils.py"]
+
+    def test_upgrades_version_1_index(self, file_tracker, temp_project):
+        """Indexes without active/modified task lists are rebuilt once."""
+        import json
+
+        from merge.file_evolution import EvolutionStorage
+
+        files = [temp_project / "src" / "utils.py", temp_project / "src" / "App.tsx"]
+        file_tracker.capture_baselines("task-001", files)
+        file_tracker.record_modification(
+            "task-001", "src/utils.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+        index_file = file_tracker.storage.index_file
+        data = json.loads(index_file.read_text())
+        for entry in data["files"].values():
+            entry.pop("active")
+            entry.pop("modified")
+        index_file.write_text(json.dumps({"version": 1, "files": data["files"]}))
+
+        storage = EvolutionStorage(temp_project, file_tracker.storage_dir)
+
+        assert storage.get_active_tasks_by_file() == {"src/utils.py": ["task-001"]}
+        assert json.loads(index_file.read_text())["version"] == 2
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for GitBatchSession
+=========================
+
+Batched reads and diffs must match the per-file git show / git diff
+calls they replace.
+"""
+
+import subprocess
+from pathlib import Path
+
+from merge.git_utils import GitBatchSession
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    ).stdout
+
+
+def _make_history(repo: Path) -> tuple[str, list[str]]:
+    """Create a base commit and a head commit touching several kinds of file."""
+    (repo / "src").mkdir()
+    (repo / "src" / "app.py").write_text("def app():\n    return 1\n")
+    (repo / "src" / "old name.py").write_text("x = 1\n")
+    (repo / "gone.txt").write_text("bye\n")
+    (repo / "crlf.txt").write_bytes(b"one\r\ntwo\r\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-m", "base")
+    base = _git(repo, "rev-parse", "HEAD").strip()
+
+    (repo / "src" / "app.py").write_text("def app():\n    return 2\n")
+    (repo / "src" / "old name.py").write_text("x = 2\n")
+    (repo / "gone.txt").unlink()
+    (repo / "new.txt").write_text("hello\n")
+    (repo / "new file.txt").write_text("spaced\n")
+    (repo / "crlf.txt").write_bytes(b"one\r\nthree\r\n")
+    (repo / "image.bin").write_bytes(bytes(range(256)))
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", "head")
+
+    changed = [
+        f for f in _git(repo, "diff", "--name-only", f"{base}..HEAD").split("\n") if f
+    ]
+    return base, changed
+
+
+def test_read_files_matches_git_show(temp_git_repo: Path):
+    base, changed = _make_history(temp_git_repo)
+
+    with GitBatchSession(temp_git_repo) as git:
+        contents = git.read_files(base, changed + ["missing.txt"])
+
+    for path in changed:
+        show = subprocess.run(
+            ["git", "show", f"{base}:{path}"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        )
+        expected = show.stdout if show.returncode == 0 else None
+        assert contents[path] == expected, path
+    assert contents["missing.txt"] is None
+    # "<spec> missing" replies for paths with spaces don't break the batch
+    assert contents["new file.txt"] is None
+
+
+def test_unreadable_specs_degrade_per_file(temp_git_repo: Path):
+    base, changed = _make_history(temp_git_repo)
+
+    with GitBatchSession(temp_git_repo) as git:
+        contents = git.read_files("no-such-ref", ["src/app.py", "new file.txt"])
+        assert contents == {"src/app.py": None, "new file.txt": None}
+        diffs = git.diff_files("no-such-ref", "HEAD", ["src/app.py"])
+        assert diffs == {"src/app.py": ""}
+        assert git.read_file("HEAD", "new file.txt") == "spaced\n"
+
+
+def test_diff_files_matches_per_file_diff(temp_git_repo: Path):
+    base, changed = _make_history(temp_git_repo)
+
+    with GitBatchSession(temp_git_repo) as git:
+        diffs = git.diff_files(base, "HEAD", changed)
+
+    assert set(diffs) == set(changed)
+    for path in changed:
+        expected = _git(temp_git_repo, "diff", f"{base}..HEAD", "--", path)
+        assert diffs[path] == expected, path
+
+
+def test_session_is_reused_and_restartable(temp_git_repo: Path):
+    base, changed = _make_history(temp_git_repo)
+    git = GitBatchSession(temp_git_repo)
+
+    first = git.read_file(base, "src/app.py")
+    process = git._process
+    assert git.read_file("HEAD", "src/app.py") == "def app():\n    return 2\n"
+    assert git._process is process
+
+    git.close()
+    assert git.read_file(base, "src/app.py") == first
+    git.close()
@@ -233,3 +233,80 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+class TestAnalysisCache:
+    """Tests for cached and batched analysis."""
+
+    def test_cached_result_matches_fresh(self, temp_dir):
+        """A cache hit returns the same analysis under the caller's path."""
+        from merge import SemanticAnalyzer
+
+        analyzer = SemanticAnalyzer(cache_dir=temp_dir)
+        first = analyzer.analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+        second = analyzer.analyze_diff(
+            "b.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+
+        assert second.file_path == "b.py"
+        assert second.changes == first.changes
+        assert second.functions_added == first.functions_added
+
+        # Mutating a result doesn't leak into later hits
+        second.changes.clear()
+        third = analyzer.analyze_diff(
+            "c.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+        assert third.changes == first.changes
+
+    def test_cache_persists_across_instances(self, temp_dir, monkeypatch):
+        """Results are reused from disk by a new analyzer."""
+        from merge import SemanticAnalyzer
+        from merge import semantic_analyzer as analyzer_module
+
+        expected = SemanticAnalyzer(cache_dir=temp_dir).analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("analysis should come from the cache")
+
+        monkeypatch.setattr(analyzer_module, "analyze_with_regex", fail)
+        cached = SemanticAnalyzer(cache_dir=temp_dir).analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT
+        )
+
+        assert cached == expected
+
+    def test_extension_is_part_of_key(self, semantic_analyzer):
+        """Same contents under a different extension are analyzed separately."""
+        py = semantic_analyzer.analyze_diff(
+            "a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+        txt = semantic_analyzer.analyze_diff(
+            "a.txt", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION
+        )
+
+        assert py.functions_added
+        assert not txt.functions_added
+
+    def test_analyze_many_matches_analyze_diff(self, monkeypatch):
+        """Batch analysis (pooled) returns the same results in input order."""
+        from merge import SemanticAnalyzer
+        from merge import semantic_analyzer as analyzer_module
+
+        monkeypatch.setattr(analyzer_module, "PARALLEL_MIN_FILES", 1)
+        items = [
+            ("a.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION),
+            ("b.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_IMPORT),
+            ("App.tsx", SAMPLE_REACT_COMPONENT, SAMPLE_REACT_WITH_HOOK),
+            ("c.py", SAMPLE_PYTHON_MODULE, SAMPLE_PYTHON_WITH_NEW_FUNCTION),
+        ]
+
+        batched = SemanticAnalyzer().analyze_many(items, max_workers=2)
+        single = [SemanticAnalyzer().analyze_diff(*item) for item in items]
+
+        assert batched == single
+        assert [a.file_path for a in batched] == ["a.py", "b.py", "App.tsx", "c.py"]
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Tests for the Implementation Plan Repository
+============================================
+
+Tests the core/plan_repository.py module functionality including:
+- Reuse of the parsed plan while the file is unchanged
+- Subtask and status indexes
+- Status updates applied without reparsing
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core import plan_repository
+from core.plan_repository import clear_plan_cache, get_plan, update_subtask_status
+from core.progress import count_subtasks_detailed, get_next_subtask
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_plan_cache()
+    yield
+    clear_plan_cache()
+
+
+@pytest.fixture
+def plan_dir(tmp_path: Path) -> Path:
+    plan = {
+        "feature": "Cache",
+        "phases": [
+            {
+                "id": "phase-1",
+                "name": "Backend",
+                "subtasks": [
+                    {"id": "1-1", "description": "Model", "status": "completed"},
+                    {"id": "1-2", "description": "API", "status": "in_progress"},
+                ],
+            },
+            {
+                "id": "phase-2",
+                "name": "Frontend",
+                "depends_on": ["phase-1"],
+                "subtasks": [
+                    {"id": "2-1", "description": "View", "status": "pending"},
+                    {"id": "2-2", "description": "Docs"},
+                ],
+            },
+        ],
+    }
+    plan_file = tmp_path / "implementation_plan.json"
+    plan_file.write_text(json.dumps(plan))
+    _age(plan_file)
+    return tmp_path
+
+
+def _age(path: Path) -> None:
+    """Backdate a file past the racy window so its snapshot is reused."""
+    old = path.stat().st_mtime - 60
+    os.utime(path, (old, old))
+
+
+def _count_parses(monkeypatch) -> list:
+    parses = []
+    original = plan_repository.PlanSnapshot.__init__
+
+    def counting(self, *args, **kwargs):
+        parses.append(args[0])
+        original(self, *args, **kwargs)
+
+    monkeypatch.setattr(plan_repository.PlanSnapshot, "__init__", counting)
+    return parses
+
+
+def test_snapshot_reused_until_file_changes(plan_dir: Path, monkeypatch):
+    parses = _count_parses(monkeypatch)
+
+    plan = get_plan(plan_dir)
+    assert get_plan(plan_dir) is plan
+    assert count_subtasks_detailed(plan_dir) == {
+        "completed": 1,
+        "in_progress": 1,
+        "pending": 2,
+        "failed": 0,
+        "total": 4,
+    }
+    assert len(parses) == 1
+
+    # A rewrite with a different size is picked up
+    plan_file = plan_dir / "implementation_plan.json"
+    data = json.loads(plan_file.read_text())
+    data["phases"][0]["subtasks"][1]["status"] = "completed"
+    plan_file.write_text(json.dumps(data))
+    assert get_plan(plan_dir).count("completed") == 2
+    assert len(parses) == 2
+
+    # Recently modified files are reparsed until they are old enough
+    assert get_plan(plan_dir) is not None
+    assert len(parses) == 3
+
+
+def test_indexes_and_next_subtask(plan_dir: Path):
+    plan = get_plan(plan_dir)
+    assert plan.get_subtask("2-1")["description"] == "View"
+    assert plan.get_phase_for_subtask("2-1")["name"] == "Frontend"
+    assert plan.get_subtask("missing") is None
+    assert plan.phase_complete == {"phase-1": False, "phase-2": False}
+
+    # phase-2 depends on the incomplete phase-1
+    assert get_next_subtask(plan_dir) is None
+
+
+def test_update_subtask_status_without_reparse(plan_dir: Path, monkeypatch):
+    get_plan(plan_dir)
+    parses = _count_parses(monkeypatch)
+
+    assert update_subtask_status(plan_dir, "1-2", "completed", "Done")
+    assert not update_subtask_status(plan_dir, "missing", "completed")
+
+    plan = get_plan(plan_dir)
+    assert parses == []
+    assert plan.count("completed") == 2
+    assert plan.phase_complete["phase-1"] is True
+
+    next_subtask = get_next_subtask(plan_dir)
+    assert next_subtask["id"] == "2-1" and next_subtask["phase_id"] == "phase-2"
+    # Returned subtasks are copies
+    next_subtask["description"] = "changed"
+    assert plan.get_subtask("2-1")["description"] == "View"
+
+    on_disk = json.loads((plan_dir / "implementation_plan.json").read_text())
+    subtask = on_disk["phases"][0]["subtasks"][1]
+    assert subtask["status"] == "completed" and subtask["notes"] == "Done"
+    assert "last_updated" in on_disk
+
+
+def test_missing_or_invalid_plan(tmp_path: Path):
+    assert get_plan(tmp_path) is None
+    (tmp_path / "implementation_plan.json").write_text("{not json")
+    assert get_plan(tmp_path) is None
+    with pytest.raises(json.JSONDecodeError):
+        update_subtask_status(tmp_path, "1-1", "completed")
@@ -315,3 +315,103 @@ def test_get_worktree_info(temp_git_repo):
 
     # Cleanup
     manager.cleanup_all_worktrees()
+
+
+def _commit(repo_dir, files):
+    """Commit files to the test repo and return the new SHA."""
+    for name, content in files.items():
+        path = repo_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    subprocess.run(["git", "add", "."], cwd=repo_dir, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", "Update"], cwd=repo_dir, check=True, capture_output=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo_dir,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def test_pooled_worktree_reused_and_reset(temp_git_repo):
+    """Released slots are reset to the next SHA instead of re-created."""
+    repo_dir, commit_sha = temp_git_repo
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+
+    slot = manager.acquire_worktree(commit_sha, pr_number=1)
+    assert slot.name == "pool-0"
+    (slot / "scratch.txt").write_text("left behind")
+    (slot / "test.txt").write_text("modified")
+    manager.release_worktree(slot)
+    assert slot.exists()
+
+    second_sha = _commit(repo_dir, {"src/app.py": "print()"})
+    reused = manager.acquire_worktree(second_sha, pr_number=2)
+    assert reused == slot
+    assert (reused / "src" / "app.py").exists()
+    assert (reused / "test.txt").read_text() == "initial content"
+    assert not (reused / "scratch.txt").exists()
+
+    # A concurrent review gets its own slot while pool-0 is leased
+    other = manager.acquire_worktree(commit_sha, pr_number=3)
+    assert other.name == "pool-1"
+    assert manager.cleanup_worktrees(force=True)["total"] == 0
+    assert reused.exists() and other.exists()
+
+    manager.release_worktree(reused)
+    manager.release_worktree(other)
+    # Follow-ups prefer the slot last used for the same PR
+    assert manager.acquire_worktree(second_sha, pr_number=3) == other
+    assert {wt.pr_number for wt in manager.get_worktree_info()} == {2, 3}
+    manager.cleanup_all_worktrees()
+
+
+def test_pool_bounded_by_max_worktrees(temp_git_repo, monkeypatch):
+    """Released slots beyond MAX_PR_WORKTREES are removed."""
+    repo_dir, commit_sha = temp_git_repo
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    monkeypatch.setenv("MAX_PR_WORKTREES", "1")
+
+    first = manager.acquire_worktree(commit_sha, pr_number=1)
+    second = manager.acquire_worktree(commit_sha, pr_number=2)
+    manager.release_worktree(first)
+    manager.release_worktree(second)
+
+    assert first.exists() != second.exists()
+    manager.cleanup_all_worktrees()
+    assert list(manager.worktree_base_dir.iterdir()) == []
+
+
+def test_sparse_pooled_worktree(temp_git_repo, monkeypatch):
+    """With PR_WORKTREE_SPARSE, only changed directories are checked out."""
+    repo_dir, _ = temp_git_repo
+    sha = _commit(repo_dir, {"src/app.py": "a", "docs/guide.md": "b"})
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    monkeypatch.setenv("PR_WORKTREE_SPARSE", "1")
+
+    slot = manager.acquire_worktree(sha, pr_number=1, changed_files=["src/app.py"])
+    assert (slot / "src" / "app.py").exists()
+    assert (slot / "test.txt").exists()
+    assert not (slot / "docs").exists()
+    manager.release_worktree(slot)
+
+    monkeypatch.delenv("PR_WORKTREE_SPARSE")
+    full = manager.acquire_worktree(sha, pr_number=2, changed_files=["src/app.py"])
+    assert full == slot
+    assert (full / "docs" / "guide.md").exists()
+    manager.cleanup_all_worktrees()
+
+
+def test_pool_disabled_creates_fresh_worktrees(temp_git_repo, monkeypatch):
+    """PR_WORKTREE_POOL=0 keeps the create/remove behavior."""
+    repo_dir, commit_sha = temp_git_repo
+    manager = PRWorktreeManager(repo_dir, ".test-worktrees")
+    monkeypatch.setenv("PR_WORKTREE_POOL", "0")
+
+    path = manager.acquire_worktree(commit_sha, pr_number=5)
+    assert "pr-5" in path.name
+    manager.release_worktree(path)
+    assert not path.exists()
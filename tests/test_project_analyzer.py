@@ -492,6 +492,68 @@ class TestSecurityProfileGeneration:
         assert profile2.created_at != created1
 
 
+class TestProjectFingerprint:
+    """Tests for the project hash used to decide re-analysis."""
+
+    @staticmethod
+    def _age(root: Path) -> None:
+        """Backdate every directory so its listing can be cached."""
+        import os
+
+        old = 1_000_000_000
+        for dirpath, _, _ in os.walk(root):
+            os.utime(dirpath, (old, old))
+
+    def test_hash_ignores_pruned_dirs(self, temp_dir: Path):
+        """Dependency and VCS directories do not affect the hash."""
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "app.py").write_text("")
+        before = ProjectAnalyzer(temp_dir).compute_project_hash()
+
+        for name in ("node_modules", ".venv", ".git"):
+            (temp_dir / name / "pkg").mkdir(parents=True)
+            (temp_dir / name / "pkg" / "mod.py").write_text("")
+            (temp_dir / name / "pkg" / "App.csproj").write_text("")
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() == before
+
+        (temp_dir / "src" / "util.py").write_text("")
+        assert ProjectAnalyzer(temp_dir).compute_project_hash() != before
+
+    def test_cached_walk_rescans_only_changed_dirs(self, temp_dir: Path):
+        """Unchanged directories are served from the persisted cache."""
+        from project.fingerprint import ProjectFingerprint
+
+        (temp_dir / ".auto-claude").mkdir()
+        for name in ("a", "b", "c"):
+            (temp_dir / name).mkdir()
+            (temp_dir / name / "main.go").write_text("")
+        (temp_dir / "b" / "App.csproj").write_text("<Project />")
+        self._age(temp_dir)
+
+        first = ProjectFingerprint(temp_dir)
+        baseline = first.compute()
+        assert first.scanned_dirs == 4
+        assert first.cache_path.exists()
+
+        second = ProjectFingerprint(temp_dir)
+        assert second.compute() == baseline
+        assert second.scanned_dirs == 0
+
+        # Edits to a cached project file are still seen
+        (temp_dir / "b" / "App.csproj").write_text("<Project Sdk='x' />")
+        assert ProjectFingerprint(temp_dir).compute() != baseline
+
+        # Adding a file re-lists only its directory
+        (temp_dir / "c" / "util.go").write_text("")
+        third = ProjectFingerprint(temp_dir)
+        changed = third.compute()
+        assert third.scanned_dirs == 1
+        assert (
+            changed
+            == ProjectFingerprint(temp_dir, cache_path=temp_dir / "x.json").compute()
+        )
+
+
 class TestCommandAllowlistChecking:
     """Tests for command allowlist checking."""
 
@@ -1584,3 +1584,59 @@ class TestInheritedSecurityProfile:
 
         # Non-ancestor inherited_from should trigger re-analysis
         assert analyzer.should_reanalyze(spoofed_profile) is True
+
+
+class TestCommandParseCache:
+    """Tests for memoized command parsing and per-profile decisions."""
+
+    def test_parse_command_matches_uncached_helpers(self):
+        """parse_command agrees with extract_commands/get_command_for_validation."""
+        from security import parse_command
+
+        command = "cd src && rm -rf build; git status | grep modified"
+        parsed = parse_command(command)
+        segments = split_command_segments(command)
+
+        assert list(parsed.commands) == extract_commands(command)
+        assert list(parsed.segments) == segments
+        for cmd in parsed.commands:
+            assert parsed.validation_segments[cmd] == get_command_for_validation(
+                cmd, segments
+            )
+
+    def test_parse_command_is_cached(self):
+        """Repeated commands return the same cached parse result."""
+        from security import clear_parse_cache, parse_command
+
+        clear_parse_cache()
+        assert parse_command("npm test") is parse_command("npm test")
+
+    def test_extract_commands_returns_fresh_list(self):
+        """Mutating a returned list does not corrupt the cache."""
+        commands = extract_commands("git status")
+        commands.append("rm")
+        assert extract_commands("git status") == ["git"]
+
+    def test_validator_decisions_are_not_cached(self, temp_dir):
+        """Commands that ran a sensitive validator are re-validated each time."""
+        from security import get_resolved_profile
+
+        reset_profile_cache()
+        validate_command("rm file.txt", temp_dir)
+        validate_command("ls -la", temp_dir)
+
+        resolved = get_resolved_profile(temp_dir)
+        assert resolved.get_cached_decision("rm file.txt") is None
+        assert resolved.get_cached_decision("ls -la") == (True, "")
+
+    def test_denied_decision_is_cached(self, temp_dir):
+        """Profile-only denials are cached and still reported."""
+        from security import get_resolved_profile
+
+        reset_profile_cache()
+        first = validate_command("format c:", temp_dir)
+        second = validate_command("format c:", temp_dir)
+
+        assert first == second
+        assert first[0] is False
+        assert get_resolved_profile(temp_dir).get_cached_decision("format c:") == first
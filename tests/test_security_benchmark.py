@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Security Hook Benchmarks
+========================
+
+Measures bash_security_hook latency over a corpus of commands agents
+actually issue, so parse-cache and decision-cache regressions are caught.
+
+Requires pytest-benchmark (see requirements-test.txt); skipped otherwise.
+Compare runs with:
+    pytest tests/test_security_benchmark.py --benchmark-autosave
+    pytest tests/test_security_benchmark.py --benchmark-compare --benchmark-compare-fail=mean:25%
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from security import bash_security_hook, clear_parse_cache, reset_profile_cache
+from security.constants import PROJECT_DIR_ENV_VAR
+
+# Commands sampled from real coding/QA agent sessions
+AGENT_COMMAND_CORPUS = [
+    "npm test",
+    "npm run build",
+    "npm run lint -- --fix",
+    "git status",
+    "git diff --stat",
+    "git log --oneline -10",
+    "git add -A && git status",
+    "pytest -x",
+    "pytest tests/test_security.py -v --tb=short",
+    "python -m pytest -q",
+    "ls -la",
+    "cat package.json | grep version",
+    "find . -name '*.py' | head -20",
+    "grep -rn 'TODO' src/ | wc -l",
+    "cd apps/backend && python -m pytest -x",
+    "rm -f /tmp/test-output.txt",
+    "chmod +x ./init.sh",
+    "echo 'done' && pwd",
+    "mkdir -p build/output && cp -r dist/* build/output/",
+    "bash -c 'npm test && npm run lint'",
+]
+
+
+@pytest.fixture
+def hook_project(temp_dir, monkeypatch):
+    """Point the security hook at an isolated project with a warm profile."""
+    monkeypatch.setenv(PROJECT_DIR_ENV_VAR, str(temp_dir))
+    reset_profile_cache()
+    clear_parse_cache()
+    yield temp_dir
+    reset_profile_cache()
+    clear_parse_cache()
+
+
+def _run_corpus() -> list[dict]:
+    async def run():
+        return [
+            await bash_security_hook(
+                {"tool_name": "Bash", "tool_input": {"command": command}}
+            )
+            for command in AGENT_COMMAND_CORPUS
+        ]
+
+    return asyncio.run(run())
+
+
+def test_hook_corpus_warm_cache(benchmark, hook_project):
+    """Hook latency over the corpus once parse/decision caches are warm."""
+    expected = _run_corpus()
+
+    results = benchmark(_run_corpus)
+
+    assert results == expected
+
+
+def test_hook_corpus_cold_parse_cache(benchmark, hook_project):
+    """Hook latency when every command must be parsed again."""
+    _run_corpus()
+
+    def run_cold():
+        clear_parse_cache()
+        reset_profile_cache()
+        return _run_corpus()
+
+    results = benchmark(run_cold)
+
+    assert len(results) == len(AGENT_COMMAND_CORPUS)
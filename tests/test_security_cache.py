@@ -114,3 +114,98 @@ def test_cache_invalidation_on_file_deletion(mock_project_dir, mock_profile_path
     # 4. Call again - should handle deletion gracefully and fallback to fresh analysis
     profile2 = get_security_profile(mock_project_dir)
     assert "unique_cmd_A" not in profile2.get_all_allowed_commands()
+
+def test_cache_holds_multiple_projects(tmp_path, monkeypatch):
+    reset_profile_cache()
+    calls = []
+
+    import security.profile as profile_module
+    original = profile_module.get_or_create_profile
+
+    def counting(project_dir, spec_dir=None):
+        calls.append(project_dir)
+        return original(project_dir, spec_dir)
+
+    monkeypatch.setattr(profile_module, "get_or_create_profile", counting)
+
+    project_a = tmp_path / "a"
+    project_b = tmp_path / "b"
+    project_a.mkdir()
+    project_b.mkdir()
+
+    for _ in range(3):
+        get_security_profile(project_a)
+        get_security_profile(project_b)
+
+    assert len(calls) == 2
+
+def test_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    reset_profile_cache()
+    monkeypatch.setenv("SECURITY_PROFILE_CACHE_SIZE", "2")
+    calls = []
+
+    import security.profile as profile_module
+    original = profile_module.get_or_create_profile
+
+    def counting(project_dir, spec_dir=None):
+        calls.append(project_dir)
+        return original(project_dir, spec_dir)
+
+    monkeypatch.setattr(profile_module, "get_or_create_profile", counting)
+
+    projects = []
+    for name in ("a", "b", "c"):
+        project = tmp_path / name
+        project.mkdir()
+        projects.append(project)
+
+    get_security_profile(projects[0])
+    get_security_profile(projects[1])
+    get_security_profile(projects[0])  # a is now most recently used
+    get_security_profile(projects[2])  # evicts b
+    get_security_profile(projects[0])
+    assert len(calls) == 3
+
+    get_security_profile(projects[1])
+    assert len(calls) == 4
+
+def test_recheck_interval_throttles_stat(mock_project_dir, mock_profile_path, monkeypatch):
+    reset_profile_cache()
+    monkeypatch.setenv("SECURITY_PROFILE_RECHECK_INTERVAL", "3600")
+
+    current_hash = get_dir_hash(mock_project_dir)
+    mock_profile_path.write_text(create_valid_profile_json(["unique_cmd_A"], current_hash))
+    profile1 = get_security_profile(mock_project_dir)
+
+    import security.profile as profile_module
+    stat_calls = []
+    original = profile_module._get_profile_mtime
+    monkeypatch.setattr(
+        profile_module,
+        "_get_profile_mtime",
+        lambda project_dir: stat_calls.append(project_dir) or original(project_dir),
+    )
+
+    mock_profile_path.unlink()
+    profile2 = get_security_profile(mock_project_dir)
+
+    assert profile2 is profile1
+    assert stat_calls == []
+
+def test_resolved_profile_dispatch_table(mock_project_dir):
+    reset_profile_cache()
+    from security.profile import get_resolved_profile
+
+    resolved = get_resolved_profile(mock_project_dir)
+
+    assert isinstance(resolved.allowed_commands, frozenset)
+    assert resolved.allowed_commands == resolved.profile.get_all_allowed_commands()
+    allowed, reason, validator = resolved.check_command("rm")
+    assert allowed is True
+    assert validator is not None
+    allowed, reason, validator = resolved.check_command("ls")
+    assert allowed is True
+    assert validator is None
+    allowed, reason, validator = resolved.check_command("definitely_not_a_command")
+    assert allowed is False
+    assert "not in the allowed commands" in reason
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Tests for the Spec Status Index
+===============================
+
+Tests the core/spec_index.py module functionality including:
+- Spec status and progress derived from implementation plans
+- Reuse of indexed entries while spec files are unchanged
+- Worktree presence
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from core.plan_repository import clear_plan_cache
+from core.spec_index import SPEC_INDEX_FILENAME, SpecStatusIndex
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_plan_cache()
+    yield
+    clear_plan_cache()
+
+
+def _write_plan(spec_dir: Path, statuses: list[str]) -> None:
+    plan = {
+        "phases": [
+            {
+                "id": "phase-1",
+                "subtasks": [
+                    {"id": f"1-{i}", "status": status}
+                    for i, status in enumerate(statuses)
+                ],
+            }
+        ]
+    }
+    plan_file = spec_dir / "implementation_plan.json"
+    plan_file.write_text(json.dumps(plan))
+    # Backdate past the racy window so the entry is indexed
+    old = plan_file.stat().st_mtime - 60
+    os.utime(plan_file, (old, old))
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    specs_dir = tmp_path / ".auto-claude" / "specs"
+    for folder in ("001-done", "002-wip", "003-new", "004-empty", "no-number"):
+        (specs_dir / folder).mkdir(parents=True)
+        (specs_dir / folder / "spec.md").write_text("# Spec")
+    (specs_dir / "005-no-spec").mkdir()
+    _write_plan(specs_dir / "001-done", ["completed", "completed"])
+    _write_plan(specs_dir / "002-wip", ["completed", "pending", "in_progress"])
+    _write_plan(specs_dir / "004-empty", [])
+    (tmp_path / ".auto-claude" / "worktrees" / "tasks" / "002-wip").mkdir(parents=True)
+    return tmp_path
+
+
+def _load(project: Path) -> tuple[SpecStatusIndex, dict[str, dict]]:
+    index = SpecStatusIndex(project / ".auto-claude" / "specs", project)
+    return index, {entry["folder"]: entry for entry in index.load()}
+
+
+def test_statuses_from_plans(project: Path):
+    index, specs = _load(project)
+
+    assert list(specs) == ["001-done", "002-wip", "003-new", "004-empty"]
+    assert (specs["001-done"]["status"], specs["001-done"]["progress"]) == (
+        "complete",
+        "2/2",
+    )
+    assert (specs["002-wip"]["status"], specs["002-wip"]["progress"]) == (
+        "in_progress",
+        "1/3",
+    )
+    assert (specs["003-new"]["status"], specs["003-new"]["progress"]) == (
+        "pending",
+        "-",
+    )
+    assert specs["004-empty"]["status"] == "initialized"
+    assert specs["002-wip"]["number"] == "002" and specs["002-wip"]["name"] == "wip"
+    assert [f for f, s in specs.items() if s["has_build"]] == ["002-wip"]
+    assert index.parsed_plans == 3
+
+
+def test_index_reused_until_plan_changes(project: Path):
+    _load(project)
+    assert (project / ".auto-claude" / "specs" / SPEC_INDEX_FILENAME).exists()
+    clear_plan_cache()
+
+    index, specs = _load(project)
+    assert index.parsed_plans == 0
+    assert specs["002-wip"]["progress"] == "1/3"
+
+    spec_dir = project / ".auto-claude" / "specs" / "002-wip"
+    _write_plan(spec_dir, ["completed", "completed", "in_progress"])
+    _write_plan(project / ".auto-claude" / "specs" / "003-new", ["pending"])
+    # Worktree presence is checked on every load
+    (project / ".auto-claude" / "worktrees" / "tasks" / "002-wip").rmdir()
+
+    index, specs = _load(project)
+    assert index.parsed_plans == 2
+    assert specs["002-wip"]["progress"] == "2/3"
+    assert not specs["002-wip"]["has_build"]
+    assert specs["003-new"]["status"] == "in_progress"
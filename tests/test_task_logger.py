@@ -7,6 +7,7 @@ Tests for the task_logger module including ANSI code stripping functionality.
 import json
 import os
 import sys
+import time
 
 # Add backend to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'backend'))
@@ -14,7 +15,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'backen
 from task_logger.ansi import strip_ansi_codes
 from task_logger.capture import StreamingLogCapture
 from task_logger.logger import TaskLogger
-from task_logger.models import LogEntryType, LogPhase
+from task_logger.models import LogEntry, LogEntryType, LogPhase
+from task_logger.storage import LogStorage, get_active_phase, load_task_logs
 
 
 # ============================================================================
@@ -303,6 +305,160 @@ class TestStreamingLogCaptureAnsiIntegration:
         assert coding_entries[1]["content"] == "Success"
 
 
+# ============================================================================
+# Journaled Storage Tests
+# ============================================================================
+
+def _entry(content: str, phase: str = "coding") -> LogEntry:
+    return LogEntry(
+        timestamp="2024-01-01T00:00:00+00:00",
+        type=LogEntryType.TEXT.value,
+        content=content,
+        phase=phase,
+    )
+
+
+class TestJournaledLogStorage:
+    """Tests for the append-only journal storage mode."""
+
+    def test_entries_go_to_journal_between_compactions(self, tmp_path):
+        """Entries after the first are appended to the phase journal."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+        storage.add_entry(_entry("third"))
+
+        journal = tmp_path / "task_logs.coding.jsonl"
+        assert journal.exists()
+        assert len(journal.read_text().splitlines()) == 2
+
+        with open(tmp_path / "task_logs.json") as f:
+            snapshot = json.load(f)
+        assert [e["content"] for e in snapshot["phases"]["coding"]["entries"]] == ["first"]
+
+    def test_load_task_logs_merges_snapshot_and_journal(self, tmp_path):
+        """Readers see snapshot entries followed by the journal tail."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        for i in range(5):
+            storage.add_entry(_entry(f"entry {i}"))
+
+        logs = load_task_logs(tmp_path)
+        contents = [e["content"] for e in logs["phases"]["coding"]["entries"]]
+        assert contents == [f"entry {i}" for i in range(5)]
+
+    def test_compaction_folds_journal_into_snapshot(self, tmp_path):
+        """Compaction writes the legacy snapshot and removes journal segments."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=3, compact_interval=3600)
+        for i in range(4):
+            storage.add_entry(_entry(f"entry {i}"))
+
+        assert not (tmp_path / "task_logs.coding.jsonl").exists()
+        with open(tmp_path / "task_logs.json") as f:
+            snapshot = json.load(f)
+        assert len(snapshot["phases"]["coding"]["entries"]) == 4
+        assert snapshot["journal_seq"] == 4
+
+    def test_stale_journal_records_are_not_duplicated(self, tmp_path):
+        """Journal records already covered by the snapshot are skipped."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+        journal = tmp_path / "task_logs.coding.jsonl"
+        leftover = journal.read_text()
+
+        storage.flush()
+        # Simulate a crash between snapshot replace and journal removal
+        journal.write_text(leftover)
+
+        logs = load_task_logs(tmp_path)
+        assert [e["content"] for e in logs["phases"]["coding"]["entries"]] == ["first", "second"]
+
+    def test_partial_trailing_line_is_ignored(self, tmp_path):
+        """A half-written journal line does not break readers."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+        with open(tmp_path / "task_logs.coding.jsonl", "a") as f:
+            f.write('{"seq": 99, "entry": {"conte')
+
+        logs = load_task_logs(tmp_path)
+        assert [e["content"] for e in logs["phases"]["coding"]["entries"]] == ["first", "second"]
+
+    def test_reopen_resumes_from_journal(self, tmp_path):
+        """A new storage instance picks up uncompacted entries."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+
+        reopened = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        reopened.add_entry(_entry("third"))
+        reopened.flush()
+
+        with open(tmp_path / "task_logs.json") as f:
+            snapshot = json.load(f)
+        assert [e["content"] for e in snapshot["phases"]["coding"]["entries"]] == [
+            "first",
+            "second",
+            "third",
+        ]
+
+    def test_phase_status_change_compacts(self, tmp_path):
+        """Phase status changes reach the snapshot on the next entry."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        storage.add_entry(_entry("first"))
+        storage.update_phase_status("coding", "active")
+        storage.add_entry(_entry("second"))
+
+        assert get_active_phase(tmp_path) == "coding"
+        with open(tmp_path / "task_logs.json") as f:
+            snapshot = json.load(f)
+        assert len(snapshot["phases"]["coding"]["entries"]) == 2
+
+    def test_snapshot_catches_up_after_burst(self, tmp_path):
+        """The last entries of a burst reach the snapshot within compact_interval."""
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=0.05)
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+
+        deadline = time.monotonic() + 5
+        while (tmp_path / "task_logs.coding.jsonl").exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with open(tmp_path / "task_logs.json") as f:
+            snapshot = json.load(f)
+        assert [e["content"] for e in snapshot["phases"]["coding"]["entries"]] == ["first", "second"]
+        storage.close()
+
+    def test_close_flushes_and_stops_exit_tracking(self, tmp_path):
+        """close() compacts the journal and releases the storage."""
+        from task_logger import storage as storage_module
+
+        storage = LogStorage(tmp_path, journaled=True, compact_every=100, compact_interval=3600)
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+        assert storage in storage_module._open_storages
+
+        storage.close()
+        assert storage not in storage_module._open_storages
+        assert not (tmp_path / "task_logs.coding.jsonl").exists()
+        assert storage._flush_timer is None
+
+    def test_env_var_enables_journal(self, tmp_path, monkeypatch):
+        """TASK_LOG_JOURNAL=true switches TaskLogger to journaled storage."""
+        monkeypatch.setenv("TASK_LOG_JOURNAL", "true")
+        logger = TaskLogger(tmp_path, emit_markers=False)
+        assert logger.storage.journaled is True
+
+        logger.start_phase(LogPhase.CODING, "Starting")
+        logger.log("hello", print_to_console=False)
+        logger.end_phase(LogPhase.CODING, success=True)
+
+        assert not list(tmp_path.glob("*.jsonl"))
+        logs = load_task_logs(tmp_path)
+        contents = [e["content"] for e in logs["phases"]["coding"]["entries"]]
+        assert contents == ["Starting", "hello", "Completed coding phase"]
+
+
 # ============================================================================
 # Public API Tests
 # ============================================================================
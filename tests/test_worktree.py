@@ -750,6 +750,67 @@ class TestWorktreeUtilities:
 
         assert len(worktrees) == 2
 
+    def test_list_worktrees_matches_per_worktree_stats(self, temp_git_repo: Path):
+        """Batched listing reports the same stats as per-worktree queries."""
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("spec-1")
+        manager.create_worktree("spec-2")
+        (info.path / "a.txt").write_text("one\ntwo\n")
+        subprocess.run(["git", "add", "."], cwd=info.path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "add a"], cwd=info.path, capture_output=True
+        )
+        # A detached HEAD still reports the spec branch
+        subprocess.run(
+            ["git", "checkout", "--detach"], cwd=info.path, capture_output=True
+        )
+
+        worktrees = {wt.spec_name: wt for wt in manager.list_all_worktrees()}
+
+        assert set(worktrees) == {"spec-1", "spec-2"}
+        for spec_name, listed in worktrees.items():
+            expected = manager._get_worktree_stats(spec_name)
+            assert listed.branch == f"auto-claude/{spec_name}"
+            assert listed.commit_count == expected["commit_count"]
+            assert listed.files_changed == expected["files_changed"]
+            assert listed.additions == expected["additions"]
+            assert listed.last_commit_date == expected["last_commit_date"]
+        assert worktrees["spec-1"].commit_count == 1
+        assert worktrees["spec-1"].additions == 2
+
+    def test_list_worktrees_caches_stats_by_head(self, temp_git_repo: Path):
+        """Unchanged worktrees are listed from the status cache."""
+        from core.worktree_status import WorktreeStatusCollector
+
+        manager = WorktreeManager(temp_git_repo)
+        manager.setup()
+        info = manager.create_worktree("spec-1")
+        manager.create_worktree("spec-2")
+
+        collector = WorktreeStatusCollector(temp_git_repo, manager.base_branch)
+        paths = [info.path, manager.get_worktree_path("spec-2")]
+        collector.collect(paths)
+        assert collector.computed == 2
+        assert collector.cache_path.exists()
+        collector.collect(paths)
+        assert collector.computed == 0
+
+        # A new commit changes the HEAD and invalidates only that entry
+        (info.path / "b.txt").write_text("b\n")
+        subprocess.run(["git", "add", "."], cwd=info.path, capture_output=True)
+        subprocess.run(
+            ["git", "commit", "-m", "add b"], cwd=info.path, capture_output=True
+        )
+        statuses = collector.collect(paths)
+        assert collector.computed == 1
+        assert statuses[info.path].stats["commit_count"] == 1
+
+        # Unregistered directories are left to the per-worktree path
+        stray = manager.worktrees_dir / "stray"
+        stray.mkdir()
+        assert stray not in collector.collect([stray])
+
     def test_get_info(self, temp_git_repo: Path):
         """get_worktree_info returns correct WorktreeInfo."""
         manager = WorktreeManager(temp_git_repo)